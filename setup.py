@@ -17,7 +17,7 @@ with open(os.path.join(here, 'README.rst'), encoding='utf-8') as f:
 
 setup(
     name='swagger_to',
-    version='5.0.2',  # Don't forget to update changelog!
+    version='5.0.2',  # Don't forget to update changelog and swagger_to.__version__!
     description='Generate server and client code from Swagger (OpenAPI 2.0) specification',
     long_description=long_description,
     url='https://github.com/Parquery/swagger-to',
@@ -43,6 +43,7 @@ setup(
             'yapf==0.20.2',
             'pydocstyle>=3.0.0,<4',
             'requests_mock>=1.8.0',
+            'aiohttp>=3.8.0,<4',
         ],
     },
     py_modules=['swagger_to'],
@@ -51,8 +52,12 @@ setup(
         'console_scripts': [
             'swagger_to_go_server.py = swagger_to.bin.swagger_to_go_server:main',
             'swagger_to_py_client.py = swagger_to.bin.swagger_to_py_client:main',
+            'swagger_to_py_async_client.py = swagger_to.bin.swagger_to_py_async_client:main',
             'swagger_to_ts_angular5_client.py = swagger_to.bin.swagger_to_ts_angular5_client:main',
             'swagger_to_elm_client.py = swagger_to.bin.swagger_to_elm_client:main',
+            'swagger_to_multi.py = swagger_to.bin.swagger_to_multi:main',
+            'swagger_to_batch.py = swagger_to.bin.swagger_to_batch:main',
+            'swagger_to_worker.py = swagger_to.bin.swagger_to_worker:main',
             'swagger_style.py = swagger_to.bin.swagger_style:main',
         ],
     })
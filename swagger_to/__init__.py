@@ -8,6 +8,8 @@ import icontract
 
 # pylint: disable=missing-docstring
 
+__version__ = '5.0.2'  # Keep in sync with setup.py!
+
 LOCAL_DEFINITION_REF_RE = re.compile(r'^#/definitions/(?P<name>[a-zA-Z0-9_.\- ]+)$')
 NAME_RE = re.compile(r'^[a-zA-Z0-9_.\- ]+$')
 
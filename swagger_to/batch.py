@@ -0,0 +1,245 @@
+"""Generate the code for many Swagger specifications and targets in a pool of worker processes."""
+import collections
+import concurrent.futures
+import json
+import os
+import pathlib
+import tempfile
+import time
+from typing import Any, Callable, List, MutableMapping, Optional, Set, Tuple  # pylint: disable=unused-import
+
+import icontract
+
+import swagger_to.cache
+import swagger_to.go_server
+import swagger_to.swagger
+import swagger_to.targets
+
+
+class Job:
+    """Represent a single target to be generated from a Swagger specification."""
+
+    @icontract.require(lambda target: target in swagger_to.targets.TARGETS)
+    @icontract.require(lambda target, go_server_options: go_server_options is None or target == 'go_server')
+    def __init__(self,
+                 swagger_path: pathlib.Path,
+                 target: str,
+                 output: pathlib.Path,
+                 no_samples: bool = False,
+                 go_server_options: Optional[swagger_to.go_server.Options] = None) -> None:
+        """
+        Initialize with the given values.
+
+        :param swagger_path: path to the Swagger specification
+        :param target: name of the target
+        :param output: output directory or path to the client module, depending on the target
+        :param no_samples: if set, the sample files are not generated
+        :param go_server_options: options of the Go server; if not given, the defaults are used
+        """
+        # pylint: disable=too-many-arguments
+        self.swagger_path = swagger_path
+        self.target = target
+        self.output = output
+        self.no_samples = no_samples
+        self.go_server_options = go_server_options
+
+
+class Result:
+    """Represent the outcome of a job."""
+
+    def __init__(self,
+                 job: Job,
+                 duration: float,
+                 error: Optional[str] = None,
+                 changed: Optional[List[pathlib.Path]] = None) -> None:
+        """
+        Initialize with the given values.
+
+        :param job: which has been executed
+        :param duration: wall-clock time of the job in seconds including loading the specification
+        :param error: description of the failure, if any
+        :param changed: paths to the generated files whose content changed
+        """
+        self.job = job
+        self.duration = duration
+        self.error = error
+        self.changed = changed if changed is not None else []
+
+
+def parse_manifest(path: pathlib.Path) -> Tuple[List[Job], List[str]]:
+    """
+    Parse the JSON manifest listing the jobs.
+
+    The manifest is an object with the property "jobs". Each job is an object with the properties "swagger_path",
+    "target", "output" and, optionally, "no_samples". The jobs of the target "go_server" can also specify
+    "go_server_options", an object mapping the names of the options to booleans. Relative paths are resolved
+    against the directory of the manifest.
+
+    :param path: to the manifest
+    :return: (jobs, errors if any)
+    """
+    # pylint: disable=too-many-branches
+    try:
+        manifest = json.loads(path.read_text(encoding='utf-8'))
+    except json.JSONDecodeError as err:
+        return [], ['failed to parse the manifest {} as JSON: {}'.format(path, err)]
+
+    if not isinstance(manifest, dict) or not isinstance(manifest.get('jobs', None), list):
+        return [], ['expected the manifest {} to be an object with the list "jobs"'.format(path)]
+
+    jobs = []  # type: List[Job]
+    errors = []  # type: List[str]
+
+    for i, job_dict in enumerate(manifest['jobs']):
+        if not isinstance(job_dict, dict):
+            errors.append('job {}: expected an object, but got: {}'.format(i, json.dumps(job_dict)))
+            continue
+
+        job_errors = []  # type: List[str]
+        for key in ['swagger_path', 'target', 'output']:
+            if not isinstance(job_dict.get(key, None), str):
+                job_errors.append('job {}: expected a string property {!r}'.format(i, key))
+
+        if 'target' in job_dict and job_dict['target'] not in swagger_to.targets.TARGETS:
+            job_errors.append('job {}: expected the target to be one of {}, but got: {!r}'.format(
+                i, ', '.join(swagger_to.targets.TARGETS), job_dict['target']))
+
+        if not isinstance(job_dict.get('no_samples', False), bool):
+            job_errors.append('job {}: expected a boolean property "no_samples"'.format(i))
+
+        go_server_options = None  # type: Optional[swagger_to.go_server.Options]
+        if 'go_server_options' in job_dict:
+            options_dict = job_dict['go_server_options']
+            if job_dict.get('target', None) != 'go_server':
+                job_errors.append(
+                    'job {}: the property "go_server_options" applies only to the target go_server'.format(i))
+            elif not isinstance(options_dict, dict) or not all(
+                    isinstance(value, bool) for value in options_dict.values()):
+                job_errors.append('job {}: expected "go_server_options" to be an object of booleans'.format(i))
+            else:
+                try:
+                    go_server_options = swagger_to.go_server.Options(**options_dict)
+                except TypeError:
+                    job_errors.append('job {}: unexpected Go server option(s) in: {}'.format(
+                        i, json.dumps(options_dict)))
+
+        if job_errors:
+            errors.extend(job_errors)
+            continue
+
+        jobs.append(
+            Job(swagger_path=path.parent / job_dict['swagger_path'],
+                target=job_dict['target'],
+                output=path.parent / job_dict['output'],
+                no_samples=job_dict.get('no_samples', False),
+                go_server_options=go_server_options))
+
+    return jobs, errors
+
+
+# Specifications loaded by this worker
+_WORKER_MEMORY = swagger_to.cache.MemoryCache(max_entries=32)
+
+
+def _initialize_worker() -> None:
+    """Warm up the worker so that the set-up cost is not paid by the first job."""
+    swagger_to.swagger.schema_validator()
+
+
+def run_job(job: Job, force: bool = False, cache_dir: Optional[pathlib.Path] = None) -> Result:
+    """
+    Execute the job.
+
+    :param job: to be executed
+    :param force: if set, overwrite existing files
+    :param cache_dir: if set, the directory of the on-disk cache
+    :return: outcome of the job; the exceptions are reported as errors
+    """
+    start = time.perf_counter()
+
+    try:
+        cache = swagger_to.cache.Cache(directory=cache_dir) if cache_dir is not None else None
+        entry, errs = swagger_to.cache.load(path=job.swagger_path, cache=cache, memory=_WORKER_MEMORY)
+        if errs:
+            raise ValueError("Failed to parse the Swagger file {}:\n{}".format(job.swagger_path, "\n".join(errs)))
+
+        assert entry is not None
+
+        files = swagger_to.targets.render(
+            target=job.target,
+            entry=entry,
+            output=job.output,
+            no_samples=job.no_samples,
+            go_server_options=job.go_server_options)
+
+        changed = swagger_to.targets.write(files=files, force=force)
+
+    except Exception as err:  # pylint: disable=broad-except
+        return Result(job=job, duration=time.perf_counter() - start, error='{}: {}'.format(type(err).__name__, err))
+
+    return Result(job=job, duration=time.perf_counter() - start, changed=changed)
+
+
+def run(jobs: List[Job],
+        max_workers: Optional[int] = None,
+        fail_fast: bool = False,
+        force: bool = False,
+        cache_dir: Optional[pathlib.Path] = None,
+        on_result: Optional[Callable[[Result], None]] = None) -> List[Result]:
+    """
+    Execute the jobs in a pool of worker processes.
+
+    Each job is executed and reported on its own. The specifications are shared among the workers through
+    the on-disk cache so that a specification is usually parsed only once. If no cache directory is given,
+    a temporary one is used for the run.
+
+    :param jobs: to be executed
+    :param max_workers: maximum number of worker processes; if None, the number of CPUs
+    :param fail_fast: if set, the pending jobs are cancelled after the first failure
+    :param force: if set, overwrite existing files
+    :param cache_dir: if set, the directory of the on-disk cache
+    :param on_result: if set, called in the main process on each result as soon as it is available
+    :return: outcomes of the executed jobs in the order of completion; cancelled jobs are omitted
+    """
+    # pylint: disable=too-many-arguments
+    if cache_dir is None:
+        with tempfile.TemporaryDirectory(prefix='swagger_to_batch_') as tmp_dir:
+            return run(
+                jobs=jobs,
+                max_workers=max_workers,
+                fail_fast=fail_fast,
+                force=force,
+                cache_dir=pathlib.Path(tmp_dir),
+                on_result=on_result)
+
+    # Submit the jobs of the same specification one after another so that the later ones hit the cache.
+    order = collections.OrderedDict()  # type: MutableMapping[pathlib.Path, List[Job]]
+    for job in jobs:
+        order.setdefault(job.swagger_path, []).append(job)
+
+    pending = collections.deque(job for group in order.values() for job in group)
+
+    # Only as many jobs as there are workers are submitted at a time so that no job starts after a failure
+    # with fail_fast.
+    workers = max_workers if max_workers is not None else (os.cpu_count() or 1)
+
+    results = []  # type: List[Result]
+
+    with concurrent.futures.ProcessPoolExecutor(max_workers=max_workers, initializer=_initialize_worker) as executor:
+        running = set()  # type: Set[concurrent.futures.Future]
+        while pending or running:
+            while pending and len(running) < workers:
+                running.add(executor.submit(run_job, job=pending.popleft(), force=force, cache_dir=cache_dir))
+
+            done, running = concurrent.futures.wait(running, return_when=concurrent.futures.FIRST_COMPLETED)
+
+            for future in done:
+                result = future.result()
+                results.append(result)
+                if on_result is not None:
+                    on_result(result)
+
+                if result.error is not None and fail_fast:
+                    pending.clear()
+
+    return results
@@ -32,7 +32,7 @@ def main() -> int:
         print("File not found error: Swagger file does not exist: {}".format(swagger_path))
         return 2
 
-    swagger, errs = swagger_to.swagger.parse_yaml_file(path=swagger_path)
+    swagger, errs = swagger_to.swagger.parse_file(path=swagger_path)
     if errs:
         print("Value error: Failed to parse Swagger file {}:\n{}".format(swagger_path, "\n".join(errs)))
         return 2
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""Generate the code for many Swagger specifications and targets listed in a manifest."""
+import argparse
+import pathlib
+import sys
+import time
+from typing import List, Optional  # pylint: disable=unused-import
+
+import swagger_to.batch
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Execute the main routine."""
+    parser = argparse.ArgumentParser(
+        "Generates the code for many Swagger specifications and targets listed in a JSON manifest "
+        "using a pool of worker processes.")
+    parser.add_argument(
+        "--manifest",
+        help="path to the JSON manifest; an object with the property 'jobs' listing objects with the properties "
+        "'swagger_path', 'target' (one of go_server, py_client, py_async_client, ts_angular5_client, elm_client), "
+        "'output' and, optionally, 'no_samples' and, for go_server, 'go_server_options' (an object of booleans "
+        "named after the options of swagger_to_go_server.py). Relative paths are resolved against the directory "
+        "of the manifest.",
+        required=True)
+    parser.add_argument("--workers", help="number of worker processes; if not set, the number of CPUs", type=int)
+    parser.add_argument("--fail_fast", help="if set, stop at the first failed job", action="store_true")
+    parser.add_argument("--force", help="overwrite existing files", action="store_true")
+    parser.add_argument(
+        "--cache_dir",
+        help="if set, the parsed specifications and their intermediate representations are cached in this directory")
+    args = parser.parse_args(argv)
+
+    if args.workers is not None and args.workers <= 0:
+        parser.error("Expected a positive --workers, but got: {}".format(args.workers))
+
+    manifest_path = pathlib.Path(args.manifest)
+    if not manifest_path.exists():
+        print("Manifest does not exist: {}".format(manifest_path), file=sys.stderr)
+        return 1
+
+    jobs, errs = swagger_to.batch.parse_manifest(path=manifest_path)
+    if errs:
+        print("Errors in the manifest {}:\n{}".format(manifest_path, "\n".join(errs)), file=sys.stderr)
+        return 1
+
+    def report(result: swagger_to.batch.Result) -> None:
+        """Print the outcome of the job."""
+        if result.error is not None:
+            status = 'FAILED'
+        elif result.changed:
+            status = 'CHANGED'
+        else:
+            status = 'SAME'
+
+        print('{:<7} {:8.3f} s  {:<18}  {} -> {}'.format(status, result.duration, result.job.target,
+                                                         result.job.swagger_path, result.job.output))
+        for pth in result.changed:
+            print('        changed: {}'.format(pth))
+        if result.error is not None:
+            print(result.error, file=sys.stderr)
+
+    start = time.perf_counter()
+
+    results = swagger_to.batch.run(
+        jobs=jobs,
+        max_workers=args.workers,
+        fail_fast=bool(args.fail_fast),
+        force=bool(args.force),
+        cache_dir=pathlib.Path(args.cache_dir) if args.cache_dir is not None else None,
+        on_result=report)
+
+    duration = time.perf_counter() - start
+    failed = sum(1 for result in results if result.error is not None)
+
+    print("Executed {} of {} job(s) in {:.3f} s, {} failed.".format(len(results), len(jobs), duration, failed))
+
+    return 0 if failed == 0 and len(results) == len(jobs) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,12 +2,9 @@
 """Read a correct swagger file and produce Elm client code."""
 import argparse
 import pathlib
-import json
-from typing import TextIO, cast
 
-import swagger_to.elm_client
-import swagger_to.intermediate
-import swagger_to.swagger
+import swagger_to.cache
+import swagger_to.targets
 
 
 def main() -> None:
@@ -18,6 +15,9 @@ def main() -> None:
     parser.add_argument("--outdir", help="path to the output directory", required=True)
     parser.add_argument("--no_samples", help="if set, do not generate sample files", action="store_true")
     parser.add_argument("--force", help="overwrite existing files", action="store_true")
+    parser.add_argument(
+        "--cache_dir",
+        help="if set, the parsed specification and its intermediate representation are cached in this directory")
     args = parser.parse_args()
 
     assert isinstance(args.force, bool)
@@ -41,32 +41,19 @@ def main() -> None:
             if pth.exists():
                 raise FileExistsError("File exists, but --force was not specified: {!r}".format(pth))
 
-    swagger, errs = swagger_to.swagger.parse_yaml_file(path=swagger_path)
+    cache = swagger_to.cache.Cache(directory=args.cache_dir) if args.cache_dir is not None else None
+
+    entry, errs = swagger_to.cache.load(path=swagger_path, cache=cache)
     if errs:
         raise ValueError("Failed to parse Swagger file {}:\n{}".format(swagger_path, "\n".join(errs)))
 
-    intermediate_typedefs = swagger_to.intermediate.to_typedefs(swagger=swagger)
-
-    intermediate_params = swagger_to.intermediate.to_parameters(swagger=swagger, typedefs=intermediate_typedefs)
-
-    endpoints = swagger_to.intermediate.to_endpoints(
-        swagger=swagger, typedefs=intermediate_typedefs, params=intermediate_params)
-
-    elm_typedefs = swagger_to.elm_client.to_typedefs(intermediate_typedefs=intermediate_typedefs)
-    elm_requests = swagger_to.elm_client.to_requests(endpoints=endpoints, typedefs=elm_typedefs)
-
-    src_pth = outdir / 'Client.elm'
-    with src_pth.open('wt') as fid:
-        fid_textio = cast(TextIO, fid)
-        swagger_to.elm_client.write_client_elm(typedefs=elm_typedefs, requests=elm_requests, fid=fid_textio)
+    assert entry is not None
 
-    if not args.no_samples:
-        pkg_pth = outdir / 'elm-package.sample.json'
-        elm_package_json = swagger_to.elm_client.elm_package_json()
-        with pkg_pth.open('wt') as fid:
-            json.dump(elm_package_json, fp=fid, indent=2, sort_keys=False)
+    files = swagger_to.targets.render_elm_client(entry=entry, outdir=outdir, no_samples=bool(args.no_samples))
+    changed = swagger_to.targets.write(files=files, force=True)
 
     print("Generated Elm client code in: {}".format(outdir))
+    print(swagger_to.targets.describe_changes(files=files, changed=changed))
 
 
 if __name__ == "__main__":
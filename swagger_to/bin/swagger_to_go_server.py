@@ -4,9 +4,80 @@ import argparse
 import pathlib
 import sys
 
+import swagger_to.cache
 import swagger_to.go_server
-import swagger_to.intermediate
-import swagger_to.swagger
+import swagger_to.targets
+
+
+def add_option_arguments(parser: argparse.ArgumentParser) -> None:
+    """
+    Add the command-line arguments of the Go server options to the parser.
+
+    :param parser: to which the arguments are added
+    """
+    parser.add_argument(
+        "--shared_json_schema_definitions",
+        help="if set, the definitions are embedded only once in jsonschemas.go and referenced by all the JSON schemas "
+        "instead of being copied into each schema; this only deduplicates the text, and each validator "
+        "still compiles the definitions it references",
+        action="store_true")
+    parser.add_argument(
+        "--typed_validation",
+        help="if set, the request bodies are validated by generated code on the decoded values "
+        "instead of against the JSON schemas",
+        action="store_true")
+    parser.add_argument(
+        "--static_router",
+        help="if set, the requests are dispatched by a generated router matching the path segments "
+        "instead of gorilla/mux",
+        action="store_true")
+    parser.add_argument(
+        "--json_methods",
+        help="if set, the structs, arrays and maps are given JSON methods in types_json.go which encode and decode "
+        "without reflection",
+        action="store_true")
+    parser.add_argument(
+        "--observer",
+        help="if set, SetupRouter accepts an Observer which is notified of the durations of the phases of each request",
+        action="store_true")
+    parser.add_argument(
+        "--route_benchmarks",
+        help="if set, routes_bench_test.go benchmarks each route on a request synthesized from the types "
+        "of its parameters",
+        action="store_true")
+    parser.add_argument(
+        "--context_handler",
+        help="if set, the handler methods receive a context.Context bound by the x-swagger-to-timeout of the route",
+        action="store_true")
+    parser.add_argument(
+        "--presence_bitmask",
+        help="if set, the optional primitive fields of the defined structs are stored by value and their presence "
+        "is tracked in a bitset; implies --json_methods",
+        action="store_true")
+    parser.add_argument(
+        "--lazy_json_schemas",
+        help="if set, the JSON schemas are compiled on first use instead of at the start-up; "
+        "WarmupSchemas() compiles them all in parallel",
+        action="store_true")
+
+
+def options_from_arguments(args: argparse.Namespace) -> swagger_to.go_server.Options:
+    """
+    Collect the Go server options from the parsed command-line arguments.
+
+    :param args: parsed command-line arguments including those added by add_option_arguments
+    :return: options of the Go server code generation
+    """
+    return swagger_to.go_server.Options(
+        shared_json_schema_definitions=bool(args.shared_json_schema_definitions),
+        typed_validation=bool(args.typed_validation),
+        static_router=bool(args.static_router),
+        json_methods=bool(args.json_methods),
+        observer=bool(args.observer),
+        route_benchmarks=bool(args.route_benchmarks),
+        context_handler=bool(args.context_handler),
+        presence_bitmask=bool(args.presence_bitmask),
+        lazy_json_schemas=bool(args.lazy_json_schemas))
 
 
 def main() -> None:
@@ -17,6 +88,10 @@ def main() -> None:
     parser.add_argument("--outdir", help="path to the output directory", required=True)
     parser.add_argument("--no_samples", help="if set, do not generate sample files", action="store_true")
     parser.add_argument("--force", help="overwrite existing files", action="store_true")
+    parser.add_argument(
+        "--cache_dir",
+        help="if set, the parsed specification and its intermediate representation are cached in this directory")
+    add_option_arguments(parser=parser)
     args = parser.parse_args()
 
     assert isinstance(args.force, bool)
@@ -42,35 +117,21 @@ def main() -> None:
                 print("File exists, but --force was not specified: {!r}".format(pth), file=sys.stderr)
                 sys.exit(1)
 
-    swagger, errs = swagger_to.swagger.parse_yaml_file(path=swagger_path.as_posix())
+    cache = swagger_to.cache.Cache(directory=args.cache_dir) if args.cache_dir is not None else None
+
+    entry, errs = swagger_to.cache.load(path=swagger_path, cache=cache)
     if errs:
         raise AssertionError("Errors in {}:\n{}".format(swagger_path, "\n".join(errs)))
 
-    intermediate_typedefs = swagger_to.intermediate.to_typedefs(swagger=swagger)
-    intermediate_params = swagger_to.intermediate.to_parameters(swagger=swagger, typedefs=intermediate_typedefs)
-
-    endpoints = swagger_to.intermediate.to_endpoints(
-        swagger=swagger, typedefs=intermediate_typedefs, params=intermediate_params)
-
-    go_typedefs = swagger_to.go_server.to_typedefs(intermediate_typedefs=intermediate_typedefs)
-    go_routes = swagger_to.go_server.to_routes(endpoints=endpoints, typedefs=go_typedefs)
-
-    package = swagger.name
-
-    (outdir / 'types.go').write_text(swagger_to.go_server.generate_types_go(package=package, typedefs=go_typedefs))
-
-    (outdir / 'routes.go').write_text(swagger_to.go_server.generate_routes_go(package=package, routes=go_routes))
-
-    (outdir / 'handler.go').write_text(swagger_to.go_server.generate_handler_go(package=package, routes=go_routes))
+    assert entry is not None
 
-    if not no_samples:
-        (outdir / 'handler_impl.go.sample').write_text(
-            swagger_to.go_server.generate_handler_impl_go(package=package, routes=go_routes))
+    options = options_from_arguments(args=args)
 
-    (outdir / 'jsonschemas.go').write_text(
-        swagger_to.go_server.generate_json_schemas_go(package=package, routes=go_routes, typedefs=go_typedefs))
+    files = swagger_to.targets.render_go_server(entry=entry, outdir=outdir, no_samples=no_samples, options=options)
+    changed = swagger_to.targets.write(files=files, force=True)
 
     print("Generated go server code in: {}".format(outdir))
+    print(swagger_to.targets.describe_changes(files=files, changed=changed))
 
 
 if __name__ == "__main__":
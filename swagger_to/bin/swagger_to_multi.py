@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""Read a correct swagger file once and produce the code for any combination of the targets."""
+import argparse
+import pathlib
+import sys
+from typing import List, Optional, Tuple  # pylint: disable=unused-import
+
+import swagger_to.bin.swagger_to_go_server
+import swagger_to.cache
+import swagger_to.targets
+
+
+def main(argv: Optional[List[str]] = None,
+         memory: Optional[swagger_to.cache.MemoryCache] = None,
+         concurrent: bool = True) -> int:
+    """
+    Execute the main routine.
+
+    :param argv: command-line arguments; if not given, sys.argv is used
+    :param memory: if given, the in-memory cache of the specifications shared between the calls
+    :param concurrent: if not set, the targets are rendered in the current process regardless of --jobs
+    :return: exit code
+    """
+    parser = argparse.ArgumentParser(
+        "Reads a correct swagger file once and produces the code for any combination of the targets. "
+        "The targets are rendered concurrently.")
+    parser.add_argument("--swagger_path", help="path to the swagger file", required=True)
+    parser.add_argument("--go_server_outdir", help="if set, generate the Go server in this directory")
+    parser.add_argument("--py_client_outpath", help="if set, generate the Python client to this file")
+    parser.add_argument(
+        "--py_async_client_outpath", help="if set, generate the asynchronous Python client to this file")
+    parser.add_argument(
+        "--ts_angular5_client_outpath", help="if set, generate the Typescript + Angular5 client to this file")
+    parser.add_argument("--elm_client_outdir", help="if set, generate the Elm client in this directory")
+    parser.add_argument("--no_samples", help="if set, do not generate sample files", action="store_true")
+    parser.add_argument("--force", help="overwrite existing files", action="store_true")
+    parser.add_argument(
+        "--cache_dir",
+        help="if set, the parsed specification and its intermediate representation are cached in this directory")
+    parser.add_argument(
+        "--jobs", help="maximum number of processes used for rendering; if 0, the number of CPUs", type=int, default=0)
+
+    # The options of the Go server apply only to --go_server_outdir.
+    swagger_to.bin.swagger_to_go_server.add_option_arguments(parser=parser)
+
+    args = parser.parse_args(argv)
+
+    swagger_path = pathlib.Path(args.swagger_path)
+    force = bool(args.force)
+    no_samples = bool(args.no_samples)
+
+    outputs = [
+        ('go_server', args.go_server_outdir),
+        ('py_client', args.py_client_outpath),
+        ('py_async_client', args.py_async_client_outpath),
+        ('ts_angular5_client', args.ts_angular5_client_outpath),
+        ('elm_client', args.elm_client_outdir),
+    ]  # type: List[Tuple[str, Optional[str]]]
+
+    jobs = []  # type: List[Tuple[str, pathlib.Path]]
+    for target, output in outputs:
+        if output is not None:
+            jobs.append((target, pathlib.Path(output)))
+
+    if not jobs:
+        parser.error("At least one output needs to be specified, see --help.")
+
+    if args.jobs < 0:
+        parser.error("Expected a non-negative --jobs, but got: {}".format(args.jobs))
+
+    if not swagger_path.exists():
+        print("Swagger file does not exist: {}".format(swagger_path), file=sys.stderr)
+        return 1
+
+    cache = swagger_to.cache.Cache(directory=args.cache_dir) if args.cache_dir is not None else None
+
+    entry, errs = swagger_to.cache.load(path=swagger_path, cache=cache, memory=memory)
+    if errs:
+        print("Errors in {}:\n{}".format(swagger_path, "\n".join(errs)), file=sys.stderr)
+        return 1
+
+    assert entry is not None
+
+    rendered = swagger_to.targets.render_concurrently(
+        entry=entry,
+        jobs=jobs,
+        no_samples=no_samples,
+        max_workers=args.jobs if concurrent else 1,
+        go_server_options=swagger_to.bin.swagger_to_go_server.options_from_arguments(args=args))
+
+    # Check all the outputs before writing any of them so that the output is not left half-written.
+    if not force:
+        existing_paths = [pth for files in rendered for pth in swagger_to.targets.existing(files=files)]
+        if existing_paths:
+            print(
+                "File(s) exist, but --force was not specified: {}".format(", ".join(
+                    str(pth) for pth in existing_paths)),
+                file=sys.stderr)
+            return 1
+
+    for (target, target_output), files in zip(jobs, rendered):
+        changed = swagger_to.targets.write(files=files, force=True)
+        print("Generated {} code in: {}".format(target, target_output))
+        print(swagger_to.targets.describe_changes(files=files, changed=changed))
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
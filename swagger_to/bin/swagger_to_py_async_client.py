@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""Read a correct swagger file and produce asynchronous Python client code."""
+import argparse
+import pathlib
+
+import swagger_to.cache
+import swagger_to.targets
+
+
+def main() -> None:
+    """Execute the main routine."""
+    parser = argparse.ArgumentParser("Reads a correct swagger file and produces asynchronous python client code")
+    parser.add_argument("--swagger_path", help="path to the swagger file", required=True)
+    parser.add_argument("--outpath", help="path to the output file", required=True)
+    parser.add_argument("--force", help="overwrite existing files", action="store_true")
+    parser.add_argument(
+        "--cache_dir",
+        help="if set, the parsed specification and its intermediate representation are cached in this directory")
+    args = parser.parse_args()
+
+    swagger_path = pathlib.Path(args.swagger_path)
+    out_path = pathlib.Path(args.outpath)
+    force = bool(args.force)
+
+    if not swagger_path.exists():
+        raise FileNotFoundError("Swagger file does not exist: {}".format(swagger_path))
+
+    out_path.parent.mkdir(exist_ok=True, parents=True)
+
+    if not force and out_path.exists():
+        raise FileExistsError("Output path already exists and --force was not specified: {}".format(out_path))
+
+    cache = swagger_to.cache.Cache(directory=args.cache_dir) if args.cache_dir is not None else None
+
+    entry, errs = swagger_to.cache.load(path=swagger_path, cache=cache)
+    if errs:
+        raise AssertionError("Errors in {}:\n{}".format(swagger_path, "\n".join(errs)))
+
+    assert entry is not None
+
+    files = swagger_to.targets.render_py_async_client(entry=entry, outpath=out_path)
+    changed = swagger_to.targets.write(files=files, force=True)
+
+    print("Generated asynchronous python client code in: {}".format(out_path))
+    print(swagger_to.targets.describe_changes(files=files, changed=changed))
+
+
+if __name__ == "__main__":
+    main()
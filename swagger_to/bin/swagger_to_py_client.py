@@ -3,10 +3,8 @@
 import argparse
 import pathlib
 
-import swagger_to.go_server
-import swagger_to.intermediate
-import swagger_to.py_client
-import swagger_to.swagger
+import swagger_to.cache
+import swagger_to.targets
 
 
 def main() -> None:
@@ -15,6 +13,9 @@ def main() -> None:
     parser.add_argument("--swagger_path", help="path to the swagger file", required=True)
     parser.add_argument("--outpath", help="path to the output file", required=True)
     parser.add_argument("--force", help="overwrite existing files", action="store_true")
+    parser.add_argument(
+        "--cache_dir",
+        help="if set, the parsed specification and its intermediate representation are cached in this directory")
     args = parser.parse_args()
 
     swagger_path = pathlib.Path(args.swagger_path)
@@ -29,28 +30,19 @@ def main() -> None:
     if not force and out_path.exists():
         raise FileExistsError("Output path already exists and --force was not specified: {}".format(out_path))
 
-    swagger, errs = swagger_to.swagger.parse_yaml_file(path=swagger_path)
+    cache = swagger_to.cache.Cache(directory=args.cache_dir) if args.cache_dir is not None else None
+
+    entry, errs = swagger_to.cache.load(path=swagger_path, cache=cache)
     if errs:
         raise AssertionError("Errors in {}:\n{}".format(swagger_path, "\n".join(errs)))
 
-    intermediate_typedefs = swagger_to.intermediate.to_typedefs(swagger=swagger)
-    intermediate_params = swagger_to.intermediate.to_parameters(swagger=swagger, typedefs=intermediate_typedefs)
-
-    endpoints = swagger_to.intermediate.to_endpoints(
-        swagger=swagger, typedefs=intermediate_typedefs, params=intermediate_params)
-
-    py_typedefs = swagger_to.py_client.to_typedefs(intermediate_typedefs=intermediate_typedefs)
-
-    if 'RemoteCaller' in py_typedefs:
-        raise ValueError("A definition was specified in the swagger with the name 'RemoteCaller', "
-                         "but it's reserved for the Python client class.")
-
-    py_requests = swagger_to.py_client.to_requests(endpoints=endpoints, typedefs=py_typedefs)
+    assert entry is not None
 
-    out_path.write_text(
-        swagger_to.py_client.generate_client_py(service_name=swagger.name, typedefs=py_typedefs, requests=py_requests))
+    files = swagger_to.targets.render_py_client(entry=entry, outpath=out_path)
+    changed = swagger_to.targets.write(files=files, force=True)
 
     print("Generated python client code in: {}".format(out_path))
+    print(swagger_to.targets.describe_changes(files=files, changed=changed))
 
 
 if __name__ == "__main__":
@@ -2,10 +2,10 @@
 """Read a correct swagger file and produce Typescript client code."""
 import argparse
 import os
+import pathlib
 
-import swagger_to.intermediate
-import swagger_to.swagger
-import swagger_to.ts_angular5_client
+import swagger_to.cache
+import swagger_to.targets
 
 
 def main() -> None:
@@ -14,6 +14,9 @@ def main() -> None:
     parser.add_argument("--swagger_path", help="path to the swagger file", required=True)
     parser.add_argument("--outpath", help="path to the output file", required=True)
     parser.add_argument("--force", help="overwrite existing file", action="store_true")
+    parser.add_argument(
+        "--cache_dir",
+        help="if set, the parsed specification and its intermediate representation are cached in this directory")
     args = parser.parse_args()
 
     swagger_path = str(args.swagger_path)
@@ -28,23 +31,19 @@ def main() -> None:
     if not force and os.path.exists(out_path):
         raise FileExistsError("Output path already exists and --force was not specified: {}".format(out_path))
 
-    swagger, errs = swagger_to.swagger.parse_yaml_file(path=args.swagger_path)
+    cache = swagger_to.cache.Cache(directory=args.cache_dir) if args.cache_dir is not None else None
+
+    entry, errs = swagger_to.cache.load(path=swagger_path, cache=cache)
     if errs:
         raise AssertionError("Failed to parse Swagger file {!r}:\n{}".format(swagger_path, "\n".join(errs)))
 
-    intermediate_typedefs = swagger_to.intermediate.to_typedefs(swagger=swagger)
-    intermediate_params = swagger_to.intermediate.to_parameters(swagger=swagger, typedefs=intermediate_typedefs)
-
-    endpoints = swagger_to.intermediate.to_endpoints(
-        swagger=swagger, typedefs=intermediate_typedefs, params=intermediate_params)
-
-    ts_typedefs = swagger_to.ts_angular5_client.to_typedefs(intermediate_typedefs=intermediate_typedefs)
-    ts_requests = swagger_to.ts_angular5_client.to_requests(endpoints=endpoints, typedefs=ts_typedefs)
+    assert entry is not None
 
-    with open(out_path, 'wt') as fid:
-        swagger_to.ts_angular5_client.write_client_ts(typedefs=ts_typedefs, requests=ts_requests, fid=fid)
+    files = swagger_to.targets.render_ts_angular5_client(entry=entry, outpath=pathlib.Path(out_path))
+    changed = swagger_to.targets.write(files=files, force=True)
 
     print("Generated Typescript + Angular5 client code in: {}".format(out_path))
+    print(swagger_to.targets.describe_changes(files=files, changed=changed))
 
 
 if __name__ == "__main__":
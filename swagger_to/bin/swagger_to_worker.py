@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+Generate code as a persistent worker of a build system such as Bazel.
+
+With ``--persistent_worker``, the worker reads JSON work requests from stdin and writes JSON work responses to stdout
+following the JSON worker protocol of Bazel. The arguments of each request are the arguments of swagger_to_multi.py.
+The worker stays alive between the requests so that the modules, the compiled templates and the schema validator
+are loaded only once and the parsed specifications are kept in memory keyed by the hash of their content.
+The targets are rendered in the worker process itself since spawning a process pool for each request would lose
+the warm state; the build system runs several workers in parallel instead.
+
+Without ``--persistent_worker``, the arguments are passed on to swagger_to_multi.py for a single run.
+"""
+import contextlib
+import io
+import json
+import pathlib
+import sys
+from typing import Any, Iterator, List, Optional, TextIO  # pylint: disable=unused-import
+
+import swagger_to.bin.swagger_to_multi
+import swagger_to.cache
+import swagger_to.swagger
+
+
+def expand_arguments(arguments: List[str]) -> List[str]:
+    """
+    Expand the arguments given in flag files.
+
+    An argument "@some/path" is replaced with the lines of the file at some/path, one argument per line.
+
+    :param arguments: command-line arguments
+    :return: expanded arguments
+    """
+    result = []  # type: List[str]
+    for argument in arguments:
+        if argument.startswith('@') and not argument.startswith('@@'):
+            text = pathlib.Path(argument[1:]).read_text(encoding='utf-8')
+            result.extend(line for line in text.splitlines() if line != '')
+        elif argument.startswith('@@'):
+            result.append(argument[1:])
+        else:
+            result.append(argument)
+
+    return result
+
+
+def read_requests(stream: TextIO) -> Iterator[Any]:
+    """
+    Read the JSON work requests from the stream one after another.
+
+    The requests are usually delimited by new lines, but a request may also span multiple lines.
+
+    :param stream: where the requests come from
+    :return: iterator over the decoded requests
+    """
+    decoder = json.JSONDecoder()
+    buf = ''
+
+    for line in stream:
+        buf += line
+
+        while True:
+            text = buf.lstrip()
+            if not text:
+                buf = ''
+                break
+
+            try:
+                request, end = decoder.raw_decode(text)
+            except json.JSONDecodeError:
+                # The request is incomplete; read more lines.
+                buf = text
+                break
+
+            buf = text[end:]
+            yield request
+
+    if buf.strip():
+        raise ValueError("Unexpected end of the input in the middle of a work request: {!r}".format(buf))
+
+
+def handle(request: Any, memory: swagger_to.cache.MemoryCache) -> Any:
+    """
+    Execute the work request.
+
+    :param request: JSON work request
+    :param memory: in-memory cache of the specifications shared between the requests
+    :return: JSON work response
+    """
+    request_id = request.get('requestId', 0) if isinstance(request, dict) else 0
+
+    output = io.StringIO()
+    try:
+        if not isinstance(request, dict) or not isinstance(request.get('arguments', []), list):
+            raise ValueError("Expected a work request with a list of arguments, but got: {}".format(
+                json.dumps(request)))
+
+        argv = expand_arguments(arguments=[str(argument) for argument in request.get('arguments', [])])
+
+        with contextlib.redirect_stdout(output), contextlib.redirect_stderr(output):
+            exit_code = swagger_to.bin.swagger_to_multi.main(argv=argv, memory=memory, concurrent=False)
+
+    except SystemExit as exit_err:
+        # argparse exits on invalid arguments.
+        exit_code = exit_err.code if isinstance(exit_err.code, int) else 1
+
+    except Exception as err:  # pylint: disable=broad-except
+        output.write('{}: {}\n'.format(type(err).__name__, err))
+        exit_code = 1
+
+    return {'exitCode': exit_code, 'output': output.getvalue(), 'requestId': request_id}
+
+
+def serve(stdin: TextIO, stdout: TextIO, memory: Optional[swagger_to.cache.MemoryCache] = None) -> None:
+    """
+    Serve the work requests until stdin is closed.
+
+    :param stdin: where the work requests come from
+    :param stdout: where the work responses go to
+    :param memory: in-memory cache of the specifications; if not given, a new one is created
+    :return:
+    """
+    memory = memory if memory is not None else swagger_to.cache.MemoryCache()
+
+    for request in read_requests(stream=stdin):
+        response = handle(request=request, memory=memory)
+        stdout.write(json.dumps(response))
+        stdout.write('\n')
+        stdout.flush()
+
+
+def main() -> int:
+    """Execute the main routine."""
+    if '--persistent_worker' not in sys.argv[1:]:
+        return swagger_to.bin.swagger_to_multi.main(argv=expand_arguments(arguments=sys.argv[1:]))
+
+    # Warm up before the first request arrives.
+    swagger_to.swagger.schema_validator()
+
+    # The responses are the only thing that may be written to stdout.
+    stdout = sys.stdout
+    sys.stdout = sys.stderr
+
+    serve(stdin=sys.stdin, stdout=stdout)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
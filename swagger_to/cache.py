@@ -0,0 +1,400 @@
+"""Cache the parsed Swagger specification and its intermediate representation on disk and in memory."""
+import collections
+import copy
+import hashlib
+import hmac
+import os
+import pathlib
+import pickle
+import sys
+import tempfile
+from typing import Any, List, MutableMapping, Optional, Tuple, Union  # pylint: disable=unused-import
+
+import icontract
+
+import swagger_to
+import swagger_to.intermediate
+import swagger_to.swagger
+
+
+class Entry:
+    """Represent the parsed Swagger specification together with its intermediate representation."""
+
+    def __init__(self, swagger: swagger_to.swagger.Swagger,
+                 typedefs: MutableMapping[str, swagger_to.intermediate.Typedef],
+                 params: MutableMapping[str, swagger_to.intermediate.Parameter],
+                 endpoints: List[swagger_to.intermediate.Endpoint]) -> None:
+        """Initialize with the given values."""
+        self.swagger = swagger
+        self.typedefs = typedefs
+        self.params = params
+        self.endpoints = endpoints
+
+
+def translate(swagger: swagger_to.swagger.Swagger) -> Entry:
+    """
+    Translate the parsed Swagger specification to the intermediate representation.
+
+    :param swagger: parsed Swagger specification
+    :return: parsed specification and its intermediate representation
+    """
+    typedefs = swagger_to.intermediate.to_typedefs(swagger=swagger)
+    params = swagger_to.intermediate.to_parameters(swagger=swagger, typedefs=typedefs)
+    endpoints = swagger_to.intermediate.to_endpoints(swagger=swagger, typedefs=typedefs, params=params)
+
+    return Entry(swagger=swagger, typedefs=typedefs, params=params, endpoints=endpoints)
+
+
+def _set_source(raw_dict: swagger_to.swagger.RawDict, source: str) -> None:
+    """Set the source of the raw dictionary and of all the raw dictionaries nested in it."""
+    stack = [raw_dict]  # type: List[Any]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, swagger_to.swagger.RawDict):
+            value.source = source
+            stack.extend(value.values())
+        elif isinstance(value, list):
+            stack.extend(value)
+
+
+def _with_source(entry: Entry, source: str) -> Entry:
+    """
+    Get the entry whose raw dictionaries refer to the given source.
+
+    The entry is copied if its source differs since the same entry is shared among the files with the same content.
+
+    :param entry: cached entry
+    :param source: path to the specification file
+    :return: the entry itself or its copy with the given source
+    """
+    if entry.swagger.raw_dict is None or entry.swagger.raw_dict.source == source:
+        return entry
+
+    result = copy.deepcopy(entry)
+    assert result.swagger.raw_dict is not None
+    _set_source(raw_dict=result.swagger.raw_dict, source=source)
+
+    return result
+
+
+_SOURCES_DIGEST = None  # type: Optional[bytes]
+
+_SECRET_SIZE = 32
+_SIGNATURE_SIZE = hashlib.sha256().digest_size
+
+
+def _sources_digest() -> bytes:
+    """
+    Hash the sources of the modules which define the classes of the entries and perform the parsing.
+
+    The entries pickled by a modified parser or intermediate representation are thus never hit, even if
+    the version of swagger_to has not been bumped.
+    """
+    global _SOURCES_DIGEST  # pylint: disable=global-statement
+    if _SOURCES_DIGEST is None:
+        hsh = hashlib.sha256()
+        for module in [swagger_to, swagger_to.swagger, swagger_to.intermediate, sys.modules[__name__]]:
+            try:
+                hsh.update(pathlib.Path(str(module.__file__)).read_bytes())
+            except OSError:
+                # The sources are not available, e.g., in a frozen application; the version still applies.
+                pass
+
+            hsh.update(b'\0')
+
+        _SOURCES_DIGEST = hsh.digest()
+
+    return _SOURCES_DIGEST
+
+
+class Cache:
+    """
+    Store the entries in a directory keyed by the hash of the specification, the version and the sources of swagger_to.
+
+    Entries of other versions or sources are never hit and eventually evicted. When the entries exceed the maximum size,
+    the least recently used entries are evicted.
+
+    The entries are pickled and signed with a secret key stored in the directory, readable only by its owner.
+    The entries with an invalid signature are never unpickled. If the key can be accessed by other users,
+    the cache is disabled: nothing is hit and nothing is stored.
+    """
+
+    @icontract.require(lambda max_size: max_size > 0)
+    def __init__(self, directory: Union[str, pathlib.Path], max_size: int = 256 * 1024 * 1024) -> None:
+        """
+        Initialize with the given values.
+
+        :param directory: where the entries are stored; created if it does not exist
+        :param max_size: maximum total size of the entries in bytes
+        """
+        self.directory = pathlib.Path(str(directory))
+        self.max_size = max_size
+        self._secret = None  # type: Optional[bytes]
+
+    @staticmethod
+    def key(content: bytes, suffix: str) -> str:
+        """
+        Compute the key of the specification.
+
+        :param content: of the specification file
+        :param suffix: of the specification file since it determines the format
+        :return: hex digest
+        """
+        hsh = hashlib.sha256()
+        hsh.update(swagger_to.__version__.encode())
+        hsh.update(b'\0')
+        hsh.update(_sources_digest())
+        hsh.update(b'\0')
+        hsh.update(suffix.lower().encode())
+        hsh.update(b'\0')
+        hsh.update(content)
+        return hsh.hexdigest()
+
+    def _path(self, key: str) -> pathlib.Path:
+        """Get the path to the entry file."""
+        return self.directory / '{}.pickle'.format(key)
+
+    def _load_secret(self) -> Optional[bytes]:
+        """
+        Load the secret key which signs the entries and create it first if it does not exist.
+
+        :return: the secret key, or None if the key can not be trusted or accessed
+        """
+        if self._secret is not None:
+            return self._secret
+
+        pth = self.directory / '.secret'
+
+        try:
+            if not pth.exists():
+                self.directory.mkdir(parents=True, exist_ok=True)
+
+                # Link a complete key file so that concurrent processes never read a partially written key and
+                # all of them end up with the same key. The temporary file is readable only by the owner.
+                fid, tmp_path = tempfile.mkstemp(dir=str(self.directory), prefix='.', suffix='.tmp')
+                try:
+                    with os.fdopen(fid, 'wb') as tmp:
+                        tmp.write(os.urandom(_SECRET_SIZE))
+
+                    os.link(tmp_path, str(pth))
+                except FileExistsError:
+                    pass
+                finally:
+                    self._remove(pth=pathlib.Path(tmp_path))
+
+            stat = pth.stat()
+            if hasattr(os, 'getuid') and (stat.st_uid != os.getuid() or stat.st_mode & 0o077):
+                # Other users could read the key and forge the entries.
+                return None
+
+            secret = pth.read_bytes()
+        except OSError:
+            return None
+
+        if len(secret) != _SECRET_SIZE:
+            return None
+
+        self._secret = secret
+        return secret
+
+    def get(self, key: str) -> Optional[Entry]:
+        """
+        Load the entry from the cache.
+
+        :param key: of the entry
+        :return: the entry, or None if it is missing or unreadable
+        """
+        secret = self._load_secret()
+        if secret is None:
+            return None
+
+        pth = self._path(key=key)
+
+        try:
+            data = pth.read_bytes()
+        except FileNotFoundError:
+            return None
+
+        signature, payload = data[:_SIGNATURE_SIZE], data[_SIGNATURE_SIZE:]
+        if not hmac.compare_digest(signature, hmac.new(secret, payload, hashlib.sha256).digest()):
+            # The entry was tampered with or signed with another key; never unpickle it.
+            self._remove(pth=pth)
+            return None
+
+        try:
+            entry = pickle.loads(payload)
+        except Exception:  # pylint: disable=broad-except
+            # The entry was corrupted or written by an incompatible version, e.g., its classes or their
+            # attributes do not exist anymore (AttributeError, ImportError) or the data is truncated.
+            self._remove(pth=pth)
+            return None
+
+        if not isinstance(entry, Entry):
+            self._remove(pth=pth)
+            return None
+
+        # Mark the entry as recently used.
+        try:
+            os.utime(str(pth))
+        except FileNotFoundError:
+            pass
+
+        return entry
+
+    def put(self, key: str, entry: Entry) -> None:
+        """
+        Store the entry in the cache and evict the least recently used entries if the cache is too large.
+
+        :param key: of the entry
+        :param entry: to be stored
+        :return:
+        """
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+        secret = self._load_secret()
+        if secret is None:
+            return
+
+        payload = pickle.dumps(entry, protocol=pickle.HIGHEST_PROTOCOL)
+        data = hmac.new(secret, payload, hashlib.sha256).digest() + payload
+
+        # Write to a temporary file first so that concurrent readers never observe a partially written entry.
+        fid, tmp_path = tempfile.mkstemp(dir=str(self.directory), prefix='.', suffix='.tmp')
+        try:
+            with os.fdopen(fid, 'wb') as tmp:
+                tmp.write(data)
+
+            os.replace(tmp_path, str(self._path(key=key)))
+        except BaseException:
+            self._remove(pth=pathlib.Path(tmp_path))
+            raise
+
+        self.evict()
+
+    def evict(self) -> None:
+        """Remove the least recently used entries until the total size of the cache is within the maximum size."""
+        if not self.directory.exists():
+            return
+
+        stats = []  # type: List[Tuple[float, int, pathlib.Path]]
+        for pth in self.directory.glob('*.pickle'):
+            try:
+                stat = pth.stat()
+            except FileNotFoundError:
+                continue
+
+            stats.append((stat.st_mtime, stat.st_size, pth))
+
+        total = sum(size for _, size, _ in stats)
+        for _, size, pth in sorted(stats, key=lambda stat: stat[0]):
+            if total <= self.max_size:
+                break
+
+            self._remove(pth=pth)
+            total -= size
+
+    def clear(self) -> None:
+        """Remove all the entries from the cache."""
+        if not self.directory.exists():
+            return
+
+        for pth in self.directory.glob('*.pickle'):
+            self._remove(pth=pth)
+
+    @staticmethod
+    def _remove(pth: pathlib.Path) -> None:
+        """Remove the file if it exists."""
+        try:
+            pth.unlink()
+        except FileNotFoundError:
+            pass
+
+
+class MemoryCache:
+    """Keep the most recently used entries in memory, keyed by the same keys as the on-disk cache."""
+
+    @icontract.require(lambda max_entries: max_entries > 0)
+    def __init__(self, max_entries: int = 32) -> None:
+        """
+        Initialize with the given values.
+
+        :param max_entries: maximum number of entries kept in memory
+        """
+        self.max_entries = max_entries
+        self._entries = collections.OrderedDict()  # type: MutableMapping[str, Entry]
+
+    def get(self, key: str) -> Optional[Entry]:
+        """
+        Get the entry from the cache.
+
+        :param key: of the entry
+        :return: the entry, or None if it is missing
+        """
+        entry = self._entries.get(key, None)
+        if entry is not None:
+            self._entries.move_to_end(key)  # type: ignore
+
+        return entry
+
+    def put(self, key: str, entry: Entry) -> None:
+        """
+        Store the entry in the cache and evict the least recently used entries if there are too many.
+
+        :param key: of the entry
+        :param entry: to be stored
+        :return:
+        """
+        self._entries[key] = entry
+        self._entries.move_to_end(key)  # type: ignore
+
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)  # type: ignore
+
+    def clear(self) -> None:
+        """Remove all the entries from the cache."""
+        self._entries.clear()
+
+
+def load(path: Union[str, pathlib.Path], cache: Optional[Cache] = None,
+         memory: Optional[MemoryCache] = None) -> Tuple[Optional[Entry], List[str]]:
+    """
+    Parse the Swagger specification from the file and translate it to the intermediate representation.
+
+    If the caches are given, the specification is parsed and translated only if it has not been cached before.
+    The in-memory cache is looked up before the on-disk one.
+
+    :param path: path to the .json or .yaml file
+    :param cache: if given, the on-disk cache used to look up and store the entry
+    :param memory: if given, the in-memory cache used to look up and store the entry
+    :return: (parsed specification and its intermediate representation or None if there were errors, parsing errors)
+    """
+    pth = pathlib.Path(str(path))
+
+    key = ''
+    if cache is not None or memory is not None:
+        key = Cache.key(content=pth.read_bytes(), suffix=pth.suffix)
+
+        entry = memory.get(key=key) if memory is not None else None
+
+        if entry is None and cache is not None:
+            entry = cache.get(key=key)
+            if entry is not None and memory is not None:
+                memory.put(key=key, entry=entry)
+
+        if entry is not None:
+            # The same content might have been cached from a different file.
+            return _with_source(entry=entry, source=str(path)), []
+
+    swagger, errs = swagger_to.swagger.parse_file(path=path)
+    if errs:
+        return None, errs
+
+    entry = translate(swagger=swagger)
+
+    if cache is not None:
+        cache.put(key=key, entry=entry)
+
+    if memory is not None:
+        memory.put(key=key, entry=entry)
+
+    return entry, []
@@ -4,9 +4,17 @@
 # pylint: disable=missing-docstring,too-many-instance-attributes,too-many-locals,too-many-ancestors,too-many-branches
 # pylint: disable=too-many-statements, too-many-lines
 
-from typing import MutableMapping, Union, Set, List, Optional, Mapping, Iterable, Tuple  # pylint: disable=unused-import
+from typing import Any, MutableMapping, Union, Set, List, Optional, Mapping, Iterable, \
+    Tuple, Callable  # pylint: disable=unused-import
 
 import collections
+import datetime
+import json
+import re
+import string
+import textwrap
+import urllib.parse
+
 import icontract
 import jinja2
 
@@ -16,6 +24,59 @@ import swagger_to.intermediate
 import swagger_to.swagger
 
 
+class Options:
+    """Represent the options of the Go server code generation."""
+
+    def __init__(self,
+                 shared_json_schema_definitions: bool = False,
+                 typed_validation: bool = False,
+                 static_router: bool = False,
+                 json_methods: bool = False,
+                 observer: bool = False,
+                 route_benchmarks: bool = False,
+                 context_handler: bool = False,
+                 presence_bitmask: bool = False,
+                 lazy_json_schemas: bool = False) -> None:
+        """
+        Initialize with the given values.
+
+        :param shared_json_schema_definitions:
+            if set, the definitions are embedded only once in jsonschemas.go and referenced by all the JSON schemas;
+            this only deduplicates the text, and each validator still compiles the definitions it references
+        :param typed_validation:
+            if set, the request bodies are validated by the generated code in validation.go on the decoded values
+            instead of against the JSON schemas
+        :param static_router:
+            if set, the requests are dispatched by a generated router matching the path segments
+            instead of gorilla/mux
+        :param json_methods:
+            if set, the structs, arrays and maps are given the JSON methods in types_json.go which encode and decode
+            without reflection
+        :param observer:
+            if set, SetupRouter accepts an Observer which is notified of the durations of the phases of each request
+        :param route_benchmarks:
+            if set, routes_bench_test.go benchmarks each route on a request synthesized from the types of its parameters
+        :param context_handler:
+            if set, the handler methods receive a context.Context which is bound by the x-swagger-to-timeout
+            of the route
+        :param presence_bitmask:
+            if set, the optional primitive fields of the defined structs are stored by value and their presence is
+            tracked in a bitset; implies json_methods
+        :param lazy_json_schemas:
+            if set, the JSON schemas are compiled on first use instead of at the package initialization
+        """
+        # pylint: disable=too-many-arguments
+        self.shared_json_schema_definitions = shared_json_schema_definitions
+        self.typed_validation = typed_validation
+        self.static_router = static_router
+        self.json_methods = json_methods
+        self.observer = observer
+        self.route_benchmarks = route_benchmarks
+        self.context_handler = context_handler
+        self.presence_bitmask = presence_bitmask
+        self.lazy_json_schemas = lazy_json_schemas
+
+
 class JsonSchema:
     """Represent a JSON validation schema."""
 
@@ -59,6 +120,9 @@ class Fielddef:
         self.json_name = ''
         self.name = ''
 
+        # Index of the bit which records the presence of the optional field stored by value, if tracked
+        self.presence_bit = None  # type: Optional[int]
+
 
 class Structdef(Typedef):
     """Represent a struct type."""
@@ -109,6 +173,8 @@ class Primitivedef(Typedef):
         super().__init__()
 
         self.type = ''
+        self.format = None  # type: Optional[str]
+        self.pattern = ''
 
 
 class Interfacedef(Typedef):
@@ -163,6 +229,9 @@ def _to_typedef(intermediate_typedef: swagger_to.intermediate.Typedef) -> Typede
                 "Unhandled translation of a primitive intermediate type to Go with 'type': {!r}".format(
                     intermediate_typedef.type))
 
+        typedef.format = intermediate_typedef.format
+        typedef.pattern = intermediate_typedef.pattern
+
     elif isinstance(intermediate_typedef, swagger_to.intermediate.Arraydef):
         if intermediate_typedef.items is None:
             raise ValueError("Unexpected intermediate type definition of an array to have items None: {!r}".format(
@@ -216,10 +285,52 @@ def _to_typedef(intermediate_typedef: swagger_to.intermediate.Typedef) -> Typede
     return typedef
 
 
+def _track_presence(typedef: Structdef) -> None:
+    """Store the optional primitive fields by value and assign them the bits which record their presence."""
+    bit = 0
+    for fielddef in typedef.fields.values():
+        if fielddef.name in typedef.required or not isinstance(fielddef.typedef, Pointerdef):
+            continue
+
+        assert fielddef.typedef.pointed is not None
+        fielddef.typedef = fielddef.typedef.pointed
+        fielddef.presence_bit = bit
+        bit += 1
+
+    for fielddef in typedef.fields.values():
+        if fielddef.presence_bit is None:
+            continue
+
+        for method in ['Has', 'Set', 'Clear']:
+            if method + fielddef.name in typedef.fields:
+                raise ValueError("The accessor {} of the optional field {!r} of the type {!r} would clash "
+                                 "with the field of the same name".format(method + fielddef.name, fielddef.json_name,
+                                                                          typedef.identifier))
+
+
+def _presence_words(typedef: Structdef) -> int:
+    """Count the 64-bit words needed to record the presence of the optional fields stored by value."""
+    bits = sum(1 for fielddef in typedef.fields.values() if fielddef.presence_bit is not None)
+    return (bits + 63) // 64
+
+
+def _presence_word(value: str, bit: int) -> str:
+    """Select the word of the presence bitset of the struct value which holds the bit."""
+    return '{}[{}]'.format(_select(value, 'presence'), bit // 64)
+
+
 @icontract.ensure(lambda result: all(key == typedef.identifier for key, typedef in result.items()))
-def to_typedefs(
-        intermediate_typedefs: MutableMapping[str, swagger_to.intermediate.Typedef]) -> MutableMapping[str, Typedef]:
-    """Convert a table of intermediate type representations to a table of type definitions for generation of Go code."""
+def to_typedefs(intermediate_typedefs: MutableMapping[str, swagger_to.intermediate.Typedef],
+                presence_bitmask: bool = False) -> MutableMapping[str, Typedef]:
+    """
+    Convert a table of intermediate type representations to a table of type definitions for generation of Go code.
+
+    :param intermediate_typedefs: table of intermediate type definitions
+    :param presence_bitmask:
+        if set, the optional primitive fields of the defined structs are stored by value instead of as pointers
+        and their presence is recorded in a bitset
+    :return: table of Go type definitions
+    """
     typedefs = collections.OrderedDict()  # type: MutableMapping[str, Typedef]
 
     for intermediate_typedef in intermediate_typedefs.values():
@@ -228,9 +339,54 @@ def to_typedefs(
         typedef = _to_typedef(intermediate_typedef=intermediate_typedef)
         typedefs[typedef.identifier] = typedef
 
+        # The accessors can not be defined on the anonymous structs so that only the defined structs track presence.
+        if presence_bitmask and isinstance(typedef, Structdef):
+            _track_presence(typedef=typedef)
+
+    for typedef in typedefs.values():
+        _resolve_nested(typedef=typedef, typedefs=typedefs)
+
     return typedefs
 
 
+def _resolved(typedef: Typedef, typedefs: Mapping[str, Typedef]) -> Typedef:
+    """Give the definition of the defined type, or resolve the nested types of the anonymous type in place."""
+    if typedef.identifier != '' and typedef.identifier in typedefs:
+        return typedefs[typedef.identifier]
+
+    _resolve_nested(typedef=typedef, typedefs=typedefs)
+    return typedef
+
+
+def _resolve_nested(typedef: Typedef, typedefs: Mapping[str, Typedef]) -> None:
+    """
+    Replace the nested copies of the defined types with their definitions from the table.
+
+    The nested types converted from the intermediate representation are copies of the defined types. The code is
+    generated from the definitions, e.g., the structs which track the presence of their fields, so that
+    the nested types need to refer to the definitions as well.
+
+    :param typedef: whose nested type definitions are replaced
+    :param typedefs: table of Go type definitions
+    """
+    if isinstance(typedef, Pointerdef):
+        assert typedef.pointed is not None
+        typedef.pointed = _resolved(typedef=typedef.pointed, typedefs=typedefs)
+
+    elif isinstance(typedef, Arraydef):
+        assert typedef.items is not None
+        typedef.items = _resolved(typedef=typedef.items, typedefs=typedefs)
+
+    elif isinstance(typedef, Mapdef):
+        assert typedef.values is not None
+        typedef.values = _resolved(typedef=typedef.values, typedefs=typedefs)
+
+    elif isinstance(typedef, Structdef):
+        for fielddef in typedef.fields.values():
+            assert fielddef.typedef is not None
+            fielddef.typedef = _resolved(typedef=fielddef.typedef, typedefs=typedefs)
+
+
 # yapf: disable
 @icontract.ensure(
     lambda intermediate_typedef, result:
@@ -251,7 +407,9 @@ def _anonymous_or_get_typedef(intermediate_typedef: swagger_to.intermediate.Type
 
         return typedefs[identifier]
 
-    return _to_typedef(intermediate_typedef=intermediate_typedef)
+    typedef = _to_typedef(intermediate_typedef=intermediate_typedef)
+    _resolve_nested(typedef=typedef, typedefs=typedefs)
+    return typedef
 
 
 def _walk(typedef: Typedef, parent: Optional[Typedef] = None) -> Iterable[Tuple[Optional[Typedef], Typedef]]:
@@ -331,6 +489,28 @@ class Wrapper:
         self.body_argument = None  # type: Union[None, Argument]
 
 
+# Maximum size of the request body in bytes if not specified with x-swagger-to-max-body-bytes
+DEFAULT_MAX_BODY_BYTES = 1024 * 1024
+
+
+class InFlightLimit:
+    """Represent a limit on the number of requests handled concurrently by one or more routes."""
+
+    def __init__(self, identifier: str, limit: int, route: str = '', tag: str = '') -> None:
+        """
+        Initialize with the given values.
+
+        :param identifier: Go identifier of the limiter
+        :param limit: maximum number of requests handled concurrently
+        :param route: identifier of the handler of the limited route, if the limit is set on a single route
+        :param tag: name of the tag whose routes share the limit, if the limit is set on a tag
+        """
+        self.identifier = identifier
+        self.limit = limit
+        self.route = route
+        self.tag = tag
+
+
 class Route:
     """Represent a muxing route to an endpoint."""
 
@@ -338,10 +518,23 @@ class Route:
         """Initialize with default values."""
         self.description = ''
         self.path = ''
+
+        # Original path of the endpoint with the parameters in curly braces
+        self.template = ''
+
         self.method = ''
         self.wrapper = Wrapper()
         self.handler = Handler()
 
+        # Maximum size of the request body in bytes
+        self.max_body_bytes = DEFAULT_MAX_BODY_BYTES
+
+        # Time budget of the request, if specified; only applied with the context-aware handler
+        self.timeout = None  # type: Optional[datetime.timedelta]
+
+        # Limits on the requests handled concurrently, acquired in this order
+        self.in_flight_limits = []  # type: List[InFlightLimit]
+
 
 def _endpoint_to_route_path(endpoint: swagger_to.intermediate.Endpoint) -> str:
     """
@@ -388,8 +581,14 @@ def _to_route(endpoint: swagger_to.intermediate.Endpoint, typedefs: MutableMappi
     route = Route()
     route.method = endpoint.method.lower()
     route.path = _endpoint_to_route_path(endpoint=endpoint)
+    route.template = endpoint.path
     route.description = endpoint.description
 
+    if endpoint.max_body_bytes is not None:
+        route.max_body_bytes = endpoint.max_body_bytes
+
+    route.timeout = endpoint.timeout
+
     ##
     # Determine handable parameters
     ##
@@ -512,8 +711,28 @@ def to_routes(endpoints: List[swagger_to.intermediate.Endpoint], typedefs: Mutab
     :return: muxing routes of a Go server stub
     """
     routes = []  # type: List[Route]
+
+    # Limits shared by the routes of a tag
+    tag_limits = dict()  # type: MutableMapping[str, InFlightLimit]
+
     for endpoint in endpoints:
-        routes.append(_to_route(endpoint=endpoint, typedefs=typedefs))
+        route = _to_route(endpoint=endpoint, typedefs=typedefs)
+
+        if endpoint.max_in_flight is not None:
+            route.in_flight_limits.append(
+                InFlightLimit(
+                    identifier='routeLimit{}'.format(route.handler.identifier),
+                    limit=endpoint.max_in_flight,
+                    route=route.handler.identifier))
+
+        for tag, limit in endpoint.tag_max_in_flight.items():
+            if tag not in tag_limits:
+                tag_limits[tag] = InFlightLimit(
+                    identifier='tagLimit{}'.format(swagger_to.capital_camel_case(identifier=tag)), limit=limit, tag=tag)
+
+            route.in_flight_limits.append(tag_limits[tag])
+
+        routes.append(route)
 
     return routes
 
@@ -550,9 +769,26 @@ def _escaped_str(text: str) -> str:
         .replace('\n', '\\n').replace('\r', '\\r').replace('\v', '\\v'))
 
 
+_HEADER_TOKEN_CHARS = set(string.ascii_letters + string.digits + "!#$%&'*+-.^_`|~")
+
+
+def _canonical_header_key(name: str) -> str:
+    """
+    Canonicalize the header name as net/http does for the keys of http.Header.
+
+    :param name: name of the header parameter
+    :return: canonical key, or the name itself if it contains characters which net/http leaves as-is
+    """
+    if not all(char in _HEADER_TOKEN_CHARS for char in name):
+        return name
+
+    return '-'.join(part[:1].upper() + part[1:].lower() for part in name.split('-'))
+
+
 # Jinja2 environment
 ENV = jinja2.Environment(trim_blocks=True, lstrip_blocks=True, loader=jinja2.BaseLoader())
 ENV.filters.update({
+    'canonical_header_key': _canonical_header_key,
     'capital_camel_case': swagger_to.capital_camel_case,
     'comment': _comment,
     'escaped_str': _escaped_str
@@ -575,6 +811,11 @@ struct {
 {% endif %}
     {{ fielddef.name }} {{ field_type[fielddef] }} `json:{{ json_tags|escaped_str }}`
 {% endfor %}
+{% if presence_words %}
+
+    // presence records which of the optional fields stored by value are set.
+    presence [{{ presence_words }}]uint64
+{% endif %}
 }
 ''')
 
@@ -615,7 +856,8 @@ def _express_type(typedef: Typedef) -> str:
 
             field_type[fielddef] = _express_or_identify_type(fielddef.typedef)
 
-        return _STRUCT_TPL.render(typedef=typedef, field_type=field_type).strip()
+        return _STRUCT_TPL.render(
+            typedef=typedef, field_type=field_type, presence_words=_presence_words(typedef=typedef)).strip()
 
     else:
         raise NotImplementedError("No Go type writing defined for typedef of type: {!r}".format(type(typedef)))
@@ -671,10 +913,40 @@ package {{ package }}
 {{ '%s %s'|format(typedef.identifier, typedef.description)|comment }}
 {% endif %}
 type {{ typedef.identifier }} {{ type_expression[typedef] }}
+{% if typedef in accessors %}
+
+{{ accessors[typedef] }}
+{% endif %}
 {% endfor %}
 
 ''')
 
+_PRESENCE_ACCESSORS_TPL = ENV.from_string('''\
+{% for fielddef in fielddefs %}
+{% if not loop.first %}
+
+{% endif %}
+{% set word = presence_word('x', fielddef.presence_bit) %}
+{% set mask = '1 << %d'|format(fielddef.presence_bit % 64) %}
+// Has{{ fielddef.name }} reports whether the optional field {{ fielddef.name }} is set.
+func (x *{{ identifier }}) Has{{ fielddef.name }}() bool {
+    return {{ word }}&({{ mask|replace(' ', '') }}) != 0
+}
+
+// Set{{ fielddef.name }} sets the optional field {{ fielddef.name }}.
+func (x *{{ identifier }}) Set{{ fielddef.name }}(value {{ field_type[fielddef] }}) {
+    x.{{ fielddef.name }} = value
+    {{ word }} |= {{ mask }}
+}
+
+// Clear{{ fielddef.name }} unsets the optional field {{ fielddef.name }} and resets it to the zero value.
+func (x *{{ identifier }}) Clear{{ fielddef.name }}() {
+    var zero {{ field_type[fielddef] }}
+    x.{{ fielddef.name }} = zero
+    {{ word }} &^= {{ mask }}
+}
+{% endfor %}''')
+
 
 @icontract.ensure(lambda result: result.endswith('\n'), "final newline")
 def generate_types_go(package: str, typedefs: Mapping[str, Typedef]) -> str:
@@ -693,12 +965,29 @@ def generate_types_go(package: str, typedefs: Mapping[str, Typedef]) -> str:
                 if another_typedef.type == 'time.Time':
                     import_set.add('time')
 
+    accessors = dict()  # type: MutableMapping[Typedef, str]
+    for typedef in typedefs.values():
+        if not isinstance(typedef, Structdef):
+            continue
+
+        fielddefs = [fielddef for fielddef in typedef.fields.values() if fielddef.presence_bit is not None]
+        if fielddefs:
+            accessors[typedef] = _PRESENCE_ACCESSORS_TPL.render(
+                identifier=typedef.identifier,
+                fielddefs=fielddefs,
+                field_type={
+                    fielddef: _express_or_identify_type(typedef=fielddef.typedef)
+                    for fielddef in fielddefs if fielddef.typedef is not None
+                },
+                presence_word=_presence_word).rstrip('\n')
+
     text = _TYPES_GO_TPL.render(
         package=package,
         imports_code=_state_imports(import_set=import_set),
         typedefs=typedefs,
         type_expression={typedef: _express_type(typedef)
-                         for typedef in typedefs.values()})
+                         for typedef in typedefs.values()},
+        accessors=accessors)
 
     return swagger_to.indent.reindent(text=text, indention='\t')
 
@@ -861,34 +1150,119 @@ def _argument_from_string(argument: Argument, string_identifier: str) -> str:
 
 _ARGUMENT_FROM_BODY_TPL = ENV.from_string('''\
 {
-    var err error
-    r.Body = http.MaxBytesReader(w, r.Body, 1024*1024)
-    body, err := ioutil.ReadAll(r.Body)
+    r.Body = http.MaxBytesReader(w, r.Body, {{ max_body_bytes }})
+    buf := getBodyBuffer()
+{% if observer %}
+    n, err := buf.ReadFrom(r.Body)
+    obs.readBody(n)
+{% else %}
+    _, err := buf.ReadFrom(r.Body)
+{% endif %}
     if err != nil {
+        putBodyBuffer(buf)
         http.Error(w, "Body unreadable: "+err.Error(), http.StatusBadRequest)
         return
     }
 
-    err = ValidateAgainst{{ argument.json_schema.identifier|capital_camel_case }}Schema(body)
+    err = ValidateAgainst{{ argument.json_schema.identifier|capital_camel_case }}Schema(buf.Bytes())
     if err != nil {
+        putBodyBuffer(buf)
         http.Error(w, "Failed to validate against schema: "+err.Error(), http.StatusBadRequest)
         return
     }
+{% if observer %}
+    obs.lap(PhaseBodyValidation)
+{% endif %}
 
-    err = json.Unmarshal(body, &{{ argument.parsing_identifier }})
+    err = json.Unmarshal(buf.Bytes(), &{{ argument.parsing_identifier }})
+    putBodyBuffer(buf)
+    if err != nil {
+{% set msg = "Error JSON-decoding body parameter '%s': "|format(argument.parameter_name)|escaped_str %}
+        http.Error(w, {{ msg }}+err.Error(),
+            http.StatusBadRequest)
+        return
+    }
+{% if observer %}
+    obs.lap(PhaseBodyDecoding)
+{% endif %}
+}''')
+_TYPED_ARGUMENT_FROM_BODY_TPL = ENV.from_string('''\
+{
+    r.Body = http.MaxBytesReader(w, r.Body, {{ max_body_bytes }})
+    buf := getBodyBuffer()
+{% if observer %}
+    n, err := buf.ReadFrom(r.Body)
+    obs.readBody(n)
+{% else %}
+    _, err := buf.ReadFrom(r.Body)
+{% endif %}
     if err != nil {
+        putBodyBuffer(buf)
+        http.Error(w, "Body unreadable: "+err.Error(), http.StatusBadRequest)
+        return
+    }
+
 {% set msg = "Error JSON-decoding body parameter '%s': "|format(argument.parameter_name)|escaped_str %}
+{% if decoder is none %}
+    err = json.Unmarshal(buf.Bytes(), &{{ argument.parsing_identifier }})
+    putBodyBuffer(buf)
+    if err != nil {
+        http.Error(w, {{ msg }}+err.Error(),
+            http.StatusBadRequest)
+        return
+    }
+{% if observer %}
+    obs.lap(PhaseBodyDecoding)
+{% endif %}
+{% else %}
+    var wire {{ decoder[0]|indent }}
+    err = json.Unmarshal(buf.Bytes(), &wire)
+    putBodyBuffer(buf)
+    if err != nil {
         http.Error(w, {{ msg }}+err.Error(),
             http.StatusBadRequest)
         return
     }
+{% if observer %}
+    obs.lap(PhaseBodyDecoding)
+{% endif %}
+
+    err = {{ decoder[1] }}(&wire, &{{ argument.parsing_identifier }})
+    if err != nil {
+        http.Error(w, "Failed to validate against schema: "+err.Error(), http.StatusBadRequest)
+        return
+    }
+{% if observer %}
+    obs.lap(PhaseBodyValidation)
+{% endif %}
+{% endif %}
 }''')
 
 
 @icontract.ensure(lambda result: not result.endswith('\n'))
-def _argument_from_body(argument: Argument) -> str:
-    """Generate the code to parse the argument from a request body."""
-    return _ARGUMENT_FROM_BODY_TPL.render(argument=argument)
+def _argument_from_body(argument: Argument,
+                        max_body_bytes: int = DEFAULT_MAX_BODY_BYTES,
+                        validation: Optional['_TypedValidation'] = None,
+                        observer: bool = False) -> str:
+    """
+    Generate the code to parse the argument from a request body.
+
+    The body is read into a buffer recycled from a pool to reduce the allocations per request.
+
+    :param argument: body argument
+    :param max_body_bytes: maximum size of the request body in bytes
+    :param validation: if set, the body is validated on the decoded value instead of against the JSON schema
+    :param observer: if set, the phases of reading, validating and decoding the body are observed
+    :return: Go code
+    """
+    if validation is None:
+        return _ARGUMENT_FROM_BODY_TPL.render(argument=argument, max_body_bytes=max_body_bytes, observer=observer)
+
+    return _TYPED_ARGUMENT_FROM_BODY_TPL.render(
+        argument=argument,
+        max_body_bytes=max_body_bytes,
+        decoder=validation.body_decoders.get(argument, None),
+        observer=observer)
 
 
 _WRAPPER_TPL = ENV.from_string('''\
@@ -902,7 +1276,31 @@ Path description:
 {% endif %}
 {% endset %}{# /set description #}
 {{ description|trim|comment }}
-func {{ route.wrapper.identifier }}(h Handler, w http.ResponseWriter, r *http.Request) {
+func {{ route.wrapper.identifier }}(h Handler, w http.ResponseWriter, r *http.Request{#
+#}{% if path_positions is not none and route.wrapper.path_arguments %}, params []string{% endif %}{#
+#}{% if observer %}, obs *Observation{% endif %}) {
+{% if route.in_flight_limits %}{# limits on the requests handled concurrently #}
+{% if newliner() %}{{ '\n' }}{% endif %}
+{% for limit in route.in_flight_limits %}
+{% if not loop.first %}
+
+{% endif %}
+    if !{{ limit.identifier }}.acquire() {
+        respondOverLimit(w)
+        return
+    }
+    defer {{ limit.identifier }}.release()
+{% endfor %}
+{% endif %}{# /if limits on the requests handled concurrently #}
+{% if context_handler %}{# context of the handler #}
+{% if newliner() %}{{ '\n' }}{% endif %}
+{% if route.timeout is not none %}
+    ctx, cancel := context.WithTimeout(r.Context(), {{ go_duration(route.timeout) }})
+    defer cancel()
+{% else %}
+    ctx := r.Context()
+{% endif %}
+{% endif %}{# /if context of the handler #}
 {% if route.handler.arguments %}{# intermediate variables #}
 {% if newliner() %}{{ '\n' }}{% endif %}
 {% for argument in route.handler.arguments %}
@@ -915,7 +1313,7 @@ func {{ route.wrapper.identifier }}(h Handler, w http.ResponseWriter, r *http.Re
     {% for argument in route.wrapper.header_arguments %}
 
     {% if argument.required %}
-    if _, ok := hdr[{{ argument.parameter_name|escaped_str }}]; !ok {
+    if _, ok := hdr[{{ argument.parameter_name|canonical_header_key|escaped_str }}]; !ok {
         {% set msg = "Parameter '%s' expected in header"|format(argument.parameter_name)|escaped_str %}
         http.Error(w, {{ msg }}, http.StatusBadRequest)
         return
@@ -923,7 +1321,7 @@ func {{ route.wrapper.identifier }}(h Handler, w http.ResponseWriter, r *http.Re
     {{ argument_from_string(
         argument, "hdr.Get(%s)"|format(argument.parameter_name|escaped_str))|indent }}
     {% else %}
-    if _, ok := hdr[{{ argument.parameter_name|escaped_str }}]; ok {
+    if _, ok := hdr[{{ argument.parameter_name|canonical_header_key|escaped_str }}]; ok {
         {{ argument_from_string(
             argument, "hdr.Get(%s)"|format(argument.parameter_name|escaped_str))|indent|indent }}
     }
@@ -951,7 +1349,21 @@ func {{ route.wrapper.identifier }}(h Handler, w http.ResponseWriter, r *http.Re
     {% endif %}{# /if argument.required #}
     {% endfor %}{# /for query arguments #}
 {% endif %}{# /if query arguments #}
-{% if route.wrapper.path_arguments %}{### Path arguments ###}
+{% if route.wrapper.path_arguments and path_positions is not none %}{### Path arguments matched by the static router ###}
+    {% if newliner() %}{{ '\n' }}{% endif %}
+    {% for argument in route.wrapper.path_arguments %}
+    {% if not loop.first %}
+
+    {% endif %}
+    {% if argument.required %}
+    {{ argument_from_string(argument, "params[%d]"|format(path_positions[argument]))|indent }}
+    {% else %}
+    {
+        {{ argument_from_string(argument, "params[%d]"|format(path_positions[argument]))|indent|indent }}
+    }
+    {% endif %}
+    {% endfor %}{# /path arguments #}
+{% elif route.wrapper.path_arguments %}{### Path arguments ###}
     {% if newliner() %}{{ '\n' }}{% endif %}
     vars := mux.Vars(r)
     {% for argument in route.wrapper.path_arguments %}
@@ -970,6 +1382,10 @@ func {{ route.wrapper.identifier }}(h Handler, w http.ResponseWriter, r *http.Re
     {% endif %}
     {% endfor %}{# /path arguments #}
 {% endif %}{# /if path arguments #}
+{% if observer and (route.wrapper.header_arguments or route.wrapper.query_arguments or route.wrapper.path_arguments) %}
+
+    obs.lap(PhaseParameters)
+{% endif %}
 {% if route.wrapper.body_argument is not none %}{### Body argument ###}
     {% if newliner() %}{{ '\n' }}{% endif %}
     {% if route.wrapper.body_argument.required %}
@@ -986,15 +1402,30 @@ func {{ route.wrapper.identifier }}(h Handler, w http.ResponseWriter, r *http.Re
     {% endif %}{# /if route.wrapper.body_argument.required #}
 {% endif %}{# /if body argument #}
 {% if newliner() %}{{ '\n' }}{% endif %}
+{% if context_handler %}
+    if ctx.Err() != nil {
+        respondContextDone(w, r)
+        return
+    }
+
+{% endif %}
 {% if not route.handler.arguments %}
-    h.{{ route.handler.identifier }}(w, r)
+    h.{{ route.handler.identifier }}({% if context_handler %}ctx, {% endif %}w, r)
+{% else %}
+{% if context_handler %}
+    h.{{ route.handler.identifier }}(ctx,
+        w,
 {% else %}
     h.{{ route.handler.identifier }}(w,
+{% endif %}
         r,
 {% for argument in route.handler.arguments %}
         {{ argument.parsing_identifier }}{{ "," if not loop.last else ")" }}
 {% endfor %}
 {% endif %}
+{% if observer %}
+    obs.lap(PhaseHandler)
+{% endif %}
 }
 ''')
 
@@ -1008,20 +1439,75 @@ package {{ package }}
 {{ imports_code }}
 {% endif %}
 
+{% if router_code is none %}
 // SetupRouter sets up a router. If you don't use any middleware, you are good to go.
 // Otherwise, you need to maually re-implement this function with your middlewares.
+{% if observer_code %}
+//
+// If the observer o is not nil, it is notified of every request handled by the wrappers.
+func SetupRouter(h Handler, o Observer) *mux.Router {
+{% else %}
 func SetupRouter(h Handler) *mux.Router {
+{% endif %}
     r := mux.NewRouter()
 {% for route in routes %}
 
     r.HandleFunc(`{{ route.path }}`,
         func(w http.ResponseWriter, r *http.Request) {
+{% if observer_code %}
+            obs := startObservation(o, {{ route.handler.identifier|escaped_str }})
+            {{ route.wrapper.identifier }}(h, obs.writer(w), r, obs)
+            obs.finish(r)
+{% else %}
             {{ route.wrapper.identifier }}(h, w, r)
+{% endif %}
         }).Methods({{ route.method|escaped_str }})
 {% endfor %}
 
     return r
 }
+{% else %}
+{{ router_code }}
+{% endif %}
+{% if has_body %}
+
+// bodyBufferPool recycles the buffers for reading the request bodies.
+var bodyBufferPool = sync.Pool{
+    New: func() interface{} {
+        return new(bytes.Buffer)
+    },
+}
+
+// maxPooledBodyBufferCap limits the capacity of the pooled buffers so that the occasional large bodies
+// are not kept in memory.
+const maxPooledBodyBufferCap = 64 * 1024
+
+// getBodyBuffer gives an empty buffer from the pool.
+func getBodyBuffer() *bytes.Buffer {
+    buf := bodyBufferPool.Get().(*bytes.Buffer)
+    buf.Reset()
+    return buf
+}
+
+// putBodyBuffer returns the buffer to the pool.
+func putBodyBuffer(buf *bytes.Buffer) {
+    if buf.Cap() <= maxPooledBodyBufferCap {
+        bodyBufferPool.Put(buf)
+    }
+}
+{% endif %}
+{% if observer_code %}
+
+{{ observer_code }}
+{% endif %}
+{% if context_handler %}
+
+{{ context_done_code }}
+{% endif %}
+{% if in_flight_code %}
+
+{{ in_flight_code }}
+{% endif %}
 {% if routes %}
 {% for route in routes %}
 
@@ -1034,99 +1520,801 @@ func SetupRouter(h Handler) *mux.Router {
 ''')
 
 
-@icontract.ensure(lambda result: result.endswith('\n'), "final new line")
-def generate_routes_go(package: str, routes: List[Route]) -> str:
+class _StaticSegment:
+    """Represent how the static router matches a segment of a route path."""
+
+    def __init__(self, prefix: str, parameter: Optional[str] = None, pattern: str = '', suffix: str = '') -> None:
+        """
+        Initialize with the given values.
+
+        :param prefix: literal text of the segment before the parameter, or the whole segment if there is no parameter
+        :param parameter: name of the path parameter, if any
+        :param pattern: regular expression that the parameter needs to match, if any
+        :param suffix: literal text of the segment after the parameter
+        """
+        self.prefix = prefix
+        self.parameter = parameter
+        self.pattern = pattern
+        self.suffix = suffix
+
+
+def _static_segments(route: Route) -> List[_StaticSegment]:
     """
-    Generate the file which defines the router and the routes.
+    Split the route path into the segments matched by the static router.
 
-    :param package: name of the package
-    :param routes: routes that the router will handle.
-    :return: Golang code
+    :param route: whose path is split
+    :return: segments of the path following the leading slash
     """
-    # imports
-    import_set = {"github.com/gorilla/mux", "net/http"}
+    if not route.template.startswith('/'):
+        raise ValueError("Expected the path of the route {} to start with a slash, but got: {!r}".format(
+            route.wrapper.identifier, route.template))
+
+    patterns = dict()  # type: MutableMapping[str, str]
+    for argument in route.wrapper.path_arguments:
+        typedef = argument.typedef.pointed if isinstance(argument.typedef, Pointerdef) else argument.typedef
+        if isinstance(typedef, Primitivedef):
+            patterns[argument.parameter_name] = typedef.pattern
+
+    segments = []  # type: List[_StaticSegment]
+    for text in route.template[1:].split('/'):
+        token_pth = swagger_to.tokenize_path(path=text)
+
+        if len(token_pth.token_index_to_parameter) == 0:
+            segments.append(_StaticSegment(prefix=text))
+            continue
 
-    for route in routes:
-        for argument in route.handler.arguments:
-            if argument.in_what == 'body':
-                import_set.add('io/ioutil')
-                import_set.add('encoding/json')
+        if len(token_pth.token_index_to_parameter) > 1:
+            raise ValueError("The static router expects at most one parameter per segment, "
+                             "but got the segment {!r} in the path of the route {}: {!r}".format(
+                                 text, route.wrapper.identifier, route.template))
 
-            if argument.in_what == 'query' or argument.in_what == 'header':
-                tajp = ''
-                if isinstance(argument.typedef, Primitivedef):
-                    tajp = argument.typedef.type
-                elif isinstance(argument.typedef, Pointerdef):
-                    if isinstance(argument.typedef.pointed, Primitivedef):
-                        tajp = argument.typedef.pointed.type
+        index, parameter = list(token_pth.token_index_to_parameter.items())[0]
+        segments.append(
+            _StaticSegment(
+                prefix=''.join(token_pth.tokens[:index]),
+                parameter=parameter,
+                pattern=patterns.get(parameter, ''),
+                suffix=''.join(token_pth.tokens[index + 1:])))
 
-                if tajp in ['int', 'int32', 'int64', 'float32', 'float64']:
-                    import_set.add('strconv')
+    return segments
 
-    imports_code = _state_imports(import_set=import_set)
 
-    wrapper_code = {
-        route: _WRAPPER_TPL.render(
-            route=route,
-            express_or_identify_type={
-                argument: _express_or_identify_type(typedef=argument.typedef)
-                for route in routes for argument in route.handler.arguments
-            },
-            argument_from_string=_argument_from_string,
-            argument_from_body=_argument_from_body)
-        for route in routes
-    }
+class _StaticNode:
+    """Represent a node in the tree of the path segments matched by the static router."""
 
-    text = _ROUTES_GO_TPL.render(package=package, imports_code=imports_code, routes=routes, wrapper_code=wrapper_code)
+    def __init__(self) -> None:
+        """Initialize with default values."""
+        # Routes whose path ends at this node
+        self.routes = []  # type: List[Route]
 
-    return swagger_to.indent.reindent(text=text, indention='\t')
+        self.literals = collections.OrderedDict()  # type: MutableMapping[str, _StaticNode]
 
+        # Children matching a parameter keyed by (prefix, pattern, suffix)
+        self.parameters = collections.OrderedDict()  # type: MutableMapping[Tuple[str, str, str], _StaticNode]
 
-_HANDLER_IMPL_GO_TPL = ENV.from_string('''\
-package {{ package }}
 
-import (
-    "net/http"
-    "log"
-)
+_STATIC_DISPATCH_TPL = ENV.from_string('''\
+switch r.Method {
+{% for route in node.routes %}
+case {{ route.method|upper|escaped_str }}:
+{% if observer %}
+    obs := startObservation(rt.o, {{ route.handler.identifier|escaped_str }})
+    {{ route.wrapper.identifier }}(rt.h, obs.writer(w), r{% if route.wrapper.path_arguments %}, params[:]{% endif %}, obs)
+    obs.finish(r)
+{% elif route.wrapper.path_arguments %}
+    {{ route.wrapper.identifier }}(rt.h, w, r, params[:])
+{% else %}
+    {{ route.wrapper.identifier }}(rt.h, w, r)
+{% endif %}
+    return
+{% endfor %}
+}
+allow = {{ node.routes|map(attribute="method")|map("upper")|join(", ")|escaped_str }}''')
+
+_STATIC_DESCEND_TPL = ENV.from_string('''\
+seg{{ depth }}, {{ "rest%d"|format(depth) if uses_rest else "_" }}, more{{ depth }} := nextSegment({{ rest }})
+{% if literals %}
+switch seg{{ depth }} {
+{% for literal, code in literals %}
+case {{ literal|escaped_str }}:
+    {{ code|indent }}
+{% endfor %}
+}
+{% endif %}
+{% for parameter in parameters %}
+{% if literals or not loop.first %}
 
-// HandlerImpl implements the Handler.
-type HandlerImpl struct {
-    LogErr *log.Logger
-    LogOut *log.Logger}
-{% for route in routes %}
+{% endif %}
+{% set segment = "seg%d"|format(depth) %}
+{% if parameter.prefix or parameter.suffix %}
+{% set value = "%s[%s:len(%s)%s]"|format(
+    segment, parameter.prefix_len or "", segment, "-%d"|format(parameter.suffix_len) if parameter.suffix_len else "") %}
+if len({{ segment }}) > {{ parameter.prefix_len + parameter.suffix_len }}{#
+#}{% if parameter.prefix %} && strings.HasPrefix({{ segment }}, {{ parameter.prefix|escaped_str }}){% endif %}{#
+#}{% if parameter.suffix %} && strings.HasSuffix({{ segment }}, {{ parameter.suffix|escaped_str }}){% endif %}{#
+#}{% if parameter.pattern_var %} && {{ parameter.pattern_var }}.MatchString({{ value }}){% endif %} {
+{% else %}
+{% set value = segment %}
+if {{ segment }} != ""{% if parameter.pattern_var %} && {{ parameter.pattern_var }}.MatchString({{ segment }}){% endif %} {
+{% endif %}
+    params[{{ parameter.position }}] = {{ value }}
+    {{ parameter.code|indent }}
+}
+{% endfor %}''')
+
+_STATIC_NODE_TPL = ENV.from_string('''\
+{% if dispatch and descend %}
+if !more{{ depth }} {
+    {{ dispatch|indent }}
+} else {
+    {{ descend|indent }}
+}
+{% elif dispatch %}
+if !more{{ depth }} {
+    {{ dispatch|indent }}
+}
+{% else %}
+if more{{ depth }} {
+    {{ descend|indent }}
+}
+{% endif %}''')
+
+_STATIC_ROUTER_TPL = ENV.from_string('''\
+// SetupRouter sets up a router which dispatches the requests on the path segments known at the generation time
+// without regular expressions. If you need middlewares, wrap the returned handler with them.
+{% if observer %}
+//
+// If the observer o is not nil, it is notified of every request handled by the wrappers.
+func SetupRouter(h Handler, o Observer) http.Handler {
+    return &router{h: h, o: o}
+}
 
-// {{ route.handler.identifier }} implements Handler.{{ route.handler.identifier }}.
-{% if not route.handler.arguments %}
-func (h *HandlerImpl) {{ route.handler.identifier }}(w http.ResponseWriter,
-    r *http.Request) {
+// router dispatches the requests to the wrappers of the routes.
+type router struct {
+    h Handler
+    o Observer
+}
 {% else %}
-func (h *HandlerImpl) {{ route.handler.identifier }}(w http.ResponseWriter,
-    r *http.Request,
-{% for argument in route.handler.arguments %}
-    {{ argument.identifier }} {{ argument_type[argument] }}{{ ',' if not loop.last else ') {' }}
-{% endfor %}
-{% endif %}{# /if not route.handler.arguments #}
-    {% set msg = "Not implemented: %s"|format(route.handler.identifier)|escaped_str %}
-    http.Error(w, {{ msg }}, http.StatusInternalServerError)
-    h.LogErr.Printf({{ msg }})
+func SetupRouter(h Handler) http.Handler {
+    return &router{h: h}
 }
-{% endfor %}{# /routes #}
-''')
+
+// router dispatches the requests to the wrappers of the routes.
+type router struct {
+    h Handler
+}
+{% endif %}
+{% if pattern_vars %}
+
+// Patterns of the path parameters
+var (
+{% for pattern, var in pattern_vars.items() %}
+    {{ var }} = regexp.MustCompile({{ "^(?:%s)$"|format(pattern)|escaped_str }})
+{% endfor %}
+)
+{% endif %}
+
+// ServeHTTP dispatches the request to the wrapper of the matching route.
+func (rt *router) ServeHTTP(w http.ResponseWriter, r *http.Request) {
+{% if descend %}
+    path := r.URL.Path
+    if !strings.HasPrefix(path, "/") {
+        http.NotFound(w, r)
+        return
+    }
+{% if max_parameters > 0 %}
+
+    var params [{{ max_parameters }}]string
+{% endif %}
+    allow := ""
+
+    {{ descend|indent }}
+
+    if allow != "" {
+        w.Header().Set("Allow", allow)
+        http.Error(w, http.StatusText(http.StatusMethodNotAllowed), http.StatusMethodNotAllowed)
+        return
+    }
+
+{% endif %}
+    http.NotFound(w, r)
+}{% if descend %}
+
+
+// nextSegment splits the path at the first slash and reports whether there was a slash.
+func nextSegment(path string) (segment string, rest string, more bool) {
+    i := strings.IndexByte(path, '/')
+    if i < 0 {
+        return path, "", false
+    }
+    return path[:i], path[i+1:], true
+}{% endif %}''')
+
+
+class _StaticRouter:
+    """Generate the router dispatching the requests on the path segments known at the generation time."""
+
+    def __init__(self, routes: List[Route], observer: bool = False) -> None:
+        """
+        Build the tree of the path segments.
+
+        :param routes: to be dispatched
+        :param observer: if set, the dispatched requests are observed
+        """
+        self.root = _StaticNode()
+        self.observer = observer
+
+        # Position of the path arguments among the parameters captured by the router
+        self.path_positions = collections.OrderedDict()  # type: MutableMapping[Route, MutableMapping[Argument, int]]
+
+        # Variable identifiers of the compiled patterns of the path parameters
+        self.pattern_vars = collections.OrderedDict()  # type: MutableMapping[str, str]
+
+        self.max_parameters = 0
+
+        for route in routes:
+            positions = collections.OrderedDict()  # type: MutableMapping[str, int]
+            captured = 0
+
+            node = self.root
+            for segment in _static_segments(route=route):
+                if segment.parameter is None:
+                    node = node.literals.setdefault(segment.prefix, _StaticNode())
+                    continue
+
+                if segment.pattern != '' and segment.pattern not in self.pattern_vars:
+                    self.pattern_vars[segment.pattern] = 'pathPattern{}'.format(len(self.pattern_vars))
+
+                positions.setdefault(segment.parameter, captured)
+                captured += 1
+                node = node.parameters.setdefault((segment.prefix, segment.pattern, segment.suffix), _StaticNode())
+
+            node.routes.append(route)
+
+            self.max_parameters = max(self.max_parameters, captured)
+
+            missing = [
+                argument.parameter_name for argument in route.wrapper.path_arguments
+                if argument.parameter_name not in positions
+            ]
+            if missing:
+                raise ValueError("The path parameter(s) of the route {} are missing in the path {!r}: {}".format(
+                    route.wrapper.identifier, route.template, ", ".join(missing)))
+
+            self.path_positions[route] = collections.OrderedDict(
+                [(argument, positions[argument.parameter_name]) for argument in route.wrapper.path_arguments])
+
+    def _node(self, node: _StaticNode, depth: int, captured: int) -> str:
+        """
+        Generate the code which matches the node after its segment has been consumed.
+
+        :param node: to be matched
+        :param depth: index of the consumed segment
+        :param captured: number of the parameters captured so far
+        :return: Go code
+        """
+        dispatch = ''
+        if node.routes:
+            dispatch = _STATIC_DISPATCH_TPL.render(node=node, observer=self.observer).strip()
+
+        descend = ''
+        if node.literals or node.parameters:
+            descend = self._descend(node=node, depth=depth + 1, rest='rest{}'.format(depth), captured=captured)
+
+        return _STATIC_NODE_TPL.render(dispatch=dispatch, descend=descend, depth=depth).strip()
+
+    def _descend(self, node: _StaticNode, depth: int, rest: str, captured: int) -> str:
+        """
+        Generate the code which consumes the next segment from the rest of the path and matches the children.
+
+        :param node: whose children are matched
+        :param depth: index of the segment to be consumed
+        :param rest: Go expression of the rest of the path
+        :param captured: number of the parameters captured so far
+        :return: Go code
+        """
+        children = list(node.literals.values()) + list(node.parameters.values())
+
+        literals = [(literal, self._node(node=child, depth=depth, captured=captured))
+                    for literal, child in node.literals.items()]
+
+        parameters = []  # type: List[Mapping[str, Any]]
+        for (prefix, pattern, suffix), child in node.parameters.items():
+            parameters.append({
+                'prefix': prefix,
+                'prefix_len': len(prefix.encode('utf-8')),
+                'suffix': suffix,
+                'suffix_len': len(suffix.encode('utf-8')),
+                'pattern_var': self.pattern_vars.get(pattern, ''),
+                'position': captured,
+                'code': self._node(node=child, depth=depth, captured=captured + 1)
+            })
+
+        return _STATIC_DESCEND_TPL.render(
+            depth=depth,
+            rest=rest,
+            uses_rest=any(child.literals or child.parameters for child in children),
+            literals=literals,
+            parameters=parameters).strip()
+
+    def imports(self) -> Set[str]:
+        """List the imports needed by the router."""
+        import_set = {'net/http'}
+        if self.root.literals or self.root.parameters:
+            import_set.add('strings')
+
+        if self.pattern_vars:
+            import_set.add('regexp')
+
+        return import_set
+
+    @icontract.ensure(lambda result: not result.endswith('\n'))
+    def generate(self) -> str:
+        """Generate the code of the router."""
+        descend = ''
+        if self.root.literals or self.root.parameters:
+            descend = self._descend(node=self.root, depth=0, rest='path[1:]', captured=0)
+
+        return _STATIC_ROUTER_TPL.render(
+            pattern_vars=self.pattern_vars, max_parameters=self.max_parameters, descend=descend,
+            observer=self.observer).strip()
+
+
+_OBSERVER_GO = '''\
+// Phase identifies a phase of handling a request in the wrappers.
+type Phase int
+
+const (
+    // PhaseParameters parses the header, query and path parameters.
+    PhaseParameters Phase = iota
+    // PhaseBodyRead reads the request body.
+    PhaseBodyRead
+    // PhaseBodyValidation validates the request body.
+    PhaseBodyValidation
+    // PhaseBodyDecoding decodes the request body from JSON.
+    PhaseBodyDecoding
+    // PhaseHandler runs the handler.
+    PhaseHandler
+    // NumPhases is the number of the phases.
+    NumPhases
+)
+
+var phaseNames = [NumPhases]string{"parameters", "body_read", "body_validation", "body_decoding", "handler"}
+
+// String gives the name of the phase, e.g., as a label of a metric.
+func (p Phase) String() string {
+    if p < 0 || p >= NumPhases {
+        return "unknown"
+    }
+    return phaseNames[p]
+}
+
+// RequestStats describes how a request has been handled by a wrapper.
+type RequestStats struct {
+    // Route is the identifier of the handler method.
+    Route string
+
+    // Durations of the phases indexed by Phase; the phases which did not run are zero.
+    Durations [NumPhases]time.Duration
+
+    // Total is the duration from the dispatch until the wrapper returned.
+    Total time.Duration
+
+    // BodyBytes is the number of bytes read from the request body.
+    BodyBytes int64
+
+    // Status is the status code of the response.
+    Status int
+}
+
+// Observer is notified of the requests handled by the wrappers, e.g., to export the metrics.
+// ObserveRequest is called in the goroutine of the request after the wrapper returned
+// and needs to be safe for concurrent use.
+type Observer interface {
+    ObserveRequest(r *http.Request, stats RequestStats)
+}
+
+// statusRecorder records the status code of the response.
+type statusRecorder struct {
+    http.ResponseWriter
+    status int
+}
+
+// WriteHeader records the status code and writes it to the underlying response.
+func (rec *statusRecorder) WriteHeader(status int) {
+    if rec.status == 0 && status >= 200 {
+        rec.status = status
+    }
+    rec.ResponseWriter.WriteHeader(status)
+}
+
+// Write records the implicit status code and writes to the underlying response.
+func (rec *statusRecorder) Write(data []byte) (int, error) {
+    if rec.status == 0 {
+        rec.status = http.StatusOK
+    }
+    return rec.ResponseWriter.Write(data)
+}
+
+// Unwrap gives the underlying response to http.ResponseController.
+func (rec *statusRecorder) Unwrap() http.ResponseWriter {
+    return rec.ResponseWriter
+}
+
+// Flush records the implicit status code and flushes the underlying response if it supports flushing.
+func (rec *statusRecorder) Flush() {
+    if rec.status == 0 {
+        rec.status = http.StatusOK
+    }
+    if flusher, ok := rec.ResponseWriter.(http.Flusher); ok {
+        flusher.Flush()
+    }
+}
+
+// Hijack lets the handler take over the connection if the underlying response supports it.
+func (rec *statusRecorder) Hijack() (net.Conn, *bufio.ReadWriter, error) {
+    hijacker, ok := rec.ResponseWriter.(http.Hijacker)
+    if !ok {
+        return nil, nil, http.ErrNotSupported
+    }
+    return hijacker.Hijack()
+}
+
+// Observation tracks the phases of an observed request.
+//
+// All the methods are no-ops on a nil observation so that the requests are not timed if there is no observer.
+// Pass nil to the wrappers if you call them directly in your own router and do not observe the requests.
+type Observation struct {
+    o     Observer
+    rec   statusRecorder
+    stats RequestStats
+    start time.Time
+    last  time.Time
+}
+
+// observationPool recycles the observations so that observing a request does not allocate.
+var observationPool = sync.Pool{
+    New: func() interface{} {
+        return new(Observation)
+    },
+}
+
+// startObservation starts observing a request of the route, or gives nil if the observer is nil.
+func startObservation(o Observer, route string) *Observation {
+    if o == nil {
+        return nil
+    }
+    return newObservation(o, route)
+}
+
+// newObservation gives an observation from the pool.
+func newObservation(o Observer, route string) *Observation {
+    obs := observationPool.Get().(*Observation)
+    obs.o = o
+    obs.stats = RequestStats{Route: route}
+    obs.start = time.Now()
+    obs.last = obs.start
+    return obs
+}
+
+// writer wraps the response to record its status code.
+func (obs *Observation) writer(w http.ResponseWriter) http.ResponseWriter {
+    if obs == nil {
+        return w
+    }
+    obs.rec = statusRecorder{ResponseWriter: w}
+    return &obs.rec
+}
+
+// lap ends the phase.
+func (obs *Observation) lap(phase Phase) {
+    if obs != nil {
+        obs.record(phase)
+    }
+}
+
+// readBody records the size of the request body and ends the phase of reading it.
+func (obs *Observation) readBody(n int64) {
+    if obs != nil {
+        obs.stats.BodyBytes += n
+        obs.record(PhaseBodyRead)
+    }
+}
+
+// record adds the time since the last phase to the duration of the phase.
+func (obs *Observation) record(phase Phase) {
+    now := time.Now()
+    obs.stats.Durations[phase] += now.Sub(obs.last)
+    obs.last = now
+}
+
+// finish notifies the observer and returns the observation to the pool.
+func (obs *Observation) finish(r *http.Request) {
+    if obs != nil {
+        obs.notify(r)
+    }
+}
+
+// notify notifies the observer and returns the observation to the pool.
+func (obs *Observation) notify(r *http.Request) {
+    obs.stats.Total = time.Since(obs.start)
+    obs.stats.Status = obs.rec.status
+    if obs.stats.Status == 0 {
+        // The server responds with 200 if the handler wrote nothing.
+        obs.stats.Status = http.StatusOK
+    }
+
+    o, stats := obs.o, obs.stats
+    *obs = Observation{}
+    observationPool.Put(obs)
+
+    o.ObserveRequest(r, stats)
+}'''
+
+_CONTEXT_DONE_GO = '''\
+// respondContextDone responds to a request whose context is done before the handler could be invoked.
+//
+// The response is 504 Gateway Timeout if the context of the request itself is done, i.e. the client went away
+// or the deadline of the caller passed, and 503 Service Unavailable if the route ran out of its own time budget.
+func respondContextDone(w http.ResponseWriter, r *http.Request) {
+    if r.Context().Err() != nil {
+        http.Error(w, http.StatusText(http.StatusGatewayTimeout), http.StatusGatewayTimeout)
+        return
+    }
+
+    http.Error(w, http.StatusText(http.StatusServiceUnavailable), http.StatusServiceUnavailable)
+}'''
+
+_IN_FLIGHT_GO_TPL = ENV.from_string('''\
+// InFlight represents the state of a limit on the requests handled concurrently.
+type InFlight struct {
+    // Route is the identifier of the limited route, or empty if the limit is shared by the routes of a tag.
+    Route string
+
+    // Tag is the name of the tag whose routes share the limit, or empty if the limit is set on a single route.
+    Tag string
+
+    // Limit is the maximum number of the requests handled concurrently.
+    Limit int64
+
+    // Current is the number of the requests being handled.
+    Current int64
+
+    // Rejected is the number of the requests rejected so far because the limit had been reached.
+    Rejected int64
+}
+
+// inFlightLimit bounds the number of the requests handled concurrently without blocking.
+type inFlightLimit struct {
+    // current and rejected come first so that they are 64-bit aligned for the atomic operations.
+    current  int64
+    rejected int64
+
+    limit int64
+    route string
+    tag   string
+}
+
+// acquire counts the request in if the limit has not been reached yet.
+func (l *inFlightLimit) acquire() bool {
+    if atomic.AddInt64(&l.current, 1) > l.limit {
+        atomic.AddInt64(&l.current, -1)
+        atomic.AddInt64(&l.rejected, 1)
+        return false
+    }
+
+    return true
+}
+
+// release counts the request out.
+func (l *inFlightLimit) release() {
+    atomic.AddInt64(&l.current, -1)
+}
+
+// state reports the state of the limit.
+func (l *inFlightLimit) state() InFlight {
+    return InFlight{
+        Route:    l.route,
+        Tag:      l.tag,
+        Limit:    l.limit,
+        Current:  atomic.LoadInt64(&l.current),
+        Rejected: atomic.LoadInt64(&l.rejected)}
+}
+
+// respondOverLimit sheds a request over a limit on the requests handled concurrently.
+func respondOverLimit(w http.ResponseWriter) {
+    w.Header().Set("Retry-After", "1")
+    http.Error(w, http.StatusText(http.StatusServiceUnavailable), http.StatusServiceUnavailable)
+}
+
+{% for limit in limits %}
+{% if limit.route %}
+// {{ limit.identifier }} limits the requests handled concurrently by {{ limit.route }}.
+var {{ limit.identifier }} = &inFlightLimit{limit: {{ limit.limit }}, route: {{ limit.route|escaped_str }}}
+{% else %}
+// {{ limit.identifier }} limits the requests handled concurrently by the routes tagged {{ limit.tag|escaped_str }}.
+var {{ limit.identifier }} = &inFlightLimit{limit: {{ limit.limit }}, tag: {{ limit.tag|escaped_str }}}
+{% endif %}
+
+{% endfor %}
+// InFlightStates reports the states of all the limits on the requests handled concurrently.
+func InFlightStates() []InFlight {
+    return []InFlight{
+{% for limit in limits %}
+        {{ limit.identifier }}.state(){{ ',' if not loop.last else '}' }}
+{% endfor %}
+}''')
+
+# Go duration units and their lengths in microseconds, from the largest to the smallest
+_GO_DURATION_UNITS = [('time.Hour', 3600 * 1000 * 1000), ('time.Minute', 60 * 1000 * 1000),
+                      ('time.Second', 1000 * 1000), ('time.Millisecond', 1000), ('time.Microsecond', 1)]
+
+
+@icontract.require(lambda duration: duration > datetime.timedelta(0))
+def _go_duration(duration: datetime.timedelta) -> str:
+    """
+    Express the duration in Go using the largest unit which represents it exactly.
+
+    :param duration: to be expressed
+    :return: Go expression of type time.Duration
+    """
+    microseconds = duration // datetime.timedelta(microseconds=1)
+
+    for unit, length in _GO_DURATION_UNITS:
+        if microseconds % length == 0:
+            return '{}*{}'.format(microseconds // length, unit)
+
+    raise AssertionError("Unexpected duration not expressible in microseconds: {!r}".format(duration))
+
+
+@icontract.ensure(lambda result: result.endswith('\n'), "final new line")
+def generate_routes_go(package: str,
+                       routes: List[Route],
+                       typed_validation: bool = False,
+                       static_router: bool = False,
+                       observer: bool = False,
+                       context_handler: bool = False) -> str:
+    """
+    Generate the file which defines the router and the routes.
+
+    :param package: name of the package
+    :param routes: routes that the router will handle.
+    :param typed_validation:
+        if set, the request bodies are validated by the code from generate_validation_go on the decoded values
+        instead of against the JSON schemas
+    :param static_router: if set, the router matches the path segments in generated code instead of using gorilla/mux
+    :param observer: if set, SetupRouter accepts an Observer which is notified of the phases of each request
+    :param context_handler: if set, the handler is given the context of the request bound by the timeout of the route
+    :return: Golang code
+    """
+    # pylint: disable=too-many-arguments
+    validation = _TypedValidation(routes=routes) if typed_validation else None
+    router = _StaticRouter(routes=routes, observer=observer) if static_router else None
+
+    # imports
+    import_set = {"github.com/gorilla/mux", "net/http"} if router is None else router.imports()
+
+    if observer:
+        import_set.update(['bufio', 'net', 'sync', 'time'])
+
+    if context_handler and any(route.timeout is not None for route in routes):
+        import_set.update(['context', 'time'])
+
+    limits = []  # type: List[InFlightLimit]
+    for route in routes:
+        for limit in route.in_flight_limits:
+            if limit not in limits:
+                limits.append(limit)
+
+    if limits:
+        import_set.add('sync/atomic')
+
+    for route in routes:
+        for argument in route.handler.arguments:
+            if argument.in_what == 'body':
+                import_set.add('bytes')
+                import_set.add('encoding/json')
+                import_set.add('sync')
+
+            if argument.in_what in ['query', 'header', 'path']:
+                tajp = ''
+                if isinstance(argument.typedef, Primitivedef):
+                    tajp = argument.typedef.type
+                elif isinstance(argument.typedef, Pointerdef):
+                    if isinstance(argument.typedef.pointed, Primitivedef):
+                        tajp = argument.typedef.pointed.type
+
+                if tajp in ['int', 'int32', 'int64', 'float32', 'float64', 'bool']:
+                    import_set.add('strconv')
+
+    imports_code = _state_imports(import_set=import_set)
+
+    wrapper_code = {
+        route: _WRAPPER_TPL.render(
+            route=route,
+            express_or_identify_type={
+                argument: _express_or_identify_type(typedef=argument.typedef)
+                for route in routes for argument in route.handler.arguments
+            },
+            argument_from_string=_argument_from_string,
+            argument_from_body=lambda argument, route=route: _argument_from_body(
+                argument=argument, max_body_bytes=route.max_body_bytes, validation=validation, observer=observer),
+            path_positions=router.path_positions[route] if router is not None else None,
+            observer=observer,
+            context_handler=context_handler,
+            go_duration=_go_duration)
+        for route in routes
+    }
+
+    text = _ROUTES_GO_TPL.render(
+        package=package,
+        imports_code=imports_code,
+        routes=routes,
+        router_code=router.generate() if router is not None else None,
+        wrapper_code=wrapper_code,
+        has_body=any(route.wrapper.body_argument is not None for route in routes),
+        observer_code=_OBSERVER_GO if observer else '',
+        context_handler=context_handler,
+        context_done_code=_CONTEXT_DONE_GO,
+        in_flight_code=_IN_FLIGHT_GO_TPL.render(limits=limits) if limits else '')
+
+    return swagger_to.indent.reindent(text=text, indention='\t')
+
+
+_HANDLER_IMPL_GO_TPL = ENV.from_string('''\
+package {{ package }}
+
+import (
+{% if context_handler %}
+    "context"
+{% endif %}
+    "net/http"
+    "log"
+)
+
+// HandlerImpl implements the Handler.
+type HandlerImpl struct {
+    LogErr *log.Logger
+    LogOut *log.Logger}
+{% for route in routes %}
+
+// {{ route.handler.identifier }} implements Handler.{{ route.handler.identifier }}.
+{% if context_handler %}
+func (h *HandlerImpl) {{ route.handler.identifier }}(ctx context.Context,
+    w http.ResponseWriter,
+{% else %}
+func (h *HandlerImpl) {{ route.handler.identifier }}(w http.ResponseWriter,
+{% endif %}
+{% if not route.handler.arguments %}
+    r *http.Request) {
+{% else %}
+    r *http.Request,
+{% for argument in route.handler.arguments %}
+    {{ argument.identifier }} {{ argument_type[argument] }}{{ ',' if not loop.last else ') {' }}
+{% endfor %}
+{% endif %}{# /if not route.handler.arguments #}
+    {% set msg = "Not implemented: %s"|format(route.handler.identifier)|escaped_str %}
+    http.Error(w, {{ msg }}, http.StatusInternalServerError)
+    h.LogErr.Printf({{ msg }})
+}
+{% endfor %}{# /routes #}
+''')
 
 
 @icontract.ensure(lambda result: result.endswith('\n'), "final newline")
-def generate_handler_impl_go(package: str, routes: List[Route]) -> str:
+def generate_handler_impl_go(package: str, routes: List[Route], context_handler: bool = False) -> str:
     """
     Generate a file which implements the handler interface with empty methods.
 
     :param package: name of the package
     :param routes: that a handler will handle
+    :param context_handler: if set, the handler methods receive the context of the request
     :return: Golang code
     """
     text = _HANDLER_IMPL_GO_TPL.render(
         package=package,
         routes=routes,
+        context_handler=context_handler,
         argument_type={
             argument: _express_or_identify_type(argument.typedef)
             for route in routes for argument in route.handler.arguments
@@ -1141,9 +2329,21 @@ package {{ package }}
 
 // Automatically generated file by swagger_to. DO NOT EDIT OR APPEND ANYTHING!
 
+{% if context_handler %}
+import (
+    "context"
+    "net/http"
+)
+
+// Handler defines an interface to handling the routes.
+//
+// The context given to the methods is done when the request is canceled or the time budget of the route
+// (x-swagger-to-timeout) runs out.
+{% else %}
 import "net/http"
 
 // Handler defines an interface to handling the routes.
+{% endif %}
 type Handler interface {
 {% for route in routes %}
     {% if not loop.first %}
@@ -1158,11 +2358,15 @@ Path description:
 {% endif %}{# /if route.description #}
     {% endset %}{# /set handler_description #}
     {{ handler_description|trim|comment|indent }}
-    {% if not route.handler.arguments %}
+    {% if context_handler %}
+    {{ route.handler.identifier }}(ctx context.Context,
+        w http.ResponseWriter,
+    {% else %}
     {{ route.handler.identifier }}(w http.ResponseWriter,
+    {% endif %}
+    {% if not route.handler.arguments %}
         r *http.Request)
     {% else %}
-    {{ route.handler.identifier }}(w http.ResponseWriter,
         r *http.Request,
     {% for argument in route.handler.arguments %}
         {{ argument.identifier }} {{ argument_type[argument] }}{{ ',' if not loop.last else ')' }}
@@ -1177,17 +2381,19 @@ Path description:
 
 
 @icontract.ensure(lambda result: result.endswith('\n'), "final newline")
-def generate_handler_go(package: str, routes: List[Route]) -> str:
+def generate_handler_go(package: str, routes: List[Route], context_handler: bool = False) -> str:
     """
     Generate a file which defines the handler interface.
 
     :param package: name of the package
     :param routes: that a handler will handle
+    :param context_handler: if set, the handler methods receive the context of the request
     :return: Golang code
     """
     text = _HANDLER_GO_TPL.render(
         package=package,
         routes=routes,
+        context_handler=context_handler,
         argument_type={
             argument: _express_or_identify_type(argument.typedef)
             for route in routes for argument in route.handler.arguments
@@ -1196,6 +2402,67 @@ def generate_handler_go(package: str, routes: List[Route]) -> str:
     return swagger_to.indent.reindent(text=text, indention='\t')
 
 
+# Identifier of the JSON schema bundling the definitions shared by all the JSON schemas
+_SHARED_DEFINITIONS_ID = 'swagger-to://definitions.json'
+
+
+def _rewrite_definition_refs(value: Any, prefix: str) -> Any:
+    """
+    Prefix the references to the local definitions in the JSON schema.
+
+    :param value: JSON schema or a part of it
+    :param prefix: to be prepended to the references
+    :return: JSON schema with the rewritten references
+    """
+    if isinstance(value, dict):
+        result = collections.OrderedDict()  # type: MutableMapping[str, Any]
+        for key, item in value.items():
+            if key == '$ref' and isinstance(item, str) and item.startswith('#/definitions/'):
+                result[key] = prefix + item
+            else:
+                result[key] = _rewrite_definition_refs(value=item, prefix=prefix)
+
+        return result
+
+    if isinstance(value, list):
+        return [_rewrite_definition_refs(value=item, prefix=prefix) for item in value]
+
+    return value
+
+
+def _share_definitions(schemas: Mapping[str, JsonSchema]) -> Tuple[str, MutableMapping[str, JsonSchema]]:
+    """
+    Move the definitions of the JSON schemas to a single JSON schema referenced by all of them.
+
+    :param schemas: self-contained JSON schemas
+    :return: JSON text of the shared definitions, JSON schemas referring to the shared definitions
+    """
+    definitions = collections.OrderedDict()  # type: MutableMapping[str, Any]
+    shared_schemas = collections.OrderedDict()  # type: MutableMapping[str, JsonSchema]
+
+    for schema_id, schema in schemas.items():
+        schema_dict = json.loads(schema.text, object_pairs_hook=collections.OrderedDict)
+
+        # The same definition is identical in all the schemas which refer to it.
+        for definition_id, definition in schema_dict.pop('definitions', collections.OrderedDict()).items():
+            if definition_id not in definitions:
+                definitions[definition_id] = definition
+
+        shared_schema = JsonSchema()
+        shared_schema.identifier = schema.identifier
+        shared_schema.text = json.dumps(
+            _rewrite_definition_refs(value=schema_dict, prefix=_SHARED_DEFINITIONS_ID), indent=2)
+
+        shared_schemas[schema_id] = shared_schema
+
+    definitions_dict = collections.OrderedDict()  # type: MutableMapping[str, Any]
+    definitions_dict['id'] = _SHARED_DEFINITIONS_ID
+    definitions_dict['$schema'] = "http://json-schema.org/draft-04/schema#"
+    definitions_dict['definitions'] = definitions
+
+    return json.dumps(definitions_dict, indent=2), shared_schemas
+
+
 _JSON_SCHEMAS_GO_TPL = ENV.from_string('''\
 {# This template must be indented with tabs since we need to include the schema as text and hence can not re-indent
    since re-indention . #}
@@ -1206,40 +2473,156 @@ package {{ package }}
 
 {% if not schemas %}
 // No schemas are defined in the swagger.
+{% if lazy %}
+
+// WarmupSchemas does nothing since there are no JSON schemas to compile.
+func WarmupSchemas() {}
+{% endif %}
 {% else %}
 import (
 	"errors"
 	"fmt"
 	"github.com/xeipuuv/gojsonschema"
+{% if lazy %}
+	"runtime"
+	"sync"
+{% endif %}
 )
 
-func mustNewJSONSchema(text string, name string) *gojsonschema.Schema {
-	loader := gojsonschema.NewStringLoader(text)
-	schema, err := gojsonschema.NewSchema(loader)
+{% if definitions_text is not none %}
+// jsonSchemaDefinitionsText bundles the definitions shared by all the JSON schemas.
+var jsonSchemaDefinitionsText = `{{ definitions_text|replace('`', '` + "`" + `') }}`
+
+func mustNewJSONSchemaLoader(text string) *gojsonschema.SchemaLoader {
+	schemaLoader := gojsonschema.NewSchemaLoader()
+	err := schemaLoader.AddSchemas(gojsonschema.NewStringLoader(text))
 	if err != nil {
-		panic(fmt.Sprintf("failed to load JSON Schema %#v: %s", text, err.Error()))
+		panic(fmt.Sprintf("failed to load the shared JSON Schema definitions: %s", err.Error()))
 	}
-	return schema
+	return schemaLoader
 }
-{% for schema in schemas.values() %}
 
-var jsonSchema{{ schema.identifier|capital_camel_case }}Text = `{{ schema.text|replace('`', '` + "`" + `') }}`
-{% endfor %}
-{% for schema in schemas.values() %}
+{% if lazy %}
+// jsonSchemaLoader resolves the references to the shared definitions. It is loaded on first use.
+var jsonSchemaLoader *gojsonschema.SchemaLoader
 
-var jsonSchema{{ schema.identifier|capital_camel_case }} = mustNewJSONSchema(
-	jsonSchema{{ schema.identifier|capital_camel_case }}Text,
-	{{ schema.identifier|escaped_str }})
-{% endfor %}
-{% for schema in schemas.values() %}
+// jsonSchemaLoaderMu guards jsonSchemaLoader which is not safe for concurrent use.
+var jsonSchemaLoaderMu sync.Mutex
 
-{% set validateFuncName = "ValidateAgainst%sSchema"|format(schema.identifier|capital_camel_case) %}
-// {{ validateFuncName }} validates a message coming from the client against {{ schema.identifier }} schema.
-func {{ validateFuncName }}(bb []byte) error {
-	loader := gojsonschema.NewStringLoader(string(bb))
-	result, err := jsonSchema{{ schema.identifier|capital_camel_case }}.Validate(loader)
-	if err != nil {
-		return err
+func mustNewJSONSchema(text string, name string) *gojsonschema.Schema {
+	jsonSchemaLoaderMu.Lock()
+	defer jsonSchemaLoaderMu.Unlock()
+
+	if jsonSchemaLoader == nil {
+		jsonSchemaLoader = mustNewJSONSchemaLoader(jsonSchemaDefinitionsText)
+	}
+
+	loader := gojsonschema.NewStringLoader(text)
+	schema, err := jsonSchemaLoader.Compile(loader)
+	if err != nil {
+		panic(fmt.Sprintf("failed to load JSON Schema %#v: %s", text, err.Error()))
+	}
+	return schema
+}
+{% else %}
+// jsonSchemaLoader resolves the references to the shared definitions.
+var jsonSchemaLoader = mustNewJSONSchemaLoader(jsonSchemaDefinitionsText)
+
+func mustNewJSONSchema(text string, name string) *gojsonschema.Schema {
+	loader := gojsonschema.NewStringLoader(text)
+	schema, err := jsonSchemaLoader.Compile(loader)
+	if err != nil {
+		panic(fmt.Sprintf("failed to load JSON Schema %#v: %s", text, err.Error()))
+	}
+	return schema
+}
+{% endif %}
+{% else %}
+func mustNewJSONSchema(text string, name string) *gojsonschema.Schema {
+	loader := gojsonschema.NewStringLoader(text)
+	schema, err := gojsonschema.NewSchema(loader)
+	if err != nil {
+		panic(fmt.Sprintf("failed to load JSON Schema %#v: %s", text, err.Error()))
+	}
+	return schema
+}
+{% endif %}
+{% for schema in schemas.values() %}
+
+var jsonSchema{{ schema.identifier|capital_camel_case }}Text = `{{ schema.text|replace('`', '` + "`" + `') }}`
+{% endfor %}
+{% if lazy %}
+
+// lazyJSONSchema compiles the JSON schema on first use.
+type lazyJSONSchema struct {
+	once   sync.Once
+	text   string
+	name   string
+	schema *gojsonschema.Schema
+}
+
+// get compiles the schema on the first call and returns the compiled schema.
+func (l *lazyJSONSchema) get() *gojsonschema.Schema {
+	l.once.Do(func() {
+		l.schema = mustNewJSONSchema(l.text, l.name)
+	})
+	return l.schema
+}
+{% for schema in schemas.values() %}
+
+var jsonSchema{{ schema.identifier|capital_camel_case }} = &lazyJSONSchema{
+	text: jsonSchema{{ schema.identifier|capital_camel_case }}Text,
+	name: {{ schema.identifier|escaped_str }}}
+{% endfor %}
+
+// WarmupSchemas compiles all the JSON schemas concurrently on the available CPUs. Call it at the start-up
+// if the first requests should not pay for the compilation of their schemas.
+func WarmupSchemas() {
+	schemas := []*lazyJSONSchema{
+{% for schema in schemas.values() %}
+		jsonSchema{{ schema.identifier|capital_camel_case }}{{ ',' if not loop.last else '}' }}
+{% endfor %}
+
+	queue := make(chan *lazyJSONSchema, len(schemas))
+	for _, schema := range schemas {
+		queue <- schema
+	}
+	close(queue)
+
+	workers := runtime.GOMAXPROCS(0)
+	if workers > len(schemas) {
+		workers = len(schemas)
+	}
+
+	var wg sync.WaitGroup
+	wg.Add(workers)
+	for i := 0; i < workers; i++ {
+		go func() {
+			defer wg.Done()
+			for schema := range queue {
+				schema.get()
+			}
+		}()
+	}
+	wg.Wait()
+}
+{% else %}
+{% for schema in schemas.values() %}
+
+var jsonSchema{{ schema.identifier|capital_camel_case }} = mustNewJSONSchema(
+	jsonSchema{{ schema.identifier|capital_camel_case }}Text,
+	{{ schema.identifier|escaped_str }})
+{% endfor %}
+{% endif %}
+{% for schema in schemas.values() %}
+
+{% set validateFuncName = "ValidateAgainst%sSchema"|format(schema.identifier|capital_camel_case) %}
+// {{ validateFuncName }} validates a message coming from the client against {{ schema.identifier }} schema.
+func {{ validateFuncName }}(bb []byte) error {
+	loader := gojsonschema.NewStringLoader(string(bb))
+	result, err := jsonSchema{{ schema.identifier|capital_camel_case }}{{ '.get()' if lazy }}.Validate(loader)
+	if err != nil {
+		return err
 	}
 
 	if result.Valid() {
@@ -1264,7 +2647,11 @@ func {{ validateFuncName }}(bb []byte) error {
 
 
 @icontract.ensure(lambda result: result.endswith('\n'), "final newline")
-def generate_json_schemas_go(package: str, routes: List[Route], typedefs: MutableMapping[str, Typedef]) -> str:
+def generate_json_schemas_go(package: str,
+                             routes: List[Route],
+                             typedefs: MutableMapping[str, Typedef],
+                             shared_definitions: bool = False,
+                             lazy: bool = False) -> str:
     """
     Represent the definitions as json schemas and hard-codes them as strings in Go.
 
@@ -1272,9 +2659,17 @@ def generate_json_schemas_go(package: str, routes: List[Route], typedefs: Mutabl
     This is theoretically not the case (some formats are swagger-only), but in most cases
     the literal translation should work.
 
+    By default, each schema is self-contained and embeds all the definitions it references. If shared_definitions
+    is set, the definitions are embedded only once in a separate schema and the other schemas refer to it.
+    This only deduplicates the embedded text; each validator still compiles the definitions it references.
+
     :param package: package name
     :param routes: needed to generate the parameter schemas if they are not already defined in the definitions
     :param typedefs: type definitions to generate the schemas for
+    :param shared_definitions: if set, the text of the definitions is shared between the schemas
+    :param lazy:
+        if set, each schema is compiled on its first use instead of at the package initialization, and
+        WarmupSchemas compiles them all in parallel
     :return: Golang code
     """
     schemas = collections.OrderedDict()  # type: MutableMapping[str, JsonSchema]
@@ -1292,4 +2687,2439 @@ def generate_json_schemas_go(package: str, routes: List[Route], typedefs: Mutabl
         if typedef.json_schema.identifier not in schemas:
             schemas[typedef.json_schema.identifier] = typedef.json_schema
 
-    return _JSON_SCHEMAS_GO_TPL.render(package=package, schemas=schemas)
+    definitions_text = None  # type: Optional[str]
+    if shared_definitions and schemas:
+        definitions_text, schemas = _share_definitions(schemas=schemas)
+
+    return _JSON_SCHEMAS_GO_TPL.render(package=package, schemas=schemas, definitions_text=definitions_text, lazy=lazy)
+
+
+# Go code of the functions checking the string formats; the format checks need the listed imports
+_FORMAT_CHECKS = collections.OrderedDict([
+    ('date', ('isDate', ['time'], '''\
+func isDate(s string) bool {
+    _, err := time.Parse("2006-01-02", s)
+    return err == nil
+}''')),
+    ('email', ('isEmail', ['net/mail'], '''\
+func isEmail(s string) bool {
+    _, err := mail.ParseAddress(s)
+    return err == nil
+}''')),
+    ('ipv4', ('isIPv4', ['net', 'strings'], '''\
+func isIPv4(s string) bool {
+    return net.ParseIP(s) != nil && strings.Contains(s, ".")
+}''')),
+    ('ipv6', ('isIPv6', ['net', 'strings'], '''\
+func isIPv6(s string) bool {
+    return net.ParseIP(s) != nil && strings.Contains(s, ":")
+}''')),
+    ('uri', ('isURI', ['net/url'], '''\
+func isURI(s string) bool {
+    u, err := url.Parse(s)
+    return err == nil && u.Scheme != ""
+}''')),
+    ('uuid', ('isUUID', ['regexp'], '''\
+var uuidRe = regexp.MustCompile(`^[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}$`)
+
+func isUUID(s string) bool {
+    return uuidRe.MatchString(s)
+}''')),
+])  # type: Mapping[str, Tuple[str, List[str], str]]
+
+_DECODE_FUNCTION_TPL = ENV.from_string('''\
+// {{ wire }} is the JSON representation of {{ identifier }} before the validation.
+type {{ wire }} {{ wire_expression }}
+
+// {{ decode }} validates the decoded JSON and converts it to {{ identifier }}.
+func {{ decode }}(wire *{{ wire }}, result *{{ identifier }}) error {
+    {{ statements|indent }}
+
+    return nil
+}''')
+
+_DECODE_BODY_FUNCTION_TPL = ENV.from_string('''\
+// {{ wire }} is the JSON representation of the body argument of {{ handler }} before the validation.
+type {{ wire }} = {{ wire_expression }}
+
+// {{ argument_type }} is the type of the body argument of {{ handler }}.
+type {{ argument_type }} = {{ expression }}
+
+// {{ decode }} validates the decoded JSON body of {{ handler }} and converts it to the argument.
+func {{ decode }}(wire *{{ wire }}, result *{{ argument_type }}) error {
+    {{ statements|indent }}
+
+    return nil
+}''')
+
+
+def _is_nilable(typedef: Typedef) -> bool:
+    """Check whether the zero value of the Go type is nil."""
+    return isinstance(typedef, (Pointerdef, Arraydef, Mapdef, Interfacedef))
+
+
+def _address(expression: str) -> str:
+    """Take the address of the Go expression; pointers are dereferenced as ``*identifier``."""
+    return expression[1:] if expression.startswith('*') else '&' + expression
+
+
+def _select(expression: str, name: str) -> str:
+    """Select the field of the Go expression relying on the implicit dereferencing of the pointers."""
+    return '{}.{}'.format(expression[1:] if expression.startswith('*') else expression, name)
+
+
+def _at(expression: str, index: str) -> str:
+    """Index the Go expression; the dereferenced pointers need to be parenthesized."""
+    if expression.startswith('*'):
+        return '({})[{}]'.format(expression, index)
+
+    return '{}[{}]'.format(expression, index)
+
+
+def _join_path(path: List[Tuple[bool, str]], as_argument: bool = False) -> str:
+    """
+    Join the parts of the JSON pointer to a Go expression.
+
+    :param path: (is literal, text); the literal parts are plain strings, the other parts are Go expressions
+    :param as_argument: if set, the expression is passed as a function argument and gofmt omits the spaces around "+"
+    :return: Go expression concatenating the parts
+    """
+    parts = []  # type: List[str]
+    literal = ''
+    for is_literal, text in path:
+        if is_literal:
+            literal += text
+        else:
+            if literal != '':
+                parts.append(_escaped_str(literal))
+                literal = ''
+            parts.append(text)
+
+    if literal != '' or not parts:
+        parts.append(_escaped_str(literal))
+
+    return ('+' if as_argument else ' + ').join(parts)
+
+
+def _align_fields(fields: List[Tuple[str, str, str]]) -> List[str]:
+    """
+    Align the fields of a struct in columns as gofmt does.
+
+    The fields are aligned in sections; a field whose type spans multiple lines closes its section.
+
+    :param fields: name, type expression and tag of each field
+    :return: lines of the fields
+    """
+    lines = []  # type: List[str]
+
+    start = 0
+    while start < len(fields):
+        end = start
+        while end < len(fields) - 1 and '\n' not in fields[end][1]:
+            end += 1
+
+        section = fields[start:end + 1]
+        name_width = max(len(name) for name, _, _ in section)
+        type_width = max([len(field_type) for _, field_type, _ in section if '\n' not in field_type], default=0)
+
+        for name, field_type, tag in section:
+            if '\n' in field_type:
+                lines.append('{} {} {}'.format(name.ljust(name_width), field_type, tag))
+            else:
+                lines.append('{} {} {}'.format(name.ljust(name_width), field_type.ljust(type_width), tag))
+
+        start = end + 1
+
+    return lines
+
+
+class _TypedValidation:
+    """
+    Generate the Go code which validates the request bodies on the decoded values instead of with JSON schemas.
+
+    The body is first decoded to a wire type which mirrors the Go type except that the required fields are pointers
+    so that their presence can be checked. The generated decode functions check the required fields, the patterns
+    and the formats, and convert the wire value to the Go type. The types which need no checks are decoded directly.
+    """
+
+    def __init__(self, routes: List[Route]) -> None:
+        """
+        Collect the decode functions for the body arguments of the routes.
+
+        :param routes: muxing routes of a Go server stub
+        """
+        self._needs_decoding = dict()  # type: MutableMapping[str, bool]
+
+        # Precompiled regular expressions of the patterns
+        self.pattern_vars = collections.OrderedDict()  # type: MutableMapping[str, str]
+
+        # Formats checked by the generated code
+        self.formats = []  # type: List[str]
+
+        # Code of the wire types and of the decode functions
+        self.functions = collections.OrderedDict()  # type: MutableMapping[str, str]
+
+        self.import_set = set()  # type: Set[str]
+
+        # Argument -> (wire type, name of the decode function)
+        self.body_decoders = collections.OrderedDict()  # type: MutableMapping[Argument, Tuple[str, str]]
+
+        for route in routes:
+            argument = route.wrapper.body_argument
+            if argument is None or argument.typedef is None or not self.needs_decoding(typedef=argument.typedef):
+                continue
+
+            typedef = argument.typedef
+            if typedef.identifier != '' and not isinstance(typedef, Primitivedef):
+                self._define(typedef=typedef)
+                self.body_decoders[argument] = ('wire' + typedef.identifier, 'decode' + typedef.identifier)
+            else:
+                decode = 'decode{}Body'.format(route.handler.identifier)
+                wire = 'wire{}Body'.format(route.handler.identifier)
+
+                self.functions[decode] = ''
+                self.functions[decode] = _DECODE_BODY_FUNCTION_TPL.render(
+                    decode=decode,
+                    handler=route.handler.identifier,
+                    wire=wire,
+                    wire_expression=self.wire_type(typedef=typedef),
+                    argument_type='argument{}Body'.format(route.handler.identifier),
+                    expression=_express_or_identify_type(typedef=typedef),
+                    statements=self._decode(typedef=typedef, wire='*wire', target='*result', path=[], level=0))
+
+                self.body_decoders[argument] = (wire, decode)
+
+    def needs_decoding(self, typedef: Typedef, root: bool = False) -> bool:
+        """
+        Check whether the type needs to be validated or converted after decoding it from JSON.
+
+        :param typedef: Go type definition
+        :param root: if set, the type is inspected even if it is identified
+        :return: True if the wire type differs from the Go type or the value needs to be checked
+        """
+        if typedef.identifier != '' and not root:
+            if typedef.identifier not in self._needs_decoding:
+                self._needs_decoding[typedef.identifier] = self.needs_decoding(typedef=typedef, root=True)
+
+            return self._needs_decoding[typedef.identifier]
+
+        if isinstance(typedef, Primitivedef):
+            return typedef.pattern != '' or (typedef.type == 'string' and typedef.format in _FORMAT_CHECKS)
+
+        if isinstance(typedef, Interfacedef):
+            return False
+
+        if isinstance(typedef, Pointerdef):
+            assert typedef.pointed is not None
+            return self.needs_decoding(typedef=typedef.pointed)
+
+        if isinstance(typedef, Arraydef):
+            assert typedef.items is not None
+            return self.needs_decoding(typedef=typedef.items)
+
+        if isinstance(typedef, Mapdef):
+            assert typedef.values is not None
+            return self.needs_decoding(typedef=typedef.values)
+
+        if isinstance(typedef, Structdef):
+            return len(typedef.required) > 0 or any(
+                self.needs_decoding(typedef=fielddef.typedef) for fielddef in typedef.fields.values()
+                if fielddef.typedef is not None)
+
+        raise NotImplementedError("Unhandled Go type definition of type: {}".format(type(typedef)))
+
+    def wire_type(self, typedef: Typedef) -> str:
+        """Express the wire type corresponding to the Go type."""
+        # The primitive values are checked in place so that they need no separate wire type.
+        if not self.needs_decoding(typedef=typedef) or isinstance(typedef, Primitivedef):
+            return _express_or_identify_type(typedef=typedef)
+
+        if typedef.identifier != '':
+            self._define(typedef=typedef)
+            return 'wire' + typedef.identifier
+
+        return self._express_wire_type(typedef=typedef)
+
+    def _express_wire_type(self, typedef: Typedef) -> str:
+        """Express the wire type of a type which needs decoding regardless of its identifier."""
+        if isinstance(typedef, Pointerdef):
+            assert typedef.pointed is not None
+            return '*' + self.wire_type(typedef=typedef.pointed)
+
+        if isinstance(typedef, Arraydef):
+            assert typedef.items is not None
+            return '[]' + self.wire_type(typedef=typedef.items)
+
+        if isinstance(typedef, Mapdef):
+            assert typedef.values is not None
+            return 'map[string]' + self.wire_type(typedef=typedef.values)
+
+        if isinstance(typedef, Structdef):
+            fields = []  # type: List[Tuple[str, str, str]]
+            for fielddef in typedef.fields.values():
+                assert fielddef.typedef is not None
+
+                field_type = self.wire_type(typedef=fielddef.typedef)
+                if ((fielddef.name in typedef.required or fielddef.presence_bit is not None)
+                        and not _is_nilable(typedef=fielddef.typedef)):
+                    field_type = '*' + field_type
+
+                fields.append((fielddef.name, field_type, '`json:{}`'.format(_escaped_str(fielddef.json_name))))
+
+            lines = ['struct {']
+            lines.extend('    ' + line.replace('\n', '\n    ') for line in _align_fields(fields=fields))
+            lines.append('}')
+            return '\n'.join(lines)
+
+        raise NotImplementedError("Unhandled Go type definition of type: {}".format(type(typedef)))
+
+    def _define(self, typedef: Typedef) -> None:
+        """Define the wire type and the decode function of the identified type."""
+        decode = 'decode' + typedef.identifier
+        if decode in self.functions:
+            return
+
+        # Reserve the name first so that the nested types are defined after this one.
+        self.functions[decode] = ''
+        self.functions[decode] = _DECODE_FUNCTION_TPL.render(
+            identifier=typedef.identifier,
+            wire='wire' + typedef.identifier,
+            decode=decode,
+            wire_expression=self._express_wire_type(typedef=typedef),
+            statements=self._decode(typedef=typedef, wire='*wire', target='*result', path=[], level=0, root=True))
+
+    def _pattern_var(self, pattern: str) -> str:
+        """Give the identifier of the precompiled regular expression."""
+        if pattern not in self.pattern_vars:
+            self.pattern_vars[pattern] = 'pattern{}'.format(len(self.pattern_vars))
+
+        return self.pattern_vars[pattern]
+
+    def _check_primitive(self, typedef: Primitivedef, value: str, path: List[Tuple[bool, str]]) -> List[str]:
+        """Generate the statements which check the pattern and the format of the primitive value."""
+        lines = []  # type: List[str]
+        if typedef.pattern != '':
+            self.import_set.add('regexp')
+            lines.extend([
+                'if !{}.MatchString(string({})) {{'.format(self._pattern_var(pattern=typedef.pattern), value),
+                '    return &validationError{{path: {}, message: {}}}'.format(
+                    _join_path(path), _escaped_str("does not match the pattern: {}".format(typedef.pattern))),
+                '}',
+            ])
+
+        if typedef.type == 'string' and typedef.format in _FORMAT_CHECKS:
+            assert typedef.format is not None
+            if typedef.format not in self.formats:
+                self.formats.append(typedef.format)
+                self.import_set.update(_FORMAT_CHECKS[typedef.format][1])
+
+            lines.extend([
+                'if !{}(string({})) {{'.format(_FORMAT_CHECKS[typedef.format][0], value),
+                '    return &validationError{{path: {}, message: {}}}'.format(
+                    _join_path(path), _escaped_str("is not a valid {}".format(typedef.format))),
+                '}',
+            ])
+
+        return lines
+
+    def _decode(self,
+                typedef: Typedef,
+                wire: str,
+                target: str,
+                path: List[Tuple[bool, str]],
+                level: int,
+                root: bool = False,
+                present: bool = False) -> str:
+        """
+        Generate the statements which validate the wire value and assign it to the target.
+
+        :param typedef: Go type definition of the target
+        :param wire: Go expression of the wire value
+        :param target: Go expression of the target
+        :param path: parts of the JSON pointer to the value; only evaluated on errors
+        :param level: nesting level used to generate unique variable names
+        :param root: if set, the type is decoded according to its structure even if it is identified
+        :param present: if set, the wire value is known not to be nil
+        :return: Go code
+        """
+        # pylint: disable=too-many-arguments,too-many-return-statements
+        if not self.needs_decoding(typedef=typedef, root=root):
+            return '{} = {}'.format(target, wire)
+
+        if isinstance(typedef, Primitivedef):
+            lines = self._check_primitive(typedef=typedef, value=wire, path=path)
+            lines.append('{} = {}'.format(target, wire))
+            return '\n'.join(lines)
+
+        if typedef.identifier != '' and not root:
+            self._define(typedef=typedef)
+            return '\n'.join([
+                'if err := decode{}({}, {}); err != nil {{'.format(typedef.identifier, _address(wire),
+                                                                   _address(target)),
+                '    return prependPath(err, {})'.format(_join_path(path, as_argument=True)),
+                '}',
+            ])
+
+        if isinstance(typedef, Pointerdef):
+            assert typedef.pointed is not None
+            if isinstance(typedef.pointed, Primitivedef):
+                # The value is checked in place and the pointer is re-used.
+                lines = ['if {} != nil {{'.format(wire)]
+                lines.extend('    ' + line
+                             for line in self._check_primitive(typedef=typedef.pointed, value='*' + wire, path=path))
+                lines.extend(['}', '{} = {}'.format(target, wire)])
+                return '\n'.join(lines)
+
+            value = 'value{}'.format(level)
+            return '\n'.join([
+                'if {} != nil {{'.format(wire),
+                '    var {} {}'.format(value, _express_or_identify_type(typedef=typedef.pointed)),
+                textwrap.indent(
+                    self._decode(typedef=typedef.pointed, wire='*' + wire, target=value, path=path, level=level + 1),
+                    '    '),
+                '    {} = &{}'.format(target, value),
+                '}',
+            ])
+
+        expression = typedef.identifier if typedef.identifier != '' else _express_type(typedef=typedef)
+
+        if isinstance(typedef, Arraydef):
+            assert typedef.items is not None
+            self.import_set.add('strconv')
+            index = 'i{}'.format(level)
+            lines = [
+                '{} = make({}, len({}))'.format(target, expression, wire),
+                'for {} := range {} {{'.format(index, wire),
+                textwrap.indent(
+                    self._decode(
+                        typedef=typedef.items,
+                        wire=_at(wire, index),
+                        target=_at(target, index),
+                        path=path + [(True, '/'), (False, 'strconv.Itoa({})'.format(index))],
+                        level=level + 1), '    '),
+                '}',
+            ]
+        elif isinstance(typedef, Mapdef):
+            assert typedef.values is not None
+            key = 'key{}'.format(level)
+            value = 'value{}'.format(level)
+            item = 'item{}'.format(level)
+            lines = [
+                '{} = make({}, len({}))'.format(target, expression, wire),
+                'for {}, {} := range {} {{'.format(key, value, wire),
+                '    var {} {}'.format(item, _express_or_identify_type(typedef=typedef.values)),
+                textwrap.indent(
+                    self._decode(
+                        typedef=typedef.values,
+                        wire=value,
+                        target=item,
+                        path=path + [(True, '/'), (False, key)],
+                        level=level + 1), '    '),
+                '    {}[{}] = {}'.format(target, key, item),
+                '}',
+            ]
+        elif isinstance(typedef, Structdef):
+            blocks = []  # type: List[str]
+            for fielddef in typedef.fields.values():
+                assert fielddef.typedef is not None
+
+                field_wire = _select(wire, fielddef.name)
+                field_path = path + [(True, '/' + fielddef.json_name)]
+
+                block = []  # type: List[str]
+                required = fielddef.name in typedef.required
+                if required:
+                    block.extend([
+                        'if {} == nil {{'.format(field_wire),
+                        '    return &validationError{{path: {}, message: "is required, but missing"}}'.format(
+                            _join_path(field_path)),
+                        '}',
+                    ])
+
+                    if not _is_nilable(typedef=fielddef.typedef):
+                        field_wire = '*' + field_wire
+
+                if fielddef.presence_bit is not None:
+                    assert isinstance(fielddef.typedef, Primitivedef)
+                    block.append('if {} != nil {{'.format(field_wire))
+                    block.extend('    ' + line for line in self._check_primitive(
+                        typedef=fielddef.typedef, value='*' + field_wire, path=field_path))
+                    block.extend([
+                        '    {}(*{})'.format(_select(target, 'Set' + fielddef.name), field_wire),
+                        '}',
+                    ])
+                    blocks.append('\n'.join(block))
+                    continue
+
+                block.append(
+                    self._decode(
+                        typedef=fielddef.typedef,
+                        wire=field_wire,
+                        target=_select(target, fielddef.name),
+                        path=field_path,
+                        level=level + 1,
+                        present=required))
+
+                blocks.append('\n'.join(block))
+
+            return '\n\n'.join(blocks)
+        else:
+            raise NotImplementedError("Unhandled Go type definition of type: {}".format(type(typedef)))
+
+        if present:
+            return '\n'.join(lines)
+
+        return '\n'.join(['if {} != nil {{'.format(wire)] + [textwrap.indent(line, '    ') for line in lines] + ['}'])
+
+
+_VALIDATION_GO_TPL = ENV.from_string('''\
+// Code generated by swagger_to. DO NOT EDIT.
+package {{ package }}
+
+// Automatically generated file by swagger_to. DO NOT EDIT OR APPEND ANYTHING!
+{% if not validation.functions %}
+
+// No request bodies need to be validated.
+{% else %}
+
+{{ imports_code }}
+
+// validationError reports where the decoded request body violates the schema.
+type validationError struct {
+    // path is the JSON pointer to the invalid value.
+    path string
+
+    message string
+}
+
+func (e *validationError) Error() string {
+    if e.path == "" {
+        return e.message
+    }
+    return e.path + ": " + e.message
+}
+
+// prependPath prefixes the path of the validation error with the path to the nested value.
+func prependPath(err error, path string) error {
+    if verr, ok := err.(*validationError); ok {
+        verr.path = path + verr.path
+    }
+    return err
+}
+{% for pattern, identifier in validation.pattern_vars.items() %}
+
+var {{ identifier }} = regexp.MustCompile({{ pattern|escaped_str }})
+{% endfor %}
+{% for format in validation.formats %}
+
+{{ format_checks[format][2] }}
+{% endfor %}
+{% for function in validation.functions.values() %}
+
+{{ function }}
+{% endfor %}
+{% endif %}
+
+// Automatically generated file by swagger_to. DO NOT EDIT OR APPEND ANYTHING!
+
+''')
+
+
+@icontract.ensure(lambda result: result.endswith('\n'), "final newline")
+def generate_validation_go(package: str, routes: List[Route]) -> str:
+    """
+    Generate the file which validates the request bodies on the decoded values.
+
+    The validation covers the required properties, the patterns and the formats of the strings (date, email, ipv4,
+    ipv6, uri and uuid; date-time is checked when decoding to time.Time). Other constraints of the JSON schemas
+    are not checked.
+
+    :param package: name of the package
+    :param routes: routes whose body arguments need to be validated
+    :return: Golang code
+    """
+    validation = _TypedValidation(routes=routes)
+
+    import_set = set(validation.import_set)
+
+    # The time package is referred to only if the wire types or the types of the anonymous body arguments contain
+    # time.Time fields.
+    if any('time.Time' in function for function in validation.functions.values()):
+        import_set.add('time')
+
+    text = _VALIDATION_GO_TPL.render(
+        package=package,
+        imports_code=_state_imports(import_set=import_set),
+        validation=validation,
+        format_checks=_FORMAT_CHECKS)
+
+    return swagger_to.indent.reindent(text=text, indention='\t')
+
+
+_TYPES_JSON_GO_TPL = ENV.from_string('''\
+// Code generated by swagger_to. DO NOT EDIT.
+
+//go:build !swagger_to_reflection
+// +build !swagger_to_reflection
+
+package {{ package }}
+
+// Automatically generated file by swagger_to. DO NOT EDIT OR APPEND ANYTHING!
+{% if not json_methods.functions %}
+
+// No types need JSON methods.
+{% else %}
+
+{{ imports_code }}
+{% for function in json_methods.functions.values() %}
+
+{{ function }}
+{% endfor %}
+
+// jsonReader decodes the JSON values from the data without reflection.
+type jsonReader struct {
+    data  []byte
+    pos   int
+    depth int
+}
+
+// maxJSONDepth limits the nesting of the skipped values as encoding/json does.
+const maxJSONDepth = 10000
+
+// syntaxError reports an unexpected input at the current position.
+func (rd *jsonReader) syntaxError(expected string) error {
+    if rd.pos >= len(rd.data) {
+        return fmt.Errorf("unexpected end of JSON input, expected %s", expected)
+    }
+    return fmt.Errorf("invalid character %q at offset %d, expected %s", rd.data[rd.pos], rd.pos, expected)
+}
+
+// skipSpace skips the white space.
+func (rd *jsonReader) skipSpace() {
+    for rd.pos < len(rd.data) {
+        switch rd.data[rd.pos] {
+        case ' ', '\\t', '\\n', '\\r':
+            rd.pos++
+        default:
+            return
+        }
+    }
+}
+
+// expect consumes the character which needs to follow after the white space.
+func (rd *jsonReader) expect(c byte) error {
+    rd.skipSpace()
+    if rd.pos >= len(rd.data) || rd.data[rd.pos] != c {
+        return rd.syntaxError(strconv.QuoteRune(rune(c)))
+    }
+    rd.pos++
+    return nil
+}
+
+// end checks that only white space follows the decoded value.
+func (rd *jsonReader) end() error {
+    rd.skipSpace()
+    if rd.pos < len(rd.data) {
+        return rd.syntaxError("the end of the input")
+    }
+    return nil
+}
+
+// literal consumes the literal if it follows after the white space.
+func (rd *jsonReader) literal(lit string) bool {
+    rd.skipSpace()
+    if len(rd.data)-rd.pos >= len(lit) && string(rd.data[rd.pos:rd.pos+len(lit)]) == lit {
+        rd.pos += len(lit)
+        return true
+    }
+    return false
+}
+
+// readNull consumes null if it follows.
+func (rd *jsonReader) readNull() bool {
+    return rd.literal("null")
+}
+
+// readBool reads a boolean.
+func (rd *jsonReader) readBool() (bool, error) {
+    if rd.literal("true") {
+        return true, nil
+    }
+    if rd.literal("false") {
+        return false, nil
+    }
+    return false, rd.syntaxError("a boolean")
+}
+
+// readDigits consumes the decimal digits and reports whether there was at least one.
+func (rd *jsonReader) readDigits() bool {
+    start := rd.pos
+    for rd.pos < len(rd.data) && rd.data[rd.pos] >= '0' && rd.data[rd.pos] <= '9' {
+        rd.pos++
+    }
+    return rd.pos > start
+}
+
+// readNumber reads the text of a number.
+func (rd *jsonReader) readNumber() ([]byte, error) {
+    rd.skipSpace()
+    start := rd.pos
+    if rd.pos < len(rd.data) && rd.data[rd.pos] == '-' {
+        rd.pos++
+    }
+    if rd.pos < len(rd.data) && rd.data[rd.pos] == '0' {
+        rd.pos++
+    } else if !rd.readDigits() {
+        return nil, rd.syntaxError("a number")
+    }
+    if rd.pos < len(rd.data) && rd.data[rd.pos] == '.' {
+        rd.pos++
+        if !rd.readDigits() {
+            return nil, rd.syntaxError("a digit")
+        }
+    }
+    if rd.pos < len(rd.data) && (rd.data[rd.pos] == 'e' || rd.data[rd.pos] == 'E') {
+        rd.pos++
+        if rd.pos < len(rd.data) && (rd.data[rd.pos] == '+' || rd.data[rd.pos] == '-') {
+            rd.pos++
+        }
+        if !rd.readDigits() {
+            return nil, rd.syntaxError("a digit")
+        }
+    }
+    return rd.data[start:rd.pos], nil
+}
+
+// readInt reads an integer which fits into the given number of bits.
+func (rd *jsonReader) readInt(bits uint) (int64, error) {
+    num, err := rd.readNumber()
+    if err != nil {
+        return 0, err
+    }
+
+    digits := num
+    if num[0] == '-' {
+        digits = num[1:]
+    }
+
+    limit := uint64(1) << (bits - 1)
+    var value uint64
+    for _, c := range digits {
+        if c < '0' || c > '9' {
+            return 0, fmt.Errorf("cannot unmarshal number %s into an integer", num)
+        }
+        if value > limit/10 {
+            return 0, fmt.Errorf("cannot unmarshal number %s into an integer of %d bits", num, bits)
+        }
+        value = value*10 + uint64(c-'0')
+    }
+
+    if num[0] == '-' {
+        if value > limit {
+            return 0, fmt.Errorf("cannot unmarshal number %s into an integer of %d bits", num, bits)
+        }
+        return -int64(value), nil
+    }
+    if value >= limit {
+        return 0, fmt.Errorf("cannot unmarshal number %s into an integer of %d bits", num, bits)
+    }
+    return int64(value), nil
+}
+
+// readFloat reads a floating-point number of the given number of bits.
+func (rd *jsonReader) readFloat(bits int) (float64, error) {
+    num, err := rd.readNumber()
+    if err != nil {
+        return 0, err
+    }
+    return strconv.ParseFloat(string(num), bits)
+}
+
+// readStringBytes reads the content of a string between the quotes. The content needs to be unescaped if it contains
+// escape sequences or invalid UTF-8, as reported by the second result.
+func (rd *jsonReader) readStringBytes() ([]byte, bool, error) {
+    if err := rd.expect('"'); err != nil {
+        return nil, false, err
+    }
+    start := rd.pos
+    escaped := false
+    ascii := true
+    for rd.pos < len(rd.data) {
+        c := rd.data[rd.pos]
+        switch {
+        case c == '"':
+            content := rd.data[start:rd.pos]
+            rd.pos++
+            return content, escaped || (!ascii && !utf8.Valid(content)), nil
+        case c == '\\\\':
+            escaped = true
+            rd.pos++
+            if rd.pos >= len(rd.data) {
+                return nil, false, rd.syntaxError("an escape sequence")
+            }
+            switch rd.data[rd.pos] {
+            case '"', '\\\\', '/', 'b', 'f', 'n', 'r', 't':
+                rd.pos++
+            case 'u':
+                rd.pos++
+                for i := 0; i < 4; i++ {
+                    if rd.pos >= len(rd.data) || unhex(rd.data[rd.pos]) < 0 {
+                        return nil, false, rd.syntaxError("a hexadecimal digit")
+                    }
+                    rd.pos++
+                }
+            default:
+                return nil, false, rd.syntaxError("an escape sequence")
+            }
+        case c < 0x20:
+            return nil, false, rd.syntaxError("a character in string literal")
+        default:
+            if c >= utf8.RuneSelf {
+                ascii = false
+            }
+            rd.pos++
+        }
+    }
+    return nil, false, rd.syntaxError("the closing quote")
+}
+
+// readString reads a string.
+func (rd *jsonReader) readString() (string, error) {
+    content, escaped, err := rd.readStringBytes()
+    if err != nil {
+        return "", err
+    }
+    if escaped {
+        return string(unescapeJSON(content)), nil
+    }
+    return string(content), nil
+}
+
+// readRaw reads the text of the next value.
+func (rd *jsonReader) readRaw() ([]byte, error) {
+    rd.skipSpace()
+    start := rd.pos
+    if err := rd.skipValue(); err != nil {
+        return nil, err
+    }
+    return rd.data[start:rd.pos], nil
+}
+
+// nextKey reads the key of the next property of the object whose opening brace has been consumed.
+// It reports false once the closing brace has been consumed.
+func (rd *jsonReader) nextKey(first *bool) ([]byte, bool, error) {
+    rd.skipSpace()
+    if rd.pos < len(rd.data) && rd.data[rd.pos] == '}' {
+        rd.pos++
+        return nil, false, nil
+    }
+    if !*first {
+        if rd.pos >= len(rd.data) || rd.data[rd.pos] != ',' {
+            return nil, false, rd.syntaxError("',' or '}'")
+        }
+        rd.pos++
+    }
+    *first = false
+
+    key, escaped, err := rd.readStringBytes()
+    if err != nil {
+        return nil, false, err
+    }
+    if escaped {
+        key = unescapeJSON(key)
+    }
+    if err := rd.expect(':'); err != nil {
+        return nil, false, err
+    }
+    return key, true, nil
+}
+
+// nextItem checks whether the array whose opening bracket has been consumed continues with another item.
+// It reports false once the closing bracket has been consumed.
+func (rd *jsonReader) nextItem(first *bool) (bool, error) {
+    rd.skipSpace()
+    if rd.pos < len(rd.data) && rd.data[rd.pos] == ']' {
+        rd.pos++
+        return false, nil
+    }
+    if !*first {
+        if rd.pos >= len(rd.data) || rd.data[rd.pos] != ',' {
+            return false, rd.syntaxError("',' or ']'")
+        }
+        rd.pos++
+    }
+    *first = false
+    return true, nil
+}
+
+// skipValue skips the next value while checking its syntax.
+func (rd *jsonReader) skipValue() error {
+    rd.skipSpace()
+    if rd.pos >= len(rd.data) {
+        return rd.syntaxError("a value")
+    }
+
+    switch rd.data[rd.pos] {
+    case '{', '[':
+        closing := rd.data[rd.pos] == '{'
+        rd.pos++
+        rd.depth++
+        if rd.depth > maxJSONDepth {
+            return fmt.Errorf("exceeded max depth of %d at offset %d", maxJSONDepth, rd.pos)
+        }
+        for first := true; ; {
+            var ok bool
+            var err error
+            if closing {
+                _, ok, err = rd.nextKey(&first)
+            } else {
+                ok, err = rd.nextItem(&first)
+            }
+            if err != nil {
+                return err
+            }
+            if !ok {
+                break
+            }
+            if err := rd.skipValue(); err != nil {
+                return err
+            }
+        }
+        rd.depth--
+        return nil
+    case '"':
+        _, _, err := rd.readStringBytes()
+        return err
+    case 't', 'f':
+        _, err := rd.readBool()
+        return err
+    case 'n':
+        if !rd.readNull() {
+            return rd.syntaxError("null")
+        }
+        return nil
+    default:
+        _, err := rd.readNumber()
+        return err
+    }
+}
+
+// unhex decodes the hexadecimal digit or gives -1.
+func unhex(c byte) rune {
+    switch {
+    case c >= '0' && c <= '9':
+        return rune(c - '0')
+    case c >= 'a' && c <= 'f':
+        return rune(c - 'a' + 10)
+    case c >= 'A' && c <= 'F':
+        return rune(c - 'A' + 10)
+    }
+    return -1
+}
+
+// unhex4 decodes four hexadecimal digits whose syntax has already been checked.
+func unhex4(text []byte) rune {
+    return unhex(text[0])<<12 | unhex(text[1])<<8 | unhex(text[2])<<4 | unhex(text[3])
+}
+
+// unescapeJSON decodes the escape sequences of a string whose syntax has already been checked and replaces
+// the invalid UTF-8 with the replacement character as encoding/json does.
+func unescapeJSON(content []byte) []byte {
+    out := make([]byte, 0, len(content))
+    for i := 0; i < len(content); {
+        c := content[i]
+        switch {
+        case c == '\\\\':
+            switch content[i+1] {
+            case 'b':
+                out = append(out, '\\b')
+            case 'f':
+                out = append(out, '\\f')
+            case 'n':
+                out = append(out, '\\n')
+            case 'r':
+                out = append(out, '\\r')
+            case 't':
+                out = append(out, '\\t')
+            case 'u':
+                r := unhex4(content[i+2 : i+6])
+                i += 4
+                if utf16.IsSurrogate(r) {
+                    decoded := unicode.ReplacementChar
+                    if i+8 <= len(content) && content[i+2] == '\\\\' && content[i+3] == 'u' {
+                        decoded = utf16.DecodeRune(r, unhex4(content[i+4:i+8]))
+                        if decoded != unicode.ReplacementChar {
+                            i += 6
+                        }
+                    }
+                    r = decoded
+                }
+                var encoded [utf8.UTFMax]byte
+                out = append(out, encoded[:utf8.EncodeRune(encoded[:], r)]...)
+            default:
+                out = append(out, content[i+1])
+            }
+            i += 2
+        case c < utf8.RuneSelf:
+            out = append(out, c)
+            i++
+        default:
+            r, size := utf8.DecodeRune(content[i:])
+            if r == utf8.RuneError && size == 1 {
+                out = append(out, "\\ufffd"...)
+            } else {
+                out = append(out, content[i:i+size]...)
+            }
+            i += size
+        }
+    }
+    return out
+}
+
+// jsonFoldField gives the index of the name which matches the key case-insensitively, or -1 if there is none.
+func jsonFoldField(key []byte, names ...string) int {
+    for i, name := range names {
+        if strings.EqualFold(string(key), name) {
+            return i
+        }
+    }
+    return -1
+}
+
+// appendJSONString appends the string encoded as JSON with the same escaping as encoding/json.
+func appendJSONString(buf []byte, s string) []byte {
+    const hex = "0123456789abcdef"
+    buf = append(buf, '"')
+    start := 0
+    for i := 0; i < len(s); {
+        c := s[i]
+        if c < utf8.RuneSelf {
+            if c >= 0x20 && c != '"' && c != '\\\\' && c != '<' && c != '>' && c != '&' {
+                i++
+                continue
+            }
+            buf = append(buf, s[start:i]...)
+            switch c {
+            case '"', '\\\\':
+                buf = append(buf, '\\\\', c)
+            case '\\n':
+                buf = append(buf, '\\\\', 'n')
+            case '\\r':
+                buf = append(buf, '\\\\', 'r')
+            case '\\t':
+                buf = append(buf, '\\\\', 't')
+            default:
+                buf = append(buf, '\\\\', 'u', '0', '0', hex[c>>4], hex[c&0xF])
+            }
+            i++
+            start = i
+            continue
+        }
+        r, size := utf8.DecodeRuneInString(s[i:])
+        if r == utf8.RuneError && size == 1 {
+            buf = append(buf, s[start:i]...)
+            buf = append(buf, `\\ufffd`...)
+            i += size
+            start = i
+            continue
+        }
+        if r == '\\u2028' || r == '\\u2029' {
+            buf = append(buf, s[start:i]...)
+            buf = append(buf, '\\\\', 'u', '2', '0', '2', hex[r&0xF])
+            i += size
+            start = i
+            continue
+        }
+        i += size
+    }
+    buf = append(buf, s[start:]...)
+    return append(buf, '"')
+}
+{% if json_methods.uses_float %}
+
+// appendJSONFloat appends the floating-point number formatted as encoding/json does.
+func appendJSONFloat(buf []byte, f float64, bits int) ([]byte, error) {
+    if math.IsInf(f, 0) || math.IsNaN(f) {
+        return buf, fmt.Errorf("json: unsupported value: %s", strconv.FormatFloat(f, 'g', -1, bits))
+    }
+
+    format := byte('f')
+    if abs := math.Abs(f); abs != 0 {
+        if bits == 64 && (abs < 1e-6 || abs >= 1e21) || bits == 32 && (float32(abs) < 1e-6 || float32(abs) >= 1e21) {
+            format = 'e'
+        }
+    }
+    buf = strconv.AppendFloat(buf, f, format, -1, bits)
+    if format == 'e' {
+        // Clean up e-09 to e-9.
+        n := len(buf)
+        if n >= 4 && buf[n-4] == 'e' && buf[n-3] == '-' && buf[n-2] == '0' {
+            buf[n-2] = buf[n-1]
+            buf = buf[:n-1]
+        }
+    }
+    return buf, nil
+}
+{% endif %}
+{% if json_methods.uses_time %}
+
+// appendJSONTime appends the time formatted as time.Time.MarshalJSON does.
+func appendJSONTime(buf []byte, t time.Time) ([]byte, error) {
+    if y := t.Year(); y < 0 || y >= 10000 {
+        return buf, errors.New("Time.MarshalJSON: year outside of range [0,9999]")
+    }
+    buf = append(buf, '"')
+    buf = t.AppendFormat(buf, time.RFC3339Nano)
+    return append(buf, '"'), nil
+}
+{% endif %}
+{% if json_methods.uses_value %}
+
+// appendJSONValue appends the value of an unknown type encoded by encoding/json.
+func appendJSONValue(buf []byte, value interface{}) ([]byte, error) {
+    encoded, err := json.Marshal(value)
+    if err != nil {
+        return buf, err
+    }
+    return append(buf, encoded...), nil
+}
+{% endif %}
+{% endif %}
+
+// Automatically generated file by swagger_to. DO NOT EDIT OR APPEND ANYTHING!
+
+''')
+
+_JSON_METHODS_TPL = ENV.from_string('''\
+// AppendJSON appends {{ identifier }} encoded as JSON to the buffer without reflection.
+func (x *{{ identifier }}) AppendJSON(buf []byte) ([]byte, error) {
+{% if 'err' in encode %}
+    var err error
+{% endif %}
+    {{ encode|indent }}
+    return buf, nil
+}
+{% if tracks_presence %}
+
+// MarshalJSON encodes {{ identifier }} as JSON; the optional fields which are not set are omitted.
+func (x {{ identifier }}) MarshalJSON() ([]byte, error) {
+    return x.AppendJSON(nil)
+}
+{% endif %}
+
+// UnmarshalJSON decodes {{ identifier }} from JSON without reflection.
+func (x *{{ identifier }}) UnmarshalJSON(data []byte) error {
+    rd := jsonReader{data: data}
+    if err := x.decodeJSON(&rd); err != nil {
+        return err
+    }
+    return rd.end()
+}
+
+// decodeJSON decodes the next JSON value from the reader into {{ identifier }}.
+func (x *{{ identifier }}) decodeJSON(rd *jsonReader) error {
+    {{ decode|indent }}
+    return nil
+}''')
+
+
+def _raw_str(text: str) -> str:
+    """Express the text as a raw Golang string if possible so that the quotes need no escaping."""
+    if '`' in text or '\r' in text:
+        return _escaped_str(text)
+
+    return '`{}`'.format(text)
+
+
+# Go primitive type -> number of bits given to the reader of the integers
+_INT_BITS = {'int': 'strconv.IntSize', 'int32': '32', 'int64': '64'}
+
+
+class _JsonMethods:
+    """
+    Generate the JSON methods of the structs, arrays and maps which encode and decode without reflection.
+
+    The methods follow the conventions of encoding/json: the optional fields are omitted when empty, the keys of
+    the maps are sorted, the property names are matched case-insensitively and the unknown properties are skipped.
+    Unlike encoding/json, the decoding stops at the first error.
+
+    Only AppendJSON is generated for encoding. A MarshalJSON method would make json.Marshal slower since
+    encoding/json validates and compacts the output of the marshalers.
+    """
+
+    def __init__(self, typedefs: Mapping[str, Typedef]) -> None:
+        """
+        Generate the methods of the identified types.
+
+        :param typedefs: table of type definitions
+        """
+        # Code of the methods by type identifier
+        self.functions = collections.OrderedDict()  # type: MutableMapping[str, str]
+
+        self.import_set = {'fmt', 'strconv', 'strings', 'unicode', 'unicode/utf16', 'unicode/utf8'}
+
+        self.uses_float = False
+        self.uses_time = False
+        self.uses_value = False
+
+        for typedef in typedefs.values():
+            if not isinstance(typedef, (Structdef, Arraydef, Mapdef)):
+                continue
+
+            value = 'x' if isinstance(typedef, Structdef) else '*x'
+
+            self.functions[typedef.identifier] = _JSON_METHODS_TPL.render(
+                identifier=typedef.identifier,
+                encode=self._encode(typedef=typedef, value=value, level=0, root=True),
+                decode=self._decode(typedef=typedef, target=value, level=0, root=True),
+                tracks_presence=isinstance(typedef, Structdef) and _presence_words(typedef=typedef) > 0)
+
+        if self.uses_float:
+            self.import_set.add('math')
+
+        if self.uses_time:
+            self.import_set.update(['errors', 'time'])
+
+        if self.uses_value:
+            self.import_set.add('encoding/json')
+
+    def _encode(self, typedef: Typedef, value: str, level: int, root: bool = False, non_nil: bool = False) -> str:
+        """
+        Generate the statements which append the value encoded as JSON to buf.
+
+        :param typedef: Go type definition of the value
+        :param value: addressable Go expression of the value
+        :param level: nesting level used to name the variables
+        :param root: if set, the identified type is encoded inline instead of calling its method
+        :param non_nil: if set, the value is known not to be nil and null needs not be encoded
+        :return: Go code
+        """
+        # pylint: disable=too-many-arguments,too-many-return-statements
+        if typedef.identifier != '' and not root and isinstance(typedef, (Structdef, Arraydef, Mapdef)):
+            return '\n'.join([
+                'buf, err = {}(buf)'.format(_select(value, 'AppendJSON')),
+                'if err != nil {',
+                '    return buf, err',
+                '}',
+            ])
+
+        if isinstance(typedef, Primitivedef):
+            if typedef.type == 'string':
+                converted = value if typedef.identifier == '' else 'string({})'.format(value)
+                return 'buf = appendJSONString(buf, {})'.format(converted)
+
+            if typedef.type in _INT_BITS:
+                return 'buf = strconv.AppendInt(buf, int64({}), 10)'.format(value)
+
+            if typedef.type == 'bool':
+                converted = value if typedef.identifier == '' else 'bool({})'.format(value)
+                return 'buf = strconv.AppendBool(buf, {})'.format(converted)
+
+            if typedef.type in ['float32', 'float64']:
+                self.uses_float = True
+                call = 'appendJSONFloat(buf, float64({}), {})'.format(value, typedef.type[len('float'):])
+            elif typedef.type == 'time.Time':
+                self.uses_time = True
+                converted = value if typedef.identifier == '' else 'time.Time({})'.format(value)
+                call = 'appendJSONTime(buf, {})'.format(converted)
+            else:
+                raise NotImplementedError("Unhandled Go primitive type: {}".format(typedef.type))
+
+            return '\n'.join(['buf, err = {}'.format(call), 'if err != nil {', '    return buf, err', '}'])
+
+        if isinstance(typedef, Interfacedef):
+            self.uses_value = True
+            return '\n'.join(
+                ['buf, err = appendJSONValue(buf, {})'.format(value), 'if err != nil {', '    return buf, err', '}'])
+
+        if isinstance(typedef, Pointerdef):
+            assert typedef.pointed is not None
+            pointed = typedef.pointed
+            if pointed.identifier != '' and isinstance(pointed, (Structdef, Arraydef, Mapdef)):
+                # The methods of the identified types are called on the pointer.
+                pointed_value = value
+            else:
+                pointed_value = '*' + value
+
+            return self._encode_nilable(
+                value=value,
+                code=self._encode(typedef=pointed, value=pointed_value, level=level + 1, root=pointed_value != value),
+                non_nil=non_nil)
+
+        if isinstance(typedef, Arraydef):
+            assert typedef.items is not None
+            index = 'i{}'.format(level)
+            code = '\n'.join([
+                "buf = append(buf, '[')",
+                'for {} := range {} {{'.format(index, value),
+                '    if {} > 0 {{'.format(index),
+                "        buf = append(buf, ',')",
+                '    }',
+                textwrap.indent(self._encode(typedef=typedef.items, value=_at(value, index), level=level + 1), ' ' * 4),
+                '}',
+                "buf = append(buf, ']')",
+            ])
+            return self._encode_nilable(value=value, code=code, non_nil=non_nil)
+
+        if isinstance(typedef, Mapdef):
+            assert typedef.values is not None
+            self.import_set.add('sort')
+            keys = 'keys{}'.format(level)
+            index = 'i{}'.format(level)
+            key = 'key{}'.format(level)
+            item = 'item{}'.format(level)
+            code = '\n'.join([
+                '{} := make([]string, 0, len({}))'.format(keys, value),
+                'for {} := range {} {{'.format(key, value),
+                '    {0} = append({0}, {1})'.format(keys, key),
+                '}',
+                'sort.Strings({})'.format(keys),
+                '',
+                "buf = append(buf, '{')",
+                'for {}, {} := range {} {{'.format(index, key, keys),
+                '    if {} > 0 {{'.format(index),
+                "        buf = append(buf, ',')",
+                '    }',
+                '    buf = appendJSONString(buf, {})'.format(key),
+                "    buf = append(buf, ':')",
+                '    {} := {}'.format(item, _at(value, key)),
+                textwrap.indent(self._encode(typedef=typedef.values, value=item, level=level + 1), ' ' * 4),
+                '}',
+                "buf = append(buf, '}')",
+            ])
+            return self._encode_nilable(value=value, code=code, non_nil=non_nil)
+
+        if isinstance(typedef, Structdef):
+            return self._encode_struct(typedef=typedef, value=value, level=level)
+
+        raise NotImplementedError("Unhandled Go type definition of type: {}".format(type(typedef)))
+
+    @staticmethod
+    def _encode_nilable(value: str, code: str, non_nil: bool) -> str:
+        """Encode nil as null unless the value is known not to be nil."""
+        if non_nil:
+            return code
+
+        return '\n'.join([
+            'if {} == nil {{'.format(value),
+            '    buf = append(buf, "null"...)',
+            '} else {',
+            textwrap.indent(code, '    '),
+            '}',
+        ])
+
+    def _encode_struct(self, typedef: Structdef, value: str, level: int) -> str:
+        """Generate the statements which append the struct encoded as JSON to buf."""
+        if not typedef.fields:
+            return 'buf = append(buf, "{}"...)'
+
+        # The separators are known in advance if the first field is always encoded. Otherwise, the separator
+        # is tracked at run time as encoding/json does.
+        fielddefs = list(typedef.fields.values())
+        assert fielddefs[0].typedef is not None
+        dynamic = fielddefs[0].presence_bit is not None or (fielddefs[0].name not in typedef.required
+                                                            and _is_nilable(typedef=fielddefs[0].typedef))
+        separator = 'separator{}'.format(level)
+
+        blocks = []  # type: List[str]
+        if dynamic:
+            blocks.append("{} := byte('{{')".format(separator))
+
+        for i, fielddef in enumerate(fielddefs):
+            assert fielddef.typedef is not None
+
+            field_value = _select(value, fielddef.name)
+            name = json.dumps(fielddef.json_name, ensure_ascii=False) + ':'
+
+            if dynamic:
+                lines = [
+                    'buf = append(buf, {})'.format(separator), '{} = \',\''.format(separator),
+                    'buf = append(buf, {}...)'.format(_raw_str(name))
+                ]
+            else:
+                prefix = '{' if i == 0 else ','
+                lines = ['buf = append(buf, {}...)'.format(_raw_str(prefix + name))]
+
+            omittable = fielddef.presence_bit is not None or (fielddef.name not in typedef.required
+                                                              and _is_nilable(typedef=fielddef.typedef))
+            lines.append(self._encode(typedef=fielddef.typedef, value=field_value, level=level + 1, non_nil=omittable))
+
+            if omittable:
+                if fielddef.presence_bit is not None:
+                    condition = '{}&(1<<{}) != 0'.format(
+                        _presence_word(value, fielddef.presence_bit), fielddef.presence_bit % 64)
+                elif isinstance(fielddef.typedef, (Arraydef, Mapdef)):
+                    condition = 'len({}) > 0'.format(field_value)
+                else:
+                    condition = '{} != nil'.format(field_value)
+
+                blocks.append(
+                    '\n'.join(['if {} {{'.format(condition)] + [textwrap.indent(line, '    ')
+                                                                for line in lines] + ['}']))
+            else:
+                blocks.append('\n'.join(lines))
+
+        if dynamic:
+            blocks.append('\n'.join(['if {} == \'{{\' {{'.format(separator), "    buf = append(buf, '{')", '}']))
+
+        blocks.append("buf = append(buf, '}')")
+
+        return '\n\n'.join(blocks)
+
+    def _decode(self, typedef: Typedef, target: str, level: int, root: bool = False, non_null: bool = False) -> str:
+        """
+        Generate the statements which decode the next JSON value from the reader rd into the target.
+
+        :param typedef: Go type definition of the target
+        :param target: addressable Go expression of the target
+        :param level: nesting level used to name the variables
+        :param root: if set, the identified type is decoded inline instead of calling its method
+        :param non_null: if set, the next JSON value is known not to be null
+        :return: Go code
+        """
+        # pylint: disable=too-many-arguments,too-many-return-statements
+        if typedef.identifier != '' and not root and isinstance(typedef, (Structdef, Arraydef, Mapdef)):
+            return '\n'.join([
+                'if err := {}(rd); err != nil {{'.format(_select(target, 'decodeJSON')),
+                '    return err',
+                '}',
+            ])
+
+        if isinstance(typedef, Primitivedef):
+            return self._decode_primitive(typedef=typedef, target=target, non_null=non_null)
+
+        if isinstance(typedef, Interfacedef):
+            self.uses_value = True
+            return '\n'.join([
+                'if raw, err := rd.readRaw(); err != nil {',
+                '    return err',
+                '}} else if err := json.Unmarshal(raw, {}); err != nil {{'.format(_address(target)),
+                '    return err',
+                '}',
+            ])
+
+        lines = []  # type: List[str]
+
+        if isinstance(typedef, Pointerdef):
+            assert typedef.pointed is not None
+            pointed = typedef.pointed
+            lines = [
+                'if {} == nil {{'.format(target),
+                '    {} = new({})'.format(target, _express_or_identify_type(typedef=pointed)),
+                '}',
+                self._decode(typedef=pointed, target='*' + target, level=level + 1, non_null=True),
+            ]
+
+        elif isinstance(typedef, Arraydef):
+            assert typedef.items is not None
+            first = 'first{}'.format(level)
+            item = 'item{}'.format(level)
+            expression = typedef.identifier if typedef.identifier != '' else _express_type(typedef=typedef)
+            lines = [
+                "if err := rd.expect('['); err != nil {",
+                '    return err',
+                '}',
+                '',
+                '{} = {}'.format(target, _at(target, ':0')),
+                'for {} := true; ; {{'.format(first),
+                '    if ok, err := rd.nextItem(&{}); err != nil {{'.format(first),
+                '        return err',
+                '    } else if !ok {',
+                '        break',
+                '    }',
+                '',
+                '    var {} {}'.format(item, _express_or_identify_type(typedef=typedef.items).replace('\n', '\n    ')),
+                textwrap.indent(self._decode(typedef=typedef.items, target=item, level=level + 1), '    '),
+                '    {0} = append({0}, {1})'.format(target, item),
+                '}',
+                '',
+                'if {} == nil {{'.format(target),
+                '    {} = {}{{}}'.format(target, expression.replace('\n', '\n    ')),
+                '}',
+            ]
+
+        elif isinstance(typedef, Mapdef):
+            assert typedef.values is not None
+            first = 'first{}'.format(level)
+            key = 'key{}'.format(level)
+            item = 'item{}'.format(level)
+            expression = typedef.identifier if typedef.identifier != '' else _express_type(typedef=typedef)
+            lines = [
+                "if err := rd.expect('{'); err != nil {",
+                '    return err',
+                '}',
+                '',
+                'if {} == nil {{'.format(target),
+                '    {} = make({})'.format(target, expression),
+                '}',
+                'for {} := true; ; {{'.format(first),
+                '    {}, ok, err := rd.nextKey(&{})'.format(key, first),
+                '    if err != nil {',
+                '        return err',
+                '    } else if !ok {',
+                '        break',
+                '    }',
+                '',
+                '    var {} {}'.format(item, _express_or_identify_type(typedef=typedef.values).replace('\n', '\n    ')),
+                textwrap.indent(self._decode(typedef=typedef.values, target=item, level=level + 1), '    '),
+                '    {} = {}'.format(_at(target, 'string({})'.format(key)), item),
+                '}',
+            ]
+
+        elif isinstance(typedef, Structdef):
+            return self._decode_struct(typedef=typedef, target=target, level=level, non_null=non_null)
+
+        else:
+            raise NotImplementedError("Unhandled Go type definition of type: {}".format(type(typedef)))
+
+        if non_null:
+            return '\n'.join(lines)
+
+        # The null sets the nilable values to nil.
+        return '\n'.join(['if rd.readNull() {', '    {} = nil'.format(target), '} else {'] +
+                         [textwrap.indent(line, '    ') if line else line for line in lines] + ['}'])
+
+    def _decode_primitive(self, typedef: Primitivedef, target: str, non_null: bool) -> str:
+        """Generate the statements which decode the primitive value; null leaves the target unchanged."""
+        if typedef.type == 'time.Time':
+            # time.Time ignores null by itself.
+            self.uses_time = True
+            unmarshal = (_select(target, 'UnmarshalJSON')
+                         if typedef.identifier == '' else '(*time.Time)({}).UnmarshalJSON'.format(_address(target)))
+            return '\n'.join([
+                'if raw, err := rd.readRaw(); err != nil {',
+                '    return err',
+                '}} else if err := {}(raw); err != nil {{'.format(unmarshal),
+                '    return err',
+                '}',
+            ])
+
+        if typedef.type == 'string':
+            read = 'rd.readString()'
+            converted = 'value'
+        elif typedef.type in _INT_BITS:
+            read = 'rd.readInt({})'.format(_INT_BITS[typedef.type])
+            converted = '{}(value)'.format(typedef.type)
+        elif typedef.type in ['float32', 'float64']:
+            read = 'rd.readFloat({})'.format(typedef.type[len('float'):])
+            converted = '{}(value)'.format(typedef.type)
+        elif typedef.type == 'bool':
+            read = 'rd.readBool()'
+            converted = 'value'
+        else:
+            raise NotImplementedError("Unhandled Go primitive type: {}".format(typedef.type))
+
+        if typedef.identifier != '':
+            converted = '{}(value)'.format(typedef.identifier)
+        elif converted == 'float64(value)':
+            converted = 'value'
+
+        lines = [
+            'value, err := {}'.format(read),
+            'if err != nil {',
+            '    return err',
+            '}',
+            '{} = {}'.format(target, converted),
+        ]
+
+        if non_null:
+            return '\n'.join(lines)
+
+        return '\n'.join(['if !rd.readNull() {'] + [textwrap.indent(line, '    ') for line in lines] + ['}'])
+
+    def _decode_struct(self, typedef: Structdef, target: str, level: int, non_null: bool) -> str:
+        """Generate the statements which decode the object into the struct; null leaves the target unchanged."""
+        first = 'first{}'.format(level)
+        key = 'key{}'.format(level)
+        field = 'field{}'.format(level)
+
+        fielddefs = list(typedef.fields.values())
+        names = [_escaped_str(fielddef.json_name) for fielddef in fielddefs]
+
+        lines = [
+            "if err := rd.expect('{'); err != nil {",
+            '    return err',
+            '}',
+            '',
+            'for {} := true; ; {{'.format(first),
+            '    {}, ok, err := rd.nextKey(&{})'.format(key if fielddefs else '_', first),
+            '    if err != nil {',
+            '        return err',
+            '    } else if !ok {',
+            '        break',
+            '    }',
+            '',
+        ]
+
+        if not fielddefs:
+            lines.extend(['    if err := rd.skipValue(); err != nil {', '        return err', '    }', '}'])
+        else:
+            # The exact names are matched first and the case-insensitive matches are looked up only as a fallback
+            # as encoding/json does.
+            lines.extend(['    var {} int'.format(field), '    switch string({}) {{'.format(key)])
+            for i, name in enumerate(names):
+                lines.extend(['    case {}:'.format(name), '        {} = {}'.format(field, i)])
+            lines.extend([
+                '    default:',
+                '        {} = jsonFoldField({}, {})'.format(field, key, ', '.join(names)),
+                '    }',
+                '',
+                '    switch {} {{'.format(field),
+            ])
+
+            for i, fielddef in enumerate(fielddefs):
+                assert fielddef.typedef is not None
+                lines.append('    case {}:'.format(i))
+
+                field_target = _select(target, fielddef.name)
+                if fielddef.presence_bit is None:
+                    lines.append(
+                        textwrap.indent(
+                            self._decode(typedef=fielddef.typedef, target=field_target, level=level + 1), ' ' * 8))
+                    continue
+
+                # The null unsets the field as it would set a pointer to nil.
+                lines.extend([
+                    '        if rd.readNull() {',
+                    '            {}()'.format(_select(target, 'Clear' + fielddef.name)),
+                    '        } else {',
+                    textwrap.indent(
+                        self._decode(typedef=fielddef.typedef, target=field_target, level=level + 1, non_null=True),
+                        ' ' * 12),
+                    '            {} |= 1 << {}'.format(
+                        _presence_word(target, fielddef.presence_bit), fielddef.presence_bit % 64),
+                    '        }',
+                ])
+
+            lines.extend([
+                '    default:',
+                '        if err := rd.skipValue(); err != nil {',
+                '            return err',
+                '        }',
+                '    }',
+                '}',
+            ])
+
+        if non_null:
+            return '\n'.join(lines)
+
+        return '\n'.join(['if !rd.readNull() {'] + [textwrap.indent(line, '    ') if line else line
+                                                    for line in lines] + ['}'])
+
+
+@icontract.ensure(lambda result: result.endswith('\n'), "final newline")
+def generate_types_json_go(package: str, typedefs: Mapping[str, Typedef]) -> str:
+    """
+    Generate the file which defines the JSON methods of the types without reflection.
+
+    The file is excluded from the build with the build tag swagger_to_reflection so that the generated methods can be
+    benchmarked against encoding/json.
+
+    :param package: name of the package
+    :param typedefs: type definitions whose structs, arrays and maps are given the methods
+    :return: Golang code
+    """
+    json_methods = _JsonMethods(typedefs=typedefs)
+
+    text = _TYPES_JSON_GO_TPL.render(
+        package=package, imports_code=_state_imports(import_set=json_methods.import_set), json_methods=json_methods)
+
+    return swagger_to.indent.reindent(text=text, indention='\t')
+
+
+_TYPES_PRESENCE_REFLECTION_GO_TPL = ENV.from_string('''\
+// Code generated by swagger_to. DO NOT EDIT.
+
+//go:build swagger_to_reflection
+// +build swagger_to_reflection
+
+package {{ package }}
+
+// Automatically generated file by swagger_to. DO NOT EDIT OR APPEND ANYTHING!
+//
+// The structs which record the presence of their optional fields need JSON methods even if the generated
+// JSON methods are excluded with the build tag swagger_to_reflection. The methods in this file encode and decode
+// them with encoding/json through wire structs whose optional fields are pointers.
+
+{{ imports_code }}
+{% for typedef in typedefs %}
+{% set wire = 'jsonWire' + typedef.identifier %}
+
+// {{ wire }} mirrors {{ typedef.identifier }} for encoding/json.
+type {{ wire }} struct {
+{% for line in wire_fields[typedef] %}
+    {{ line|indent }}
+{% endfor %}
+}
+
+// MarshalJSON encodes {{ typedef.identifier }} as JSON; the optional fields which are not set are omitted.
+func (x {{ typedef.identifier }}) MarshalJSON() ([]byte, error) {
+    var wire {{ wire }}
+{% for fielddef in typedef.fields.values() %}
+{% if fielddef.presence_bit is none %}
+    wire.{{ fielddef.name }} = x.{{ fielddef.name }}
+{% else %}
+    if x.Has{{ fielddef.name }}() {
+        wire.{{ fielddef.name }} = &x.{{ fielddef.name }}
+    }
+{% endif %}
+{% endfor %}
+    return json.Marshal(&wire)
+}
+
+// UnmarshalJSON decodes {{ typedef.identifier }} from JSON. The properties missing in the data leave the fields unchanged
+// as encoding/json does.
+func (x *{{ typedef.identifier }}) UnmarshalJSON(data []byte) error {
+    var wire {{ wire }}
+{% for fielddef in typedef.fields.values() %}
+{% if fielddef.presence_bit is none %}
+    wire.{{ fielddef.name }} = x.{{ fielddef.name }}
+{% else %}
+    if x.Has{{ fielddef.name }}() {
+        wire.{{ fielddef.name }} = &x.{{ fielddef.name }}
+    }
+{% endif %}
+{% endfor %}
+
+    if err := json.Unmarshal(data, &wire); err != nil {
+        return err
+    }
+
+{% for fielddef in typedef.fields.values() %}
+{% if fielddef.presence_bit is none %}
+    x.{{ fielddef.name }} = wire.{{ fielddef.name }}
+{% else %}
+    if wire.{{ fielddef.name }} != nil {
+        x.Set{{ fielddef.name }}(*wire.{{ fielddef.name }})
+    } else {
+        x.Clear{{ fielddef.name }}()
+    }
+{% endif %}
+{% endfor %}
+    return nil
+}
+{% endfor %}
+
+// Automatically generated file by swagger_to. DO NOT EDIT OR APPEND ANYTHING!
+
+''')
+
+
+def tracks_presence(typedefs: Mapping[str, Typedef]) -> bool:
+    """Check whether any of the structs records the presence of its optional fields in a bitset."""
+    return any(isinstance(typedef, Structdef) and _presence_words(typedef=typedef) > 0 for typedef in typedefs.values())
+
+
+@icontract.require(lambda typedefs: tracks_presence(typedefs=typedefs))
+@icontract.ensure(lambda result: result.endswith('\n'), "final newline")
+def generate_types_presence_reflection_go(package: str, typedefs: Mapping[str, Typedef]) -> str:
+    """
+    Generate the JSON methods of the structs tracking presence which are used instead of the generated JSON methods.
+
+    The file is included in the build only with the build tag swagger_to_reflection.
+
+    :param package: name of the package
+    :param typedefs: type definitions
+    :return: Golang code
+    """
+    structdefs = [
+        typedef for typedef in typedefs.values()
+        if isinstance(typedef, Structdef) and _presence_words(typedef=typedef) > 0
+    ]
+
+    wire_type = dict()  # type: MutableMapping[Fielddef, str]
+    json_tags = dict()  # type: MutableMapping[Fielddef, str]
+    for structdef in structdefs:
+        for fielddef in structdef.fields.values():
+            assert fielddef.typedef is not None
+            expression = _express_or_identify_type(typedef=fielddef.typedef)
+
+            if fielddef.presence_bit is not None:
+                wire_type[fielddef] = '*' + expression
+            else:
+                wire_type[fielddef] = expression
+
+            if fielddef.name in structdef.required:
+                json_tags[fielddef] = fielddef.json_name
+            else:
+                json_tags[fielddef] = fielddef.json_name + ',omitempty'
+
+    wire_fields = dict()  # type: MutableMapping[Structdef, List[str]]
+    for structdef in structdefs:
+        fields = [(fielddef.name, wire_type[fielddef], '`json:{}`'.format(_escaped_str(json_tags[fielddef])))
+                  for fielddef in structdef.fields.values()]
+        wire_fields[structdef] = _align_fields(fields=fields)
+
+    import_set = {'encoding/json'}
+    if any('time.Time' in expression for expression in wire_type.values()):
+        import_set.add('time')
+
+    text = _TYPES_PRESENCE_REFLECTION_GO_TPL.render(
+        package=package,
+        imports_code=_state_imports(import_set=import_set),
+        typedefs=structdefs,
+        wire_fields=wire_fields)
+
+    return swagger_to.indent.reindent(text=text, indention='\t')
+
+
+# Sample values of the string formats
+_SAMPLE_STRINGS = {
+    'date': '2016-01-02',
+    'email': 'someone@example.com',
+    'ipv4': '192.168.0.1',
+    'ipv6': '2001:db8::1',
+    'uri': 'https://example.com/some/path',
+    'uuid': '123e4567-e89b-12d3-a456-426614174000'
+}
+
+# Characters tried in turn when a character of a set needs to be synthesized
+_SAMPLE_CHARS = string.ascii_lowercase + string.digits + string.ascii_uppercase + string.punctuation + ' '
+
+# Regular expressions of the character class escapes
+_CATEGORY_RES = {letter: re.compile('\\' + letter) for letter in 'dDsSwW'}
+
+# Characters denoted by the escapes of the control characters
+_CONTROL_ESCAPES = {'t': '\t', 'n': '\n', 'r': '\r', 'f': '\f', 'v': '\v'}
+
+
+class _PatternSampler:
+    """
+    Synthesize the shortest text matching a regular expression.
+
+    Only a subset of the regular expressions is supported: literals, escapes, character classes, groups,
+    alternations, quantifiers and the anchors ^ and $. The other constructs such as backreferences
+    and lookarounds raise a ValueError.
+    """
+
+    def __init__(self, pattern: str) -> None:
+        """
+        Initialize with the given values.
+
+        :param pattern: regular expression to be sampled
+        """
+        self.pattern = pattern
+        self.pos = 0
+
+    def sample(self) -> str:
+        """Synthesize the text matching the whole pattern."""
+        result = self._alternation()
+        if self.pos < len(self.pattern):
+            raise ValueError("Unexpected {!r} at {} in the pattern: {}".format(self.pattern[self.pos], self.pos,
+                                                                               self.pattern))
+
+        return result
+
+    def _peek(self) -> str:
+        """Give the next character of the pattern, or an empty string at the end."""
+        return self.pattern[self.pos] if self.pos < len(self.pattern) else ''
+
+    def _next(self) -> str:
+        """Consume the next character of the pattern."""
+        char = self._peek()
+        if char == '':
+            raise ValueError("Unexpected end of the pattern: {}".format(self.pattern))
+
+        self.pos += 1
+        return char
+
+    def _alternation(self) -> str:
+        """Sample the shortest of the alternatives."""
+        alternatives = [self._concatenation()]
+        while self._peek() == '|':
+            self.pos += 1
+            alternatives.append(self._concatenation())
+
+        return min(alternatives, key=len)
+
+    def _concatenation(self) -> str:
+        """Sample the repeated atoms in sequence."""
+        parts = []  # type: List[str]
+        while self._peek() not in ['', '|', ')']:
+            atom = self._atom()
+            parts.append(atom * self._quantifier())
+
+        return ''.join(parts)
+
+    def _quantifier(self) -> int:
+        """Consume the quantifier, if any, and give the minimum number of repetitions."""
+        char = self._peek()
+        if char in ['*', '?']:
+            self.pos += 1
+            count = 0
+        elif char == '+':
+            self.pos += 1
+            count = 1
+        elif char == '{':
+            mtch = re.compile(r'\{([0-9]+)(,[0-9]*)?\}').match(self.pattern, self.pos)
+            if not mtch:
+                raise ValueError("Unsupported repetition at {} in the pattern: {}".format(self.pos, self.pattern))
+
+            self.pos = mtch.end()
+            count = int(mtch.group(1))
+        else:
+            return 1
+
+        # Lazy quantifier
+        if self._peek() == '?':
+            self.pos += 1
+
+        return count
+
+    def _atom(self) -> str:
+        """Sample a single literal, character class or group."""
+        char = self._next()
+        if char == '(':
+            if self._peek() == '?':
+                mtch = re.compile(r'\?(:|P?<[a-zA-Z_][a-zA-Z0-9_]*>)').match(self.pattern, self.pos)
+                if not mtch:
+                    raise ValueError("Unsupported group at {} in the pattern: {}".format(self.pos, self.pattern))
+
+                self.pos = mtch.end()
+
+            result = self._alternation()
+            if self._next() != ')':
+                raise ValueError("Unbalanced parenthesis in the pattern: {}".format(self.pattern))
+
+            return result
+
+        if char == '[':
+            return self._character_class()
+
+        if char in ['^', '$']:
+            return ''
+
+        if char == '.':
+            return _SAMPLE_CHARS[0]
+
+        if char == '\\':
+            escaped = self._next()
+            if escaped in _CATEGORY_RES:
+                return _sample_char(lambda candidate: _CATEGORY_RES[escaped].match(candidate) is not None)
+
+            return self._escaped_literal(escaped=escaped)
+
+        if char in ['*', '+', '?', '{', ')']:
+            raise ValueError("Unexpected {!r} at {} in the pattern: {}".format(char, self.pos - 1, self.pattern))
+
+        return char
+
+    def _escaped_literal(self, escaped: str) -> str:
+        """Give the character denoted by the escape."""
+        if escaped in _CONTROL_ESCAPES:
+            return _CONTROL_ESCAPES[escaped]
+
+        if escaped in ['x', 'u']:
+            digits = 2 if escaped == 'x' else 4
+            code = self.pattern[self.pos:self.pos + digits]
+            if len(code) != digits or any(digit not in string.hexdigits for digit in code):
+                raise ValueError("Invalid escape \\{}{} in the pattern: {}".format(escaped, code, self.pattern))
+
+            self.pos += digits
+            return chr(int(code, 16))
+
+        if escaped.isalnum():
+            raise ValueError("Unsupported escape \\{} in the pattern: {}".format(escaped, self.pattern))
+
+        return escaped
+
+    def _character_class(self) -> str:
+        """Sample a character of the bracketed class."""
+        negate = self._peek() == '^'
+        if negate:
+            self.pos += 1
+
+        ranges = []  # type: List[Tuple[str, str]]
+        categories = []  # type: List[str]
+        first = True
+        while first or self._peek() != ']':
+            first = False
+            char = self._next()
+
+            if char == '\\':
+                escaped = self._next()
+                if escaped in _CATEGORY_RES:
+                    categories.append(escaped)
+                    continue
+
+                char = self._escaped_literal(escaped=escaped)
+
+            last = char
+            if self._peek() == '-' and self.pos + 1 < len(self.pattern) and self.pattern[self.pos + 1] != ']':
+                self.pos += 1
+                last = self._next()
+                if last == '\\':
+                    last = self._escaped_literal(escaped=self._next())
+
+            ranges.append((char, last))
+
+        self.pos += 1
+        return _sample_char(lambda candidate: negate != (
+            any(low <= candidate <= high for low, high in ranges) or
+            any(_CATEGORY_RES[category].match(candidate) is not None for category in categories)))
+
+
+def _sample_char(matches: Callable[[str], bool]) -> str:
+    """Synthesize a character of a character set given as its membership test."""
+    for char in _SAMPLE_CHARS:
+        if matches(char):
+            return char
+
+    raise ValueError("No sample character in the character set")
+
+
+def _sample_matching(pattern: str, text: str) -> Optional[str]:
+    """
+    Synthesize a text matching the pattern.
+
+    :param pattern: regular expression that the text needs to match
+    :param text: preferred text if it already matches
+    :return: matching text, or None if the pattern is not supported by the sampler
+    """
+    try:
+        if re.search(pattern, text):
+            return text
+
+        sample = _PatternSampler(pattern=pattern).sample()
+        if re.search(pattern, sample):
+            return sample
+    except (re.error, ValueError):
+        pass
+
+    return None
+
+
+def _sample_value(typedef: Typedef, depth: int = 0, unsampled: Optional[List[str]] = None) -> Any:
+    """
+    Synthesize a JSON value of the type.
+
+    :param typedef: Go type definition
+    :param depth: nesting depth; the optional properties and the items of the deeper nested values are omitted
+        so that the recursive types are sampled finitely
+    :param unsampled: if given, the patterns which no text could be synthesized for are appended to it
+    :return: value which can be serialized with json.dumps
+    """
+    # pylint: disable=too-many-return-statements
+    if isinstance(typedef, Primitivedef):
+        if typedef.type == 'time.Time':
+            return '2006-01-02T15:04:05Z'
+
+        if typedef.type == 'string':
+            text = _SAMPLE_STRINGS.get(typedef.format or '', 'some text')
+            if not typedef.pattern:
+                return text
+
+            sample = _sample_matching(pattern=typedef.pattern, text=text)
+            if sample is None:
+                if unsampled is not None and typedef.pattern not in unsampled:
+                    unsampled.append(typedef.pattern)
+
+                return text
+
+            return sample
+
+        if typedef.type in _INT_BITS:
+            return 42
+
+        if typedef.type in ['float32', 'float64']:
+            return 3.5
+
+        if typedef.type == 'bool':
+            return True
+
+        raise NotImplementedError("Unhandled Go primitive type: {}".format(typedef.type))
+
+    if isinstance(typedef, Interfacedef):
+        return collections.OrderedDict([('key', 'value')])
+
+    if isinstance(typedef, Pointerdef):
+        assert typedef.pointed is not None
+        return _sample_value(typedef=typedef.pointed, depth=depth, unsampled=unsampled)
+
+    count = 3 if depth < 3 else 0
+
+    if isinstance(typedef, Arraydef):
+        assert typedef.items is not None
+        return [_sample_value(typedef=typedef.items, depth=depth + 1, unsampled=unsampled) for _ in range(count)]
+
+    if isinstance(typedef, Mapdef):
+        assert typedef.values is not None
+        return collections.OrderedDict([('key{}'.format(i),
+                                         _sample_value(typedef=typedef.values, depth=depth + 1, unsampled=unsampled))
+                                        for i in range(count)])
+
+    if isinstance(typedef, Structdef):
+        result = collections.OrderedDict()  # type: MutableMapping[str, Any]
+        for fielddef in typedef.fields.values():
+            assert fielddef.typedef is not None
+            if fielddef.name in typedef.required:
+                result[fielddef.json_name] = _sample_value(
+                    typedef=fielddef.typedef, depth=depth + 1, unsampled=unsampled)
+            elif depth < 3:
+                value = _sample_value(typedef=fielddef.typedef, depth=depth + 1, unsampled=unsampled)
+
+                # The empty optional arrays and maps are omitted by encoding/json.
+                if value != [] and value != {}:
+                    result[fielddef.json_name] = value
+
+        return result
+
+    raise NotImplementedError("Unhandled Go type definition of type: {}".format(type(typedef)))
+
+
+def _sample_json(typedef: Typedef, unsampled: Optional[List[str]] = None) -> str:
+    """Synthesize a compact JSON text of the type as encoding/json would encode it."""
+    return json.dumps(_sample_value(typedef=typedef, unsampled=unsampled), ensure_ascii=False, separators=(',', ':'))
+
+
+_TYPES_JSON_TEST_GO_TPL = ENV.from_string('''\
+// Code generated by swagger_to. DO NOT EDIT.
+package {{ package }}
+
+// Automatically generated file by swagger_to. DO NOT EDIT OR APPEND ANYTHING!
+//
+// The tests and the benchmarks use the generated JSON methods. Exclude the methods with the build tag
+// swagger_to_reflection to run the same tests and benchmarks with encoding/json for comparison:
+//
+//     go test -run JSON -bench JSON .
+//     go test -run JSON -bench JSON -tags swagger_to_reflection .
+{% if payloads %}
+
+import (
+    "encoding/json"
+    "testing"
+)
+
+// jsonAppender is implemented by the types with the generated JSON methods.
+type jsonAppender interface {
+    AppendJSON(buf []byte) ([]byte, error)
+}
+
+// appendJSON encodes the value with the generated method if available and with encoding/json otherwise.
+func appendJSON(buf []byte, value interface{}) ([]byte, error) {
+    if appender, ok := value.(jsonAppender); ok {
+        return appender.AppendJSON(buf)
+    }
+
+    encoded, err := json.Marshal(value)
+    return append(buf, encoded...), err
+}
+
+// unmarshalJSON decodes the value with the generated method if available and with encoding/json otherwise.
+func unmarshalJSON(data []byte, value interface{}) error {
+    if unmarshaler, ok := value.(json.Unmarshaler); ok {
+        return unmarshaler.UnmarshalJSON(data)
+    }
+
+    return json.Unmarshal(data, value)
+}
+{% for identifier, payload in payloads.items() %}
+
+// payload{{ identifier }} is a synthetic {{ identifier }} as encoded by encoding/json.
+var payload{{ identifier }} = []byte({{ payload|escaped_str }})
+
+func TestJSONRoundTrip{{ identifier }}(t *testing.T) {
+    var value {{ identifier }}
+    if err := unmarshalJSON(payload{{ identifier }}, &value); err != nil {
+        t.Fatal(err)
+    }
+
+    encoded, err := appendJSON(nil, &value)
+    if err != nil {
+        t.Fatal(err)
+    }
+
+    if string(encoded) != string(payload{{ identifier }}) {
+        t.Fatalf("expected %s, got %s", payload{{ identifier }}, encoded)
+    }
+}
+
+func BenchmarkJSONEncode{{ identifier }}(b *testing.B) {
+    var value {{ identifier }}
+    if err := json.Unmarshal(payload{{ identifier }}, &value); err != nil {
+        b.Fatal(err)
+    }
+
+    var buf []byte
+    var err error
+
+    b.ReportAllocs()
+    b.ResetTimer()
+    for i := 0; i < b.N; i++ {
+        buf, err = appendJSON(buf[:0], &value)
+        if err != nil {
+            b.Fatal(err)
+        }
+    }
+}
+
+func BenchmarkJSONDecode{{ identifier }}(b *testing.B) {
+    var value {{ identifier }}
+
+    b.ReportAllocs()
+    for i := 0; i < b.N; i++ {
+        value = {{ identifier }}{}
+        if err := unmarshalJSON(payload{{ identifier }}, &value); err != nil {
+            b.Fatal(err)
+        }
+    }
+}
+{% endfor %}
+{% endif %}
+
+// Automatically generated file by swagger_to. DO NOT EDIT OR APPEND ANYTHING!
+
+''')
+
+
+@icontract.ensure(lambda result: result.endswith('\n'), "final newline")
+def generate_types_json_test_go(package: str, typedefs: Mapping[str, Typedef]) -> str:
+    """
+    Generate the round-trip tests and the benchmarks of the JSON methods on synthetic payloads.
+
+    :param package: name of the package
+    :param typedefs: type definitions whose structs, arrays and maps are given the methods
+    :return: Golang code
+    """
+    payloads = collections.OrderedDict([(typedef.identifier, _sample_json(typedef=typedef))
+                                        for typedef in typedefs.values()
+                                        if isinstance(typedef, (Structdef, Arraydef, Mapdef))])
+
+    text = _TYPES_JSON_TEST_GO_TPL.render(package=package, payloads=payloads)
+
+    return swagger_to.indent.reindent(text=text, indention='\t')
+
+
+def _sample_parameter(typedef: Typedef, unsampled: Optional[List[str]] = None) -> str:
+    """Synthesize the text of a header, query or path parameter."""
+    value = _sample_value(typedef=typedef, unsampled=unsampled)
+    if isinstance(value, bool):
+        return 'true' if value else 'false'
+
+    return str(value)
+
+
+class _SampleRequest:
+    """Represent a synthetic request of a route."""
+
+    def __init__(self, route: Route) -> None:
+        """
+        Synthesize the request from the types of the route arguments.
+
+        :param route: whose request is synthesized
+        """
+        # Patterns which no text could be synthesized for so that the request would be rejected;
+        # the patterns of the query and header parameters are not checked by the wrappers.
+        self.unsampled = []  # type: List[str]
+
+        token_pth = swagger_to.tokenize_path(path=route.template)
+        for argument in route.wrapper.path_arguments:
+            for i in token_pth.parameter_to_token_indices.get(argument.parameter_name, []):
+                token_pth.tokens[i] = urllib.parse.quote(
+                    _sample_parameter(typedef=argument.typedef, unsampled=self.unsampled), safe='')
+
+        self.target = ''.join(token_pth.tokens)
+        if route.wrapper.query_arguments:
+            self.target += '?' + urllib.parse.urlencode([(argument.parameter_name,
+                                                          _sample_parameter(typedef=argument.typedef))
+                                                         for argument in route.wrapper.query_arguments])
+
+        self.header = collections.OrderedDict([(_canonical_header_key(argument.parameter_name),
+                                                _sample_parameter(typedef=argument.typedef))
+                                               for argument in route.wrapper.header_arguments])
+
+        self.payload = None  # type: Optional[str]
+        if route.wrapper.body_argument is not None:
+            self.payload = _sample_json(typedef=route.wrapper.body_argument.typedef, unsampled=self.unsampled)
+
+
+_ROUTES_BENCH_TEST_GO_TPL = ENV.from_string('''\
+// Code generated by swagger_to. DO NOT EDIT.
+package {{ package }}
+
+// Automatically generated file by swagger_to. DO NOT EDIT OR APPEND ANYTHING!
+
+// The benchmarks send a synthetic request to each route through SetupRouter. The requests are synthesized from
+// the types of the parameters and are expected to be accepted by the wrappers. By default, the handler does nothing
+// so that the benchmarks measure the routing, the parsing, the validation and the decoding. Set newBenchHandler
+// in an init function of your own test file to benchmark your handler as well.
+
+import (
+    "bytes"
+{% if context_handler %}
+    "context"
+{% endif %}
+    "net/http"
+    "net/http/httptest"
+    "testing"
+)
+
+// newBenchHandler creates the handler for the benchmarks.
+var newBenchHandler = func() Handler { return benchNoopHandler{} }
+
+// benchNoopHandler implements the Handler with methods which do nothing.
+type benchNoopHandler struct{}
+{% for route in routes %}
+
+// {{ route.handler.identifier }} does nothing.
+{% if not route.handler.arguments %}
+func (benchNoopHandler) {{ route.handler.identifier }}({% if context_handler %}ctx context.Context, {% endif %}{#
+#}w http.ResponseWriter, r *http.Request) {}
+{% else %}
+{% if context_handler %}
+func (benchNoopHandler) {{ route.handler.identifier }}(ctx context.Context,
+    w http.ResponseWriter,
+{% else %}
+func (benchNoopHandler) {{ route.handler.identifier }}(w http.ResponseWriter,
+{% endif %}
+    r *http.Request,
+{% for argument in route.handler.arguments %}
+    {{ argument.identifier }} {{ argument_type[argument]|indent }}{{ ',' if not loop.last else ') {' }}
+{% endfor %}
+}
+{% endif %}
+{% endfor %}
+
+// benchBody replays the request body without allocations.
+type benchBody struct {
+    bytes.Reader
+}
+
+// Close does nothing.
+func (*benchBody) Close() error {
+    return nil
+}
+
+// benchResponseWriter discards the response.
+type benchResponseWriter struct {
+    header http.Header
+    status int
+}
+
+// Header gives the header of the response.
+func (w *benchResponseWriter) Header() http.Header {
+    return w.header
+}
+
+// Write discards the data.
+func (w *benchResponseWriter) Write(data []byte) (int, error) {
+    if w.status == 0 {
+        w.status = http.StatusOK
+    }
+    return len(data), nil
+}
+
+// WriteHeader records the status code.
+func (w *benchResponseWriter) WriteHeader(status int) {
+    if w.status == 0 {
+        w.status = status
+    }
+}
+
+// benchRoute checks that the request is accepted and then measures how long the router takes to handle it.
+func benchRoute(b *testing.B, method string, target string, header http.Header, payload []byte) {
+{% if observer %}
+    router := SetupRouter(newBenchHandler(), nil)
+{% else %}
+    router := SetupRouter(newBenchHandler())
+{% endif %}
+
+    req := httptest.NewRequest(method, target, nil)
+    for key, values := range header {
+        req.Header[key] = values
+    }
+
+    body := &benchBody{}
+    if payload != nil {
+        body.Reset(payload)
+        req.Body = body
+        req.ContentLength = int64(len(payload))
+    }
+
+    rec := httptest.NewRecorder()
+    router.ServeHTTP(rec, req)
+    switch rec.Code {
+    case http.StatusBadRequest, http.StatusNotFound, http.StatusMethodNotAllowed:
+        b.Fatalf("The synthetic request %s %s was rejected with the status %d: %s", method, target, rec.Code, rec.Body)
+    }
+
+    w := &benchResponseWriter{header: make(http.Header)}
+
+    b.ReportAllocs()
+    b.ResetTimer()
+    for i := 0; i < b.N; i++ {
+        for key := range w.header {
+            delete(w.header, key)
+        }
+        w.status = 0
+
+        if payload != nil {
+            body.Reset(payload)
+            req.Body = body
+        }
+
+        router.ServeHTTP(w, req)
+    }
+}
+{% for route in routes %}
+{% set request = requests[route] %}
+
+// BenchmarkRoute{{ route.handler.identifier }} benchmarks the path `{{ route.path }}` with the method "{{ route.method }}".
+func BenchmarkRoute{{ route.handler.identifier }}(b *testing.B) {
+{% if request.unsampled %}
+    b.Skip({{ "No request could be synthesized for the patterns: %s"|format(request.unsampled|join(", "))|escaped_str }})
+}
+{% else %}
+{% if request.header %}
+    header := http.Header{
+{% for key, value in request.header.items() %}
+        {{ key|escaped_str }}: {{ '{' }}{{ value|escaped_str }}{{ '}' }},
+{% endfor %}
+    }
+{% else %}
+    var header http.Header
+{% endif %}
+{% if request.payload is not none %}
+    payload := []byte({{ raw_str(request.payload) }})
+{% else %}
+    var payload []byte
+{% endif %}
+
+    benchRoute(b, {{ route.method|upper|escaped_str }}, {{ request.target|escaped_str }}, header, payload)
+}
+{% endif %}
+{% endfor %}
+
+// Automatically generated file by swagger_to. DO NOT EDIT OR APPEND ANYTHING!
+
+''')
+
+
+@icontract.ensure(lambda result: result.endswith('\n'), "final newline")
+def generate_routes_bench_test_go(package: str,
+                                  routes: List[Route],
+                                  observer: bool = False,
+                                  context_handler: bool = False) -> str:
+    """
+    Generate the benchmarks which send a synthetic request to each route.
+
+    :param package: name of the package
+    :param routes: to be benchmarked
+    :param observer: if set, SetupRouter expects an Observer
+    :param context_handler: if set, the handler methods receive the context of the request
+    :return: Golang code
+    """
+    text = _ROUTES_BENCH_TEST_GO_TPL.render(
+        package=package,
+        routes=routes,
+        argument_type={
+            argument: _express_or_identify_type(argument.typedef)
+            for route in routes for argument in route.handler.arguments
+        },
+        requests={route: _SampleRequest(route=route)
+                  for route in routes},
+        raw_str=_raw_str,
+        observer=observer,
+        context_handler=context_handler)
+
+    return swagger_to.indent.reindent(text=text, indention='\t')
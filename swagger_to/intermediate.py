@@ -10,6 +10,7 @@ do not figure as strings.
 # pylint: disable=too-many-statements
 
 import collections
+import datetime
 import json
 from typing import List, MutableMapping, Union, Any, Optional, \
     Mapping, Set  # pylint: disable=unused-import
@@ -141,6 +142,19 @@ class Endpoint:
         self.responses = collections.OrderedDict()  # type: MutableMapping[str, Response]
         self.line = 0
 
+        # Maximum size of the request body in bytes, if specified
+        self.max_body_bytes = None  # type: Optional[int]
+
+        # Time budget of the request, if specified
+        self.timeout = None  # type: Optional[datetime.timedelta]
+
+        # Maximum number of in-flight requests of the endpoint, if specified
+        self.max_in_flight = None  # type: Optional[int]
+
+        # Maximum numbers of in-flight requests shared with the other endpoints of a tag, for the tags of the endpoint
+        # with a limit
+        self.tag_max_in_flight = collections.OrderedDict()  # type: MutableMapping[str, int]
+
 
 def _preallocate_named_typedefs(definition: swagger_to.swagger.Definition,
                                 typedefs: MutableMapping[str, Typedef]) -> None:
@@ -346,64 +360,42 @@ def to_typedefs(swagger: swagger_to.swagger.Swagger) -> MutableMapping[str, Type
     for defi in swagger.definitions.values():
         _resolve_substructures(definition=defi, typedefs=typedefs)
 
+    graph = _DefinitionGraph(definitions=swagger.definitions)
+
     for typedef in typedefs.values():
         json_schema_identifier = typedef.identifier
 
         typedef.json_schema = _to_json_schema(
             identifier=json_schema_identifier,
             original_typedef=swagger.definitions[typedef.identifier].typedef,
-            definitions=swagger.definitions)
+            graph=graph)
 
     return typedefs
 
 
-# yapf: disable
-@icontract.ensure(
-    lambda definitions, result:
-    all(
-        name in definitions
-        for name in result
-    ),
-    enabled=icontract.SLOW
-)
-@icontract.ensure(
-    lambda result: len(set(result)) == len(result),
-    "No duplicates in the result" ,
-    enabled=icontract.SLOW
-)
-# yapf: enable
-def _collect_referenced_definitions(typedef: swagger_to.swagger.Typedef,
-                                    definitions: MutableMapping[str, swagger_to.swagger.Definition]) -> List[str]:
+def _collect_direct_references(typedef: swagger_to.swagger.Typedef) -> List[str]:
     """
-    Inspect the intermediate representation of a type definition and collect other type definitions referenced by it.
+    Collect the definitions referenced by the type definition without following the references.
+
+    The definitions are listed in the order in which a depth-first walk over the type definition encounters them.
 
     :param typedef: type definition in the original Swagger spec
-    :param definitions: table of type definitions in intermediate representation
-    :return: referenced type definitions given as a list of their identifiers
+    :return: identifiers of the referenced definitions, without duplicates
     """
     result = []  # type: List[str]
+    collected = set()  # type: Set[str]
 
     stack = [typedef]  # type: List[swagger_to.swagger.Typedef]
 
-    # This set is necessary to prevent endless recursion. The set contains the names of the referenced definitions
-    # which have been already included in the result.
-    # See: https://github.com/Parquery/swagger-to/issues/129
-    visited_definitions = set()  # type: Set[str]
-
     while len(stack) > 0:
         another_typedef = stack.pop()
 
         if another_typedef.ref != '':
             definition_name = swagger_to.parse_definition_ref(another_typedef.ref)
 
-            # We need this check to avoid endless recursion.
-            # See: https://github.com/Parquery/swagger-to/issues/129
-            if definition_name not in visited_definitions:
-                definition = definitions[definition_name]
+            if definition_name not in collected:
                 result.append(definition_name)
-
-                stack.append(definition.typedef)
-                visited_definitions.add(definition_name)
+                collected.add(definition_name)
 
         else:
             for prop in another_typedef.properties.values():
@@ -422,6 +414,220 @@ def _collect_referenced_definitions(typedef: swagger_to.swagger.Typedef,
     return result
 
 
+def _strongly_connected_components(successors: Mapping[str, List[str]]) -> List[List[str]]:
+    """
+    Compute the strongly connected components of the graph with Tarjan's algorithm.
+
+    :param successors: successors of each node; successors which are not nodes of the graph are ignored
+    :return: strongly connected components in reverse topological order (a component comes after all the components
+        reachable from it)
+    """
+    index = dict()  # type: MutableMapping[str, int]
+    lowlink = dict()  # type: MutableMapping[str, int]
+    on_stack = set()  # type: Set[str]
+    stack = []  # type: List[str]
+    components = []  # type: List[List[str]]
+
+    for root in successors:
+        if root in index:
+            continue
+
+        # The recursion is unrolled into a stack of (node, index of the next successor) to handle long chains.
+        work = [(root, 0)]
+        index[root] = lowlink[root] = len(index)
+        stack.append(root)
+        on_stack.add(root)
+
+        while work:
+            node, i = work[-1]
+            node_successors = successors[node]
+
+            if i < len(node_successors):
+                work[-1] = (node, i + 1)
+                successor = node_successors[i]
+
+                if successor not in successors:
+                    continue
+
+                if successor not in index:
+                    index[successor] = lowlink[successor] = len(index)
+                    stack.append(successor)
+                    on_stack.add(successor)
+                    work.append((successor, 0))
+
+                elif successor in on_stack:
+                    lowlink[node] = min(lowlink[node], index[successor])
+
+                continue
+
+            work.pop()
+            if work:
+                parent = work[-1][0]
+                lowlink[parent] = min(lowlink[parent], lowlink[node])
+
+            if lowlink[node] == index[node]:
+                component = []  # type: List[str]
+                while True:
+                    member = stack.pop()
+                    on_stack.remove(member)
+                    component.append(member)
+                    if member == node:
+                        break
+
+                components.append(component)
+
+    return components
+
+
+class _DefinitionGraph:
+    """
+    Represent the graph of references between the definitions of a Swagger spec.
+
+    The depth-first orders of the referenced definitions and the stripped JSON representations of the definitions
+    are memoized so that they are computed only once for all the JSON schemas.
+    """
+
+    def __init__(self, definitions: Mapping[str, swagger_to.swagger.Definition]) -> None:
+        """
+        Initialize with the given values.
+
+        :param definitions: table of original type definitions in the Swagger spec
+        """
+        self.definitions = definitions
+
+        self.references = collections.OrderedDict(
+            (name, _collect_direct_references(typedef=definition.typedef))
+            for name, definition in definitions.items())  # type: Mapping[str, List[str]]
+
+        # Components come in reverse topological order so that a component can only reach the components
+        # with a lower index.
+        self.components = _strongly_connected_components(successors=self.references)
+
+        self.component_of = dict()  # type: MutableMapping[str, int]
+        for i, component in enumerate(self.components):
+            for name in component:
+                self.component_of[name] = i
+
+        # Depth-first pre-order of all the definitions reachable from a definition, including the definition itself
+        self._orders = dict()  # type: MutableMapping[str, List[str]]
+
+        # JSON representation of the stripped definitions indented as values in the "definitions" of a schema
+        self._texts = dict()  # type: MutableMapping[str, str]
+
+    def _compute_order(self, name: str) -> List[str]:
+        """
+        Walk the definitions reachable from the given definition in depth-first pre-order.
+
+        The orders of the definitions in other strongly connected components need to be computed beforehand.
+        """
+        result = [name]
+        visited = {name}
+        component = self.component_of[name]
+
+        stack = [(name, 0)]
+        while stack:
+            node, i = stack[-1]
+            node_references = self.references[node]
+
+            if i == len(node_references):
+                stack.pop()
+                continue
+
+            stack[-1] = (node, i + 1)
+            reference = node_references[i]
+
+            if reference in visited:
+                continue
+
+            if self.component_of[reference] == component:
+                visited.add(reference)
+                result.append(reference)
+                stack.append((reference, 0))
+            else:
+                # The definitions of a different component can not reach the definitions on the stack so
+                # the walk would visit the unvisited definitions in the same order as the memoized walk.
+                for another_name in self._orders[reference]:
+                    if another_name not in visited:
+                        visited.add(another_name)
+                        result.append(another_name)
+
+        return result
+
+    def order(self, name: str) -> List[str]:
+        """
+        List the definitions reachable from the given definition in depth-first pre-order.
+
+        :param name: identifier of the definition
+        :return: identifiers of the reachable definitions, starting with the definition itself
+        """
+        if name in self._orders:
+            return self._orders[name]
+
+        if name not in self.definitions:
+            raise KeyError(name)
+
+        # Collect the components whose orders are missing and compute them bottom-up.
+        missing = set()  # type: Set[int]
+        stack = [self.component_of[name]]
+        while stack:
+            component = stack.pop()
+            if component in missing:
+                continue
+
+            missing.add(component)
+            for member in self.components[component]:
+                for reference in self.references[member]:
+                    if reference not in self.definitions:
+                        raise KeyError(reference)
+
+                    if reference not in self._orders and self.component_of[reference] not in missing:
+                        stack.append(self.component_of[reference])
+
+        for component in sorted(missing):
+            for member in self.components[component]:
+                self._orders[member] = self._compute_order(name=member)
+
+        return self._orders[name]
+
+    def referenced_definitions(self, typedef: swagger_to.swagger.Typedef) -> List[str]:
+        """
+        Collect the definitions referenced by the type definition either directly or indirectly.
+
+        :param typedef: type definition in the original Swagger spec
+        :return: identifiers of the referenced definitions in depth-first pre-order
+        """
+        result = []  # type: List[str]
+        visited = set()  # type: Set[str]
+
+        for reference in _collect_direct_references(typedef=typedef):
+            if reference in visited:
+                continue
+
+            for name in self.order(name=reference):
+                if name not in visited:
+                    visited.add(name)
+                    result.append(name)
+
+        return result
+
+    def definition_text(self, name: str) -> str:
+        """
+        Serialize the definition stripped of the surrounding whitespace in the descriptions to JSON.
+
+        :param name: identifier of the definition
+        :return: JSON text indented as a value in the "definitions" of a schema
+        """
+        text = self._texts.get(name, None)
+        if text is None:
+            stripped = _recursively_strip_descriptions(schema_dict=self.definitions[name].typedef.raw_dict)
+
+            # JSON strings can not contain new lines so all the new lines come from the indention.
+            text = json.dumps(stripped, indent=2).replace('\n', '\n' + 4 * ' ')
+            self._texts[name] = text
+
+        return text
+
+
 def _recursively_strip_descriptions(schema_dict: MutableMapping[str, Any]) -> MutableMapping[str, Any]:
     """
     Walk the dictionary and strip the value if the key is "description".
@@ -457,14 +663,18 @@ def _recursively_strip_descriptions(schema_dict: MutableMapping[str, Any]) -> Mu
     return new_schema_dict
 
 
+# Placeholder for the definitions of a JSON schema which are serialized separately
+_DEFINITIONS_PLACEHOLDER = object()
+
+
 def _to_json_schema(identifier: str, original_typedef: swagger_to.swagger.Typedef,
-                    definitions: MutableMapping[str, swagger_to.swagger.Definition]) -> JsonSchema:
+                    graph: _DefinitionGraph) -> JsonSchema:
     """
     Convert the JSON validation schema to an intermediate representation.
 
     :param identifier: identifier of the JSON validation schema
     :param original_typedef: original type definition from a Swagger spec
-    :param definitions: table of original type definitions in the Swagger spec
+    :param graph: graph of references between the original type definitions in the Swagger spec
     :return:
     """
     json_schema = JsonSchema()
@@ -475,27 +685,33 @@ def _to_json_schema(identifier: str, original_typedef: swagger_to.swagger.Typede
     schema['title'] = json_schema.identifier
     schema['$schema'] = "http://json-schema.org/draft-04/schema#"
 
-    referenced_definitions = _collect_referenced_definitions(
-        typedef=original_typedef, definitions=definitions)  # top-down
+    referenced_definitions = graph.referenced_definitions(typedef=original_typedef)  # top-down
     referenced_definitions.reverse()  # bottom-up
 
-    schema_definitions = collections.OrderedDict()  # type: MutableMapping[str, Any]
-
-    for definition_name in referenced_definitions:
-        if definition_name in schema_definitions:
-            continue
-
-        schema_definitions[definition_name] = definitions[definition_name].typedef.raw_dict
-
-    if len(schema_definitions) > 0:
-        schema['definitions'] = schema_definitions
+    if len(referenced_definitions) > 0:
+        schema['definitions'] = _DEFINITIONS_PLACEHOLDER
 
     for key, value in original_typedef.raw_dict.items():
         schema[key] = value
 
     schema = _recursively_strip_descriptions(schema_dict=schema)
 
-    json_schema.text = json.dumps(schema, indent=2)
+    # The schema is serialized as json.dumps(schema, indent=2) would do, but the definitions are serialized
+    # only once for all the schemas.
+    parts = []  # type: List[str]
+    for key, value in schema.items():
+        if value is _DEFINITIONS_PLACEHOLDER:
+            definition_parts = [
+                '    {}: {}'.format(json.dumps(name), graph.definition_text(name=name))
+                for name in referenced_definitions
+            ]
+            value_text = '{\n' + ',\n'.join(definition_parts) + '\n  }'
+        else:
+            value_text = json.dumps(value, indent=2).replace('\n', '\n' + 2 * ' ')
+
+        parts.append('  {}: {}'.format(json.dumps(key), value_text))
+
+    json_schema.text = '{\n' + ',\n'.join(parts) + '\n}'
 
     return json_schema
 
@@ -618,13 +834,15 @@ def _to_response(swagger_response: swagger_to.swagger.Response, typedefs: Mutabl
 
 
 def _to_endpoint(swagger: swagger_to.swagger.Swagger, method: swagger_to.swagger.Method,
-                 typedefs: MutableMapping[str, Typedef], params: MutableMapping[str, Parameter]) -> Endpoint:
+                 typedefs: MutableMapping[str, Typedef], params: MutableMapping[str, Parameter],
+                 graph: _DefinitionGraph) -> Endpoint:
     """
     Translate the endpoint from the original Swagger spec to an intermediate representation.
 
     :param method: the method specification in the original Swagger spec
     :param typedefs: table of type definitions in intermediate representation
     :param params: table of parameter definitions in intermediate representation
+    :param graph: graph of references between the original type definitions in the Swagger spec
     :return: intermediate representation of an endpoint
     """
     if method.path is None:
@@ -664,6 +882,12 @@ def _to_endpoint(swagger: swagger_to.swagger.Swagger, method: swagger_to.swagger
         endpt.produces = swagger.produces
 
     endpt.line = method.__lineno__
+    endpt.max_body_bytes = method.x_swagger_to_max_body_bytes
+    endpt.timeout = method.x_swagger_to_timeout
+    endpt.max_in_flight = method.x_swagger_to_max_in_flight
+    for tag in method.tags:
+        if tag in swagger.x_swagger_to_max_in_flight:
+            endpt.tag_max_in_flight[tag] = swagger.x_swagger_to_max_in_flight[tag]
 
     # We need to join method parameters with the path's common parameters.
     # See https://swagger.io/docs/specification/2-0/describing-parameters/,
@@ -686,9 +910,7 @@ def _to_endpoint(swagger: swagger_to.swagger.Swagger, method: swagger_to.swagger
                     original_param.name, pth))
 
             param.json_schema = _to_json_schema(
-                identifier=json_schema_identifier,
-                original_typedef=original_param.schema,
-                definitions=method.path.swagger.definitions)
+                identifier=json_schema_identifier, original_typedef=original_param.schema, graph=graph)
 
         endpt.parameters.append(param)
 
@@ -708,11 +930,13 @@ def to_endpoints(swagger: swagger_to.swagger.Swagger, typedefs: MutableMapping[s
     :param params: table of parameter definitions in intermediate representation
     :return: intermediate representation of endpoints
     """
+    graph = _DefinitionGraph(definitions=swagger.definitions)
+
     endpoints = []  # type: List[Endpoint]
     for path in swagger.paths.values():
         for method in path.methods:
             if not method.x_swagger_to_skip:
-                endpoint = _to_endpoint(swagger=swagger, method=method, typedefs=typedefs, params=params)
+                endpoint = _to_endpoint(swagger=swagger, method=method, typedefs=typedefs, params=params, graph=graph)
                 endpoints.append(endpoint)
 
     return endpoints
@@ -1000,12 +1000,54 @@ def _generate_from_obj(classdefs: List[Classdef]) -> str:
     return _FROM_OBJ_TPL.render(classdefs=classdefs)
 
 
-def _expected_type_expression(typedef: Typedef) -> str:
+# Python type and its description in the error messages for the primitive type definitions
+_PRIMITIVE_CHECKS = {Booldef: ('bool', 'a bool'), Intdef: ('int', 'an int'), Strdef: ('str', 'a str')}
+
+_PRIMITIVE_CHECK_TPL = _from_string_with_informative_exceptions(
+    env=_ENV,
+    text='''\
+{% if is_float %}
+if isinstance({{ var }}, int):
+    {{ var }} = float({{ var }})
+elif {{ '%s is not None and '|format(var) if optional }}not isinstance({{ var }}, float):
+    raise _Mismatch('an int or a float', {{ var }}, {{ path }})
+{% else %}
+if {{ '%s is not None and '|format(var) if optional }}not isinstance({{ var }}, {{ check[0] }}):
+    raise _Mismatch({{ check[1]|repr }}, {{ var }}, {{ path }})
+{% endif %}''')
+
+
+def _is_checked_primitive(typedef: Typedef) -> bool:
+    """Check whether the values of the type definition are checked inline instead of by a decoder."""
+    return isinstance(typedef, (Booldef, Intdef, Floatdef, Strdef))
+
+
+@icontract.require(lambda typedef: _is_checked_primitive(typedef))
+@icontract.ensure(lambda result: not result.endswith('\n'))
+def _primitive_check(typedef: Typedef, var: str, path: str, optional: bool = False) -> str:
+    """
+    Generate the code which checks the variable holding a JSON-ed primitive value and converts it in place.
+
+    :param typedef: type definition of the primitive value
+    :param var: name of the variable
+    :param path: Python expression of the path reported on a mismatch
+    :param optional: if set, the variable can also hold None
+    :return: Python code
+    """
+    return _PRIMITIVE_CHECK_TPL.render(
+        is_float=isinstance(typedef, Floatdef),
+        check=_PRIMITIVE_CHECKS.get(type(typedef), None),
+        var=var,
+        path=path,
+        optional=optional).strip()
+
+
+def _structure_name(typedef: Typedef) -> str:
     """
-    Determine the type expression supplied to ``from_obj`` function corresponding to the type definition.
+    Name the structure of the type definition so that the decoders of equal structures share the name.
 
     :param typedef: type definition in Python representation
-    :return: Python code representing the type definition
+    :return: part of a Python identifier
     """
     # pylint: disable=too-many-return-statements
     if isinstance(typedef, Booldef):
@@ -1016,26 +1058,169 @@ def _expected_type_expression(typedef: Typedef) -> str:
         return 'float'
     elif isinstance(typedef, Strdef):
         return 'str'
-    elif isinstance(typedef, Bytesdef):
-        return 'bytes'
+    elif isinstance(typedef, Anydef):
+        return 'any'
     elif isinstance(typedef, Listdef):
         if typedef.items is None:
             raise ValueError('Unexpected None items in typedef: {!r}'.format(typedef.identifier))
-        if isinstance(typedef.items, Anydef):
-            return 'list, Any'
-        return 'list, {}'.format(_expected_type_expression(typedef=typedef.items))
+
+        return 'list_of_{}'.format(_structure_name(typedef=typedef.items))
     elif isinstance(typedef, Dictdef):
         if typedef.values is None:
             raise ValueError('Unexpected None values in typedef: {!r}'.format(typedef.identifier))
-        if isinstance(typedef.values, Anydef):
-            return 'dict, Any'
-        return 'dict, {}'.format(_expected_type_expression(typedef=typedef.values))
+
+        return 'dict_of_{}'.format(_structure_name(typedef=typedef.values))
     elif isinstance(typedef, Classdef):
-        return _class_name(typedef.identifier)
-    elif isinstance(typedef, Anydef):
-        return 'Any'
+        return _function_name(typedef.identifier)
+    else:
+        raise NotImplementedError('Naming the structure of the typedef is not supported: {}'.format(typedef))
+
+
+def _decoder_name(typedef: Typedef) -> str:
+    """
+    Determine the name of the function decoding a JSON-ed object to the type definition.
+
+    :param typedef: type definition in Python representation
+    :return: Python identifier
+    """
+    if isinstance(typedef, Classdef):
+        return _function_name(typedef.identifier + '_from_obj')
+
+    return '_decode_{}'.format(_structure_name(typedef=typedef))
+
+
+def _encoder_name(typedef: Typedef) -> str:
+    """
+    Determine the name of the function converting an instance of the type definition to a JSON-able object.
+
+    :param typedef: type definition in Python representation
+    :return: Python identifier
+    """
+    if isinstance(typedef, Classdef):
+        return _function_name(typedef.identifier + '_to_jsonable')
+
+    return '_encode_{}'.format(_structure_name(typedef=typedef))
+
+
+def _register_containers(typedef: Typedef, containers: MutableMapping[str, Typedef]) -> None:
+    """
+    Register the lists and dictionaries nested in the type definition which need their own converters.
+
+    The classes have their own converters and the primitive values are converted inline.
+
+    :param typedef: type definition in Python representation
+    :param containers: type definitions of the containers, identified by the names of their structures
+    """
+    if isinstance(typedef, Listdef):
+        assert typedef.items is not None
+        _register_containers(typedef=typedef.items, containers=containers)
+    elif isinstance(typedef, Dictdef):
+        assert typedef.values is not None
+        _register_containers(typedef=typedef.values, containers=containers)
+    else:
+        return
+
+    containers.setdefault(_structure_name(typedef=typedef), typedef)
+
+
+_DECODER_TPL = _from_string_with_informative_exceptions(
+    env=_ENV,
+    text='''\
+def {{ name }}(obj: Any) -> {{ type_expression }}:
+    """
+    Checks and converts the JSON-ed object to {{ type_expression }}.
+
+    :param obj: to be converted
+    :return: the converted object
+    """
+{% if primitive_check %}
+    {{ primitive_check|indent }}
+
+    return obj
+{% elif is_list %}
+    if not isinstance(obj, list):
+        raise _Mismatch('a list', obj, '')
+    {% if item_check is none and item_decoder is none %}
+
+    return list(obj)
+    {% else %}
+
+    result = []  # type: {{ type_expression }}
+    {% if item_check %}
+    for item in obj:
+        {{ item_check|indent|indent }}
+
+        result.append(item)
+    {% else %}
+    try:
+        for item in obj:
+            result.append({{ item_decoder }}(item))
+    except _Mismatch as err:
+        raise err.within('[{}]'.format(len(result)))
+    {% endif %}
+
+    return result
+    {% endif %}
+{% else %}
+    if not isinstance(obj, dict):
+        raise _Mismatch('a dict', obj, '')
+
+    result = dict()  # type: {{ type_expression }}
+    for key, value in obj.items():
+        if not isinstance(key, str):
+            raise _Mismatch('a key of type str', key, '')
+
+    {% if item_check %}
+        {{ item_check|indent|indent }}
+
+        result[key] = value
+    {% elif item_decoder %}
+        try:
+            result[key] = {{ item_decoder }}(value)
+        except _Mismatch as err:
+            raise err.within('[{!r}]'.format(key))
+    {% else %}
+        result[key] = value
+    {% endif %}
+
+    return result
+{% endif %}''')
+
+
+@icontract.require(lambda typedef: isinstance(typedef, (Listdef, Dictdef)) or _is_checked_primitive(typedef))
+@icontract.ensure(lambda result: not result.endswith('\n'))
+def _generate_decoder(typedef: Typedef) -> str:
+    """
+    Generate the function which decodes a JSON-ed list, dictionary or primitive value to the type definition.
+
+    :param typedef: type definition in Python representation
+    :return: Python code
+    """
+    primitive_check = None  # type: Optional[str]
+    item_check = None  # type: Optional[str]
+    item_decoder = None  # type: Optional[str]
+
+    if _is_checked_primitive(typedef):
+        primitive_check = _primitive_check(typedef=typedef, var='obj', path="''")
     else:
-        raise NotImplementedError('Translating the typedef to an expected type is not supported: {}'.format(typedef))
+        items = typedef.items if isinstance(typedef, Listdef) else typedef.values  # type: ignore
+        assert items is not None
+
+        if _is_checked_primitive(items):
+            if isinstance(typedef, Listdef):
+                item_check = _primitive_check(typedef=items, var='item', path="'[{}]'.format(len(result))")
+            else:
+                item_check = _primitive_check(typedef=items, var='value', path="'[{!r}]'.format(key)")
+        elif not isinstance(items, Anydef):
+            item_decoder = _decoder_name(typedef=items)
+
+    return _DECODER_TPL.render(
+        name=_decoder_name(typedef=typedef),
+        type_expression=_type_expression(typedef=typedef),
+        primitive_check=primitive_check,
+        is_list=isinstance(typedef, Listdef),
+        item_check=item_check,
+        item_decoder=item_decoder).strip()
 
 
 _CLASS_FROM_OBJ_TPL = _from_string_with_informative_exceptions(
@@ -1050,45 +1235,43 @@ def {{ (classdef.identifier+"_from_obj")|function_name }}(obj: Any, path: str =
     :return: parsed instance of {{ classdef.identifier|class_name }}
     """
     if not isinstance(obj, dict):
-        raise ValueError('Expected a dict at path {}, but got: {}'.format(path, type(obj)))
+        raise _Mismatch('a dict', obj, path)
 
     {% if not classdef.attributes %}
     return {{ classdef.identifier|class_name }}()
     {% else %}
-    for key in obj:
-        if not isinstance(key, str):
-            raise ValueError(
-                'Expected a key of type str at path {}, but got: {}'.format(path, type(key)))
     {% for attr in classdef.attributes.values() %}
-
+    {% set var = ("obj_"+attr.name)|var_name %}
+    {% set path = 'path + %s'|format(('.%s'|format(attr.name))|repr) %}
     {% if attr.required %}
-    {% if attr in expected_type_expression %}
-    {{ (attr.name+"_from_obj")|var_name }} = from_obj(
-        obj[{{ attr.name|repr }}],
-        expected=[{{ expected_type_expression[attr] }}],
-        path=path + {{ '.%s'|format(attr.name)|repr }})  # type: {{ type_expression[attr] }}
-    {% else %}{# if attr in expected_type_expression #}
-    {{ (attr.name+"_from_obj")|var_name }} = obj[{{ attr.name|repr }}]
-    {% endif %}{# /if attr in expected_type_expression #}
+    {% if attr in primitive_check or attr not in decoder %}
+    {{ var }} = obj[{{ attr.name|repr }}]  # type: {{ type_expression[attr] }}
+    {% if attr in primitive_check %}
+    {{ primitive_check[attr]|indent }}
+    {% endif %}
+    {% else %}
+    try:
+        {{ var }} = {{ decoder[attr] }}(obj[{{ attr.name|repr }}])  # type: {{ type_expression[attr] }}
+    except _Mismatch as err:
+        raise err.within({{ path }})
+    {% endif %}
     {% else %}{# if attr.required #}
-    {% if attr in expected_type_expression %}
-    {{ ("obj_"+attr.name)|var_name }} = obj.get({{ attr.name|repr }}, None)
-    if {{ ("obj_"+attr.name)|var_name }} is not None:
-        {{ (attr.name+"_from_obj")|var_name }} = from_obj(
-            {{ ("obj_"+attr.name)|var_name }},
-            expected=[{{ expected_type_expression[attr] }}],
-            path=path + {{ '.%s'|format(attr.name)|repr }})  # type: Optional[{{ type_expression[attr] }}]
-    else:
-        {{ (attr.name+"_from_obj")|var_name }} = None
-    {% else %}{# if attr in expected_type_expression #}
-    {{ (attr.name+"_from_obj")|var_name }} = obj.get({{ attr.name|repr }}, None)
-    {% endif %}{# /if attr in expected_type_expression #}
+    {{ var }} = obj.get({{ attr.name|repr }}, None)  # type: Optional[{{ type_expression[attr] }}]
+    {% if attr in primitive_check %}
+    {{ primitive_check[attr]|indent }}
+    {% elif attr in decoder %}
+    if {{ var }} is not None:
+        try:
+            {{ var }} = {{ decoder[attr] }}({{ var }})
+        except _Mismatch as err:
+            raise err.within({{ path }})
+    {% endif %}
     {% endif %}{# /if attr.required #}
-    {% endfor %}{# /for attr in classdef.attributes.values() #}
 
+    {% endfor %}{# /for attr in classdef.attributes.values() #}
     return {{ classdef.identifier|class_name }}(
     {% for attr in classdef.attributes.values() %}
-        {{ attr.name|arg_name }}={{ (attr.name+"_from_obj")|var_name }}{{ ')' if loop.last else ',' }}
+        {{ attr.name|arg_name }}={{ ("obj_"+attr.name)|var_name }}{{ ')' if loop.last else ',' }}
     {% endfor %}{# /for attr in classdef.attributes.values() #}
     {% endif %}{# /if not classdef.attributes #}''')
 
@@ -1098,22 +1281,33 @@ def _generate_class_from_obj(classdef: Classdef) -> str:
     """
     Generate the code of the ``{class}_from_obj`` function that parses the JSON-ed object to an instance of a class.
 
+    The primitive attributes are checked inline, the others are passed to their specialized decoders. The local
+    variables are prefixed with ``obj_`` so that they do not shadow the decoders of the classes.
+
     :param classdef: class definition in Python representation
     :return: Python code
     """
-    expected_type_expression = dict()
-    type_expression = dict()
+    primitive_check = dict()  # type: Dict[Attribute, str]
+    decoder = dict()  # type: Dict[Attribute, str]
+    type_expression = dict()  # type: Dict[Attribute, str]
     for attr in classdef.attributes.values():
         if attr.typedef is None:
             raise ValueError('Unexpected None typedef of attr {!r} in class {!r}'.format(
                 attr.name, classdef.identifier))
 
-        if not isinstance(attr.typedef, Anydef):
-            expected_type_expression[attr] = _expected_type_expression(typedef=attr.typedef)
+        if _is_checked_primitive(attr.typedef):
+            primitive_check[attr] = _primitive_check(
+                typedef=attr.typedef,
+                var=_var_name('obj_' + attr.name),
+                path='path + {!r}'.format('.{}'.format(attr.name)),
+                optional=not attr.required)
+        elif not isinstance(attr.typedef, Anydef):
+            decoder[attr] = _decoder_name(typedef=attr.typedef)
+
         type_expression[attr] = _type_expression(typedef=attr.typedef, path=classdef.identifier + '.' + attr.name)
 
     return _CLASS_FROM_OBJ_TPL.render(
-        classdef=classdef, expected_type_expression=expected_type_expression, type_expression=type_expression).strip()
+        classdef=classdef, primitive_check=primitive_check, decoder=decoder, type_expression=type_expression).strip()
 
 
 _TO_JSONABLE_TPL = _from_string_with_informative_exceptions(
@@ -1199,6 +1393,50 @@ def _generate_to_jsonable(classdefs: List[Classdef]) -> str:
     return _TO_JSONABLE_TPL.render(classdefs=classdefs)
 
 
+_ENCODER_TPL = _from_string_with_informative_exceptions(
+    env=_ENV,
+    text='''\
+def {{ name }}(obj: {{ type_expression }}) -> {{ 'List[Any]' if is_list else 'Dict[str, Any]' }}:
+    """
+    Converts the {{ 'list' if is_list else 'dictionary' }} to a JSON-able representation.
+
+    :param obj: to be converted
+    :return: JSON-able representation
+    """
+    {% if item_encoder is none %}
+    return {{ 'list' if is_list else 'dict' }}(obj)
+    {% elif is_list %}
+    return [{{ item_encoder }}(item) for item in obj]
+    {% else %}
+    return {key: {{ item_encoder }}(value) for key, value in obj.items()}
+    {% endif %}''')
+
+
+@icontract.require(lambda typedef: isinstance(typedef, (Listdef, Dictdef)))
+@icontract.ensure(lambda result: not result.endswith('\n'))
+def _generate_encoder(typedef: Typedef) -> str:
+    """
+    Generate the function which converts a list or a dictionary to a JSON-able representation.
+
+    The items are trusted to conform to the type annotations so that they are converted without checks.
+
+    :param typedef: type definition in Python representation
+    :return: Python code
+    """
+    items = typedef.items if isinstance(typedef, Listdef) else typedef.values  # type: ignore
+    assert items is not None
+
+    item_encoder = None  # type: Optional[str]
+    if not isinstance(items, (Booldef, Intdef, Floatdef, Strdef, Anydef)):
+        item_encoder = _encoder_name(typedef=items)
+
+    return _ENCODER_TPL.render(
+        name=_encoder_name(typedef=typedef),
+        type_expression=_type_expression(typedef=typedef),
+        is_list=isinstance(typedef, Listdef),
+        item_encoder=item_encoder).strip()
+
+
 _CLASS_TO_JSONABLE_TPL = _from_string_with_informative_exceptions(
     env=_ENV,
     text='''\
@@ -1222,10 +1460,7 @@ def {{ (classdef.identifier + "_to_jsonable")|function_name }}(
 {% if is_primitive[attr] %}
 res[{{ attr.name|repr }}] = {{ classdef.identifier|arg_name }}.{{ attr.name|property_name }}
 {% else %}
-res[{{ attr.name|repr }}] = to_jsonable(
-    {{ classdef.identifier|arg_name }}.{{ attr.name|property_name }},
-    expected=[{{ expected_type_expression[attr] }}],
-    path={{ '{}.%s'|format(attr.name)|repr }}.format(path))
+res[{{ attr.name|repr }}] = {{ encoder[attr] }}({{ classdef.identifier|arg_name }}.{{ attr.name|property_name }})
 {% endif %}{# /if is_primitive[attr] #}
     {% endset %}{# /set assignment #}
     {% if not attr.required %}
@@ -1245,11 +1480,13 @@ def _generate_class_to_jsonable(classdef: Classdef) -> str:
     """
     Generate ``{class}_to_jsonable`` function which converts the given instance of the class to a JSON-able format.
 
+    The attributes are trusted to conform to their type annotations so that they are converted without checks.
+
     :param classdef: class definition in Python representation
     :return: Python code
     """
     is_primitive = dict()
-    expected_type_expression = dict()
+    encoder = dict()
 
     for attr in classdef.attributes.values():
         if attr.typedef is None:
@@ -1257,13 +1494,80 @@ def _generate_class_to_jsonable(classdef: Classdef) -> str:
                 attr.name, classdef.identifier))
 
         is_primitive[attr] = isinstance(attr.typedef, (Booldef, Intdef, Floatdef, Strdef, Anydef))
-        if not isinstance(attr.typedef, Anydef):
-            expected_type_expression[attr] = _expected_type_expression(typedef=attr.typedef)
+        if not is_primitive[attr]:
+            encoder[attr] = _encoder_name(typedef=attr.typedef)
+
+    return _CLASS_TO_JSONABLE_TPL.render(classdef=classdef, is_primitive=is_primitive, encoder=encoder).strip()
+
+
+_DEFINITIONS_PY = _from_string_with_informative_exceptions(
+    env=_ENV,
+    text='''\
+{% if classdefs or decoders %}
+
+
+class _Mismatch(ValueError):
+    """Signals that a JSON-ed object does not conform to the expected type."""
+
+    def __init__(self, expected: str, got: Any, path: str) -> None:
+        """
+        Initializes with the given values.
+
+        The decoders do not track the paths to the objects. The path is relative to the decoder which
+        raised the error and the enclosing decoders prepend their paths while the error propagates.
+
+        :param expected: description of the expected type
+        :param got: the mismatched object
+        :param path: path to the mismatched object
+        """
+        super().__init__()
+        self.expected = expected
+        self.got = type(got)
+        self.segments = [path]
+
+    def within(self, path: str) -> '_Mismatch':
+        """Prepends the path to the enclosing object."""
+        self.segments.append(path)
+        return self
+
+    def __str__(self) -> str:
+        return 'Expected {} at {!r}, but got {}.'.format(
+            self.expected, ''.join(reversed(self.segments)), self.got)
+{% endif %}{# /if classdefs or decoders #}
+{% if classdefs %}
+
+
+{{ from_obj }}
+
+
+{{ to_jsonable }}
+{% for classdef in classdefs %}
+
+
+{{ class_definition[classdef] }}
+
+
+{{ factory_method[classdef] }}
+
+
+{{ class_from_obj[classdef] }}
+
+
+{{ class_to_jsonable[classdef] }}
+{% endfor %}{# /for classdef in classdefs #}
+{% endif %}{# /if classdefs #}
+{% for decoder in decoders %}
+
 
-    return _CLASS_TO_JSONABLE_TPL.render(
-        classdef=classdef, is_primitive=is_primitive, expected_type_expression=expected_type_expression).strip()
+{{ decoder }}
+{% endfor %}{# /for decoder in decoders #}
+{% for encoder in encoders %}
 
 
+{{ encoder }}
+{% endfor %}{# /for encoder in encoders #}
+''')
+
 _REQUEST_DOCSTRING_TPL = _from_string_with_informative_exceptions(
     env=_ENV,
     text='''\
@@ -1287,6 +1591,10 @@ Send a {{ request.method }} request to {{ request.path }}.
 {% endif %}{# /if not param.description #}
 {% endfor %}{# /for request.parameters #}
 {% endif %}{# /if request.parameters #}
+{% if not request.parameters %}
+
+{% endif %}
+:param request_timeout: overrides the connect and read timeouts of the caller for this call
 {% if resp is none or resp.description == ''%}
 
 :return:
@@ -1304,20 +1612,16 @@ Send a {{ request.method }} request to {{ request.path }}.
 _REQUEST_FUNCTION_TPL = _from_string_with_informative_exceptions(
     env=_ENV,
     text='''\
-{% if not request.parameters %}
-def {{ function_name }}(self) -> {{ return_type }}:
-{% else %}
-{% set suffix = ') -> %s:'|format(return_type) %}
-def {{ function_name }}(
+{{ 'async ' if is_async else '' }}def {{ function_name }}(
         self,
         {% for param in request.parameters %}
         {% if not param.required %}
-        {{ param.identifier|arg_name }}: Optional[{{ type_expression[param] }}] = None{{ suffix if loop.last else ',' }}
+        {{ param.identifier|arg_name }}: Optional[{{ type_expression[param] }}] = None,
         {% else %}
-        {{ param.identifier|arg_name }}: {{ type_expression[param] }}{{ suffix if loop.last else ',' }}
+        {{ param.identifier|arg_name }}: {{ type_expression[param] }},
         {% endif %}
         {% endfor %}{# /for param in request.parameters #}
-{% endif %}{# /if not request.parameters #}
+        request_timeout: Optional[_Timeout] = None) -> {{ return_type }}:
     {{ request_docstring|docstring|indent }}
     {% if not path_tokens %}{### Path parameters ###}
     url = self.url_prefix + {{ request.path|repr }}
@@ -1344,10 +1648,7 @@ headers[{{ param.name|repr }}] = {{ param.identifier|arg_name }}
                 {% elif is_primitive[param] %}
 headers[{{ param.name|repr }}] = json.dumps({{ param.identifier|arg_name }})
                 {% else %}
-headers[{{ param.name|repr }}] = json.dumps(
-    to_jsonable(
-        {{ param.identifier|arg_name }},
-        expected=[{{ expected_type_expression[param] }}]))
+headers[{{ param.name|repr }}] = json.dumps({{ encoder[param] }}({{ param.identifier|arg_name }}))
                 {% endif %}{# /if is_primitive[param] #}
             {% endset %}
             {% if param.required %}
@@ -1369,10 +1670,7 @@ params[{{ param.name|repr }}] = {{ param.identifier|arg_name }}
                 {% elif is_primitive[param] %}
 params[{{ param.name|repr }}] = json.dumps({{ param.identifier|arg_name }})
                 {% else %}
-params[{{ param.name|repr }}] = json.dumps(
-    to_jsonable(
-        {{ param.identifier|arg_name }},
-        expected=[{{ expected_type_expression[param] }}]))
+params[{{ param.name|repr }}] = json.dumps({{ encoder[param] }}({{ param.identifier|arg_name }}))
                 {% endif %}{# /if is_primitive[param] #}
             {% endset %}
             {% if param.required %}
@@ -1389,13 +1687,11 @@ params[{{ param.name|repr }}] = json.dumps(
         {% if is_primitive[request.body_parameter] %}
 data = {{ request.body_parameter.identifier|arg_name }}
         {% else %}
-data = to_jsonable(
-    {{ request.body_parameter.identifier|arg_name }},
-    expected=[{{ expected_type_expression[request.body_parameter] }}])
+data = {{ encoder[request.body_parameter] }}({{ request.body_parameter.identifier|arg_name }})
         {% endif %}{# /is_primitive[request.body_parameter] #}
     {% endset %}
     {% if request.body_parameter.required %}
-    {{ set_body|indent }}
+    {{ set_body|trim|indent }}
     {% else %}
     data = None  # type: Optional[Any]
     if {{ request.body_parameter.identifier|arg_name }} != None:
@@ -1413,10 +1709,7 @@ data[{{ param.name|repr }}] = {{ param.identifier|arg_name }}
             {% elif is_primitive[param] %}
 data[{{ param.name|repr }}] = json.dumps({{ param.identifier|arg_name }})
             {% else %}
-data[{{ param.name|repr }}] = json.dumps(
-    to_jsonable(
-        {{ param.identifier|arg_name }},
-        expected=[{{ expected_type_expression[param] }}]))
+data[{{ param.name|repr }}] = json.dumps({{ encoder[param] }}({{ param.identifier|arg_name }}))
             {% endif %}{# /if is_primitive[param] #}
         {% endset %}
         {% if param.required %}
@@ -1440,11 +1733,58 @@ data[{{ param.name|repr }}] = json.dumps(
             {% endif %}{# /if param.required #}
         {% endfor %}{# /for param in request.file_parameters #}
     {% endif %}{# /if request.file_parameters #}
+    {% if is_async %}{### Asynchronous call ###}
+    {% if request.file_parameters %}
 
-    {% if not request.parameters %}
-    resp = self.session.request(method={{ request.method|repr }}, url=url)
-    {% else %}
-    resp = self.session.request(
+    form = aiohttp.FormData()
+    {% if request.formdata_parameters %}
+    for name, value in data.items():
+        form.add_field(name, value)
+    {% endif %}
+    for name, file in files.items():
+        form.add_field(name, file)
+    {% endif %}{# /if request.file_parameters #}
+    {% set arguments = ['method=%s'|format(request.method|repr), 'url=url', 'timeout=self._timeout(request_timeout)'] %}
+    {% if request.header_parameters %}
+    {% set arguments = arguments + ['headers=headers'] %}
+    {% endif %}
+    {% if request.query_parameters %}
+    {% set arguments = arguments + ['params=params'] %}
+    {% endif %}
+    {% if request.body_parameter %}
+    {% set arguments = arguments + ['json=data'] %}
+    {% endif %}
+    {% if request.file_parameters %}
+    {% set arguments = arguments + ['data=form'] %}
+    {% elif request.formdata_parameters %}
+    {% set arguments = arguments + ['data=data'] %}
+    {% endif %}
+
+    async with self._slot():
+        {% if streamed %}
+        resp = await self._session().request(
+            {% for argument in arguments %}
+            {{ argument }}{{ ')' if loop.last else ',' }}
+            {% endfor %}
+        resp.raise_for_status()
+        return resp
+        {% else %}
+        async with self._session().request(
+                {% for argument in arguments %}
+                {{ argument }}{{ ') as resp:' if loop.last else ',' }}
+                {% endfor %}
+            resp.raise_for_status()
+            {% if return_type == 'bytes' %}
+            return await resp.read()
+            {% elif response_decoder is none %}
+            return await resp.json(content_type=None)
+            {% else %}
+            return {{ response_decoder }}(await resp.json(content_type=None))
+            {% endif %}
+        {% endif %}{# /if streamed #}
+    {% else %}{### Synchronous call ###}
+
+    resp = self._session().request(
         method={{ request.method|repr }},
         url=url,
         {% if request.header_parameters %}
@@ -1462,13 +1802,13 @@ data[{{ param.name|repr }}] = json.dumps(
         {% if request.file_parameters %}
         files=files,
         {% endif %}
-        {% if return_type == 'BinaryIO' %}
+        {% if streamed %}
         stream=True,
         {% endif %}
+        timeout=self.timeout if request_timeout is None else request_timeout,
     )
-    {% endif %}{# /if not request.parameters #}
 
-    {% if return_type == 'BinaryIO' %}
+    {% if streamed %}
     resp.raise_for_status()
     return _wrap_response(resp)
     {% else %}
@@ -1478,12 +1818,13 @@ data[{{ param.name|repr }}] = json.dumps(
         return resp.content
         {% elif return_type == 'MutableMapping[str, Any]' %}
         return resp.json()
+        {% elif response_decoder is none %}
+        return resp.json()
         {% else %}
-        return from_obj(
-            obj=resp.json(),
-            expected=[{{ expected_type_expression[resp] }}])
+        return {{ response_decoder }}(resp.json())
         {% endif %}
-    {% endif %}''')
+    {% endif %}{# /if streamed #}
+    {% endif %}{# /if is_async #}''')
 
 
 class _Token:
@@ -1505,12 +1846,17 @@ class _Token:
     'Both body parameter and form-data parameters are specified. '
     'The python client does not know how to resolve this request.',
     enabled=True)
+@icontract.require(
+    lambda request: all(_arg_name(param.identifier) != 'request_timeout' for param in request.parameters),
+    "The argument 'request_timeout' of the request function is reserved for the timeout of the call.",
+    enabled=True)
 @icontract.ensure(lambda result: not result.endswith('\n'))
-def _generate_request_function(request: Request) -> str:
+def _generate_request_function(request: Request, is_async: bool = False) -> str:
     """
     Generate the code of the client request function.
 
     :param request: request to the endpoint in Python representation
+    :param is_async: if set, generate the coroutine of the asynchronous client
     :return: Python code
     """
     ##
@@ -1537,7 +1883,7 @@ def _generate_request_function(request: Request) -> str:
     # Preapre request docstring
     ##
 
-    request_docstring = _REQUEST_DOCSTRING_TPL.render(request=request, resp=resp).rstrip()
+    request_docstring = _REQUEST_DOCSTRING_TPL.render(request=request, resp=resp, is_async=is_async).rstrip()
 
     ##
     # Prepare a representation of path parameters
@@ -1557,20 +1903,21 @@ def _generate_request_function(request: Request) -> str:
             path_tokens.append(_Token(text=token_text, parameter=param))
 
     ##
-    # Prepare expected types
+    # Prepare the converters of the parameters and the response
     ##
 
-    expected_type_expression = dict()  # type: Dict[Union[Parameter, Response], str]
+    is_primitive = dict()  # type: Dict[Parameter, bool]
+    encoder = dict()  # type: Dict[Parameter, str]
     for param in request.parameters:
-        if isinstance(param.typedef, Filedef):
-            continue
-
         if param.typedef is None:
             raise ValueError('Unexpected None typedef in param {!r} of request {!r}'.format(
                 param.name, request.operation_id))
 
-        expected_type_expression[param] = _expected_type_expression(typedef=param.typedef)
+        is_primitive[param] = isinstance(param.typedef, (Booldef, Intdef, Floatdef, Strdef, Filedef, Anydef))
+        if not is_primitive[param]:
+            encoder[param] = _encoder_name(typedef=param.typedef)
 
+    response_decoder = None  # type: Optional[str]
     if return_type not in ['bytes', 'MutableMapping[str, Any]', 'BinaryIO']:
         if resp is None:
             raise ValueError('Unexpected None resp with return_type {!r} in request {!r}'.format(
@@ -1580,7 +1927,8 @@ def _generate_request_function(request: Request) -> str:
             raise ValueError('Unexpected None resp.typedef with return_type {!r} in request {!r}'.format(
                 return_type, request.operation_id))
 
-        expected_type_expression[resp] = _expected_type_expression(typedef=resp.typedef)
+        if not isinstance(resp.typedef, Anydef):
+            response_decoder = _decoder_name(typedef=resp.typedef)
 
     ##
     # Render
@@ -1595,21 +1943,27 @@ def _generate_request_function(request: Request) -> str:
         type_expression[param] = _type_expression(
             typedef=param.typedef, path='{}.{}'.format(request.operation_id, param.name))
 
+    # The asynchronous client hands over the response itself so that the caller can read the content
+    # as a stream and release the connection.
+    streamed = return_type == 'BinaryIO'
+    if is_async and streamed:
+        return_type = 'aiohttp.ClientResponse'
+
     return _REQUEST_FUNCTION_TPL.render(
         request=request,
+        is_async=is_async,
+        streamed=streamed,
         function_name=_function_name(request.operation_id),
         return_type=return_type,
         resp=resp,
+        response_decoder=response_decoder,
         request_docstring=request_docstring,
         type_expression=type_expression,
         path_tokens=path_tokens,
         is_str={param: isinstance(param.typedef, Strdef)
                 for param in request.parameters},
-        is_primitive={
-            param: isinstance(param.typedef, (Booldef, Intdef, Floatdef, Strdef, Filedef))
-            for param in request.parameters
-        },
-        expected_type_expression=expected_type_expression).strip()
+        is_primitive=is_primitive,
+        encoder=encoder).strip()
 
 
 _CLIENT_PY = _from_string_with_informative_exceptions(
@@ -1624,16 +1978,19 @@ _CLIENT_PY = _from_string_with_informative_exceptions(
 
 import contextlib
 import json
-from typing import Any, BinaryIO, Dict, List, MutableMapping, Optional, cast
+import threading
+import weakref
+from typing import Any, BinaryIO, Callable, Dict, List, MutableMapping, Optional, Tuple, Union, cast
 
 import requests
+import requests.adapters
 import requests.auth
+import urllib3
+import urllib3.util.retry
 {% if file_responses %}
 
 from http.client import HTTPResponse
 
-import urllib3
-
 
 class _WrappedResponse(urllib3.HTTPResponse):
     """
@@ -1667,45 +2024,257 @@ def _wrap_response(resp: requests.Response) -> HTTPResponse:
     # (see docs for urllib3.HTTPResponse)
     return cast(HTTPResponse, _WrappedResponse(resp))
 {% endif %}{# /if file_responses #}
-{% if classdefs %}
+{% if definitions %}
+{{ definitions }}
+{% endif %}{# /if definitions #}
 
 
-{{ from_obj }}
+# Timeout in seconds of both connecting and reading, or a tuple of the two
+_Timeout = Union[float, Tuple[Optional[float], Optional[float]]]
 
 
-{{ to_jsonable }}
-{% for classdef in classdefs %}
+class RemoteCaller:
+    """Executes the remote calls to the server."""
 
+    def __init__(
+        self,
+        url_prefix: str,
+        auth: Optional[requests.auth.AuthBase] = None,
+        session: Optional[requests.Session] = None,
+        pool_size: int = 10,
+        max_connections_per_host: int = 10,
+        max_retries: int = 0,
+        backoff_factor: float = 0.0,
+        connect_timeout: Optional[float] = None,
+        read_timeout: Optional[float] = None,
+        session_factory: Optional[Callable[[], requests.Session]] = None) -> None:
+        """
+        Initializes with the given values.
+
+        If the session is not given, the caller is thread-safe: each thread calls through its own session and all
+        the sessions share a single thread-safe pool of the connections. The connections are kept alive in the pool
+        between the calls. The session property then gives the session of the current thread.
+
+        :param url_prefix: prefix of the URLs of the remote calls
+        :param auth: authentication of the calls
+        :param session:
+            session to be used for all the calls instead of the sessions of the threads.
+            The pool and the retries are not applied to it, and it is up to you whether it is safe to share.
+        :param pool_size: number of the hosts whose connections are pooled
+        :param max_connections_per_host: maximum number of the pooled connections to a single host
+        :param max_retries:
+            maximum number of the retries on connection errors and on the statuses 502, 503 and 504.
+            Non-idempotent methods such as POST are not retried. The read errors are not retried so that
+            the read timeouts are raised as requests.ReadTimeout.
+        :param backoff_factor: the retries wait backoff_factor * 2 ** (retry - 1) seconds
+        :param connect_timeout: timeout in seconds for establishing a connection; None means no timeout
+        :param read_timeout: timeout in seconds between the bytes received from the server; None means no timeout
+        :param session_factory:
+            creates the session of each thread, e.g., to set the headers or the hooks of all the calls.
+            The pool and the retries are mounted on the created sessions.
+        """
+        self.url_prefix = url_prefix
+        self.auth = auth
+        self._given_session = session
+        self.session_factory = session_factory if session_factory is not None else requests.Session
+        self.timeout = (connect_timeout, read_timeout)  # type: _Timeout
+
+        self._adapter = requests.adapters.HTTPAdapter(
+            pool_connections=pool_size,
+            pool_maxsize=max_connections_per_host,
+            max_retries=urllib3.util.retry.Retry(
+                total=max_retries,
+                read=False,
+                backoff_factor=backoff_factor,
+                status_forcelist=[502, 503, 504],
+                raise_on_status=False))
+        self._local = threading.local()
+
+        # Sessions of the threads so that they can be closed; the sessions of the finished threads are dropped.
+        self._sessions = weakref.WeakSet()  # type: weakref.WeakSet[requests.Session]
+        self._sessions_lock = threading.Lock()
+
+    def close(self) -> None:
+        """Closes the sessions of the threads and the pooled connections."""
+        with self._sessions_lock:
+            sessions = list(self._sessions)
+            self._sessions.clear()
+
+        for session in sessions:
+            session.close()
+
+        self._adapter.close()
+
+    @property
+    def session(self) -> requests.Session:
+        """
+        Returns the session given to the constructor or, if none was given, the session of the current thread.
 
-{{ class_definition[classdef] }}
+        The changes to the session of a thread do not apply to the other threads; configure the sessions of all
+        the threads with the session_factory instead.
+        """
+        return self._session()
+
+    @session.setter
+    def session(self, value: Optional[requests.Session]) -> None:
+        """Sets the session to be used for all the calls; None switches back to the sessions of the threads."""
+        self._given_session = value
+
+    def _session(self) -> requests.Session:
+        """Returns the session of the current thread, creates it on the first call in the thread."""
+        if self._given_session is not None:
+            return self._given_session
+
+        session = getattr(self._local, 'session', None)  # type: Optional[requests.Session]
+        if session is None:
+            session = self.session_factory()
+            if self.auth is not None:
+                session.auth = self.auth
+            session.mount('http://', self._adapter)
+            session.mount('https://', self._adapter)
+            self._local.session = session
+
+            with self._sessions_lock:
+                self._sessions.add(session)
+
+        return session
+    {% for request in requests %}
 
+    {{ request_function[request]|indent }}
+    {% endfor %}{# /for request in requests #}
 
-{{ factory_method[classdef] }}
 
+# Automatically generated file by swagger_to. DO NOT EDIT OR APPEND ANYTHING!
 
-{{ class_from_obj[classdef] }}
+''')
 
+_ASYNC_CLIENT_PY = _from_string_with_informative_exceptions(
+    env=_ENV,
+    text='''\
+#!/usr/bin/env python3
+# Automatically generated file by swagger_to. DO NOT EDIT OR APPEND ANYTHING!
+"""Implements the asynchronous client for {{ service_name }}."""
+
+# pylint: skip-file
+# pydocstyle: add-ignore=D105,D107,D401
+
+import asyncio
+import json
+from typing import Any, BinaryIO, Dict, List, MutableMapping, Optional, Tuple, Union
+
+import aiohttp
+{% if definitions %}
+{{ definitions }}
+{% endif %}{# /if definitions #}
+
+
+# Timeout in seconds of both connecting and reading, a tuple of the two, or the timeout of aiohttp
+_Timeout = Union[float, Tuple[Optional[float], Optional[float]], aiohttp.ClientTimeout]
+
+
+class _Unlimited:
+    """Stands in for the semaphore if the number of the concurrent calls is not limited."""
+
+    async def __aenter__(self) -> None:
+        return None
+
+    async def __aexit__(self, exc_type: Any, exc_value: Any, traceback: Any) -> None:
+        return None
 
-{{ class_to_jsonable[classdef] }}
-{% endfor %}{# /for classdef in classdefs #}
-{% endif %}{# /if classdefs #}
+
+_UNLIMITED = _Unlimited()
 
 
 class RemoteCaller:
-    """Executes the remote calls to the server."""
+    """Executes the remote calls to the server asynchronously."""
 
     def __init__(
         self,
         url_prefix: str,
-        auth: Optional[requests.auth.AuthBase] = None,
-        session: Optional[requests.Session] = None) -> None:
+        auth: Optional[aiohttp.BasicAuth] = None,
+        session: Optional[aiohttp.ClientSession] = None,
+        max_connections: int = 100,
+        max_connections_per_host: int = 0,
+        max_concurrency: int = 0,
+        connect_timeout: Optional[float] = None,
+        read_timeout: Optional[float] = None) -> None:
+        """
+        Initializes with the given values.
+
+        If the session is not given, it is created on the first call so that it binds to the running event loop.
+        The pool size and the authentication apply only to the created session. The timeouts apply to all
+        the calls and are raised as asyncio.TimeoutError.
+
+        :param url_prefix: prefix of the URLs of the remote calls
+        :param auth: authentication of the calls
+        :param session: session to be used for the calls instead of the created one
+        :param max_connections: maximum number of the pooled connections; 0 means no limit
+        :param max_connections_per_host: maximum number of the pooled connections to a single host; 0 means no limit
+        :param max_concurrency: maximum number of the calls in flight, the excess calls wait; 0 means no limit
+        :param connect_timeout: timeout in seconds for establishing a connection; None means no timeout
+        :param read_timeout: timeout in seconds between the bytes received from the server; None means no timeout
+        """
         self.url_prefix = url_prefix
         self.auth = auth
         self.session = session
+        self.max_connections = max_connections
+        self.max_connections_per_host = max_connections_per_host
+        self.max_concurrency = max_concurrency
+        self.timeout = aiohttp.ClientTimeout(total=None, sock_connect=connect_timeout, sock_read=read_timeout)
+
+        self._owns_session = session is None
+        self._semaphore = None  # type: Optional[asyncio.Semaphore]
+
+    async def __aenter__(self) -> 'RemoteCaller':
+        return self
+
+    async def __aexit__(self, exc_type: Any, exc_value: Any, traceback: Any) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """Closes the session unless it has been given to the constructor."""
+        if self._owns_session and self.session is not None:
+            await self.session.close()
+            self.session = None
+
+    def _session(self) -> aiohttp.ClientSession:
+        """Returns the session, creates it on the first call."""
+        if self.session is None:
+            self.session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=self.max_connections, limit_per_host=self.max_connections_per_host),
+                auth=self.auth)
+
+        return self.session
+
+    def _timeout(self, request_timeout: Optional[_Timeout]) -> aiohttp.ClientTimeout:
+        """Returns the timeout of the call, the timeout of the caller unless overridden for the call."""
+        if request_timeout is None:
+            return self.timeout
+
+        if isinstance(request_timeout, aiohttp.ClientTimeout):
+            return request_timeout
+
+        if isinstance(request_timeout, tuple):
+            connect_timeout, read_timeout = request_timeout
+        else:
+            connect_timeout, read_timeout = request_timeout, request_timeout
+
+        return aiohttp.ClientTimeout(total=None, sock_connect=connect_timeout, sock_read=read_timeout)
+
+    def _slot(self) -> Union[asyncio.Semaphore, _Unlimited]:
+        """
+        Returns the context holding a slot for a call in flight.
+
+        A streamed response frees its slot once the headers are received.
+        """
+        if self.max_concurrency == 0:
+            return _UNLIMITED
+
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
 
-        if not self.session:
-            self.session = requests.Session()
-            self.session.auth = self.auth
+        return self._semaphore
     {% for request in requests %}
 
     {{ request_function[request]|indent }}
@@ -1717,6 +2286,64 @@ class RemoteCaller:
 ''')
 
 
+def _check_function_names(requests: List[Request]) -> None:
+    """Raise if the names of the request functions clash."""
+    observed_request_function_names = dict()  # type: Dict[str, Request]
+    for request in requests:
+        function_name = _function_name(name=request.operation_id)
+        if function_name in observed_request_function_names:
+            raise KeyError(
+                'The function names for the requests with the operation IDs {!r} and {!r} are identical: {!r}'.format(
+                    request.operation_id, observed_request_function_names[function_name], function_name))
+
+
+@icontract.ensure(lambda result: not result.endswith('\n'))
+def _generate_definitions(classdefs: List[Classdef], requests: List[Request]) -> str:
+    """
+    Generate the code of the classes, their decoders and encoders shared by the synchronous and asynchronous client.
+
+    :param classdefs: class definitions in Python representation
+    :param requests: request functions in Python representation
+    :return: Python code, empty if there is nothing to define
+    """
+    # The containers in the classes need both the decoders and the encoders, the others only what their
+    # requests need.
+    decoded = collections.OrderedDict()  # type: MutableMapping[str, Typedef]
+    encoded = collections.OrderedDict()  # type: MutableMapping[str, Typedef]
+    for classdef in classdefs:
+        for attr in classdef.attributes.values():
+            assert attr.typedef is not None
+            _register_containers(typedef=attr.typedef, containers=decoded)
+            _register_containers(typedef=attr.typedef, containers=encoded)
+
+    for request in requests:
+        for param in request.parameters:
+            assert param.typedef is not None
+            _register_containers(typedef=param.typedef, containers=encoded)
+
+        resp = request.responses.get('200', None)
+        if resp is not None and resp.typedef is not None and not isinstance(resp.typedef, Filedef):
+            _register_containers(typedef=resp.typedef, containers=decoded)
+
+            if _is_checked_primitive(resp.typedef):
+                decoded.setdefault(_structure_name(typedef=resp.typedef), resp.typedef)
+
+    return _DEFINITIONS_PY.render(
+        classdefs=classdefs,
+        decoders=[_generate_decoder(typedef=typedef) for typedef in decoded.values()],
+        encoders=[_generate_encoder(typedef=typedef) for typedef in encoded.values()],
+        from_obj=_generate_from_obj(classdefs=classdefs),
+        to_jsonable=_generate_to_jsonable(classdefs=classdefs),
+        class_definition={classdef: _generate_class_definition(classdef=classdef)
+                          for classdef in classdefs},
+        factory_method={classdef: _generate_factory_method(classdef=classdef)
+                        for classdef in classdefs},
+        class_from_obj={classdef: _generate_class_from_obj(classdef=classdef)
+                        for classdef in classdefs},
+        class_to_jsonable={classdef: _generate_class_to_jsonable(classdef=classdef)
+                           for classdef in classdefs}).rstrip('\n')
+
+
 @icontract.ensure(lambda result: result.endswith('\n'), 'File ends with a new line.')
 def generate_client_py(service_name: str, typedefs: MutableMapping[str, Typedef], requests: List[Request]) -> str:
     """
@@ -1736,28 +2363,37 @@ def generate_client_py(service_name: str, typedefs: MutableMapping[str, Typedef]
     assert len(set(classdefs)) == len(classdefs), \
         'All class definitions in Python representation are expected to be unique.'
 
-    observed_request_function_names = dict()  # type: Dict[str, Request]
-    for request in requests:
-        function_name = _function_name(name=request.operation_id)
-        if function_name in observed_request_function_names:
-            raise KeyError(
-                'The function names for the requests with the operation IDs {!r} and {!r} are identical: {!r}'.format(
-                    request.operation_id, observed_request_function_names[function_name], function_name))
+    _check_function_names(requests=requests)
 
     return _CLIENT_PY.render(
         service_name=service_name,
-        classdefs=classdefs,
         file_responses=file_responses,
-        from_obj=_generate_from_obj(classdefs=classdefs),
-        to_jsonable=_generate_to_jsonable(classdefs=classdefs),
-        class_definition={classdef: _generate_class_definition(classdef=classdef)
-                          for classdef in classdefs},
-        factory_method={classdef: _generate_factory_method(classdef=classdef)
-                        for classdef in classdefs},
-        class_from_obj={classdef: _generate_class_from_obj(classdef=classdef)
-                        for classdef in classdefs},
-        class_to_jsonable={classdef: _generate_class_to_jsonable(classdef=classdef)
-                           for classdef in classdefs},
+        definitions=_generate_definitions(classdefs=classdefs, requests=requests),
         requests=requests,
         request_function={request: _generate_request_function(request=request)
                           for request in requests})
+
+
+@icontract.ensure(lambda result: result.endswith('\n'), 'File ends with a new line.')
+def generate_async_client_py(service_name: str, typedefs: MutableMapping[str, Typedef], requests: List[Request]) -> str:
+    """
+    Generate the code of the asynchronous client based on aiohttp.
+
+    :param service_name: used to designate the service that client connects to
+    :param typedefs: table of type definitions in Python representation
+    :param requests: request functions in Python representation
+    :return: Python code
+    """
+    classdefs = [typedef for typedef in typedefs.values() if isinstance(typedef, Classdef)]
+
+    assert len(set(classdefs)) == len(classdefs), \
+        'All class definitions in Python representation are expected to be unique.'
+
+    _check_function_names(requests=requests)
+
+    return _ASYNC_CLIENT_PY.render(
+        service_name=service_name,
+        definitions=_generate_definitions(classdefs=classdefs, requests=requests),
+        requests=requests,
+        request_function={request: _generate_request_function(request=request, is_async=True)
+                          for request in requests})
@@ -1,8 +1,13 @@
 """Parse Swagger spec."""
 
+import bisect
 import collections
+import datetime
+import decimal
+import functools
 import json
 import pathlib
+import re
 from typing import List, Optional, MutableMapping, Any, Tuple, Union, cast  # pylint: disable=unused-import
 
 import jsonschema
@@ -119,6 +124,9 @@ class Method:
         self.produces = None  # type: Optional[List[str]]
         self.consumes = None  # type: Optional[List[str]]
         self.x_swagger_to_skip = False
+        self.x_swagger_to_max_body_bytes = None  # type: Optional[int]
+        self.x_swagger_to_timeout = None  # type: Optional[datetime.timedelta]
+        self.x_swagger_to_max_in_flight = None  # type: Optional[int]
         self.__lineno__ = 0
 
         # original specification dictionary, if available; not deep-copied, do not modify
@@ -161,9 +169,52 @@ class Swagger:
         self.produces = None  # type: Optional[List[str]]
         self.consumes = None  # type: Optional[List[str]]
 
+        # Maximum numbers of in-flight requests shared by the endpoints of a tag, if specified for the tag
+        self.x_swagger_to_max_in_flight = collections.OrderedDict()  # type: MutableMapping[str, int]
+
         self.raw_dict = None  # type: Optional[RawDict]
 
 
+# Nanoseconds in a unit of a duration as written in Go (see time.ParseDuration)
+_DURATION_UNITS = {
+    'h': 3600 * 1000 * 1000 * 1000,
+    'm': 60 * 1000 * 1000 * 1000,
+    's': 1000 * 1000 * 1000,
+    'ms': 1000 * 1000,
+    'us': 1000,
+    '\u00b5s': 1000,
+    'ns': 1
+}
+
+_DURATION_PART_RE = re.compile(r'([0-9]+(?:\.[0-9]*)?|\.[0-9]+)(ns|us|\u00b5s|ms|s|m|h)')
+
+
+def _parse_duration(text: str) -> Optional[datetime.timedelta]:
+    """
+    Parse a duration written as in Go such as "2s", "250ms" or "1m30s".
+
+    :param text: text representation of the duration
+    :return: parsed duration, or None if the text is not a valid duration or not a whole number of microseconds
+    """
+    if text == '':
+        return None
+
+    nanoseconds = decimal.Decimal(0)
+    cursor = 0
+    while cursor < len(text):
+        mtch = _DURATION_PART_RE.match(text, cursor)
+        if not mtch:
+            return None
+
+        nanoseconds += decimal.Decimal(mtch.group(1)) * _DURATION_UNITS[mtch.group(2)]
+        cursor = mtch.end()
+
+    if nanoseconds % 1000 != 0:
+        return None
+
+    return datetime.timedelta(microseconds=int(nanoseconds // 1000))
+
+
 def _parse_typedef(raw_dict: RawDict) -> Tuple[Typedef, List[str]]:
     """
     Parse the type definition from the raw dictionary in the Swagger spec.
@@ -320,6 +371,31 @@ def _parse_method(raw_dict: RawDict) -> Tuple[Method, List[str]]:
     mth.description = raw_dict.get('description', '').strip()
     mth.x_swagger_to_skip = raw_dict.get('x-swagger-to-skip', False)
 
+    max_body_bytes = raw_dict.get('x-swagger-to-max-body-bytes', None)
+    if max_body_bytes is not None:
+        if isinstance(max_body_bytes, bool) or not isinstance(max_body_bytes, int) or max_body_bytes <= 0:
+            errors.append(
+                'expected x-swagger-to-max-body-bytes to be a positive integer, but got: {!r}'.format(max_body_bytes))
+        else:
+            mth.x_swagger_to_max_body_bytes = max_body_bytes
+
+    timeout = raw_dict.get('x-swagger-to-timeout', None)
+    if timeout is not None:
+        duration = _parse_duration(text=timeout) if isinstance(timeout, str) else None
+        if duration is None or duration <= datetime.timedelta(0):
+            errors.append('expected x-swagger-to-timeout to be a positive duration of whole microseconds '
+                          'such as "2s", "250ms" or "1m30s", but got: {!r}'.format(timeout))
+        else:
+            mth.x_swagger_to_timeout = duration
+
+    max_in_flight = raw_dict.get('x-swagger-to-max-in-flight', None)
+    if max_in_flight is not None:
+        if isinstance(max_in_flight, bool) or not isinstance(max_in_flight, int) or max_in_flight <= 0:
+            errors.append(
+                'expected x-swagger-to-max-in-flight to be a positive integer, but got: {!r}'.format(max_in_flight))
+        else:
+            mth.x_swagger_to_max_in_flight = max_in_flight
+
     mth.produces = raw_dict.get('produces', None)
     mth.consumes = raw_dict.get('consumes', None)
     mth.__lineno__ = raw_dict.lineno
@@ -384,43 +460,105 @@ def _parse_path(raw_dict: RawDict) -> Tuple[Path, List[str]]:
     return pth, errors
 
 
-def parse_yaml(stream: Any) -> Tuple[Swagger, List[str]]:
+# Adapted from https://stackoverflow.com/questions/5121931/in-python-how-can-you-load-yaml-mappings-as-ordereddicts
+# and https://stackoverflow.com/questions/13319067/parsing-yaml-return-with-line-number
+
+
+def _construct_raw_dict(loader: Any, node: Any, deep: bool = False) -> RawDict:
+    """Construct a raw dictionary from the YAML mapping node with the source and line number of the node."""
+    loader.flatten_mapping(node)
+    mapping = yaml.constructor.Constructor.construct_pairs(loader, node, deep=deep)
+
+    # Enforce keys to be strings,
+    # see https://stackoverflow.com/questions/50045617/yaml-load-force-dict-keys-to-strings
+
+    data = collections.OrderedDict([(str(k), v) for k, v in mapping])
+
+    return RawDict(adict=data, source=loader.source, lineno=node.start_mark.line)
+
+
+def _raw_dict_loader(base: Any) -> Any:
+    """Define a YAML loader on top of the given base loader which constructs the mappings as raw dictionaries."""
+    pass  # needed for pydocstyle
+
+    class Loader(base):  # type: ignore
+        def __init__(self, stream: Any) -> None:
+            super().__init__(stream)
+            self.source = str(getattr(stream, 'name', ''))
+
+    Loader.add_constructor(yaml.resolver.BaseResolver.DEFAULT_MAPPING_TAG, _construct_raw_dict)
+
+    return Loader
+
+
+# Pure-Python loader; always available.
+_PY_LOADER = _raw_dict_loader(base=yaml.SafeLoader)  # pylint: disable=invalid-name
+
+# Use libyaml bindings if PyYAML has been built with them since they are an order of magnitude faster.
+_LOADER = _raw_dict_loader(base=yaml.CSafeLoader) if hasattr(yaml, 'CSafeLoader') else _PY_LOADER  # pylint: disable=invalid-name
+
+
+@functools.lru_cache(maxsize=1)
+def schema_validator() -> jsonschema.Draft4Validator:
     """
-    Parse the Swagger specification from the given text.
+    Check the JSON schema of OpenAPI 2 once and build the validator shared by all the parse calls in the process.
 
-    :param stream: YAML representation of the Swagger spec satisfying file interface
-    :return: (parsed Swagger specification, parsing errors if any)
+    :return: validator of Swagger specifications
     """
-    pass  # needed for pydocstyle
+    jsonschema.Draft4Validator.check_schema(swagger_to.swaggerjsonschema.SCHEMA)
+    return jsonschema.Draft4Validator(swagger_to.swaggerjsonschema.SCHEMA)
+
+
+# Matches JSON strings; JSON strings can not contain raw new lines.
+_JSON_STRING_RE = re.compile(r'"[^"\\]*(?:\\.[^"\\]*)*"')
+
+_JSON_BRACE_RE = re.compile(r'[{}]')
 
-    # Adapted from https://stackoverflow.com/questions/5121931/in-python-how-can-you-load-yaml-mappings-as-ordereddicts
-    # and https://stackoverflow.com/questions/13319067/parsing-yaml-return-with-line-number
 
-    class Loader(yaml.SafeLoader):
-        pass
+def _load_json(text: str, source: str) -> Any:
+    """
+    Load the JSON text constructing the objects as raw dictionaries with the line number of their opening brace.
+
+    :param text: JSON representation of the Swagger spec
+    :param source: name of the source of the text
+    :return: loaded JSON value
+    """
+    # Empty the strings so that the braces in them are ignored. This preserves the lines.
+    stripped = _JSON_STRING_RE.sub('""', text)
 
-    def construct_mapping(loader, node, deep=False):
-        loader.flatten_mapping(node)
-        mapping = yaml.constructor.Constructor.construct_pairs(loader, node, deep=deep)
+    # json calls the object hook when an object is closed so we list the opening braces in the order of closing.
+    openings = []  # type: List[int]
+    closed_openings = []  # type: List[int]
+    for mtch in _JSON_BRACE_RE.finditer(stripped):
+        if mtch.group(0) == '{':
+            openings.append(mtch.start())
+        elif openings:
+            closed_openings.append(openings.pop())
 
-        # Enforce keys to be strings,
-        # see https://stackoverflow.com/questions/50045617/yaml-load-force-dict-keys-to-strings
+    line_starts = [mtch.end() for mtch in re.finditer('\n', stripped)]
 
-        data = collections.OrderedDict([(str(k), v) for k, v in mapping])
+    # Line numbers are 0-based as in the YAML loader.
+    linenos = iter([bisect.bisect_right(line_starts, position) for position in closed_openings])
 
-        return RawDict(adict=data, source=stream.name, lineno=node.start_mark.line)
+    def construct_raw_dict(pairs: List[Tuple[str, Any]]) -> RawDict:
+        return RawDict(adict=collections.OrderedDict(pairs), source=source, lineno=next(linenos, 0))
 
-    Loader.add_constructor(yaml.resolver.BaseResolver.DEFAULT_MAPPING_TAG, construct_mapping)
+    return json.loads(text, object_pairs_hook=construct_raw_dict)
 
-    raw_dict = cast(RawDict, yaml.load(stream, Loader))
 
+def _parse_raw_dict(raw_dict: RawDict) -> Tuple[Swagger, List[str]]:
+    """
+    Validate and parse the Swagger specification from the raw dictionary.
+
+    :param raw_dict: raw dictionary of the Swagger spec as loaded from the file
+    :return: (parsed Swagger specification, parsing errors if any)
+    """
     ##
     # Validate the raw dict against the JSON schema
     ##
 
     try:
-        jsonschema.Draft4Validator.check_schema(swagger_to.swaggerjsonschema.SCHEMA)
-        jsonschema.Draft4Validator(swagger_to.swaggerjsonschema.SCHEMA).validate(raw_dict)
+        schema_validator().validate(raw_dict)
     except jsonschema.exceptions.ValidationError as err:
         jsonized_parts = map(json.dumps, list(err.relative_path))
         # yapf: disable
@@ -452,6 +590,16 @@ def parse_yaml(stream: Any) -> Tuple[Swagger, List[str]]:
                     if key == 'name':
                         swagger.name = value
 
+                limit = tag.get('x-swagger-to-max-in-flight', None)
+                if limit is None:
+                    continue
+
+                if isinstance(limit, bool) or not isinstance(limit, int) or limit <= 0:
+                    errors.append('in tag {!r}: expected x-swagger-to-max-in-flight to be a positive integer, '
+                                  'but got: {!r}'.format(tag.get('name', ''), limit))
+                else:
+                    swagger.x_swagger_to_max_in_flight[tag.get('name', '')] = limit
+
     if swagger.name == '':
         errors.append('missing tag "name" in the swagger specification')
 
@@ -491,6 +639,32 @@ def parse_yaml(stream: Any) -> Tuple[Swagger, List[str]]:
     return swagger, errors
 
 
+def parse_yaml(stream: Any) -> Tuple[Swagger, List[str]]:
+    """
+    Parse the Swagger specification from the given text.
+
+    :param stream: YAML representation of the Swagger spec satisfying file interface
+    :return: (parsed Swagger specification, parsing errors if any)
+    """
+    raw_dict = cast(RawDict, yaml.load(stream, _LOADER))
+
+    return _parse_raw_dict(raw_dict=raw_dict)
+
+
+def parse_json(stream: Any) -> Tuple[Swagger, List[str]]:
+    """
+    Parse the Swagger specification from the given JSON text.
+
+    The JSON text is loaded with the standard library instead of the much slower YAML loader.
+
+    :param stream: JSON representation of the Swagger spec satisfying file interface
+    :return: (parsed Swagger specification, parsing errors if any)
+    """
+    raw_dict = cast(RawDict, _load_json(text=stream.read(), source=str(getattr(stream, 'name', ''))))
+
+    return _parse_raw_dict(raw_dict=raw_dict)
+
+
 def parse_yaml_file(path: Union[str, pathlib.Path]) -> Tuple[Swagger, List[str]]:
     """
     Parse the Swagger specification from the given file.
@@ -500,3 +674,29 @@ def parse_yaml_file(path: Union[str, pathlib.Path]) -> Tuple[Swagger, List[str]]
     """
     with open(str(path), 'rt', encoding='utf-8') as fid:
         return parse_yaml(stream=fid)
+
+
+def parse_json_file(path: Union[str, pathlib.Path]) -> Tuple[Swagger, List[str]]:
+    """
+    Parse the Swagger specification from the given JSON file.
+
+    :param path: path to the .json file
+    :return: (parsed Swagger specification, parsing errors if any)
+    """
+    with open(str(path), 'rt', encoding='utf-8') as fid:
+        return parse_json(stream=fid)
+
+
+def parse_file(path: Union[str, pathlib.Path]) -> Tuple[Swagger, List[str]]:
+    """
+    Parse the Swagger specification from the given file which is either in JSON or in YAML format.
+
+    The format is determined by the extension: ".json" files are parsed as JSON, all the other files as YAML.
+
+    :param path: path to the .json or .yaml file
+    :return: (parsed Swagger specification, parsing errors if any)
+    """
+    if pathlib.Path(str(path)).suffix.lower() == '.json':
+        return parse_json_file(path=path)
+
+    return parse_yaml_file(path=path)
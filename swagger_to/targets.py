@@ -0,0 +1,321 @@
+"""Render the code of the individual targets from the intermediate representation and write it to disk."""
+import collections
+import concurrent.futures
+import io
+import json
+import os
+import pathlib
+from typing import Callable, List, Mapping, MutableMapping, Optional, Tuple  # pylint: disable=unused-import
+
+import icontract
+
+import swagger_to.cache
+import swagger_to.elm_client
+import swagger_to.go_server
+import swagger_to.py_client
+import swagger_to.ts_angular5_client
+
+# pylint: disable=invalid-name
+Files = MutableMapping[pathlib.Path, str]
+
+
+def render_go_server(entry: swagger_to.cache.Entry,
+                     outdir: pathlib.Path,
+                     no_samples: bool = False,
+                     options: Optional[swagger_to.go_server.Options] = None) -> Files:
+    """
+    Render the Go server.
+
+    :param entry: parsed Swagger specification and its intermediate representation
+    :param outdir: output directory
+    :param no_samples: if set, the sample implementation of the handler is not rendered
+    :param options: options of the code generation; if not given, the defaults are used
+    :return: content of the files to be written
+    """
+    options = options if options is not None else swagger_to.go_server.Options()
+
+    go_typedefs = swagger_to.go_server.to_typedefs(
+        intermediate_typedefs=entry.typedefs, presence_bitmask=options.presence_bitmask)
+    go_routes = swagger_to.go_server.to_routes(endpoints=entry.endpoints, typedefs=go_typedefs)
+
+    package = entry.swagger.name
+
+    files = collections.OrderedDict()  # type: Files
+    files[outdir / 'types.go'] = swagger_to.go_server.generate_types_go(package=package, typedefs=go_typedefs)
+    files[outdir / 'routes.go'] = swagger_to.go_server.generate_routes_go(
+        package=package,
+        routes=go_routes,
+        typed_validation=options.typed_validation,
+        static_router=options.static_router,
+        observer=options.observer,
+        context_handler=options.context_handler)
+    files[outdir / 'handler.go'] = swagger_to.go_server.generate_handler_go(
+        package=package, routes=go_routes, context_handler=options.context_handler)
+
+    if not no_samples:
+        files[outdir / 'handler_impl.go.sample'] = swagger_to.go_server.generate_handler_impl_go(
+            package=package, routes=go_routes, context_handler=options.context_handler)
+
+    files[outdir / 'jsonschemas.go'] = swagger_to.go_server.generate_json_schemas_go(
+        package=package,
+        routes=go_routes,
+        typedefs=go_typedefs,
+        shared_definitions=options.shared_json_schema_definitions,
+        lazy=options.lazy_json_schemas)
+
+    # The structs tracking the presence of their optional fields can not be encoded by encoding/json alone.
+    if options.json_methods or options.presence_bitmask:
+        files[outdir / 'types_json.go'] = swagger_to.go_server.generate_types_json_go(
+            package=package, typedefs=go_typedefs)
+        files[outdir / 'types_json_test.go'] = swagger_to.go_server.generate_types_json_test_go(
+            package=package, typedefs=go_typedefs)
+
+    if swagger_to.go_server.tracks_presence(typedefs=go_typedefs):
+        files[outdir / 'types_presence_reflection.go'] = swagger_to.go_server.generate_types_presence_reflection_go(
+            package=package, typedefs=go_typedefs)
+
+    if options.route_benchmarks:
+        files[outdir / 'routes_bench_test.go'] = swagger_to.go_server.generate_routes_bench_test_go(
+            package=package, routes=go_routes, observer=options.observer, context_handler=options.context_handler)
+
+    if options.typed_validation:
+        files[outdir / 'validation.go'] = swagger_to.go_server.generate_validation_go(package=package, routes=go_routes)
+
+    return files
+
+
+def render_py_client(entry: swagger_to.cache.Entry, outpath: pathlib.Path) -> Files:
+    """
+    Render the Python client.
+
+    :param entry: parsed Swagger specification and its intermediate representation
+    :param outpath: path to the client module
+    :return: content of the files to be written
+    """
+    py_typedefs = swagger_to.py_client.to_typedefs(intermediate_typedefs=entry.typedefs)
+
+    if 'RemoteCaller' in py_typedefs:
+        raise ValueError("A definition was specified in the swagger with the name 'RemoteCaller', "
+                         "but it's reserved for the Python client class.")
+
+    py_requests = swagger_to.py_client.to_requests(endpoints=entry.endpoints, typedefs=py_typedefs)
+
+    files = collections.OrderedDict()  # type: Files
+    files[outpath] = swagger_to.py_client.generate_client_py(
+        service_name=entry.swagger.name, typedefs=py_typedefs, requests=py_requests)
+
+    return files
+
+
+def render_py_async_client(entry: swagger_to.cache.Entry, outpath: pathlib.Path) -> Files:
+    """
+    Render the asynchronous Python client.
+
+    :param entry: parsed Swagger specification and its intermediate representation
+    :param outpath: path to the client module
+    :return: content of the files to be written
+    """
+    py_typedefs = swagger_to.py_client.to_typedefs(intermediate_typedefs=entry.typedefs)
+
+    if 'RemoteCaller' in py_typedefs:
+        raise ValueError("A definition was specified in the swagger with the name 'RemoteCaller', "
+                         "but it's reserved for the Python client class.")
+
+    py_requests = swagger_to.py_client.to_requests(endpoints=entry.endpoints, typedefs=py_typedefs)
+
+    files = collections.OrderedDict()  # type: Files
+    files[outpath] = swagger_to.py_client.generate_async_client_py(
+        service_name=entry.swagger.name, typedefs=py_typedefs, requests=py_requests)
+
+    return files
+
+
+def render_ts_angular5_client(entry: swagger_to.cache.Entry, outpath: pathlib.Path) -> Files:
+    """
+    Render the Typescript + Angular5 client.
+
+    :param entry: parsed Swagger specification and its intermediate representation
+    :param outpath: path to the client module
+    :return: content of the files to be written
+    """
+    ts_typedefs = swagger_to.ts_angular5_client.to_typedefs(intermediate_typedefs=entry.typedefs)
+    ts_requests = swagger_to.ts_angular5_client.to_requests(endpoints=entry.endpoints, typedefs=ts_typedefs)
+
+    buf = io.StringIO()
+    swagger_to.ts_angular5_client.write_client_ts(typedefs=ts_typedefs, requests=ts_requests, fid=buf)
+
+    files = collections.OrderedDict()  # type: Files
+    files[outpath] = buf.getvalue()
+
+    return files
+
+
+def render_elm_client(entry: swagger_to.cache.Entry, outdir: pathlib.Path, no_samples: bool = False) -> Files:
+    """
+    Render the Elm client.
+
+    :param entry: parsed Swagger specification and its intermediate representation
+    :param outdir: output directory
+    :param no_samples: if set, the sample Elm package is not rendered
+    :return: content of the files to be written
+    """
+    elm_typedefs = swagger_to.elm_client.to_typedefs(intermediate_typedefs=entry.typedefs)
+    elm_requests = swagger_to.elm_client.to_requests(endpoints=entry.endpoints, typedefs=elm_typedefs)
+
+    buf = io.StringIO()
+    swagger_to.elm_client.write_client_elm(typedefs=elm_typedefs, requests=elm_requests, fid=buf)
+
+    files = collections.OrderedDict()  # type: Files
+    files[outdir / 'Client.elm'] = buf.getvalue()
+
+    if not no_samples:
+        files[outdir / 'elm-package.sample.json'] = json.dumps(
+            swagger_to.elm_client.elm_package_json(), indent=2, sort_keys=False)
+
+    return files
+
+
+# Names of the supported targets
+TARGETS = ['go_server', 'py_client', 'py_async_client', 'ts_angular5_client', 'elm_client']
+
+
+@icontract.require(lambda target: target in TARGETS)
+def render(target: str,
+           entry: swagger_to.cache.Entry,
+           output: pathlib.Path,
+           no_samples: bool = False,
+           go_server_options: Optional[swagger_to.go_server.Options] = None) -> Files:
+    """
+    Render the given target.
+
+    :param target: name of the target
+    :param entry: parsed Swagger specification and its intermediate representation
+    :param output: output directory or path to the client module, depending on the target
+    :param no_samples: if set, the sample files are not rendered
+    :param go_server_options: options of the Go server; if not given, the defaults are used
+    :return: content of the files to be written
+    """
+    if target == 'go_server':
+        return render_go_server(entry=entry, outdir=output, no_samples=no_samples, options=go_server_options)
+
+    if target == 'py_client':
+        return render_py_client(entry=entry, outpath=output)
+
+    if target == 'py_async_client':
+        return render_py_async_client(entry=entry, outpath=output)
+
+    if target == 'ts_angular5_client':
+        return render_ts_angular5_client(entry=entry, outpath=output)
+
+    if target == 'elm_client':
+        return render_elm_client(entry=entry, outdir=output, no_samples=no_samples)
+
+    raise NotImplementedError("Unhandled target: {}".format(target))
+
+
+def render_concurrently(entry: swagger_to.cache.Entry,
+                        jobs: List[Tuple[str, pathlib.Path]],
+                        no_samples: bool = False,
+                        max_workers: int = 0,
+                        go_server_options: Optional[swagger_to.go_server.Options] = None) -> List[Files]:
+    """
+    Render the targets concurrently in separate processes.
+
+    The rendering is CPU-bound so the targets are rendered in separate processes. A single target is rendered
+    in the current process.
+
+    :param entry: parsed Swagger specification and its intermediate representation
+    :param jobs: (name of the target, output) to be rendered
+    :param no_samples: if set, the sample files are not rendered
+    :param max_workers: maximum number of processes; if 0, at most the number of CPUs
+    :param go_server_options: options of the Go server; if not given, the defaults are used
+    :return: content of the files to be written for each job, in the order of the jobs
+    """
+    if len(jobs) <= 1 or max_workers == 1:
+        return [
+            render(
+                target=target, entry=entry, output=output, no_samples=no_samples, go_server_options=go_server_options)
+            for target, output in jobs
+        ]
+
+    workers = min(len(jobs), max_workers if max_workers > 0 else (os.cpu_count() or 1))
+
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(
+                render,
+                target=target,
+                entry=entry,
+                output=output,
+                no_samples=no_samples,
+                go_server_options=go_server_options) for target, output in jobs
+        ]
+
+        return [future.result() for future in futures]
+
+
+def existing(files: Mapping[pathlib.Path, str]) -> List[pathlib.Path]:
+    """
+    List the files which already exist on disk.
+
+    :param files: content of the files to be written
+    :return: paths to the existing files
+    """
+    return [pth for pth in files if pth.exists()]
+
+
+def _has_content(path: pathlib.Path, data: bytes) -> bool:
+    """Check whether the file exists and holds exactly the given data."""
+    try:
+        if path.stat().st_size != len(data):
+            return False
+
+        return path.read_bytes() == data
+    except FileNotFoundError:
+        return False
+
+
+def write(files: Mapping[pathlib.Path, str], force: bool = False) -> List[pathlib.Path]:
+    """
+    Write the files to disk creating the parent directories as needed.
+
+    The files whose content did not change are not written so that their modification times are preserved
+    and the downstream builds are not triggered needlessly.
+
+    :param files: content of the files to be written
+    :param force: if set, overwrite existing files
+    :return: paths to the files which have been written
+    """
+    if not force:
+        existing_paths = existing(files=files)
+        if existing_paths:
+            raise FileExistsError("File(s) exist, but --force was not specified: {}".format(
+                ", ".join(str(pth) for pth in existing_paths)))
+
+    changed = []  # type: List[pathlib.Path]
+    for pth, text in files.items():
+        data = text.encode('utf-8')
+        if _has_content(path=pth, data=data):
+            continue
+
+        pth.parent.mkdir(parents=True, exist_ok=True)
+        pth.write_bytes(data)
+        changed.append(pth)
+
+    return changed
+
+
+def describe_changes(files: Mapping[pathlib.Path, str], changed: List[pathlib.Path]) -> str:
+    """
+    Describe which of the files have been changed by the write.
+
+    :param files: content of the files which were to be written
+    :param changed: paths to the files which have been written
+    :return: human-readable description
+    """
+    if not changed:
+        return "None of {} file(s) changed.".format(len(files))
+
+    parts = ["{} of {} file(s) changed:".format(len(changed), len(files))]
+    parts.extend("  {}".format(pth) for pth in changed)
+    return "\n".join(parts)
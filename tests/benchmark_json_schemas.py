@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Benchmarks the generation of the JSON schemas for the type definitions on synthetic Swagger specifications.
+
+Each definition references the next one and, every few definitions, one of the previous ones so that the specification
+contains both long chains of references and cycles. The time is reported for a growing number of definitions
+to inspect how the generation scales.
+"""
+import argparse
+import functools
+import io
+import sys
+import timeit
+from typing import List  # pylint: disable=unused-import
+
+import swagger_to.intermediate
+import swagger_to.swagger
+
+
+def synthesize_swagger(definition_count: int, cycle_every: int) -> str:
+    """Generate a valid Swagger specification with the given number of interlinked definitions."""
+    parts = [
+        "swagger: '2.0'\n", "info:\n", "  title: Benchmark\n", "  version: '1.0'\n", "basePath: /\n", "tags:\n",
+        "- name: benchmark\n", "paths: {}\n", "definitions:\n"
+    ]
+
+    for i in range(definition_count):
+        parts.append(("  Thing{i}:\n"
+                      "    type: object\n"
+                      "    description: represents the thing {i}.\n"
+                      "    properties:\n"
+                      "      name:\n"
+                      "        type: string\n"
+                      "        description: |\n"
+                      "          name of the thing {i}\n").format(i=i))
+
+        if i + 1 < definition_count:
+            parts.append("      next:\n        $ref: '#/definitions/Thing{}'\n".format(i + 1))
+
+        if cycle_every > 0 and i % cycle_every == cycle_every - 1:
+            parts.append(("      previous:\n"
+                          "        type: array\n"
+                          "        items:\n"
+                          "          $ref: '#/definitions/Thing{}'\n").format(i - cycle_every + 1))
+
+    return ''.join(parts)
+
+
+def main() -> int:
+    """
+    Main routine
+    """
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--definitions",
+        help="numbers of definitions in the synthetic specs",
+        type=int,
+        nargs='+',
+        default=[100, 200, 400, 800])
+    parser.add_argument(
+        "--cycle_every", help="close a cycle of references every so many definitions; 0 for none", type=int, default=10)
+    parser.add_argument("--repeat", help="number of measurements", type=int, default=3)
+    args = parser.parse_args()
+
+    for definition_count in args.definitions:
+        text = synthesize_swagger(definition_count=definition_count, cycle_every=args.cycle_every)
+        swagger, errs = swagger_to.swagger.parse_yaml(io.StringIO(text))
+        if errs:
+            print("Failed to parse the synthetic spec:\n{}".format("\n".join(errs)), file=sys.stderr)
+            return 1
+
+        assert swagger is not None
+
+        duration = min(
+            timeit.repeat(
+                functools.partial(swagger_to.intermediate.to_typedefs, swagger=swagger), number=1, repeat=args.repeat))
+
+        typedefs = swagger_to.intermediate.to_typedefs(swagger=swagger)
+        size = sum(len(typedef.json_schema.text) for typedef in typedefs.values() if typedef.json_schema is not None)
+
+        print("  {:>6} definitions: {:.3f} s, {:.1f} MB of JSON schemas".format(definition_count, duration,
+                                                                                size / (1024 * 1024)))
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+Benchmarks the decoding of large responses and the encoding of large requests by the generated Python client.
+
+The client is generated from a synthetic Swagger specification whose request body and response are lists of nested
+objects. The specialized decoder and encoder are compared against the generic ``from_obj`` and ``to_jsonable`` of
+the same client, which dispatch on the expected types and build the path to each item before delegating to
+the converters of the classes. The time is reported for a growing number of items.
+"""
+import argparse
+import functools
+import importlib.util
+import io
+import pathlib
+import sys
+import tempfile
+import timeit
+from typing import Any, List  # pylint: disable=unused-import
+
+import swagger_to.intermediate
+import swagger_to.py_client
+import swagger_to.swagger
+
+SWAGGER = """\
+swagger: '2.0'
+info:
+  title: Benchmark
+  version: '1.0'
+basePath: /
+tags:
+- name: benchmark
+paths:
+  /things:
+    get:
+      operationId: list_things
+      produces:
+      - application/json
+      responses:
+        200:
+          description: all the things
+          schema:
+            type: array
+            items:
+              $ref: '#/definitions/Thing'
+    post:
+      operationId: upload_things
+      consumes:
+      - application/json
+      parameters:
+      - name: things
+        in: body
+        required: true
+        schema:
+          type: array
+          items:
+            $ref: '#/definitions/Thing'
+      responses:
+        200:
+          description: uploaded
+definitions:
+  Thing:
+    type: object
+    required: [id, name, price, tags, owner]
+    properties:
+      id:
+        type: integer
+      name:
+        type: string
+      price:
+        type: number
+      discount:
+        type: number
+      tags:
+        type: array
+        items:
+          type: string
+      owner:
+        $ref: '#/definitions/Owner'
+  Owner:
+    type: object
+    required: [name]
+    properties:
+      name:
+        type: string
+      email:
+        type: string
+"""
+
+
+def generate_client(directory: pathlib.Path) -> Any:
+    """Generate the client of the synthetic specification in the directory and import it."""
+    swagger, errs = swagger_to.swagger.parse_yaml(io.StringIO(SWAGGER))
+    if errs:
+        raise AssertionError("Failed to parse the synthetic spec:\n{}".format("\n".join(errs)))
+
+    assert swagger is not None
+
+    intermediate_typedefs = swagger_to.intermediate.to_typedefs(swagger=swagger)
+    intermediate_params = swagger_to.intermediate.to_parameters(swagger=swagger, typedefs=intermediate_typedefs)
+    endpoints = swagger_to.intermediate.to_endpoints(
+        swagger=swagger, typedefs=intermediate_typedefs, params=intermediate_params)
+
+    py_typedefs = swagger_to.py_client.to_typedefs(intermediate_typedefs=intermediate_typedefs)
+    py_requests = swagger_to.py_client.to_requests(endpoints=endpoints, typedefs=py_typedefs)
+
+    pth = directory / "client.py"
+    pth.write_text(
+        swagger_to.py_client.generate_client_py(service_name=swagger.name, typedefs=py_typedefs, requests=py_requests))
+
+    spec = importlib.util.spec_from_file_location("client", str(pth))
+    module = importlib.util.module_from_spec(spec)  # type: ignore
+    spec.loader.exec_module(module)  # type: ignore
+    return module
+
+
+def synthesize_response(item_count: int) -> List[Any]:
+    """Generate the JSON-ed response with the given number of things."""
+    return [{
+        'id': i,
+        'name': 'thing {}'.format(i),
+        'price': i * 0.5,
+        'discount': i % 3,
+        'tags': ['red', 'large'],
+        'owner': {
+            'name': 'owner {}'.format(i % 100),
+            'email': 'owner@example.com'
+        }
+    } for i in range(item_count)]
+
+
+def main() -> int:
+    """
+    Main routine
+    """
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--items",
+        help="numbers of the things in the synthetic responses",
+        type=int,
+        nargs='+',
+        default=[1000, 10000, 100000])
+    parser.add_argument("--repeat", help="number of measurements", type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        client = generate_client(directory=pathlib.Path(tmp_dir))
+
+        for item_count in args.items:
+            obj = synthesize_response(item_count=item_count)
+
+            specialized = min(
+                timeit.repeat(
+                    functools.partial(client._decode_list_of_thing, obj),  # pylint: disable=protected-access
+                    number=1,
+                    repeat=args.repeat))
+
+            generic = min(
+                timeit.repeat(
+                    functools.partial(client.from_obj, obj, expected=[list, client.Thing]),
+                    number=1,
+                    repeat=args.repeat))
+
+            print("  {:>7} things decoded: specialized {:.3f} s, generic from_obj {:.3f} s, {:.1f}x".format(
+                item_count, specialized, generic, generic / specialized))
+
+            things = client._decode_list_of_thing(obj)  # pylint: disable=protected-access
+
+            specialized = min(
+                timeit.repeat(
+                    functools.partial(client._encode_list_of_thing, things),  # pylint: disable=protected-access
+                    number=1,
+                    repeat=args.repeat))
+
+            generic = min(
+                timeit.repeat(
+                    functools.partial(client.to_jsonable, things, expected=[list, client.Thing]),
+                    number=1,
+                    repeat=args.repeat))
+
+            print("  {:>7} things encoded: specialized {:.3f} s, generic to_jsonable {:.3f} s, {:.1f}x".format(
+                item_count, specialized, generic, generic / specialized))
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Benchmarks the validation of Swagger specifications against the JSON schema of OpenAPI 2.
+
+Compares the shared validator from swagger_to.swagger.schema_validator against checking the schema and building
+a new validator on every parse.
+"""
+import argparse
+import json
+import os
+import pathlib
+import sys
+import timeit
+from typing import Any, List  # pylint: disable=unused-import
+
+import jsonschema
+import yaml
+
+import swagger_to.swagger
+import swagger_to.swaggerjsonschema
+
+
+def validate_per_call(raw_dicts: List[Any]) -> None:
+    """Validate the specifications by checking the schema and building a new validator each time."""
+    for raw_dict in raw_dicts:
+        jsonschema.Draft4Validator.check_schema(swagger_to.swaggerjsonschema.SCHEMA)
+        jsonschema.Draft4Validator(swagger_to.swaggerjsonschema.SCHEMA).validate(raw_dict)
+
+
+def validate_shared(raw_dicts: List[Any]) -> None:
+    """Validate the specifications with the shared validator."""
+    for raw_dict in raw_dicts:
+        swagger_to.swagger.schema_validator().validate(raw_dict)
+
+
+def main() -> int:
+    """
+    Main routine
+    """
+    script_dir = pathlib.Path(os.path.realpath(__file__)).parent
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--swagger_dir",
+        help="path to the directory that holds swagger files; recursively walks this directory",
+        default=str(script_dir / "cases"))
+    parser.add_argument("--repeat", help="number of times to validate all the specifications", type=int, default=5)
+    args = parser.parse_args()
+
+    swagger_dir = pathlib.Path(args.swagger_dir)
+
+    raw_dicts = []  # type: List[Any]
+    for swagger_pth in sorted(swagger_dir.glob(pattern="**/swagger.yaml")):
+        # Round-trip through JSON so that the keys are strings as in swagger_to.swagger.parse_yaml.
+        raw_dicts.append(json.loads(json.dumps(yaml.safe_load(swagger_pth.read_text(encoding='utf-8')))))
+
+    if len(raw_dicts) == 0:
+        print("There are no swagger specifications in: {}".format(swagger_dir))
+        return 1
+
+    valid_dicts = []  # type: List[Any]
+    for raw_dict in raw_dicts:
+        if swagger_to.swagger.schema_validator().is_valid(raw_dict):
+            valid_dicts.append(raw_dict)
+
+    # Warm up the shared validator so that the measurement reflects the steady state of a long-running process.
+    validate_shared(raw_dicts=valid_dicts)
+
+    per_call = min(timeit.repeat(lambda: validate_per_call(raw_dicts=valid_dicts), number=1, repeat=args.repeat))
+    shared = min(timeit.repeat(lambda: validate_shared(raw_dicts=valid_dicts), number=1, repeat=args.repeat))
+
+    print("Validated {} specifications (best of {} runs):".format(len(valid_dicts), args.repeat))
+    print("  per-call validator: {:.4f} s".format(per_call))
+    print("  shared validator:   {:.4f} s".format(shared))
+    print("  speed-up:           {:.1f}x".format(per_call / shared if shared > 0 else float('inf')))
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
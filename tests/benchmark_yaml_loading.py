@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Benchmarks loading a large synthetic Swagger specification with the pure-Python and the libyaml loaders.
+
+The same specification is also loaded from JSON for comparison. All the loaders construct
+swagger_to.swagger.RawDict's with the source and line numbers.
+"""
+import argparse
+import io
+import json
+import sys
+import timeit
+from typing import Any, Callable, List, Tuple  # pylint: disable=unused-import
+
+import yaml
+
+import swagger_to.swagger
+
+# pylint: disable=protected-access
+
+
+def synthesize_swagger(definition_count: int) -> str:
+    """Generate a valid Swagger specification with the given number of definitions and as many endpoints."""
+    parts = [
+        "swagger: '2.0'\n", "info:\n", "  title: Benchmark\n", "  version: '1.0'\n", "basePath: /\n", "tags:\n",
+        "- name: benchmark\n", "paths:\n"
+    ]
+
+    for i in range(definition_count):
+        parts.append(("  /things{i}/{{id}}:\n"
+                      "    get:\n"
+                      "      operationId: get_thing{i}\n"
+                      "      description: gets the thing {i}.\n"
+                      "      parameters:\n"
+                      "      - name: id\n"
+                      "        in: path\n"
+                      "        required: true\n"
+                      "        type: string\n"
+                      "      responses:\n"
+                      "        200:\n"
+                      "          description: the thing {i}.\n"
+                      "          schema:\n"
+                      "            $ref: '#/definitions/Thing{i}'\n").format(i=i))
+
+    parts.append("definitions:\n")
+    for i in range(definition_count):
+        parts.append(("  Thing{i}:\n"
+                      "    type: object\n"
+                      "    description: represents the thing {i}.\n"
+                      "    required: [identifier, name]\n"
+                      "    properties:\n"
+                      "      identifier:\n"
+                      "        type: string\n"
+                      "        pattern: '^[a-z0-9-]+$'\n"
+                      "      name:\n"
+                      "        type: string\n"
+                      "      size:\n"
+                      "        type: integer\n"
+                      "        format: int64\n"
+                      "      labels:\n"
+                      "        type: array\n"
+                      "        items:\n"
+                      "          type: string\n"
+                      "      attributes:\n"
+                      "        type: object\n"
+                      "        additionalProperties:\n"
+                      "          type: number\n").format(i=i))
+
+    return ''.join(parts)
+
+
+def main() -> int:
+    """
+    Main routine
+    """
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--definitions", help="number of definitions in the synthetic spec", type=int, default=8000)
+    parser.add_argument("--repeat", help="number of measurements", type=int, default=3)
+    args = parser.parse_args()
+
+    text = synthesize_swagger(definition_count=args.definitions)
+    json_text = json.dumps(yaml.load(text, swagger_to.swagger._LOADER), indent=2)
+    print("Synthetic spec: {:.1f} MB".format(len(text) / (1024 * 1024)))
+
+    if swagger_to.swagger._LOADER is swagger_to.swagger._PY_LOADER:
+        print("PyYAML has been built without libyaml; only the pure-Python loader is available.")
+
+    measurements = [
+        ("pure-Python loader", lambda: yaml.load(io.StringIO(text), swagger_to.swagger._PY_LOADER)),
+        ("default loader", lambda: yaml.load(io.StringIO(text), swagger_to.swagger._LOADER)),
+        ("parse_yaml", lambda: swagger_to.swagger.parse_yaml(io.StringIO(text))),
+        ("JSON loader", lambda: swagger_to.swagger._load_json(json_text, source='')),
+        ("parse_json", lambda: swagger_to.swagger.parse_json(io.StringIO(json_text))),
+    ]  # type: List[Tuple[str, Callable[[], Any]]]
+
+    for label, func in measurements:
+        duration = min(timeit.repeat(func, number=1, repeat=args.repeat))
+        print("  {:<20} {:.3f} s".format(label + ':', duration))
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
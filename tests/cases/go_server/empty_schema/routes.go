@@ -4,10 +4,11 @@ package product
 // Automatically generated file by swagger_to. DO NOT EDIT OR APPEND ANYTHING!
 
 import (
+	"bytes"
 	"encoding/json"
 	"github.com/gorilla/mux"
-	"io/ioutil"
 	"net/http"
+	"sync"
 )
 
 // SetupRouter sets up a router. If you don't use any middleware, you are good to go.
@@ -23,6 +24,31 @@ func SetupRouter(h Handler) *mux.Router {
 	return r
 }
 
+// bodyBufferPool recycles the buffers for reading the request bodies.
+var bodyBufferPool = sync.Pool{
+	New: func() interface{} {
+		return new(bytes.Buffer)
+	},
+}
+
+// maxPooledBodyBufferCap limits the capacity of the pooled buffers so that the occasional large bodies
+// are not kept in memory.
+const maxPooledBodyBufferCap = 64 * 1024
+
+// getBodyBuffer gives an empty buffer from the pool.
+func getBodyBuffer() *bytes.Buffer {
+	buf := bodyBufferPool.Get().(*bytes.Buffer)
+	buf.Reset()
+	return buf
+}
+
+// putBodyBuffer returns the buffer to the pool.
+func putBodyBuffer(buf *bytes.Buffer) {
+	if buf.Cap() <= maxPooledBodyBufferCap {
+		bodyBufferPool.Put(buf)
+	}
+}
+
 // WrapTestEndpoint wraps the path `/test_endpoint` with the method "get".
 //
 // Path description:
@@ -35,21 +61,24 @@ func WrapTestEndpoint(h Handler, w http.ResponseWriter, r *http.Request) {
 		return
 	}
 	{
-		var err error
-		r.Body = http.MaxBytesReader(w, r.Body, 1024*1024)
-		body, err := ioutil.ReadAll(r.Body)
+		r.Body = http.MaxBytesReader(w, r.Body, 1048576)
+		buf := getBodyBuffer()
+		_, err := buf.ReadFrom(r.Body)
 		if err != nil {
+			putBodyBuffer(buf)
 			http.Error(w, "Body unreadable: "+err.Error(), http.StatusBadRequest)
 			return
 		}
 
-		err = ValidateAgainstEmptyParameterSchema(body)
+		err = ValidateAgainstEmptyParameterSchema(buf.Bytes())
 		if err != nil {
+			putBodyBuffer(buf)
 			http.Error(w, "Failed to validate against schema: "+err.Error(), http.StatusBadRequest)
 			return
 		}
 
-		err = json.Unmarshal(body, &aRequiredEmptyParameter)
+		err = json.Unmarshal(buf.Bytes(), &aRequiredEmptyParameter)
+		putBodyBuffer(buf)
 		if err != nil {
 			http.Error(w, "Error JSON-decoding body parameter 'required_empty_parameter': "+err.Error(),
 				http.StatusBadRequest)
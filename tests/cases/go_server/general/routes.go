@@ -4,11 +4,12 @@ package uber
 // Automatically generated file by swagger_to. DO NOT EDIT OR APPEND ANYTHING!
 
 import (
+	"bytes"
 	"encoding/json"
 	"github.com/gorilla/mux"
-	"io/ioutil"
 	"net/http"
 	"strconv"
+	"sync"
 )
 
 // SetupRouter sets up a router. If you don't use any middleware, you are good to go.
@@ -49,6 +50,31 @@ func SetupRouter(h Handler) *mux.Router {
 	return r
 }
 
+// bodyBufferPool recycles the buffers for reading the request bodies.
+var bodyBufferPool = sync.Pool{
+	New: func() interface{} {
+		return new(bytes.Buffer)
+	},
+}
+
+// maxPooledBodyBufferCap limits the capacity of the pooled buffers so that the occasional large bodies
+// are not kept in memory.
+const maxPooledBodyBufferCap = 64 * 1024
+
+// getBodyBuffer gives an empty buffer from the pool.
+func getBodyBuffer() *bytes.Buffer {
+	buf := bodyBufferPool.Get().(*bytes.Buffer)
+	buf.Reset()
+	return buf
+}
+
+// putBodyBuffer returns the buffer to the pool.
+func putBodyBuffer(buf *bytes.Buffer) {
+	if buf.Cap() <= maxPooledBodyBufferCap {
+		bodyBufferPool.Put(buf)
+	}
+}
+
 // WrapProducts wraps the path `/products` with the method "get".
 //
 // Path description:
@@ -257,21 +283,24 @@ func WrapUpdateMe(h Handler, w http.ResponseWriter, r *http.Request) {
 		return
 	}
 	{
-		var err error
-		r.Body = http.MaxBytesReader(w, r.Body, 1024*1024)
-		body, err := ioutil.ReadAll(r.Body)
+		r.Body = http.MaxBytesReader(w, r.Body, 1048576)
+		buf := getBodyBuffer()
+		_, err := buf.ReadFrom(r.Body)
 		if err != nil {
+			putBodyBuffer(buf)
 			http.Error(w, "Body unreadable: "+err.Error(), http.StatusBadRequest)
 			return
 		}
 
-		err = ValidateAgainstProfileSchema(body)
+		err = ValidateAgainstProfileSchema(buf.Bytes())
 		if err != nil {
+			putBodyBuffer(buf)
 			http.Error(w, "Failed to validate against schema: "+err.Error(), http.StatusBadRequest)
 			return
 		}
 
-		err = json.Unmarshal(body, &aUpdateUser)
+		err = json.Unmarshal(buf.Bytes(), &aUpdateUser)
+		putBodyBuffer(buf)
 		if err != nil {
 			http.Error(w, "Error JSON-decoding body parameter 'update_user': "+err.Error(),
 				http.StatusBadRequest)
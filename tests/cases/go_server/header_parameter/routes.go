@@ -33,13 +33,13 @@ func WrapTestMe(h Handler, w http.ResponseWriter, r *http.Request) {
 
 	hdr := r.Header
 
-	if _, ok := hdr["Some-parameter"]; !ok {
+	if _, ok := hdr["Some-Parameter"]; !ok {
 		http.Error(w, "Parameter 'Some-parameter' expected in header", http.StatusBadRequest)
 		return
 	}
 	aSomeParameter = hdr.Get("Some-parameter")
 
-	if _, ok := hdr["Some-optional"]; ok {
+	if _, ok := hdr["Some-Optional"]; ok {
 		val := hdr.Get("Some-optional")
 		aSomeOptional = &val
 	}
@@ -0,0 +1,92 @@
+// Code generated by swagger_to. DO NOT EDIT.
+package test
+
+// Automatically generated file by swagger_to. DO NOT EDIT OR APPEND ANYTHING!
+
+import (
+	"bytes"
+	"encoding/json"
+	"github.com/gorilla/mux"
+	"net/http"
+	"sync"
+)
+
+// SetupRouter sets up a router. If you don't use any middleware, you are good to go.
+// Otherwise, you need to maually re-implement this function with your middlewares.
+func SetupRouter(h Handler) *mux.Router {
+	r := mux.NewRouter()
+
+	r.HandleFunc(`/products`,
+		func(w http.ResponseWriter, r *http.Request) {
+			WrapTestMe(h, w, r)
+		}).Methods("get")
+
+	return r
+}
+
+// bodyBufferPool recycles the buffers for reading the request bodies.
+var bodyBufferPool = sync.Pool{
+	New: func() interface{} {
+		return new(bytes.Buffer)
+	},
+}
+
+// maxPooledBodyBufferCap limits the capacity of the pooled buffers so that the occasional large bodies
+// are not kept in memory.
+const maxPooledBodyBufferCap = 64 * 1024
+
+// getBodyBuffer gives an empty buffer from the pool.
+func getBodyBuffer() *bytes.Buffer {
+	buf := bodyBufferPool.Get().(*bytes.Buffer)
+	buf.Reset()
+	return buf
+}
+
+// putBodyBuffer returns the buffer to the pool.
+func putBodyBuffer(buf *bytes.Buffer) {
+	if buf.Cap() <= maxPooledBodyBufferCap {
+		bodyBufferPool.Put(buf)
+	}
+}
+
+// WrapTestMe wraps the path `/products` with the method "get".
+//
+// Path description:
+// is a test endpoint.
+func WrapTestMe(h Handler, w http.ResponseWriter, r *http.Request) {
+	var aTestObject TestObject
+
+	if r.Body != nil {
+		{
+			r.Body = http.MaxBytesReader(w, r.Body, 4096)
+			buf := getBodyBuffer()
+			_, err := buf.ReadFrom(r.Body)
+			if err != nil {
+				putBodyBuffer(buf)
+				http.Error(w, "Body unreadable: "+err.Error(), http.StatusBadRequest)
+				return
+			}
+
+			err = ValidateAgainstTestObjectSchema(buf.Bytes())
+			if err != nil {
+				putBodyBuffer(buf)
+				http.Error(w, "Failed to validate against schema: "+err.Error(), http.StatusBadRequest)
+				return
+			}
+
+			err = json.Unmarshal(buf.Bytes(), &aTestObject)
+			putBodyBuffer(buf)
+			if err != nil {
+				http.Error(w, "Error JSON-decoding body parameter 'test_object': "+err.Error(),
+					http.StatusBadRequest)
+				return
+			}
+		}
+	}
+
+	h.TestMe(w,
+		r,
+		aTestObject)
+}
+
+// Automatically generated file by swagger_to. DO NOT EDIT OR APPEND ANYTHING!
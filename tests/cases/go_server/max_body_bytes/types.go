@@ -0,0 +1,15 @@
+// Code generated by swagger_to. DO NOT EDIT.
+package test
+
+// Automatically generated file by swagger_to. DO NOT EDIT OR APPEND ANYTHING!
+
+// Capacity is an identifiable primitive definition.
+type Capacity int32
+
+// TestObject is a test object.
+type TestObject struct {
+	// is a test string property.
+	ProductID *string `json:"product_id,omitempty"`
+
+	Capacity *Capacity `json:"capacity,omitempty"`
+}
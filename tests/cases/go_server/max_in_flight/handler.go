@@ -0,0 +1,43 @@
+// Code generated by swagger_to. DO NOT EDIT.
+package reports
+
+// Automatically generated file by swagger_to. DO NOT EDIT OR APPEND ANYTHING!
+
+import "net/http"
+
+// Handler defines an interface to handling the routes.
+type Handler interface {
+	// GetReport handles the path `/reports/{id}` with the method "get".
+	//
+	// Path description:
+	// gets a report.
+	GetReport(w http.ResponseWriter,
+		r *http.Request,
+		id int64)
+
+	// PutReport handles the path `/reports/{id}` with the method "put".
+	//
+	// Path description:
+	// puts a report.
+	PutReport(w http.ResponseWriter,
+		r *http.Request,
+		id int64,
+		report Report)
+
+	// ExportReport handles the path `/reports/{id}/export` with the method "post".
+	//
+	// Path description:
+	// exports a report.
+	ExportReport(w http.ResponseWriter,
+		r *http.Request,
+		id int64)
+
+	// Health handles the path `/health` with the method "get".
+	//
+	// Path description:
+	// checks the health.
+	Health(w http.ResponseWriter,
+		r *http.Request)
+}
+
+// Automatically generated file by swagger_to. DO NOT EDIT OR APPEND ANYTHING!
@@ -0,0 +1,301 @@
+// Code generated by swagger_to. DO NOT EDIT.
+package reports
+
+// Automatically generated file by swagger_to. DO NOT EDIT OR APPEND ANYTHING!
+
+import (
+	"bytes"
+	"encoding/json"
+	"github.com/gorilla/mux"
+	"net/http"
+	"strconv"
+	"sync"
+	"sync/atomic"
+)
+
+// SetupRouter sets up a router. If you don't use any middleware, you are good to go.
+// Otherwise, you need to maually re-implement this function with your middlewares.
+func SetupRouter(h Handler) *mux.Router {
+	r := mux.NewRouter()
+
+	r.HandleFunc(`/reports/{id}`,
+		func(w http.ResponseWriter, r *http.Request) {
+			WrapGetReport(h, w, r)
+		}).Methods("get")
+
+	r.HandleFunc(`/reports/{id}`,
+		func(w http.ResponseWriter, r *http.Request) {
+			WrapPutReport(h, w, r)
+		}).Methods("put")
+
+	r.HandleFunc(`/reports/{id}/export`,
+		func(w http.ResponseWriter, r *http.Request) {
+			WrapExportReport(h, w, r)
+		}).Methods("post")
+
+	r.HandleFunc(`/health`,
+		func(w http.ResponseWriter, r *http.Request) {
+			WrapHealth(h, w, r)
+		}).Methods("get")
+
+	return r
+}
+
+// bodyBufferPool recycles the buffers for reading the request bodies.
+var bodyBufferPool = sync.Pool{
+	New: func() interface{} {
+		return new(bytes.Buffer)
+	},
+}
+
+// maxPooledBodyBufferCap limits the capacity of the pooled buffers so that the occasional large bodies
+// are not kept in memory.
+const maxPooledBodyBufferCap = 64 * 1024
+
+// getBodyBuffer gives an empty buffer from the pool.
+func getBodyBuffer() *bytes.Buffer {
+	buf := bodyBufferPool.Get().(*bytes.Buffer)
+	buf.Reset()
+	return buf
+}
+
+// putBodyBuffer returns the buffer to the pool.
+func putBodyBuffer(buf *bytes.Buffer) {
+	if buf.Cap() <= maxPooledBodyBufferCap {
+		bodyBufferPool.Put(buf)
+	}
+}
+
+// InFlight represents the state of a limit on the requests handled concurrently.
+type InFlight struct {
+	// Route is the identifier of the limited route, or empty if the limit is shared by the routes of a tag.
+	Route string
+
+	// Tag is the name of the tag whose routes share the limit, or empty if the limit is set on a single route.
+	Tag string
+
+	// Limit is the maximum number of the requests handled concurrently.
+	Limit int64
+
+	// Current is the number of the requests being handled.
+	Current int64
+
+	// Rejected is the number of the requests rejected so far because the limit had been reached.
+	Rejected int64
+}
+
+// inFlightLimit bounds the number of the requests handled concurrently without blocking.
+type inFlightLimit struct {
+	// current and rejected come first so that they are 64-bit aligned for the atomic operations.
+	current  int64
+	rejected int64
+
+	limit int64
+	route string
+	tag   string
+}
+
+// acquire counts the request in if the limit has not been reached yet.
+func (l *inFlightLimit) acquire() bool {
+	if atomic.AddInt64(&l.current, 1) > l.limit {
+		atomic.AddInt64(&l.current, -1)
+		atomic.AddInt64(&l.rejected, 1)
+		return false
+	}
+
+	return true
+}
+
+// release counts the request out.
+func (l *inFlightLimit) release() {
+	atomic.AddInt64(&l.current, -1)
+}
+
+// state reports the state of the limit.
+func (l *inFlightLimit) state() InFlight {
+	return InFlight{
+		Route:    l.route,
+		Tag:      l.tag,
+		Limit:    l.limit,
+		Current:  atomic.LoadInt64(&l.current),
+		Rejected: atomic.LoadInt64(&l.rejected)}
+}
+
+// respondOverLimit sheds a request over a limit on the requests handled concurrently.
+func respondOverLimit(w http.ResponseWriter) {
+	w.Header().Set("Retry-After", "1")
+	http.Error(w, http.StatusText(http.StatusServiceUnavailable), http.StatusServiceUnavailable)
+}
+
+// tagLimitReports limits the requests handled concurrently by the routes tagged "reports".
+var tagLimitReports = &inFlightLimit{limit: 16, tag: "reports"}
+
+// routeLimitPutReport limits the requests handled concurrently by PutReport.
+var routeLimitPutReport = &inFlightLimit{limit: 4, route: "PutReport"}
+
+// tagLimitExports limits the requests handled concurrently by the routes tagged "exports".
+var tagLimitExports = &inFlightLimit{limit: 2, tag: "exports"}
+
+// InFlightStates reports the states of all the limits on the requests handled concurrently.
+func InFlightStates() []InFlight {
+	return []InFlight{
+		tagLimitReports.state(),
+		routeLimitPutReport.state(),
+		tagLimitExports.state()}
+}
+
+// WrapGetReport wraps the path `/reports/{id}` with the method "get".
+//
+// Path description:
+// gets a report.
+func WrapGetReport(h Handler, w http.ResponseWriter, r *http.Request) {
+	if !tagLimitReports.acquire() {
+		respondOverLimit(w)
+		return
+	}
+	defer tagLimitReports.release()
+
+	var aID int64
+
+	vars := mux.Vars(r)
+
+	if _, ok := vars["id"]; !ok {
+		http.Error(w, "Parameter 'id' expected in path", http.StatusBadRequest)
+		return
+	}
+	{
+		parsed, err := strconv.ParseInt(vars["id"], 10, 64)
+		if err != nil {
+			http.Error(w, "Parameter 'id': "+err.Error(), http.StatusBadRequest)
+			return
+		}
+		converted := int64(parsed)
+		aID = converted
+	}
+
+	h.GetReport(w,
+		r,
+		aID)
+}
+
+// WrapPutReport wraps the path `/reports/{id}` with the method "put".
+//
+// Path description:
+// puts a report.
+func WrapPutReport(h Handler, w http.ResponseWriter, r *http.Request) {
+	if !routeLimitPutReport.acquire() {
+		respondOverLimit(w)
+		return
+	}
+	defer routeLimitPutReport.release()
+
+	if !tagLimitReports.acquire() {
+		respondOverLimit(w)
+		return
+	}
+	defer tagLimitReports.release()
+
+	var aID int64
+	var aReport Report
+
+	vars := mux.Vars(r)
+
+	if _, ok := vars["id"]; !ok {
+		http.Error(w, "Parameter 'id' expected in path", http.StatusBadRequest)
+		return
+	}
+	{
+		parsed, err := strconv.ParseInt(vars["id"], 10, 64)
+		if err != nil {
+			http.Error(w, "Parameter 'id': "+err.Error(), http.StatusBadRequest)
+			return
+		}
+		converted := int64(parsed)
+		aID = converted
+	}
+
+	if r.Body == nil {
+		http.Error(w, "Parameter 'report' expected in body, but got no body", http.StatusBadRequest)
+		return
+	}
+	{
+		r.Body = http.MaxBytesReader(w, r.Body, 1048576)
+		buf := getBodyBuffer()
+		_, err := buf.ReadFrom(r.Body)
+		if err != nil {
+			putBodyBuffer(buf)
+			http.Error(w, "Body unreadable: "+err.Error(), http.StatusBadRequest)
+			return
+		}
+
+		err = ValidateAgainstReportSchema(buf.Bytes())
+		if err != nil {
+			putBodyBuffer(buf)
+			http.Error(w, "Failed to validate against schema: "+err.Error(), http.StatusBadRequest)
+			return
+		}
+
+		err = json.Unmarshal(buf.Bytes(), &aReport)
+		putBodyBuffer(buf)
+		if err != nil {
+			http.Error(w, "Error JSON-decoding body parameter 'report': "+err.Error(),
+				http.StatusBadRequest)
+			return
+		}
+	}
+
+	h.PutReport(w,
+		r,
+		aID,
+		aReport)
+}
+
+// WrapExportReport wraps the path `/reports/{id}/export` with the method "post".
+//
+// Path description:
+// exports a report.
+func WrapExportReport(h Handler, w http.ResponseWriter, r *http.Request) {
+	if !tagLimitReports.acquire() {
+		respondOverLimit(w)
+		return
+	}
+	defer tagLimitReports.release()
+
+	if !tagLimitExports.acquire() {
+		respondOverLimit(w)
+		return
+	}
+	defer tagLimitExports.release()
+
+	var aID int64
+
+	vars := mux.Vars(r)
+
+	if _, ok := vars["id"]; !ok {
+		http.Error(w, "Parameter 'id' expected in path", http.StatusBadRequest)
+		return
+	}
+	{
+		parsed, err := strconv.ParseInt(vars["id"], 10, 64)
+		if err != nil {
+			http.Error(w, "Parameter 'id': "+err.Error(), http.StatusBadRequest)
+			return
+		}
+		converted := int64(parsed)
+		aID = converted
+	}
+
+	h.ExportReport(w,
+		r,
+		aID)
+}
+
+// WrapHealth wraps the path `/health` with the method "get".
+//
+// Path description:
+// checks the health.
+func WrapHealth(h Handler, w http.ResponseWriter, r *http.Request) {
+	h.Health(w, r)
+}
+
+// Automatically generated file by swagger_to. DO NOT EDIT OR APPEND ANYTHING!
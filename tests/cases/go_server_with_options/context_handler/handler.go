@@ -0,0 +1,45 @@
+// Code generated by swagger_to. DO NOT EDIT.
+package reports
+
+// Automatically generated file by swagger_to. DO NOT EDIT OR APPEND ANYTHING!
+
+import (
+	"context"
+	"net/http"
+)
+
+// Handler defines an interface to handling the routes.
+//
+// The context given to the methods is done when the request is canceled or the time budget of the route
+// (x-swagger-to-timeout) runs out.
+type Handler interface {
+	// GetReport handles the path `/reports/{id}` with the method "get".
+	//
+	// Path description:
+	// gets a report.
+	GetReport(ctx context.Context,
+		w http.ResponseWriter,
+		r *http.Request,
+		id int64,
+		format *string)
+
+	// PutReport handles the path `/reports/{id}` with the method "put".
+	//
+	// Path description:
+	// puts a report.
+	PutReport(ctx context.Context,
+		w http.ResponseWriter,
+		r *http.Request,
+		id int64,
+		report Report)
+
+	// Health handles the path `/health` with the method "get".
+	//
+	// Path description:
+	// checks the health.
+	Health(ctx context.Context,
+		w http.ResponseWriter,
+		r *http.Request)
+}
+
+// Automatically generated file by swagger_to. DO NOT EDIT OR APPEND ANYTHING!
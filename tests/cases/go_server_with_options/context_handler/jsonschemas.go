@@ -0,0 +1,66 @@
+// Code generated by swagger_to. DO NOT EDIT.
+package reports
+
+// Automatically generated file by swagger_to. DO NOT EDIT OR APPEND ANYTHING!
+
+import (
+	"errors"
+	"fmt"
+	"github.com/xeipuuv/gojsonschema"
+)
+
+func mustNewJSONSchema(text string, name string) *gojsonschema.Schema {
+	loader := gojsonschema.NewStringLoader(text)
+	schema, err := gojsonschema.NewSchema(loader)
+	if err != nil {
+		panic(fmt.Sprintf("failed to load JSON Schema %#v: %s", text, err.Error()))
+	}
+	return schema
+}
+
+var jsonSchemaReportText = `{
+  "title": "Report",
+  "$schema": "http://json-schema.org/draft-04/schema#",
+  "definitions": {
+    "Report": {
+      "type": "object",
+      "required": [
+        "title"
+      ],
+      "properties": {
+        "title": {
+          "type": "string"
+        }
+      }
+    }
+  },
+  "$ref": "#/definitions/Report"
+}`
+
+var jsonSchemaReport = mustNewJSONSchema(
+	jsonSchemaReportText,
+	"Report")
+
+// ValidateAgainstReportSchema validates a message coming from the client against Report schema.
+func ValidateAgainstReportSchema(bb []byte) error {
+	loader := gojsonschema.NewStringLoader(string(bb))
+	result, err := jsonSchemaReport.Validate(loader)
+	if err != nil {
+		return err
+	}
+
+	if result.Valid() {
+		return nil
+	}
+
+	msg := ""
+	for i, valErr := range result.Errors() {
+		if i > 0 {
+			msg += ", "
+		}
+		msg += valErr.String()
+	}
+	return errors.New(msg)
+}
+
+// Automatically generated file by swagger_to. DO NOT EDIT OR APPEND ANYTHING!
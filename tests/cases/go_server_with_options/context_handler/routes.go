@@ -0,0 +1,208 @@
+// Code generated by swagger_to. DO NOT EDIT.
+package reports
+
+// Automatically generated file by swagger_to. DO NOT EDIT OR APPEND ANYTHING!
+
+import (
+	"bytes"
+	"context"
+	"encoding/json"
+	"github.com/gorilla/mux"
+	"net/http"
+	"strconv"
+	"sync"
+	"time"
+)
+
+// SetupRouter sets up a router. If you don't use any middleware, you are good to go.
+// Otherwise, you need to maually re-implement this function with your middlewares.
+func SetupRouter(h Handler) *mux.Router {
+	r := mux.NewRouter()
+
+	r.HandleFunc(`/reports/{id}`,
+		func(w http.ResponseWriter, r *http.Request) {
+			WrapGetReport(h, w, r)
+		}).Methods("get")
+
+	r.HandleFunc(`/reports/{id}`,
+		func(w http.ResponseWriter, r *http.Request) {
+			WrapPutReport(h, w, r)
+		}).Methods("put")
+
+	r.HandleFunc(`/health`,
+		func(w http.ResponseWriter, r *http.Request) {
+			WrapHealth(h, w, r)
+		}).Methods("get")
+
+	return r
+}
+
+// bodyBufferPool recycles the buffers for reading the request bodies.
+var bodyBufferPool = sync.Pool{
+	New: func() interface{} {
+		return new(bytes.Buffer)
+	},
+}
+
+// maxPooledBodyBufferCap limits the capacity of the pooled buffers so that the occasional large bodies
+// are not kept in memory.
+const maxPooledBodyBufferCap = 64 * 1024
+
+// getBodyBuffer gives an empty buffer from the pool.
+func getBodyBuffer() *bytes.Buffer {
+	buf := bodyBufferPool.Get().(*bytes.Buffer)
+	buf.Reset()
+	return buf
+}
+
+// putBodyBuffer returns the buffer to the pool.
+func putBodyBuffer(buf *bytes.Buffer) {
+	if buf.Cap() <= maxPooledBodyBufferCap {
+		bodyBufferPool.Put(buf)
+	}
+}
+
+// respondContextDone responds to a request whose context is done before the handler could be invoked.
+//
+// The response is 504 Gateway Timeout if the context of the request itself is done, i.e. the client went away
+// or the deadline of the caller passed, and 503 Service Unavailable if the route ran out of its own time budget.
+func respondContextDone(w http.ResponseWriter, r *http.Request) {
+	if r.Context().Err() != nil {
+		http.Error(w, http.StatusText(http.StatusGatewayTimeout), http.StatusGatewayTimeout)
+		return
+	}
+
+	http.Error(w, http.StatusText(http.StatusServiceUnavailable), http.StatusServiceUnavailable)
+}
+
+// WrapGetReport wraps the path `/reports/{id}` with the method "get".
+//
+// Path description:
+// gets a report.
+func WrapGetReport(h Handler, w http.ResponseWriter, r *http.Request) {
+	ctx, cancel := context.WithTimeout(r.Context(), 250*time.Millisecond)
+	defer cancel()
+
+	var aID int64
+	var aFormat *string
+
+	q := r.URL.Query()
+
+	if _, ok := q["format"]; ok {
+		val := q.Get("format")
+		aFormat = &val
+	}
+
+	vars := mux.Vars(r)
+
+	if _, ok := vars["id"]; !ok {
+		http.Error(w, "Parameter 'id' expected in path", http.StatusBadRequest)
+		return
+	}
+	{
+		parsed, err := strconv.ParseInt(vars["id"], 10, 64)
+		if err != nil {
+			http.Error(w, "Parameter 'id': "+err.Error(), http.StatusBadRequest)
+			return
+		}
+		converted := int64(parsed)
+		aID = converted
+	}
+
+	if ctx.Err() != nil {
+		respondContextDone(w, r)
+		return
+	}
+
+	h.GetReport(ctx,
+		w,
+		r,
+		aID,
+		aFormat)
+}
+
+// WrapPutReport wraps the path `/reports/{id}` with the method "put".
+//
+// Path description:
+// puts a report.
+func WrapPutReport(h Handler, w http.ResponseWriter, r *http.Request) {
+	ctx, cancel := context.WithTimeout(r.Context(), 90*time.Second)
+	defer cancel()
+
+	var aID int64
+	var aReport Report
+
+	vars := mux.Vars(r)
+
+	if _, ok := vars["id"]; !ok {
+		http.Error(w, "Parameter 'id' expected in path", http.StatusBadRequest)
+		return
+	}
+	{
+		parsed, err := strconv.ParseInt(vars["id"], 10, 64)
+		if err != nil {
+			http.Error(w, "Parameter 'id': "+err.Error(), http.StatusBadRequest)
+			return
+		}
+		converted := int64(parsed)
+		aID = converted
+	}
+
+	if r.Body == nil {
+		http.Error(w, "Parameter 'report' expected in body, but got no body", http.StatusBadRequest)
+		return
+	}
+	{
+		r.Body = http.MaxBytesReader(w, r.Body, 1048576)
+		buf := getBodyBuffer()
+		_, err := buf.ReadFrom(r.Body)
+		if err != nil {
+			putBodyBuffer(buf)
+			http.Error(w, "Body unreadable: "+err.Error(), http.StatusBadRequest)
+			return
+		}
+
+		err = ValidateAgainstReportSchema(buf.Bytes())
+		if err != nil {
+			putBodyBuffer(buf)
+			http.Error(w, "Failed to validate against schema: "+err.Error(), http.StatusBadRequest)
+			return
+		}
+
+		err = json.Unmarshal(buf.Bytes(), &aReport)
+		putBodyBuffer(buf)
+		if err != nil {
+			http.Error(w, "Error JSON-decoding body parameter 'report': "+err.Error(),
+				http.StatusBadRequest)
+			return
+		}
+	}
+
+	if ctx.Err() != nil {
+		respondContextDone(w, r)
+		return
+	}
+
+	h.PutReport(ctx,
+		w,
+		r,
+		aID,
+		aReport)
+}
+
+// WrapHealth wraps the path `/health` with the method "get".
+//
+// Path description:
+// checks the health.
+func WrapHealth(h Handler, w http.ResponseWriter, r *http.Request) {
+	ctx := r.Context()
+
+	if ctx.Err() != nil {
+		respondContextDone(w, r)
+		return
+	}
+
+	h.Health(ctx, w, r)
+}
+
+// Automatically generated file by swagger_to. DO NOT EDIT OR APPEND ANYTHING!
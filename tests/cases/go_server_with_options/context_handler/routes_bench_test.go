@@ -0,0 +1,146 @@
+// Code generated by swagger_to. DO NOT EDIT.
+package reports
+
+// Automatically generated file by swagger_to. DO NOT EDIT OR APPEND ANYTHING!
+
+// The benchmarks send a synthetic request to each route through SetupRouter. The requests are synthesized from
+// the types of the parameters and are expected to be accepted by the wrappers. By default, the handler does nothing
+// so that the benchmarks measure the routing, the parsing, the validation and the decoding. Set newBenchHandler
+// in an init function of your own test file to benchmark your handler as well.
+
+import (
+	"bytes"
+	"context"
+	"net/http"
+	"net/http/httptest"
+	"testing"
+)
+
+// newBenchHandler creates the handler for the benchmarks.
+var newBenchHandler = func() Handler { return benchNoopHandler{} }
+
+// benchNoopHandler implements the Handler with methods which do nothing.
+type benchNoopHandler struct{}
+
+// GetReport does nothing.
+func (benchNoopHandler) GetReport(ctx context.Context,
+	w http.ResponseWriter,
+	r *http.Request,
+	id int64,
+	format *string) {
+}
+
+// PutReport does nothing.
+func (benchNoopHandler) PutReport(ctx context.Context,
+	w http.ResponseWriter,
+	r *http.Request,
+	id int64,
+	report Report) {
+}
+
+// Health does nothing.
+func (benchNoopHandler) Health(ctx context.Context, w http.ResponseWriter, r *http.Request) {}
+
+// benchBody replays the request body without allocations.
+type benchBody struct {
+	bytes.Reader
+}
+
+// Close does nothing.
+func (*benchBody) Close() error {
+	return nil
+}
+
+// benchResponseWriter discards the response.
+type benchResponseWriter struct {
+	header http.Header
+	status int
+}
+
+// Header gives the header of the response.
+func (w *benchResponseWriter) Header() http.Header {
+	return w.header
+}
+
+// Write discards the data.
+func (w *benchResponseWriter) Write(data []byte) (int, error) {
+	if w.status == 0 {
+		w.status = http.StatusOK
+	}
+	return len(data), nil
+}
+
+// WriteHeader records the status code.
+func (w *benchResponseWriter) WriteHeader(status int) {
+	if w.status == 0 {
+		w.status = status
+	}
+}
+
+// benchRoute checks that the request is accepted and then measures how long the router takes to handle it.
+func benchRoute(b *testing.B, method string, target string, header http.Header, payload []byte) {
+	router := SetupRouter(newBenchHandler())
+
+	req := httptest.NewRequest(method, target, nil)
+	for key, values := range header {
+		req.Header[key] = values
+	}
+
+	body := &benchBody{}
+	if payload != nil {
+		body.Reset(payload)
+		req.Body = body
+		req.ContentLength = int64(len(payload))
+	}
+
+	rec := httptest.NewRecorder()
+	router.ServeHTTP(rec, req)
+	switch rec.Code {
+	case http.StatusBadRequest, http.StatusNotFound, http.StatusMethodNotAllowed:
+		b.Fatalf("The synthetic request %s %s was rejected with the status %d: %s", method, target, rec.Code, rec.Body)
+	}
+
+	w := &benchResponseWriter{header: make(http.Header)}
+
+	b.ReportAllocs()
+	b.ResetTimer()
+	for i := 0; i < b.N; i++ {
+		for key := range w.header {
+			delete(w.header, key)
+		}
+		w.status = 0
+
+		if payload != nil {
+			body.Reset(payload)
+			req.Body = body
+		}
+
+		router.ServeHTTP(w, req)
+	}
+}
+
+// BenchmarkRouteGetReport benchmarks the path `/reports/{id}` with the method "get".
+func BenchmarkRouteGetReport(b *testing.B) {
+	var header http.Header
+	var payload []byte
+
+	benchRoute(b, "GET", "/reports/42?format=some+text", header, payload)
+}
+
+// BenchmarkRoutePutReport benchmarks the path `/reports/{id}` with the method "put".
+func BenchmarkRoutePutReport(b *testing.B) {
+	var header http.Header
+	payload := []byte(`{"title":"some text"}`)
+
+	benchRoute(b, "PUT", "/reports/42", header, payload)
+}
+
+// BenchmarkRouteHealth benchmarks the path `/health` with the method "get".
+func BenchmarkRouteHealth(b *testing.B) {
+	var header http.Header
+	var payload []byte
+
+	benchRoute(b, "GET", "/health", header, payload)
+}
+
+// Automatically generated file by swagger_to. DO NOT EDIT OR APPEND ANYTHING!
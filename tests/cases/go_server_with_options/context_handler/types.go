@@ -0,0 +1,8 @@
+// Code generated by swagger_to. DO NOT EDIT.
+package reports
+
+// Automatically generated file by swagger_to. DO NOT EDIT OR APPEND ANYTHING!
+
+type Report struct {
+	Title string `json:"title"`
+}
@@ -0,0 +1,19 @@
+// Code generated by swagger_to. DO NOT EDIT.
+package inventory
+
+// Automatically generated file by swagger_to. DO NOT EDIT OR APPEND ANYTHING!
+
+import "net/http"
+
+// Handler defines an interface to handling the routes.
+type Handler interface {
+	// PutItem handles the path `/items` with the method "put".
+	//
+	// Path description:
+	// puts an item.
+	PutItem(w http.ResponseWriter,
+		r *http.Request,
+		item Item)
+}
+
+// Automatically generated file by swagger_to. DO NOT EDIT OR APPEND ANYTHING!
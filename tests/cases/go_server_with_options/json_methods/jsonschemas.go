@@ -0,0 +1,562 @@
+// Code generated by swagger_to. DO NOT EDIT.
+package inventory
+
+// Automatically generated file by swagger_to. DO NOT EDIT OR APPEND ANYTHING!
+
+import (
+	"errors"
+	"fmt"
+	"github.com/xeipuuv/gojsonschema"
+)
+
+func mustNewJSONSchema(text string, name string) *gojsonschema.Schema {
+	loader := gojsonschema.NewStringLoader(text)
+	schema, err := gojsonschema.NewSchema(loader)
+	if err != nil {
+		panic(fmt.Sprintf("failed to load JSON Schema %#v: %s", text, err.Error()))
+	}
+	return schema
+}
+
+var jsonSchemaItemText = `{
+  "title": "Item",
+  "$schema": "http://json-schema.org/draft-04/schema#",
+  "definitions": {
+    "Quantity": {
+      "description": "is an identified primitive type.",
+      "type": "integer",
+      "format": "int64"
+    },
+    "Dimensions": {
+      "type": "object",
+      "required": [
+        "width",
+        "height"
+      ],
+      "properties": {
+        "width": {
+          "type": "number",
+          "format": "float"
+        },
+        "height": {
+          "type": "number"
+        },
+        "depth": {
+          "type": "number",
+          "format": "double"
+        }
+      }
+    },
+    "Label": {
+      "type": "string"
+    },
+    "Item": {
+      "type": "object",
+      "required": [
+        "id",
+        "name",
+        "quantity",
+        "dimensions"
+      ],
+      "properties": {
+        "id": {
+          "type": "integer"
+        },
+        "name": {
+          "type": "string"
+        },
+        "quantity": {
+          "$ref": "#/definitions/Quantity"
+        },
+        "price": {
+          "type": "number",
+          "format": "double"
+        },
+        "available": {
+          "type": "boolean"
+        },
+        "created": {
+          "type": "string",
+          "format": "date-time"
+        },
+        "dimensions": {
+          "$ref": "#/definitions/Dimensions"
+        },
+        "labels": {
+          "type": "array",
+          "items": {
+            "$ref": "#/definitions/Label"
+          }
+        },
+        "attributes": {
+          "type": "object",
+          "additionalProperties": {
+            "type": "string"
+          }
+        },
+        "extra": {
+          "description": "is an arbitrary value."
+        },
+        "variants": {
+          "type": "array",
+          "items": {
+            "type": "object",
+            "required": [
+              "sku"
+            ],
+            "properties": {
+              "sku": {
+                "type": "string"
+              },
+              "stock": {
+                "type": "integer",
+                "format": "int32"
+              },
+              "tags": {
+                "type": "array",
+                "items": {
+                  "type": "array",
+                  "items": {
+                    "type": "string"
+                  }
+                }
+              }
+            }
+          }
+        }
+      }
+    }
+  },
+  "$ref": "#/definitions/Item"
+}`
+
+var jsonSchemaQuantityText = `{
+  "title": "Quantity",
+  "$schema": "http://json-schema.org/draft-04/schema#",
+  "description": "is an identified primitive type.",
+  "type": "integer",
+  "format": "int64"
+}`
+
+var jsonSchemaLabelText = `{
+  "title": "Label",
+  "$schema": "http://json-schema.org/draft-04/schema#",
+  "type": "string"
+}`
+
+var jsonSchemaDimensionsText = `{
+  "title": "Dimensions",
+  "$schema": "http://json-schema.org/draft-04/schema#",
+  "type": "object",
+  "required": [
+    "width",
+    "height"
+  ],
+  "properties": {
+    "width": {
+      "type": "number",
+      "format": "float"
+    },
+    "height": {
+      "type": "number"
+    },
+    "depth": {
+      "type": "number",
+      "format": "double"
+    }
+  }
+}`
+
+var jsonSchemaItemsText = `{
+  "title": "Items",
+  "$schema": "http://json-schema.org/draft-04/schema#",
+  "definitions": {
+    "Quantity": {
+      "description": "is an identified primitive type.",
+      "type": "integer",
+      "format": "int64"
+    },
+    "Dimensions": {
+      "type": "object",
+      "required": [
+        "width",
+        "height"
+      ],
+      "properties": {
+        "width": {
+          "type": "number",
+          "format": "float"
+        },
+        "height": {
+          "type": "number"
+        },
+        "depth": {
+          "type": "number",
+          "format": "double"
+        }
+      }
+    },
+    "Label": {
+      "type": "string"
+    },
+    "Item": {
+      "type": "object",
+      "required": [
+        "id",
+        "name",
+        "quantity",
+        "dimensions"
+      ],
+      "properties": {
+        "id": {
+          "type": "integer"
+        },
+        "name": {
+          "type": "string"
+        },
+        "quantity": {
+          "$ref": "#/definitions/Quantity"
+        },
+        "price": {
+          "type": "number",
+          "format": "double"
+        },
+        "available": {
+          "type": "boolean"
+        },
+        "created": {
+          "type": "string",
+          "format": "date-time"
+        },
+        "dimensions": {
+          "$ref": "#/definitions/Dimensions"
+        },
+        "labels": {
+          "type": "array",
+          "items": {
+            "$ref": "#/definitions/Label"
+          }
+        },
+        "attributes": {
+          "type": "object",
+          "additionalProperties": {
+            "type": "string"
+          }
+        },
+        "extra": {
+          "description": "is an arbitrary value."
+        },
+        "variants": {
+          "type": "array",
+          "items": {
+            "type": "object",
+            "required": [
+              "sku"
+            ],
+            "properties": {
+              "sku": {
+                "type": "string"
+              },
+              "stock": {
+                "type": "integer",
+                "format": "int32"
+              },
+              "tags": {
+                "type": "array",
+                "items": {
+                  "type": "array",
+                  "items": {
+                    "type": "string"
+                  }
+                }
+              }
+            }
+          }
+        }
+      }
+    }
+  },
+  "type": "array",
+  "items": {
+    "$ref": "#/definitions/Item"
+  }
+}`
+
+var jsonSchemaInventoryText = `{
+  "title": "Inventory",
+  "$schema": "http://json-schema.org/draft-04/schema#",
+  "definitions": {
+    "Quantity": {
+      "description": "is an identified primitive type.",
+      "type": "integer",
+      "format": "int64"
+    },
+    "Dimensions": {
+      "type": "object",
+      "required": [
+        "width",
+        "height"
+      ],
+      "properties": {
+        "width": {
+          "type": "number",
+          "format": "float"
+        },
+        "height": {
+          "type": "number"
+        },
+        "depth": {
+          "type": "number",
+          "format": "double"
+        }
+      }
+    },
+    "Label": {
+      "type": "string"
+    },
+    "Item": {
+      "type": "object",
+      "required": [
+        "id",
+        "name",
+        "quantity",
+        "dimensions"
+      ],
+      "properties": {
+        "id": {
+          "type": "integer"
+        },
+        "name": {
+          "type": "string"
+        },
+        "quantity": {
+          "$ref": "#/definitions/Quantity"
+        },
+        "price": {
+          "type": "number",
+          "format": "double"
+        },
+        "available": {
+          "type": "boolean"
+        },
+        "created": {
+          "type": "string",
+          "format": "date-time"
+        },
+        "dimensions": {
+          "$ref": "#/definitions/Dimensions"
+        },
+        "labels": {
+          "type": "array",
+          "items": {
+            "$ref": "#/definitions/Label"
+          }
+        },
+        "attributes": {
+          "type": "object",
+          "additionalProperties": {
+            "type": "string"
+          }
+        },
+        "extra": {
+          "description": "is an arbitrary value."
+        },
+        "variants": {
+          "type": "array",
+          "items": {
+            "type": "object",
+            "required": [
+              "sku"
+            ],
+            "properties": {
+              "sku": {
+                "type": "string"
+              },
+              "stock": {
+                "type": "integer",
+                "format": "int32"
+              },
+              "tags": {
+                "type": "array",
+                "items": {
+                  "type": "array",
+                  "items": {
+                    "type": "string"
+                  }
+                }
+              }
+            }
+          }
+        }
+      }
+    },
+    "Items": {
+      "type": "array",
+      "items": {
+        "$ref": "#/definitions/Item"
+      }
+    }
+  },
+  "type": "object",
+  "additionalProperties": {
+    "$ref": "#/definitions/Items"
+  }
+}`
+
+var jsonSchemaItem = mustNewJSONSchema(
+	jsonSchemaItemText,
+	"Item")
+
+var jsonSchemaQuantity = mustNewJSONSchema(
+	jsonSchemaQuantityText,
+	"Quantity")
+
+var jsonSchemaLabel = mustNewJSONSchema(
+	jsonSchemaLabelText,
+	"Label")
+
+var jsonSchemaDimensions = mustNewJSONSchema(
+	jsonSchemaDimensionsText,
+	"Dimensions")
+
+var jsonSchemaItems = mustNewJSONSchema(
+	jsonSchemaItemsText,
+	"Items")
+
+var jsonSchemaInventory = mustNewJSONSchema(
+	jsonSchemaInventoryText,
+	"Inventory")
+
+// ValidateAgainstItemSchema validates a message coming from the client against Item schema.
+func ValidateAgainstItemSchema(bb []byte) error {
+	loader := gojsonschema.NewStringLoader(string(bb))
+	result, err := jsonSchemaItem.Validate(loader)
+	if err != nil {
+		return err
+	}
+
+	if result.Valid() {
+		return nil
+	}
+
+	msg := ""
+	for i, valErr := range result.Errors() {
+		if i > 0 {
+			msg += ", "
+		}
+		msg += valErr.String()
+	}
+	return errors.New(msg)
+}
+
+// ValidateAgainstQuantitySchema validates a message coming from the client against Quantity schema.
+func ValidateAgainstQuantitySchema(bb []byte) error {
+	loader := gojsonschema.NewStringLoader(string(bb))
+	result, err := jsonSchemaQuantity.Validate(loader)
+	if err != nil {
+		return err
+	}
+
+	if result.Valid() {
+		return nil
+	}
+
+	msg := ""
+	for i, valErr := range result.Errors() {
+		if i > 0 {
+			msg += ", "
+		}
+		msg += valErr.String()
+	}
+	return errors.New(msg)
+}
+
+// ValidateAgainstLabelSchema validates a message coming from the client against Label schema.
+func ValidateAgainstLabelSchema(bb []byte) error {
+	loader := gojsonschema.NewStringLoader(string(bb))
+	result, err := jsonSchemaLabel.Validate(loader)
+	if err != nil {
+		return err
+	}
+
+	if result.Valid() {
+		return nil
+	}
+
+	msg := ""
+	for i, valErr := range result.Errors() {
+		if i > 0 {
+			msg += ", "
+		}
+		msg += valErr.String()
+	}
+	return errors.New(msg)
+}
+
+// ValidateAgainstDimensionsSchema validates a message coming from the client against Dimensions schema.
+func ValidateAgainstDimensionsSchema(bb []byte) error {
+	loader := gojsonschema.NewStringLoader(string(bb))
+	result, err := jsonSchemaDimensions.Validate(loader)
+	if err != nil {
+		return err
+	}
+
+	if result.Valid() {
+		return nil
+	}
+
+	msg := ""
+	for i, valErr := range result.Errors() {
+		if i > 0 {
+			msg += ", "
+		}
+		msg += valErr.String()
+	}
+	return errors.New(msg)
+}
+
+// ValidateAgainstItemsSchema validates a message coming from the client against Items schema.
+func ValidateAgainstItemsSchema(bb []byte) error {
+	loader := gojsonschema.NewStringLoader(string(bb))
+	result, err := jsonSchemaItems.Validate(loader)
+	if err != nil {
+		return err
+	}
+
+	if result.Valid() {
+		return nil
+	}
+
+	msg := ""
+	for i, valErr := range result.Errors() {
+		if i > 0 {
+			msg += ", "
+		}
+		msg += valErr.String()
+	}
+	return errors.New(msg)
+}
+
+// ValidateAgainstInventorySchema validates a message coming from the client against Inventory schema.
+func ValidateAgainstInventorySchema(bb []byte) error {
+	loader := gojsonschema.NewStringLoader(string(bb))
+	result, err := jsonSchemaInventory.Validate(loader)
+	if err != nil {
+		return err
+	}
+
+	if result.Valid() {
+		return nil
+	}
+
+	msg := ""
+	for i, valErr := range result.Errors() {
+		if i > 0 {
+			msg += ", "
+		}
+		msg += valErr.String()
+	}
+	return errors.New(msg)
+}
+
+// Automatically generated file by swagger_to. DO NOT EDIT OR APPEND ANYTHING!
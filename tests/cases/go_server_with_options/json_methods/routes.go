@@ -0,0 +1,94 @@
+// Code generated by swagger_to. DO NOT EDIT.
+package inventory
+
+// Automatically generated file by swagger_to. DO NOT EDIT OR APPEND ANYTHING!
+
+import (
+	"bytes"
+	"encoding/json"
+	"github.com/gorilla/mux"
+	"net/http"
+	"sync"
+)
+
+// SetupRouter sets up a router. If you don't use any middleware, you are good to go.
+// Otherwise, you need to maually re-implement this function with your middlewares.
+func SetupRouter(h Handler) *mux.Router {
+	r := mux.NewRouter()
+
+	r.HandleFunc(`/items`,
+		func(w http.ResponseWriter, r *http.Request) {
+			WrapPutItem(h, w, r)
+		}).Methods("put")
+
+	return r
+}
+
+// bodyBufferPool recycles the buffers for reading the request bodies.
+var bodyBufferPool = sync.Pool{
+	New: func() interface{} {
+		return new(bytes.Buffer)
+	},
+}
+
+// maxPooledBodyBufferCap limits the capacity of the pooled buffers so that the occasional large bodies
+// are not kept in memory.
+const maxPooledBodyBufferCap = 64 * 1024
+
+// getBodyBuffer gives an empty buffer from the pool.
+func getBodyBuffer() *bytes.Buffer {
+	buf := bodyBufferPool.Get().(*bytes.Buffer)
+	buf.Reset()
+	return buf
+}
+
+// putBodyBuffer returns the buffer to the pool.
+func putBodyBuffer(buf *bytes.Buffer) {
+	if buf.Cap() <= maxPooledBodyBufferCap {
+		bodyBufferPool.Put(buf)
+	}
+}
+
+// WrapPutItem wraps the path `/items` with the method "put".
+//
+// Path description:
+// puts an item.
+func WrapPutItem(h Handler, w http.ResponseWriter, r *http.Request) {
+	var aItem Item
+
+	if r.Body == nil {
+		http.Error(w, "Parameter 'item' expected in body, but got no body", http.StatusBadRequest)
+		return
+	}
+	{
+		r.Body = http.MaxBytesReader(w, r.Body, 1048576)
+		buf := getBodyBuffer()
+		_, err := buf.ReadFrom(r.Body)
+		if err != nil {
+			putBodyBuffer(buf)
+			http.Error(w, "Body unreadable: "+err.Error(), http.StatusBadRequest)
+			return
+		}
+
+		err = ValidateAgainstItemSchema(buf.Bytes())
+		if err != nil {
+			putBodyBuffer(buf)
+			http.Error(w, "Failed to validate against schema: "+err.Error(), http.StatusBadRequest)
+			return
+		}
+
+		err = json.Unmarshal(buf.Bytes(), &aItem)
+		putBodyBuffer(buf)
+		if err != nil {
+			http.Error(w, "Error JSON-decoding body parameter 'item': "+err.Error(),
+				http.StatusBadRequest)
+			return
+		}
+	}
+
+	h.PutItem(w,
+		r,
+		aItem)
+}
+
+// Automatically generated file by swagger_to. DO NOT EDIT OR APPEND ANYTHING!
@@ -0,0 +1,54 @@
+// Code generated by swagger_to. DO NOT EDIT.
+package inventory
+
+// Automatically generated file by swagger_to. DO NOT EDIT OR APPEND ANYTHING!
+
+import "time"
+
+// Quantity is an identified primitive type.
+type Quantity int64
+
+type Label string
+
+type Dimensions struct {
+	Width float32 `json:"width"`
+
+	Height float64 `json:"height"`
+
+	Depth *float64 `json:"depth,omitempty"`
+}
+
+type Item struct {
+	ID int `json:"id"`
+
+	Name string `json:"name"`
+
+	Quantity Quantity `json:"quantity"`
+
+	Price *float64 `json:"price,omitempty"`
+
+	Available *bool `json:"available,omitempty"`
+
+	Created *time.Time `json:"created,omitempty"`
+
+	Dimensions Dimensions `json:"dimensions"`
+
+	Labels []Label `json:"labels,omitempty"`
+
+	Attributes map[string]string `json:"attributes,omitempty"`
+
+	// is an arbitrary value.
+	Extra interface{} `json:"extra,omitempty"`
+
+	Variants []struct {
+	Sku string `json:"sku"`
+
+	Stock *int32 `json:"stock,omitempty"`
+
+	Tags [][]string `json:"tags,omitempty"`
+} `json:"variants,omitempty"`
+}
+
+type Items []Item
+
+type Inventory map[string]Items
@@ -0,0 +1,241 @@
+// Code generated by swagger_to. DO NOT EDIT.
+package inventory
+
+// Automatically generated file by swagger_to. DO NOT EDIT OR APPEND ANYTHING!
+//
+// The tests and the benchmarks use the generated JSON methods. Exclude the methods with the build tag
+// swagger_to_reflection to run the same tests and benchmarks with encoding/json for comparison:
+//
+//     go test -run JSON -bench JSON .
+//     go test -run JSON -bench JSON -tags swagger_to_reflection .
+
+import (
+	"encoding/json"
+	"testing"
+)
+
+// jsonAppender is implemented by the types with the generated JSON methods.
+type jsonAppender interface {
+	AppendJSON(buf []byte) ([]byte, error)
+}
+
+// appendJSON encodes the value with the generated method if available and with encoding/json otherwise.
+func appendJSON(buf []byte, value interface{}) ([]byte, error) {
+	if appender, ok := value.(jsonAppender); ok {
+		return appender.AppendJSON(buf)
+	}
+
+	encoded, err := json.Marshal(value)
+	return append(buf, encoded...), err
+}
+
+// unmarshalJSON decodes the value with the generated method if available and with encoding/json otherwise.
+func unmarshalJSON(data []byte, value interface{}) error {
+	if unmarshaler, ok := value.(json.Unmarshaler); ok {
+		return unmarshaler.UnmarshalJSON(data)
+	}
+
+	return json.Unmarshal(data, value)
+}
+
+// payloadDimensions is a synthetic Dimensions as encoded by encoding/json.
+var payloadDimensions = []byte("{\"width\":3.5,\"height\":3.5,\"depth\":3.5}")
+
+func TestJSONRoundTripDimensions(t *testing.T) {
+	var value Dimensions
+	if err := unmarshalJSON(payloadDimensions, &value); err != nil {
+		t.Fatal(err)
+	}
+
+	encoded, err := appendJSON(nil, &value)
+	if err != nil {
+		t.Fatal(err)
+	}
+
+	if string(encoded) != string(payloadDimensions) {
+		t.Fatalf("expected %s, got %s", payloadDimensions, encoded)
+	}
+}
+
+func BenchmarkJSONEncodeDimensions(b *testing.B) {
+	var value Dimensions
+	if err := json.Unmarshal(payloadDimensions, &value); err != nil {
+		b.Fatal(err)
+	}
+
+	var buf []byte
+	var err error
+
+	b.ReportAllocs()
+	b.ResetTimer()
+	for i := 0; i < b.N; i++ {
+		buf, err = appendJSON(buf[:0], &value)
+		if err != nil {
+			b.Fatal(err)
+		}
+	}
+}
+
+func BenchmarkJSONDecodeDimensions(b *testing.B) {
+	var value Dimensions
+
+	b.ReportAllocs()
+	for i := 0; i < b.N; i++ {
+		value = Dimensions{}
+		if err := unmarshalJSON(payloadDimensions, &value); err != nil {
+			b.Fatal(err)
+		}
+	}
+}
+
+// payloadItem is a synthetic Item as encoded by encoding/json.
+var payloadItem = []byte("{\"id\":42,\"name\":\"some text\",\"quantity\":42,\"price\":3.5,\"available\":true,\"created\":\"2006-01-02T15:04:05Z\",\"dimensions\":{\"width\":3.5,\"height\":3.5,\"depth\":3.5},\"labels\":[\"some text\",\"some text\",\"some text\"],\"attributes\":{\"key0\":\"some text\",\"key1\":\"some text\",\"key2\":\"some text\"},\"extra\":{\"key\":\"value\"},\"variants\":[{\"sku\":\"some text\",\"stock\":42},{\"sku\":\"some text\",\"stock\":42},{\"sku\":\"some text\",\"stock\":42}]}")
+
+func TestJSONRoundTripItem(t *testing.T) {
+	var value Item
+	if err := unmarshalJSON(payloadItem, &value); err != nil {
+		t.Fatal(err)
+	}
+
+	encoded, err := appendJSON(nil, &value)
+	if err != nil {
+		t.Fatal(err)
+	}
+
+	if string(encoded) != string(payloadItem) {
+		t.Fatalf("expected %s, got %s", payloadItem, encoded)
+	}
+}
+
+func BenchmarkJSONEncodeItem(b *testing.B) {
+	var value Item
+	if err := json.Unmarshal(payloadItem, &value); err != nil {
+		b.Fatal(err)
+	}
+
+	var buf []byte
+	var err error
+
+	b.ReportAllocs()
+	b.ResetTimer()
+	for i := 0; i < b.N; i++ {
+		buf, err = appendJSON(buf[:0], &value)
+		if err != nil {
+			b.Fatal(err)
+		}
+	}
+}
+
+func BenchmarkJSONDecodeItem(b *testing.B) {
+	var value Item
+
+	b.ReportAllocs()
+	for i := 0; i < b.N; i++ {
+		value = Item{}
+		if err := unmarshalJSON(payloadItem, &value); err != nil {
+			b.Fatal(err)
+		}
+	}
+}
+
+// payloadItems is a synthetic Items as encoded by encoding/json.
+var payloadItems = []byte("[{\"id\":42,\"name\":\"some text\",\"quantity\":42,\"price\":3.5,\"available\":true,\"created\":\"2006-01-02T15:04:05Z\",\"dimensions\":{\"width\":3.5,\"height\":3.5,\"depth\":3.5},\"labels\":[\"some text\",\"some text\",\"some text\"],\"attributes\":{\"key0\":\"some text\",\"key1\":\"some text\",\"key2\":\"some text\"},\"extra\":{\"key\":\"value\"},\"variants\":[{\"sku\":\"some text\"},{\"sku\":\"some text\"},{\"sku\":\"some text\"}]},{\"id\":42,\"name\":\"some text\",\"quantity\":42,\"price\":3.5,\"available\":true,\"created\":\"2006-01-02T15:04:05Z\",\"dimensions\":{\"width\":3.5,\"height\":3.5,\"depth\":3.5},\"labels\":[\"some text\",\"some text\",\"some text\"],\"attributes\":{\"key0\":\"some text\",\"key1\":\"some text\",\"key2\":\"some text\"},\"extra\":{\"key\":\"value\"},\"variants\":[{\"sku\":\"some text\"},{\"sku\":\"some text\"},{\"sku\":\"some text\"}]},{\"id\":42,\"name\":\"some text\",\"quantity\":42,\"price\":3.5,\"available\":true,\"created\":\"2006-01-02T15:04:05Z\",\"dimensions\":{\"width\":3.5,\"height\":3.5,\"depth\":3.5},\"labels\":[\"some text\",\"some text\",\"some text\"],\"attributes\":{\"key0\":\"some text\",\"key1\":\"some text\",\"key2\":\"some text\"},\"extra\":{\"key\":\"value\"},\"variants\":[{\"sku\":\"some text\"},{\"sku\":\"some text\"},{\"sku\":\"some text\"}]}]")
+
+func TestJSONRoundTripItems(t *testing.T) {
+	var value Items
+	if err := unmarshalJSON(payloadItems, &value); err != nil {
+		t.Fatal(err)
+	}
+
+	encoded, err := appendJSON(nil, &value)
+	if err != nil {
+		t.Fatal(err)
+	}
+
+	if string(encoded) != string(payloadItems) {
+		t.Fatalf("expected %s, got %s", payloadItems, encoded)
+	}
+}
+
+func BenchmarkJSONEncodeItems(b *testing.B) {
+	var value Items
+	if err := json.Unmarshal(payloadItems, &value); err != nil {
+		b.Fatal(err)
+	}
+
+	var buf []byte
+	var err error
+
+	b.ReportAllocs()
+	b.ResetTimer()
+	for i := 0; i < b.N; i++ {
+		buf, err = appendJSON(buf[:0], &value)
+		if err != nil {
+			b.Fatal(err)
+		}
+	}
+}
+
+func BenchmarkJSONDecodeItems(b *testing.B) {
+	var value Items
+
+	b.ReportAllocs()
+	for i := 0; i < b.N; i++ {
+		value = Items{}
+		if err := unmarshalJSON(payloadItems, &value); err != nil {
+			b.Fatal(err)
+		}
+	}
+}
+
+// payloadInventory is a synthetic Inventory as encoded by encoding/json.
+var payloadInventory = []byte("{\"key0\":[{\"id\":42,\"name\":\"some text\",\"quantity\":42,\"price\":3.5,\"available\":true,\"created\":\"2006-01-02T15:04:05Z\",\"dimensions\":{\"width\":3.5,\"height\":3.5},\"extra\":{\"key\":\"value\"}},{\"id\":42,\"name\":\"some text\",\"quantity\":42,\"price\":3.5,\"available\":true,\"created\":\"2006-01-02T15:04:05Z\",\"dimensions\":{\"width\":3.5,\"height\":3.5},\"extra\":{\"key\":\"value\"}},{\"id\":42,\"name\":\"some text\",\"quantity\":42,\"price\":3.5,\"available\":true,\"created\":\"2006-01-02T15:04:05Z\",\"dimensions\":{\"width\":3.5,\"height\":3.5},\"extra\":{\"key\":\"value\"}}],\"key1\":[{\"id\":42,\"name\":\"some text\",\"quantity\":42,\"price\":3.5,\"available\":true,\"created\":\"2006-01-02T15:04:05Z\",\"dimensions\":{\"width\":3.5,\"height\":3.5},\"extra\":{\"key\":\"value\"}},{\"id\":42,\"name\":\"some text\",\"quantity\":42,\"price\":3.5,\"available\":true,\"created\":\"2006-01-02T15:04:05Z\",\"dimensions\":{\"width\":3.5,\"height\":3.5},\"extra\":{\"key\":\"value\"}},{\"id\":42,\"name\":\"some text\",\"quantity\":42,\"price\":3.5,\"available\":true,\"created\":\"2006-01-02T15:04:05Z\",\"dimensions\":{\"width\":3.5,\"height\":3.5},\"extra\":{\"key\":\"value\"}}],\"key2\":[{\"id\":42,\"name\":\"some text\",\"quantity\":42,\"price\":3.5,\"available\":true,\"created\":\"2006-01-02T15:04:05Z\",\"dimensions\":{\"width\":3.5,\"height\":3.5},\"extra\":{\"key\":\"value\"}},{\"id\":42,\"name\":\"some text\",\"quantity\":42,\"price\":3.5,\"available\":true,\"created\":\"2006-01-02T15:04:05Z\",\"dimensions\":{\"width\":3.5,\"height\":3.5},\"extra\":{\"key\":\"value\"}},{\"id\":42,\"name\":\"some text\",\"quantity\":42,\"price\":3.5,\"available\":true,\"created\":\"2006-01-02T15:04:05Z\",\"dimensions\":{\"width\":3.5,\"height\":3.5},\"extra\":{\"key\":\"value\"}}]}")
+
+func TestJSONRoundTripInventory(t *testing.T) {
+	var value Inventory
+	if err := unmarshalJSON(payloadInventory, &value); err != nil {
+		t.Fatal(err)
+	}
+
+	encoded, err := appendJSON(nil, &value)
+	if err != nil {
+		t.Fatal(err)
+	}
+
+	if string(encoded) != string(payloadInventory) {
+		t.Fatalf("expected %s, got %s", payloadInventory, encoded)
+	}
+}
+
+func BenchmarkJSONEncodeInventory(b *testing.B) {
+	var value Inventory
+	if err := json.Unmarshal(payloadInventory, &value); err != nil {
+		b.Fatal(err)
+	}
+
+	var buf []byte
+	var err error
+
+	b.ReportAllocs()
+	b.ResetTimer()
+	for i := 0; i < b.N; i++ {
+		buf, err = appendJSON(buf[:0], &value)
+		if err != nil {
+			b.Fatal(err)
+		}
+	}
+}
+
+func BenchmarkJSONDecodeInventory(b *testing.B) {
+	var value Inventory
+
+	b.ReportAllocs()
+	for i := 0; i < b.N; i++ {
+		value = Inventory{}
+		if err := unmarshalJSON(payloadInventory, &value); err != nil {
+			b.Fatal(err)
+		}
+	}
+}
+
+// Automatically generated file by swagger_to. DO NOT EDIT OR APPEND ANYTHING!
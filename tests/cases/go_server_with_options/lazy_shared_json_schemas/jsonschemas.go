@@ -0,0 +1,562 @@
+// Code generated by swagger_to. DO NOT EDIT.
+package uber
+
+// Automatically generated file by swagger_to. DO NOT EDIT OR APPEND ANYTHING!
+
+import (
+	"errors"
+	"fmt"
+	"github.com/xeipuuv/gojsonschema"
+	"runtime"
+	"sync"
+)
+
+// jsonSchemaDefinitionsText bundles the definitions shared by all the JSON schemas.
+var jsonSchemaDefinitionsText = `{
+  "id": "swagger-to://definitions.json",
+  "$schema": "http://json-schema.org/draft-04/schema#",
+  "definitions": {
+    "Profile": {
+      "type": "object",
+      "properties": {
+        "first_name": {
+          "type": "string",
+          "description": "First name of the Uber user."
+        },
+        "last_name": {
+          "type": "string",
+          "description": "Last name of the Uber user."
+        },
+        "email": {
+          "type": "string",
+          "description": "Email address of the Uber user"
+        },
+        "picture": {
+          "type": "string",
+          "description": "Image URL of the Uber user."
+        },
+        "promo_code": {
+          "type": "string",
+          "description": "Promo code of the Uber user."
+        }
+      },
+      "required": [
+        "last_name",
+        "email",
+        "picture"
+      ]
+    },
+    "Product": {
+      "type": "object",
+      "properties": {
+        "product_id": {
+          "type": "string",
+          "description": "Unique identifier representing a specific product for a given latitude & longitude.\nFor example, uberX in San Francisco will have a different product_id than uberX in Los Angeles."
+        },
+        "desc": {
+          "type": "string",
+          "description": "Description of product."
+        },
+        "display_name": {
+          "type": "string",
+          "description": "Display name of product."
+        },
+        "capacity": {
+          "type": "integer",
+          "format": "int32",
+          "description": "Capacity of product. For example, 4 people."
+        },
+        "image": {
+          "type": "string",
+          "description": "Image URL representing the product."
+        }
+      },
+      "required": [
+        "product_id",
+        "desc",
+        "display_name",
+        "capacity",
+        "image"
+      ]
+    },
+    "Activity": {
+      "type": "object",
+      "properties": {
+        "uuid": {
+          "type": "string",
+          "description": "Unique identifier for the activity"
+        }
+      },
+      "required": [
+        "uuid"
+      ]
+    }
+  }
+}`
+
+func mustNewJSONSchemaLoader(text string) *gojsonschema.SchemaLoader {
+	schemaLoader := gojsonschema.NewSchemaLoader()
+	err := schemaLoader.AddSchemas(gojsonschema.NewStringLoader(text))
+	if err != nil {
+		panic(fmt.Sprintf("failed to load the shared JSON Schema definitions: %s", err.Error()))
+	}
+	return schemaLoader
+}
+
+// jsonSchemaLoader resolves the references to the shared definitions. It is loaded on first use.
+var jsonSchemaLoader *gojsonschema.SchemaLoader
+
+// jsonSchemaLoaderMu guards jsonSchemaLoader which is not safe for concurrent use.
+var jsonSchemaLoaderMu sync.Mutex
+
+func mustNewJSONSchema(text string, name string) *gojsonschema.Schema {
+	jsonSchemaLoaderMu.Lock()
+	defer jsonSchemaLoaderMu.Unlock()
+
+	if jsonSchemaLoader == nil {
+		jsonSchemaLoader = mustNewJSONSchemaLoader(jsonSchemaDefinitionsText)
+	}
+
+	loader := gojsonschema.NewStringLoader(text)
+	schema, err := jsonSchemaLoader.Compile(loader)
+	if err != nil {
+		panic(fmt.Sprintf("failed to load JSON Schema %#v: %s", text, err.Error()))
+	}
+	return schema
+}
+
+var jsonSchemaProfileText = `{
+  "title": "Profile",
+  "$schema": "http://json-schema.org/draft-04/schema#",
+  "$ref": "swagger-to://definitions.json#/definitions/Profile"
+}`
+
+var jsonSchemaProductText = `{
+  "title": "Product",
+  "$schema": "http://json-schema.org/draft-04/schema#",
+  "type": "object",
+  "properties": {
+    "product_id": {
+      "type": "string",
+      "description": "Unique identifier representing a specific product for a given latitude & longitude.\nFor example, uberX in San Francisco will have a different product_id than uberX in Los Angeles."
+    },
+    "desc": {
+      "type": "string",
+      "description": "Description of product."
+    },
+    "display_name": {
+      "type": "string",
+      "description": "Display name of product."
+    },
+    "capacity": {
+      "type": "integer",
+      "format": "int32",
+      "description": "Capacity of product. For example, 4 people."
+    },
+    "image": {
+      "type": "string",
+      "description": "Image URL representing the product."
+    }
+  },
+  "required": [
+    "product_id",
+    "desc",
+    "display_name",
+    "capacity",
+    "image"
+  ]
+}`
+
+var jsonSchemaProductListText = `{
+  "title": "ProductList",
+  "$schema": "http://json-schema.org/draft-04/schema#",
+  "type": "object",
+  "properties": {
+    "products": {
+      "description": "Contains the list of products",
+      "type": "array",
+      "items": {
+        "$ref": "swagger-to://definitions.json#/definitions/Product"
+      }
+    }
+  },
+  "required": [
+    "products"
+  ]
+}`
+
+var jsonSchemaProductMapText = `{
+  "title": "ProductMap",
+  "$schema": "http://json-schema.org/draft-04/schema#",
+  "type": "object",
+  "additionalProperties": {
+    "$ref": "swagger-to://definitions.json#/definitions/Product"
+  }
+}`
+
+var jsonSchemaPriceEstimateText = `{
+  "title": "PriceEstimate",
+  "$schema": "http://json-schema.org/draft-04/schema#",
+  "type": "object",
+  "properties": {
+    "product_id": {
+      "type": "string",
+      "description": "Unique identifier representing a specific product for a given latitude & longitude. For example,\nuberX in San Francisco will have a different product_id than uberX in Los Angeles"
+    },
+    "currency_code": {
+      "type": "string",
+      "description": "[ISO 4217](http://en.wikipedia.org/wiki/ISO_4217) currency code."
+    },
+    "display_name": {
+      "type": "string",
+      "description": "Display name of product."
+    },
+    "estimate": {
+      "type": "string",
+      "description": "Formatted string of estimate in local currency of the start location.\nEstimate could be a range, a single number (flat rate) or \"Metered\" for TAXI."
+    },
+    "low_estimate": {
+      "type": "number",
+      "format": "double",
+      "description": "Lower bound of the estimated price."
+    },
+    "high_estimate": {
+      "type": "number",
+      "format": "double",
+      "description": "Upper bound of the estimated price."
+    },
+    "surge_multiplier": {
+      "type": "number",
+      "format": "double",
+      "description": "Expected surge multiplier. Surge is active if surge_multiplier is greater than 1.\nPrice estimate already factors in the surge multiplier."
+    }
+  },
+  "required": [
+    "product_id",
+    "currency_code",
+    "display_name",
+    "estimate"
+  ]
+}`
+
+var jsonSchemaPriceEstimateArrayText = `{
+  "title": "PriceEstimateArray",
+  "$schema": "http://json-schema.org/draft-04/schema#",
+  "type": "array",
+  "items": {
+    "$ref": "swagger-to://definitions.json#/definitions/Product"
+  }
+}`
+
+var jsonSchemaActivityText = `{
+  "title": "Activity",
+  "$schema": "http://json-schema.org/draft-04/schema#",
+  "type": "object",
+  "properties": {
+    "uuid": {
+      "type": "string",
+      "description": "Unique identifier for the activity"
+    }
+  },
+  "required": [
+    "uuid"
+  ]
+}`
+
+var jsonSchemaActivitiesText = `{
+  "title": "Activities",
+  "$schema": "http://json-schema.org/draft-04/schema#",
+  "type": "object",
+  "properties": {
+    "offset": {
+      "type": "integer",
+      "format": "int32",
+      "description": "Position in pagination."
+    },
+    "limit": {
+      "type": "integer",
+      "format": "int32",
+      "description": "Number of items to retrieve (100 max)."
+    },
+    "count": {
+      "type": "integer",
+      "format": "int64",
+      "description": "Total number of items available."
+    },
+    "history": {
+      "type": "array",
+      "items": {
+        "$ref": "swagger-to://definitions.json#/definitions/Activity"
+      }
+    }
+  },
+  "required": [
+    "offset",
+    "limit",
+    "count",
+    "history"
+  ]
+}`
+
+// lazyJSONSchema compiles the JSON schema on first use.
+type lazyJSONSchema struct {
+	once   sync.Once
+	text   string
+	name   string
+	schema *gojsonschema.Schema
+}
+
+// get compiles the schema on the first call and returns the compiled schema.
+func (l *lazyJSONSchema) get() *gojsonschema.Schema {
+	l.once.Do(func() {
+		l.schema = mustNewJSONSchema(l.text, l.name)
+	})
+	return l.schema
+}
+
+var jsonSchemaProfile = &lazyJSONSchema{
+	text: jsonSchemaProfileText,
+	name: "Profile"}
+
+var jsonSchemaProduct = &lazyJSONSchema{
+	text: jsonSchemaProductText,
+	name: "Product"}
+
+var jsonSchemaProductList = &lazyJSONSchema{
+	text: jsonSchemaProductListText,
+	name: "ProductList"}
+
+var jsonSchemaProductMap = &lazyJSONSchema{
+	text: jsonSchemaProductMapText,
+	name: "ProductMap"}
+
+var jsonSchemaPriceEstimate = &lazyJSONSchema{
+	text: jsonSchemaPriceEstimateText,
+	name: "PriceEstimate"}
+
+var jsonSchemaPriceEstimateArray = &lazyJSONSchema{
+	text: jsonSchemaPriceEstimateArrayText,
+	name: "PriceEstimateArray"}
+
+var jsonSchemaActivity = &lazyJSONSchema{
+	text: jsonSchemaActivityText,
+	name: "Activity"}
+
+var jsonSchemaActivities = &lazyJSONSchema{
+	text: jsonSchemaActivitiesText,
+	name: "Activities"}
+
+// WarmupSchemas compiles all the JSON schemas concurrently on the available CPUs. Call it at the start-up
+// if the first requests should not pay for the compilation of their schemas.
+func WarmupSchemas() {
+	schemas := []*lazyJSONSchema{
+		jsonSchemaProfile,
+		jsonSchemaProduct,
+		jsonSchemaProductList,
+		jsonSchemaProductMap,
+		jsonSchemaPriceEstimate,
+		jsonSchemaPriceEstimateArray,
+		jsonSchemaActivity,
+		jsonSchemaActivities}
+
+	queue := make(chan *lazyJSONSchema, len(schemas))
+	for _, schema := range schemas {
+		queue <- schema
+	}
+	close(queue)
+
+	workers := runtime.GOMAXPROCS(0)
+	if workers > len(schemas) {
+		workers = len(schemas)
+	}
+
+	var wg sync.WaitGroup
+	wg.Add(workers)
+	for i := 0; i < workers; i++ {
+		go func() {
+			defer wg.Done()
+			for schema := range queue {
+				schema.get()
+			}
+		}()
+	}
+	wg.Wait()
+}
+
+// ValidateAgainstProfileSchema validates a message coming from the client against Profile schema.
+func ValidateAgainstProfileSchema(bb []byte) error {
+	loader := gojsonschema.NewStringLoader(string(bb))
+	result, err := jsonSchemaProfile.get().Validate(loader)
+	if err != nil {
+		return err
+	}
+
+	if result.Valid() {
+		return nil
+	}
+
+	msg := ""
+	for i, valErr := range result.Errors() {
+		if i > 0 {
+			msg += ", "
+		}
+		msg += valErr.String()
+	}
+	return errors.New(msg)
+}
+
+// ValidateAgainstProductSchema validates a message coming from the client against Product schema.
+func ValidateAgainstProductSchema(bb []byte) error {
+	loader := gojsonschema.NewStringLoader(string(bb))
+	result, err := jsonSchemaProduct.get().Validate(loader)
+	if err != nil {
+		return err
+	}
+
+	if result.Valid() {
+		return nil
+	}
+
+	msg := ""
+	for i, valErr := range result.Errors() {
+		if i > 0 {
+			msg += ", "
+		}
+		msg += valErr.String()
+	}
+	return errors.New(msg)
+}
+
+// ValidateAgainstProductListSchema validates a message coming from the client against ProductList schema.
+func ValidateAgainstProductListSchema(bb []byte) error {
+	loader := gojsonschema.NewStringLoader(string(bb))
+	result, err := jsonSchemaProductList.get().Validate(loader)
+	if err != nil {
+		return err
+	}
+
+	if result.Valid() {
+		return nil
+	}
+
+	msg := ""
+	for i, valErr := range result.Errors() {
+		if i > 0 {
+			msg += ", "
+		}
+		msg += valErr.String()
+	}
+	return errors.New(msg)
+}
+
+// ValidateAgainstProductMapSchema validates a message coming from the client against ProductMap schema.
+func ValidateAgainstProductMapSchema(bb []byte) error {
+	loader := gojsonschema.NewStringLoader(string(bb))
+	result, err := jsonSchemaProductMap.get().Validate(loader)
+	if err != nil {
+		return err
+	}
+
+	if result.Valid() {
+		return nil
+	}
+
+	msg := ""
+	for i, valErr := range result.Errors() {
+		if i > 0 {
+			msg += ", "
+		}
+		msg += valErr.String()
+	}
+	return errors.New(msg)
+}
+
+// ValidateAgainstPriceEstimateSchema validates a message coming from the client against PriceEstimate schema.
+func ValidateAgainstPriceEstimateSchema(bb []byte) error {
+	loader := gojsonschema.NewStringLoader(string(bb))
+	result, err := jsonSchemaPriceEstimate.get().Validate(loader)
+	if err != nil {
+		return err
+	}
+
+	if result.Valid() {
+		return nil
+	}
+
+	msg := ""
+	for i, valErr := range result.Errors() {
+		if i > 0 {
+			msg += ", "
+		}
+		msg += valErr.String()
+	}
+	return errors.New(msg)
+}
+
+// ValidateAgainstPriceEstimateArraySchema validates a message coming from the client against PriceEstimateArray schema.
+func ValidateAgainstPriceEstimateArraySchema(bb []byte) error {
+	loader := gojsonschema.NewStringLoader(string(bb))
+	result, err := jsonSchemaPriceEstimateArray.get().Validate(loader)
+	if err != nil {
+		return err
+	}
+
+	if result.Valid() {
+		return nil
+	}
+
+	msg := ""
+	for i, valErr := range result.Errors() {
+		if i > 0 {
+			msg += ", "
+		}
+		msg += valErr.String()
+	}
+	return errors.New(msg)
+}
+
+// ValidateAgainstActivitySchema validates a message coming from the client against Activity schema.
+func ValidateAgainstActivitySchema(bb []byte) error {
+	loader := gojsonschema.NewStringLoader(string(bb))
+	result, err := jsonSchemaActivity.get().Validate(loader)
+	if err != nil {
+		return err
+	}
+
+	if result.Valid() {
+		return nil
+	}
+
+	msg := ""
+	for i, valErr := range result.Errors() {
+		if i > 0 {
+			msg += ", "
+		}
+		msg += valErr.String()
+	}
+	return errors.New(msg)
+}
+
+// ValidateAgainstActivitiesSchema validates a message coming from the client against Activities schema.
+func ValidateAgainstActivitiesSchema(bb []byte) error {
+	loader := gojsonschema.NewStringLoader(string(bb))
+	result, err := jsonSchemaActivities.get().Validate(loader)
+	if err != nil {
+		return err
+	}
+
+	if result.Valid() {
+		return nil
+	}
+
+	msg := ""
+	for i, valErr := range result.Errors() {
+		if i > 0 {
+			msg += ", "
+		}
+		msg += valErr.String()
+	}
+	return errors.New(msg)
+}
+
+// Automatically generated file by swagger_to. DO NOT EDIT OR APPEND ANYTHING!
@@ -0,0 +1,37 @@
+// Code generated by swagger_to. DO NOT EDIT.
+package users
+
+// Automatically generated file by swagger_to. DO NOT EDIT OR APPEND ANYTHING!
+
+import "net/http"
+
+// Handler defines an interface to handling the routes.
+type Handler interface {
+	// GetUser handles the path `/users/{id}` with the method "get".
+	//
+	// Path description:
+	// gets a user.
+	GetUser(w http.ResponseWriter,
+		r *http.Request,
+		id int64,
+		fields *string,
+		xRequestID *string)
+
+	// PutUser handles the path `/users/{id}` with the method "put".
+	//
+	// Path description:
+	// puts a user.
+	PutUser(w http.ResponseWriter,
+		r *http.Request,
+		id int64,
+		user User)
+
+	// Health handles the path `/health` with the method "get".
+	//
+	// Path description:
+	// checks the health.
+	Health(w http.ResponseWriter,
+		r *http.Request)
+}
+
+// Automatically generated file by swagger_to. DO NOT EDIT OR APPEND ANYTHING!
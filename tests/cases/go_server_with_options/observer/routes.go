@@ -0,0 +1,388 @@
+// Code generated by swagger_to. DO NOT EDIT.
+package users
+
+// Automatically generated file by swagger_to. DO NOT EDIT OR APPEND ANYTHING!
+
+import (
+	"bufio"
+	"bytes"
+	"encoding/json"
+	"github.com/gorilla/mux"
+	"net"
+	"net/http"
+	"strconv"
+	"sync"
+	"time"
+)
+
+// SetupRouter sets up a router. If you don't use any middleware, you are good to go.
+// Otherwise, you need to maually re-implement this function with your middlewares.
+//
+// If the observer o is not nil, it is notified of every request handled by the wrappers.
+func SetupRouter(h Handler, o Observer) *mux.Router {
+	r := mux.NewRouter()
+
+	r.HandleFunc(`/users/{id}`,
+		func(w http.ResponseWriter, r *http.Request) {
+			obs := startObservation(o, "GetUser")
+			WrapGetUser(h, obs.writer(w), r, obs)
+			obs.finish(r)
+		}).Methods("get")
+
+	r.HandleFunc(`/users/{id}`,
+		func(w http.ResponseWriter, r *http.Request) {
+			obs := startObservation(o, "PutUser")
+			WrapPutUser(h, obs.writer(w), r, obs)
+			obs.finish(r)
+		}).Methods("put")
+
+	r.HandleFunc(`/health`,
+		func(w http.ResponseWriter, r *http.Request) {
+			obs := startObservation(o, "Health")
+			WrapHealth(h, obs.writer(w), r, obs)
+			obs.finish(r)
+		}).Methods("get")
+
+	return r
+}
+
+// bodyBufferPool recycles the buffers for reading the request bodies.
+var bodyBufferPool = sync.Pool{
+	New: func() interface{} {
+		return new(bytes.Buffer)
+	},
+}
+
+// maxPooledBodyBufferCap limits the capacity of the pooled buffers so that the occasional large bodies
+// are not kept in memory.
+const maxPooledBodyBufferCap = 64 * 1024
+
+// getBodyBuffer gives an empty buffer from the pool.
+func getBodyBuffer() *bytes.Buffer {
+	buf := bodyBufferPool.Get().(*bytes.Buffer)
+	buf.Reset()
+	return buf
+}
+
+// putBodyBuffer returns the buffer to the pool.
+func putBodyBuffer(buf *bytes.Buffer) {
+	if buf.Cap() <= maxPooledBodyBufferCap {
+		bodyBufferPool.Put(buf)
+	}
+}
+
+// Phase identifies a phase of handling a request in the wrappers.
+type Phase int
+
+const (
+	// PhaseParameters parses the header, query and path parameters.
+	PhaseParameters Phase = iota
+	// PhaseBodyRead reads the request body.
+	PhaseBodyRead
+	// PhaseBodyValidation validates the request body.
+	PhaseBodyValidation
+	// PhaseBodyDecoding decodes the request body from JSON.
+	PhaseBodyDecoding
+	// PhaseHandler runs the handler.
+	PhaseHandler
+	// NumPhases is the number of the phases.
+	NumPhases
+)
+
+var phaseNames = [NumPhases]string{"parameters", "body_read", "body_validation", "body_decoding", "handler"}
+
+// String gives the name of the phase, e.g., as a label of a metric.
+func (p Phase) String() string {
+	if p < 0 || p >= NumPhases {
+		return "unknown"
+	}
+	return phaseNames[p]
+}
+
+// RequestStats describes how a request has been handled by a wrapper.
+type RequestStats struct {
+	// Route is the identifier of the handler method.
+	Route string
+
+	// Durations of the phases indexed by Phase; the phases which did not run are zero.
+	Durations [NumPhases]time.Duration
+
+	// Total is the duration from the dispatch until the wrapper returned.
+	Total time.Duration
+
+	// BodyBytes is the number of bytes read from the request body.
+	BodyBytes int64
+
+	// Status is the status code of the response.
+	Status int
+}
+
+// Observer is notified of the requests handled by the wrappers, e.g., to export the metrics.
+// ObserveRequest is called in the goroutine of the request after the wrapper returned
+// and needs to be safe for concurrent use.
+type Observer interface {
+	ObserveRequest(r *http.Request, stats RequestStats)
+}
+
+// statusRecorder records the status code of the response.
+type statusRecorder struct {
+	http.ResponseWriter
+	status int
+}
+
+// WriteHeader records the status code and writes it to the underlying response.
+func (rec *statusRecorder) WriteHeader(status int) {
+	if rec.status == 0 && status >= 200 {
+		rec.status = status
+	}
+	rec.ResponseWriter.WriteHeader(status)
+}
+
+// Write records the implicit status code and writes to the underlying response.
+func (rec *statusRecorder) Write(data []byte) (int, error) {
+	if rec.status == 0 {
+		rec.status = http.StatusOK
+	}
+	return rec.ResponseWriter.Write(data)
+}
+
+// Unwrap gives the underlying response to http.ResponseController.
+func (rec *statusRecorder) Unwrap() http.ResponseWriter {
+	return rec.ResponseWriter
+}
+
+// Flush records the implicit status code and flushes the underlying response if it supports flushing.
+func (rec *statusRecorder) Flush() {
+	if rec.status == 0 {
+		rec.status = http.StatusOK
+	}
+	if flusher, ok := rec.ResponseWriter.(http.Flusher); ok {
+		flusher.Flush()
+	}
+}
+
+// Hijack lets the handler take over the connection if the underlying response supports it.
+func (rec *statusRecorder) Hijack() (net.Conn, *bufio.ReadWriter, error) {
+	hijacker, ok := rec.ResponseWriter.(http.Hijacker)
+	if !ok {
+		return nil, nil, http.ErrNotSupported
+	}
+	return hijacker.Hijack()
+}
+
+// Observation tracks the phases of an observed request.
+//
+// All the methods are no-ops on a nil observation so that the requests are not timed if there is no observer.
+// Pass nil to the wrappers if you call them directly in your own router and do not observe the requests.
+type Observation struct {
+	o     Observer
+	rec   statusRecorder
+	stats RequestStats
+	start time.Time
+	last  time.Time
+}
+
+// observationPool recycles the observations so that observing a request does not allocate.
+var observationPool = sync.Pool{
+	New: func() interface{} {
+		return new(Observation)
+	},
+}
+
+// startObservation starts observing a request of the route, or gives nil if the observer is nil.
+func startObservation(o Observer, route string) *Observation {
+	if o == nil {
+		return nil
+	}
+	return newObservation(o, route)
+}
+
+// newObservation gives an observation from the pool.
+func newObservation(o Observer, route string) *Observation {
+	obs := observationPool.Get().(*Observation)
+	obs.o = o
+	obs.stats = RequestStats{Route: route}
+	obs.start = time.Now()
+	obs.last = obs.start
+	return obs
+}
+
+// writer wraps the response to record its status code.
+func (obs *Observation) writer(w http.ResponseWriter) http.ResponseWriter {
+	if obs == nil {
+		return w
+	}
+	obs.rec = statusRecorder{ResponseWriter: w}
+	return &obs.rec
+}
+
+// lap ends the phase.
+func (obs *Observation) lap(phase Phase) {
+	if obs != nil {
+		obs.record(phase)
+	}
+}
+
+// readBody records the size of the request body and ends the phase of reading it.
+func (obs *Observation) readBody(n int64) {
+	if obs != nil {
+		obs.stats.BodyBytes += n
+		obs.record(PhaseBodyRead)
+	}
+}
+
+// record adds the time since the last phase to the duration of the phase.
+func (obs *Observation) record(phase Phase) {
+	now := time.Now()
+	obs.stats.Durations[phase] += now.Sub(obs.last)
+	obs.last = now
+}
+
+// finish notifies the observer and returns the observation to the pool.
+func (obs *Observation) finish(r *http.Request) {
+	if obs != nil {
+		obs.notify(r)
+	}
+}
+
+// notify notifies the observer and returns the observation to the pool.
+func (obs *Observation) notify(r *http.Request) {
+	obs.stats.Total = time.Since(obs.start)
+	obs.stats.Status = obs.rec.status
+	if obs.stats.Status == 0 {
+		// The server responds with 200 if the handler wrote nothing.
+		obs.stats.Status = http.StatusOK
+	}
+
+	o, stats := obs.o, obs.stats
+	*obs = Observation{}
+	observationPool.Put(obs)
+
+	o.ObserveRequest(r, stats)
+}
+
+// WrapGetUser wraps the path `/users/{id}` with the method "get".
+//
+// Path description:
+// gets a user.
+func WrapGetUser(h Handler, w http.ResponseWriter, r *http.Request, obs *Observation) {
+	var aID int64
+	var aFields *string
+	var aXRequestID *string
+
+	hdr := r.Header
+
+	if _, ok := hdr["X-Request-Id"]; ok {
+		val := hdr.Get("X-Request-ID")
+		aXRequestID = &val
+	}
+
+	q := r.URL.Query()
+
+	if _, ok := q["fields"]; ok {
+		val := q.Get("fields")
+		aFields = &val
+	}
+
+	vars := mux.Vars(r)
+
+	if _, ok := vars["id"]; !ok {
+		http.Error(w, "Parameter 'id' expected in path", http.StatusBadRequest)
+		return
+	}
+	{
+		parsed, err := strconv.ParseInt(vars["id"], 10, 64)
+		if err != nil {
+			http.Error(w, "Parameter 'id': "+err.Error(), http.StatusBadRequest)
+			return
+		}
+		converted := int64(parsed)
+		aID = converted
+	}
+
+	obs.lap(PhaseParameters)
+
+	h.GetUser(w,
+		r,
+		aID,
+		aFields,
+		aXRequestID)
+	obs.lap(PhaseHandler)
+}
+
+// WrapPutUser wraps the path `/users/{id}` with the method "put".
+//
+// Path description:
+// puts a user.
+func WrapPutUser(h Handler, w http.ResponseWriter, r *http.Request, obs *Observation) {
+	var aID int64
+	var aUser User
+
+	vars := mux.Vars(r)
+
+	if _, ok := vars["id"]; !ok {
+		http.Error(w, "Parameter 'id' expected in path", http.StatusBadRequest)
+		return
+	}
+	{
+		parsed, err := strconv.ParseInt(vars["id"], 10, 64)
+		if err != nil {
+			http.Error(w, "Parameter 'id': "+err.Error(), http.StatusBadRequest)
+			return
+		}
+		converted := int64(parsed)
+		aID = converted
+	}
+
+	obs.lap(PhaseParameters)
+
+	if r.Body == nil {
+		http.Error(w, "Parameter 'user' expected in body, but got no body", http.StatusBadRequest)
+		return
+	}
+	{
+		r.Body = http.MaxBytesReader(w, r.Body, 1048576)
+		buf := getBodyBuffer()
+		n, err := buf.ReadFrom(r.Body)
+		obs.readBody(n)
+		if err != nil {
+			putBodyBuffer(buf)
+			http.Error(w, "Body unreadable: "+err.Error(), http.StatusBadRequest)
+			return
+		}
+
+		err = ValidateAgainstUserSchema(buf.Bytes())
+		if err != nil {
+			putBodyBuffer(buf)
+			http.Error(w, "Failed to validate against schema: "+err.Error(), http.StatusBadRequest)
+			return
+		}
+		obs.lap(PhaseBodyValidation)
+
+		err = json.Unmarshal(buf.Bytes(), &aUser)
+		putBodyBuffer(buf)
+		if err != nil {
+			http.Error(w, "Error JSON-decoding body parameter 'user': "+err.Error(),
+				http.StatusBadRequest)
+			return
+		}
+		obs.lap(PhaseBodyDecoding)
+	}
+
+	h.PutUser(w,
+		r,
+		aID,
+		aUser)
+	obs.lap(PhaseHandler)
+}
+
+// WrapHealth wraps the path `/health` with the method "get".
+//
+// Path description:
+// checks the health.
+func WrapHealth(h Handler, w http.ResponseWriter, r *http.Request, obs *Observation) {
+	h.Health(w, r)
+	obs.lap(PhaseHandler)
+}
+
+// Automatically generated file by swagger_to. DO NOT EDIT OR APPEND ANYTHING!
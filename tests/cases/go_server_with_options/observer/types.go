@@ -0,0 +1,10 @@
+// Code generated by swagger_to. DO NOT EDIT.
+package users
+
+// Automatically generated file by swagger_to. DO NOT EDIT OR APPEND ANYTHING!
+
+type User struct {
+	Name string `json:"name"`
+
+	Email *string `json:"email,omitempty"`
+}
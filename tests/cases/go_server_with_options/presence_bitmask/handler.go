@@ -0,0 +1,29 @@
+// Code generated by swagger_to. DO NOT EDIT.
+package profiles
+
+// Automatically generated file by swagger_to. DO NOT EDIT OR APPEND ANYTHING!
+
+import "net/http"
+
+// Handler defines an interface to handling the routes.
+type Handler interface {
+	// PatchProfile handles the path `/profiles/{id}` with the method "patch".
+	//
+	// Path description:
+	// patches a profile.
+	PatchProfile(w http.ResponseWriter,
+		r *http.Request,
+		id int64,
+		dryRun *bool,
+		patch ProfilePatch)
+
+	// PutSettings handles the path `/settings` with the method "put".
+	//
+	// Path description:
+	// puts the settings.
+	PutSettings(w http.ResponseWriter,
+		r *http.Request,
+		settings Settings)
+}
+
+// Automatically generated file by swagger_to. DO NOT EDIT OR APPEND ANYTHING!
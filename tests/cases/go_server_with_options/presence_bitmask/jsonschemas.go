@@ -0,0 +1,190 @@
+// Code generated by swagger_to. DO NOT EDIT.
+package profiles
+
+// Automatically generated file by swagger_to. DO NOT EDIT OR APPEND ANYTHING!
+
+import (
+	"errors"
+	"fmt"
+	"github.com/xeipuuv/gojsonschema"
+)
+
+func mustNewJSONSchema(text string, name string) *gojsonschema.Schema {
+	loader := gojsonschema.NewStringLoader(text)
+	schema, err := gojsonschema.NewSchema(loader)
+	if err != nil {
+		panic(fmt.Sprintf("failed to load JSON Schema %#v: %s", text, err.Error()))
+	}
+	return schema
+}
+
+var jsonSchemaProfilePatchText = `{
+  "title": "ProfilePatch",
+  "$schema": "http://json-schema.org/draft-04/schema#",
+  "definitions": {
+    "ProfilePatch": {
+      "type": "object",
+      "properties": {
+        "nickname": {
+          "type": "string",
+          "pattern": "^[a-z]+$"
+        },
+        "age": {
+          "type": "integer",
+          "format": "int32"
+        },
+        "email": {
+          "type": "string",
+          "format": "email"
+        }
+      }
+    }
+  },
+  "$ref": "#/definitions/ProfilePatch"
+}`
+
+var jsonSchemaSettingsText = `{
+  "title": "Settings",
+  "$schema": "http://json-schema.org/draft-04/schema#",
+  "definitions": {
+    "Settings": {
+      "type": "object",
+      "properties": {
+        "notifications": {
+          "type": "boolean"
+        },
+        "volume": {
+          "type": "number",
+          "format": "float"
+        }
+      }
+    }
+  },
+  "$ref": "#/definitions/Settings"
+}`
+
+var jsonSchemaProfileText = `{
+  "title": "Profile",
+  "$schema": "http://json-schema.org/draft-04/schema#",
+  "type": "object",
+  "required": [
+    "name"
+  ],
+  "properties": {
+    "name": {
+      "type": "string"
+    },
+    "age": {
+      "type": "integer",
+      "format": "int64"
+    },
+    "score": {
+      "type": "number",
+      "format": "double"
+    },
+    "verified": {
+      "type": "boolean"
+    },
+    "born": {
+      "type": "string",
+      "format": "date-time"
+    },
+    "tags": {
+      "type": "array",
+      "items": {
+        "type": "string"
+      }
+    },
+    "address": {
+      "type": "object",
+      "properties": {
+        "city": {
+          "type": "string"
+        },
+        "zip": {
+          "type": "string"
+        }
+      }
+    }
+  }
+}`
+
+var jsonSchemaProfilePatch = mustNewJSONSchema(
+	jsonSchemaProfilePatchText,
+	"ProfilePatch")
+
+var jsonSchemaSettings = mustNewJSONSchema(
+	jsonSchemaSettingsText,
+	"Settings")
+
+var jsonSchemaProfile = mustNewJSONSchema(
+	jsonSchemaProfileText,
+	"Profile")
+
+// ValidateAgainstProfilePatchSchema validates a message coming from the client against ProfilePatch schema.
+func ValidateAgainstProfilePatchSchema(bb []byte) error {
+	loader := gojsonschema.NewStringLoader(string(bb))
+	result, err := jsonSchemaProfilePatch.Validate(loader)
+	if err != nil {
+		return err
+	}
+
+	if result.Valid() {
+		return nil
+	}
+
+	msg := ""
+	for i, valErr := range result.Errors() {
+		if i > 0 {
+			msg += ", "
+		}
+		msg += valErr.String()
+	}
+	return errors.New(msg)
+}
+
+// ValidateAgainstSettingsSchema validates a message coming from the client against Settings schema.
+func ValidateAgainstSettingsSchema(bb []byte) error {
+	loader := gojsonschema.NewStringLoader(string(bb))
+	result, err := jsonSchemaSettings.Validate(loader)
+	if err != nil {
+		return err
+	}
+
+	if result.Valid() {
+		return nil
+	}
+
+	msg := ""
+	for i, valErr := range result.Errors() {
+		if i > 0 {
+			msg += ", "
+		}
+		msg += valErr.String()
+	}
+	return errors.New(msg)
+}
+
+// ValidateAgainstProfileSchema validates a message coming from the client against Profile schema.
+func ValidateAgainstProfileSchema(bb []byte) error {
+	loader := gojsonschema.NewStringLoader(string(bb))
+	result, err := jsonSchemaProfile.Validate(loader)
+	if err != nil {
+		return err
+	}
+
+	if result.Valid() {
+		return nil
+	}
+
+	msg := ""
+	for i, valErr := range result.Errors() {
+		if i > 0 {
+			msg += ", "
+		}
+		msg += valErr.String()
+	}
+	return errors.New(msg)
+}
+
+// Automatically generated file by swagger_to. DO NOT EDIT OR APPEND ANYTHING!
@@ -0,0 +1,168 @@
+// Code generated by swagger_to. DO NOT EDIT.
+package profiles
+
+// Automatically generated file by swagger_to. DO NOT EDIT OR APPEND ANYTHING!
+
+import (
+	"bytes"
+	"encoding/json"
+	"github.com/gorilla/mux"
+	"net/http"
+	"strconv"
+	"sync"
+)
+
+// SetupRouter sets up a router. If you don't use any middleware, you are good to go.
+// Otherwise, you need to maually re-implement this function with your middlewares.
+func SetupRouter(h Handler) *mux.Router {
+	r := mux.NewRouter()
+
+	r.HandleFunc(`/profiles/{id}`,
+		func(w http.ResponseWriter, r *http.Request) {
+			WrapPatchProfile(h, w, r)
+		}).Methods("patch")
+
+	r.HandleFunc(`/settings`,
+		func(w http.ResponseWriter, r *http.Request) {
+			WrapPutSettings(h, w, r)
+		}).Methods("put")
+
+	return r
+}
+
+// bodyBufferPool recycles the buffers for reading the request bodies.
+var bodyBufferPool = sync.Pool{
+	New: func() interface{} {
+		return new(bytes.Buffer)
+	},
+}
+
+// maxPooledBodyBufferCap limits the capacity of the pooled buffers so that the occasional large bodies
+// are not kept in memory.
+const maxPooledBodyBufferCap = 64 * 1024
+
+// getBodyBuffer gives an empty buffer from the pool.
+func getBodyBuffer() *bytes.Buffer {
+	buf := bodyBufferPool.Get().(*bytes.Buffer)
+	buf.Reset()
+	return buf
+}
+
+// putBodyBuffer returns the buffer to the pool.
+func putBodyBuffer(buf *bytes.Buffer) {
+	if buf.Cap() <= maxPooledBodyBufferCap {
+		bodyBufferPool.Put(buf)
+	}
+}
+
+// WrapPatchProfile wraps the path `/profiles/{id}` with the method "patch".
+//
+// Path description:
+// patches a profile.
+func WrapPatchProfile(h Handler, w http.ResponseWriter, r *http.Request) {
+	var aID int64
+	var aDryRun *bool
+	var aPatch ProfilePatch
+
+	q := r.URL.Query()
+
+	if _, ok := q["dry_run"]; ok {
+		{
+			parsed, err := strconv.ParseBool(q.Get("dry_run"))
+			if err != nil {
+				http.Error(w, "Parameter 'dry_run': "+err.Error(), http.StatusBadRequest)
+				return
+			}
+			aDryRun = &parsed
+		}
+	}
+
+	vars := mux.Vars(r)
+
+	if _, ok := vars["id"]; !ok {
+		http.Error(w, "Parameter 'id' expected in path", http.StatusBadRequest)
+		return
+	}
+	{
+		parsed, err := strconv.ParseInt(vars["id"], 10, 64)
+		if err != nil {
+			http.Error(w, "Parameter 'id': "+err.Error(), http.StatusBadRequest)
+			return
+		}
+		converted := int64(parsed)
+		aID = converted
+	}
+
+	if r.Body == nil {
+		http.Error(w, "Parameter 'patch' expected in body, but got no body", http.StatusBadRequest)
+		return
+	}
+	{
+		r.Body = http.MaxBytesReader(w, r.Body, 1048576)
+		buf := getBodyBuffer()
+		_, err := buf.ReadFrom(r.Body)
+		if err != nil {
+			putBodyBuffer(buf)
+			http.Error(w, "Body unreadable: "+err.Error(), http.StatusBadRequest)
+			return
+		}
+
+		var wire wireProfilePatch
+		err = json.Unmarshal(buf.Bytes(), &wire)
+		putBodyBuffer(buf)
+		if err != nil {
+			http.Error(w, "Error JSON-decoding body parameter 'patch': "+err.Error(),
+				http.StatusBadRequest)
+			return
+		}
+
+		err = decodeProfilePatch(&wire, &aPatch)
+		if err != nil {
+			http.Error(w, "Failed to validate against schema: "+err.Error(), http.StatusBadRequest)
+			return
+		}
+	}
+
+	h.PatchProfile(w,
+		r,
+		aID,
+		aDryRun,
+		aPatch)
+}
+
+// WrapPutSettings wraps the path `/settings` with the method "put".
+//
+// Path description:
+// puts the settings.
+func WrapPutSettings(h Handler, w http.ResponseWriter, r *http.Request) {
+	var aSettings Settings
+
+	if r.Body == nil {
+		http.Error(w, "Parameter 'settings' expected in body, but got no body", http.StatusBadRequest)
+		return
+	}
+	{
+		r.Body = http.MaxBytesReader(w, r.Body, 1048576)
+		buf := getBodyBuffer()
+		_, err := buf.ReadFrom(r.Body)
+		if err != nil {
+			putBodyBuffer(buf)
+			http.Error(w, "Body unreadable: "+err.Error(), http.StatusBadRequest)
+			return
+		}
+
+		err = json.Unmarshal(buf.Bytes(), &aSettings)
+		putBodyBuffer(buf)
+		if err != nil {
+			http.Error(w, "Error JSON-decoding body parameter 'settings': "+err.Error(),
+				http.StatusBadRequest)
+			return
+		}
+	}
+
+	h.PutSettings(w,
+		r,
+		aSettings)
+}
+
+// Automatically generated file by swagger_to. DO NOT EDIT OR APPEND ANYTHING!
@@ -0,0 +1,211 @@
+// Code generated by swagger_to. DO NOT EDIT.
+package profiles
+
+// Automatically generated file by swagger_to. DO NOT EDIT OR APPEND ANYTHING!
+
+import "time"
+
+type Profile struct {
+	Name string `json:"name"`
+
+	Age int64 `json:"age,omitempty"`
+
+	Score float64 `json:"score,omitempty"`
+
+	Verified bool `json:"verified,omitempty"`
+
+	Born time.Time `json:"born,omitempty"`
+
+	Tags []string `json:"tags,omitempty"`
+
+	Address struct {
+	City *string `json:"city,omitempty"`
+
+	Zip *string `json:"zip,omitempty"`
+} `json:"address,omitempty"`
+
+	// presence records which of the optional fields stored by value are set.
+	presence [1]uint64
+}
+
+// HasAge reports whether the optional field Age is set.
+func (x *Profile) HasAge() bool {
+	return x.presence[0]&(1<<0) != 0
+}
+
+// SetAge sets the optional field Age.
+func (x *Profile) SetAge(value int64) {
+	x.Age = value
+	x.presence[0] |= 1 << 0
+}
+
+// ClearAge unsets the optional field Age and resets it to the zero value.
+func (x *Profile) ClearAge() {
+	var zero int64
+	x.Age = zero
+	x.presence[0] &^= 1 << 0
+}
+
+// HasScore reports whether the optional field Score is set.
+func (x *Profile) HasScore() bool {
+	return x.presence[0]&(1<<1) != 0
+}
+
+// SetScore sets the optional field Score.
+func (x *Profile) SetScore(value float64) {
+	x.Score = value
+	x.presence[0] |= 1 << 1
+}
+
+// ClearScore unsets the optional field Score and resets it to the zero value.
+func (x *Profile) ClearScore() {
+	var zero float64
+	x.Score = zero
+	x.presence[0] &^= 1 << 1
+}
+
+// HasVerified reports whether the optional field Verified is set.
+func (x *Profile) HasVerified() bool {
+	return x.presence[0]&(1<<2) != 0
+}
+
+// SetVerified sets the optional field Verified.
+func (x *Profile) SetVerified(value bool) {
+	x.Verified = value
+	x.presence[0] |= 1 << 2
+}
+
+// ClearVerified unsets the optional field Verified and resets it to the zero value.
+func (x *Profile) ClearVerified() {
+	var zero bool
+	x.Verified = zero
+	x.presence[0] &^= 1 << 2
+}
+
+// HasBorn reports whether the optional field Born is set.
+func (x *Profile) HasBorn() bool {
+	return x.presence[0]&(1<<3) != 0
+}
+
+// SetBorn sets the optional field Born.
+func (x *Profile) SetBorn(value time.Time) {
+	x.Born = value
+	x.presence[0] |= 1 << 3
+}
+
+// ClearBorn unsets the optional field Born and resets it to the zero value.
+func (x *Profile) ClearBorn() {
+	var zero time.Time
+	x.Born = zero
+	x.presence[0] &^= 1 << 3
+}
+
+type ProfilePatch struct {
+	Nickname string `json:"nickname,omitempty"`
+
+	Age int32 `json:"age,omitempty"`
+
+	Email string `json:"email,omitempty"`
+
+	// presence records which of the optional fields stored by value are set.
+	presence [1]uint64
+}
+
+// HasNickname reports whether the optional field Nickname is set.
+func (x *ProfilePatch) HasNickname() bool {
+	return x.presence[0]&(1<<0) != 0
+}
+
+// SetNickname sets the optional field Nickname.
+func (x *ProfilePatch) SetNickname(value string) {
+	x.Nickname = value
+	x.presence[0] |= 1 << 0
+}
+
+// ClearNickname unsets the optional field Nickname and resets it to the zero value.
+func (x *ProfilePatch) ClearNickname() {
+	var zero string
+	x.Nickname = zero
+	x.presence[0] &^= 1 << 0
+}
+
+// HasAge reports whether the optional field Age is set.
+func (x *ProfilePatch) HasAge() bool {
+	return x.presence[0]&(1<<1) != 0
+}
+
+// SetAge sets the optional field Age.
+func (x *ProfilePatch) SetAge(value int32) {
+	x.Age = value
+	x.presence[0] |= 1 << 1
+}
+
+// ClearAge unsets the optional field Age and resets it to the zero value.
+func (x *ProfilePatch) ClearAge() {
+	var zero int32
+	x.Age = zero
+	x.presence[0] &^= 1 << 1
+}
+
+// HasEmail reports whether the optional field Email is set.
+func (x *ProfilePatch) HasEmail() bool {
+	return x.presence[0]&(1<<2) != 0
+}
+
+// SetEmail sets the optional field Email.
+func (x *ProfilePatch) SetEmail(value string) {
+	x.Email = value
+	x.presence[0] |= 1 << 2
+}
+
+// ClearEmail unsets the optional field Email and resets it to the zero value.
+func (x *ProfilePatch) ClearEmail() {
+	var zero string
+	x.Email = zero
+	x.presence[0] &^= 1 << 2
+}
+
+type Settings struct {
+	Notifications bool `json:"notifications,omitempty"`
+
+	Volume float32 `json:"volume,omitempty"`
+
+	// presence records which of the optional fields stored by value are set.
+	presence [1]uint64
+}
+
+// HasNotifications reports whether the optional field Notifications is set.
+func (x *Settings) HasNotifications() bool {
+	return x.presence[0]&(1<<0) != 0
+}
+
+// SetNotifications sets the optional field Notifications.
+func (x *Settings) SetNotifications(value bool) {
+	x.Notifications = value
+	x.presence[0] |= 1 << 0
+}
+
+// ClearNotifications unsets the optional field Notifications and resets it to the zero value.
+func (x *Settings) ClearNotifications() {
+	var zero bool
+	x.Notifications = zero
+	x.presence[0] &^= 1 << 0
+}
+
+// HasVolume reports whether the optional field Volume is set.
+func (x *Settings) HasVolume() bool {
+	return x.presence[0]&(1<<1) != 0
+}
+
+// SetVolume sets the optional field Volume.
+func (x *Settings) SetVolume(value float32) {
+	x.Volume = value
+	x.presence[0] |= 1 << 1
+}
+
+// ClearVolume unsets the optional field Volume and resets it to the zero value.
+func (x *Settings) ClearVolume() {
+	var zero float32
+	x.Volume = zero
+	x.presence[0] &^= 1 << 1
+}
@@ -0,0 +1,1008 @@
+// Code generated by swagger_to. DO NOT EDIT.
+
+//go:build !swagger_to_reflection
+// +build !swagger_to_reflection
+
+package profiles
+
+// Automatically generated file by swagger_to. DO NOT EDIT OR APPEND ANYTHING!
+
+import (
+	"errors"
+	"fmt"
+	"math"
+	"strconv"
+	"strings"
+	"time"
+	"unicode"
+	"unicode/utf16"
+	"unicode/utf8"
+)
+
+// AppendJSON appends Profile encoded as JSON to the buffer without reflection.
+func (x *Profile) AppendJSON(buf []byte) ([]byte, error) {
+	var err error
+	buf = append(buf, `{"name":`...)
+	buf = appendJSONString(buf, x.Name)
+
+	if x.presence[0]&(1<<0) != 0 {
+		buf = append(buf, `,"age":`...)
+		buf = strconv.AppendInt(buf, int64(x.Age), 10)
+	}
+
+	if x.presence[0]&(1<<1) != 0 {
+		buf = append(buf, `,"score":`...)
+		buf, err = appendJSONFloat(buf, float64(x.Score), 64)
+		if err != nil {
+			return buf, err
+		}
+	}
+
+	if x.presence[0]&(1<<2) != 0 {
+		buf = append(buf, `,"verified":`...)
+		buf = strconv.AppendBool(buf, x.Verified)
+	}
+
+	if x.presence[0]&(1<<3) != 0 {
+		buf = append(buf, `,"born":`...)
+		buf, err = appendJSONTime(buf, x.Born)
+		if err != nil {
+			return buf, err
+		}
+	}
+
+	if len(x.Tags) > 0 {
+		buf = append(buf, `,"tags":`...)
+		buf = append(buf, '[')
+		for i1 := range x.Tags {
+			if i1 > 0 {
+				buf = append(buf, ',')
+			}
+			buf = appendJSONString(buf, x.Tags[i1])
+		}
+		buf = append(buf, ']')
+	}
+
+	buf = append(buf, `,"address":`...)
+	separator1 := byte('{')
+
+	if x.Address.City != nil {
+		buf = append(buf, separator1)
+		separator1 = ','
+		buf = append(buf, `"city":`...)
+		buf = appendJSONString(buf, *x.Address.City)
+	}
+
+	if x.Address.Zip != nil {
+		buf = append(buf, separator1)
+		separator1 = ','
+		buf = append(buf, `"zip":`...)
+		buf = appendJSONString(buf, *x.Address.Zip)
+	}
+
+	if separator1 == '{' {
+		buf = append(buf, '{')
+	}
+
+	buf = append(buf, '}')
+
+	buf = append(buf, '}')
+	return buf, nil
+}
+
+// MarshalJSON encodes Profile as JSON; the optional fields which are not set are omitted.
+func (x Profile) MarshalJSON() ([]byte, error) {
+	return x.AppendJSON(nil)
+}
+
+// UnmarshalJSON decodes Profile from JSON without reflection.
+func (x *Profile) UnmarshalJSON(data []byte) error {
+	rd := jsonReader{data: data}
+	if err := x.decodeJSON(&rd); err != nil {
+		return err
+	}
+	return rd.end()
+}
+
+// decodeJSON decodes the next JSON value from the reader into Profile.
+func (x *Profile) decodeJSON(rd *jsonReader) error {
+	if !rd.readNull() {
+		if err := rd.expect('{'); err != nil {
+			return err
+		}
+
+		for first0 := true; ; {
+			key0, ok, err := rd.nextKey(&first0)
+			if err != nil {
+				return err
+			} else if !ok {
+				break
+			}
+
+			var field0 int
+			switch string(key0) {
+			case "name":
+				field0 = 0
+			case "age":
+				field0 = 1
+			case "score":
+				field0 = 2
+			case "verified":
+				field0 = 3
+			case "born":
+				field0 = 4
+			case "tags":
+				field0 = 5
+			case "address":
+				field0 = 6
+			default:
+				field0 = jsonFoldField(key0, "name", "age", "score", "verified", "born", "tags", "address")
+			}
+
+			switch field0 {
+			case 0:
+				if !rd.readNull() {
+					value, err := rd.readString()
+					if err != nil {
+						return err
+					}
+					x.Name = value
+				}
+			case 1:
+				if rd.readNull() {
+					x.ClearAge()
+				} else {
+					value, err := rd.readInt(64)
+					if err != nil {
+						return err
+					}
+					x.Age = int64(value)
+					x.presence[0] |= 1 << 0
+				}
+			case 2:
+				if rd.readNull() {
+					x.ClearScore()
+				} else {
+					value, err := rd.readFloat(64)
+					if err != nil {
+						return err
+					}
+					x.Score = value
+					x.presence[0] |= 1 << 1
+				}
+			case 3:
+				if rd.readNull() {
+					x.ClearVerified()
+				} else {
+					value, err := rd.readBool()
+					if err != nil {
+						return err
+					}
+					x.Verified = value
+					x.presence[0] |= 1 << 2
+				}
+			case 4:
+				if rd.readNull() {
+					x.ClearBorn()
+				} else {
+					if raw, err := rd.readRaw(); err != nil {
+						return err
+					} else if err := x.Born.UnmarshalJSON(raw); err != nil {
+						return err
+					}
+					x.presence[0] |= 1 << 3
+				}
+			case 5:
+				if rd.readNull() {
+					x.Tags = nil
+				} else {
+					if err := rd.expect('['); err != nil {
+						return err
+					}
+
+					x.Tags = x.Tags[:0]
+					for first1 := true; ; {
+						if ok, err := rd.nextItem(&first1); err != nil {
+							return err
+						} else if !ok {
+							break
+						}
+
+						var item1 string
+						if !rd.readNull() {
+							value, err := rd.readString()
+							if err != nil {
+								return err
+							}
+							item1 = value
+						}
+						x.Tags = append(x.Tags, item1)
+					}
+
+					if x.Tags == nil {
+						x.Tags = []string{}
+					}
+				}
+			case 6:
+				if !rd.readNull() {
+					if err := rd.expect('{'); err != nil {
+						return err
+					}
+
+					for first1 := true; ; {
+						key1, ok, err := rd.nextKey(&first1)
+						if err != nil {
+							return err
+						} else if !ok {
+							break
+						}
+
+						var field1 int
+						switch string(key1) {
+						case "city":
+							field1 = 0
+						case "zip":
+							field1 = 1
+						default:
+							field1 = jsonFoldField(key1, "city", "zip")
+						}
+
+						switch field1 {
+						case 0:
+							if rd.readNull() {
+								x.Address.City = nil
+							} else {
+								if x.Address.City == nil {
+									x.Address.City = new(string)
+								}
+								value, err := rd.readString()
+								if err != nil {
+									return err
+								}
+								*x.Address.City = value
+							}
+						case 1:
+							if rd.readNull() {
+								x.Address.Zip = nil
+							} else {
+								if x.Address.Zip == nil {
+									x.Address.Zip = new(string)
+								}
+								value, err := rd.readString()
+								if err != nil {
+									return err
+								}
+								*x.Address.Zip = value
+							}
+						default:
+							if err := rd.skipValue(); err != nil {
+								return err
+							}
+						}
+					}
+				}
+			default:
+				if err := rd.skipValue(); err != nil {
+					return err
+				}
+			}
+		}
+	}
+	return nil
+}
+
+// AppendJSON appends ProfilePatch encoded as JSON to the buffer without reflection.
+func (x *ProfilePatch) AppendJSON(buf []byte) ([]byte, error) {
+	separator0 := byte('{')
+
+	if x.presence[0]&(1<<0) != 0 {
+		buf = append(buf, separator0)
+		separator0 = ','
+		buf = append(buf, `"nickname":`...)
+		buf = appendJSONString(buf, x.Nickname)
+	}
+
+	if x.presence[0]&(1<<1) != 0 {
+		buf = append(buf, separator0)
+		separator0 = ','
+		buf = append(buf, `"age":`...)
+		buf = strconv.AppendInt(buf, int64(x.Age), 10)
+	}
+
+	if x.presence[0]&(1<<2) != 0 {
+		buf = append(buf, separator0)
+		separator0 = ','
+		buf = append(buf, `"email":`...)
+		buf = appendJSONString(buf, x.Email)
+	}
+
+	if separator0 == '{' {
+		buf = append(buf, '{')
+	}
+
+	buf = append(buf, '}')
+	return buf, nil
+}
+
+// MarshalJSON encodes ProfilePatch as JSON; the optional fields which are not set are omitted.
+func (x ProfilePatch) MarshalJSON() ([]byte, error) {
+	return x.AppendJSON(nil)
+}
+
+// UnmarshalJSON decodes ProfilePatch from JSON without reflection.
+func (x *ProfilePatch) UnmarshalJSON(data []byte) error {
+	rd := jsonReader{data: data}
+	if err := x.decodeJSON(&rd); err != nil {
+		return err
+	}
+	return rd.end()
+}
+
+// decodeJSON decodes the next JSON value from the reader into ProfilePatch.
+func (x *ProfilePatch) decodeJSON(rd *jsonReader) error {
+	if !rd.readNull() {
+		if err := rd.expect('{'); err != nil {
+			return err
+		}
+
+		for first0 := true; ; {
+			key0, ok, err := rd.nextKey(&first0)
+			if err != nil {
+				return err
+			} else if !ok {
+				break
+			}
+
+			var field0 int
+			switch string(key0) {
+			case "nickname":
+				field0 = 0
+			case "age":
+				field0 = 1
+			case "email":
+				field0 = 2
+			default:
+				field0 = jsonFoldField(key0, "nickname", "age", "email")
+			}
+
+			switch field0 {
+			case 0:
+				if rd.readNull() {
+					x.ClearNickname()
+				} else {
+					value, err := rd.readString()
+					if err != nil {
+						return err
+					}
+					x.Nickname = value
+					x.presence[0] |= 1 << 0
+				}
+			case 1:
+				if rd.readNull() {
+					x.ClearAge()
+				} else {
+					value, err := rd.readInt(32)
+					if err != nil {
+						return err
+					}
+					x.Age = int32(value)
+					x.presence[0] |= 1 << 1
+				}
+			case 2:
+				if rd.readNull() {
+					x.ClearEmail()
+				} else {
+					value, err := rd.readString()
+					if err != nil {
+						return err
+					}
+					x.Email = value
+					x.presence[0] |= 1 << 2
+				}
+			default:
+				if err := rd.skipValue(); err != nil {
+					return err
+				}
+			}
+		}
+	}
+	return nil
+}
+
+// AppendJSON appends Settings encoded as JSON to the buffer without reflection.
+func (x *Settings) AppendJSON(buf []byte) ([]byte, error) {
+	var err error
+	separator0 := byte('{')
+
+	if x.presence[0]&(1<<0) != 0 {
+		buf = append(buf, separator0)
+		separator0 = ','
+		buf = append(buf, `"notifications":`...)
+		buf = strconv.AppendBool(buf, x.Notifications)
+	}
+
+	if x.presence[0]&(1<<1) != 0 {
+		buf = append(buf, separator0)
+		separator0 = ','
+		buf = append(buf, `"volume":`...)
+		buf, err = appendJSONFloat(buf, float64(x.Volume), 32)
+		if err != nil {
+			return buf, err
+		}
+	}
+
+	if separator0 == '{' {
+		buf = append(buf, '{')
+	}
+
+	buf = append(buf, '}')
+	return buf, nil
+}
+
+// MarshalJSON encodes Settings as JSON; the optional fields which are not set are omitted.
+func (x Settings) MarshalJSON() ([]byte, error) {
+	return x.AppendJSON(nil)
+}
+
+// UnmarshalJSON decodes Settings from JSON without reflection.
+func (x *Settings) UnmarshalJSON(data []byte) error {
+	rd := jsonReader{data: data}
+	if err := x.decodeJSON(&rd); err != nil {
+		return err
+	}
+	return rd.end()
+}
+
+// decodeJSON decodes the next JSON value from the reader into Settings.
+func (x *Settings) decodeJSON(rd *jsonReader) error {
+	if !rd.readNull() {
+		if err := rd.expect('{'); err != nil {
+			return err
+		}
+
+		for first0 := true; ; {
+			key0, ok, err := rd.nextKey(&first0)
+			if err != nil {
+				return err
+			} else if !ok {
+				break
+			}
+
+			var field0 int
+			switch string(key0) {
+			case "notifications":
+				field0 = 0
+			case "volume":
+				field0 = 1
+			default:
+				field0 = jsonFoldField(key0, "notifications", "volume")
+			}
+
+			switch field0 {
+			case 0:
+				if rd.readNull() {
+					x.ClearNotifications()
+				} else {
+					value, err := rd.readBool()
+					if err != nil {
+						return err
+					}
+					x.Notifications = value
+					x.presence[0] |= 1 << 0
+				}
+			case 1:
+				if rd.readNull() {
+					x.ClearVolume()
+				} else {
+					value, err := rd.readFloat(32)
+					if err != nil {
+						return err
+					}
+					x.Volume = float32(value)
+					x.presence[0] |= 1 << 1
+				}
+			default:
+				if err := rd.skipValue(); err != nil {
+					return err
+				}
+			}
+		}
+	}
+	return nil
+}
+
+// jsonReader decodes the JSON values from the data without reflection.
+type jsonReader struct {
+	data  []byte
+	pos   int
+	depth int
+}
+
+// maxJSONDepth limits the nesting of the skipped values as encoding/json does.
+const maxJSONDepth = 10000
+
+// syntaxError reports an unexpected input at the current position.
+func (rd *jsonReader) syntaxError(expected string) error {
+	if rd.pos >= len(rd.data) {
+		return fmt.Errorf("unexpected end of JSON input, expected %s", expected)
+	}
+	return fmt.Errorf("invalid character %q at offset %d, expected %s", rd.data[rd.pos], rd.pos, expected)
+}
+
+// skipSpace skips the white space.
+func (rd *jsonReader) skipSpace() {
+	for rd.pos < len(rd.data) {
+		switch rd.data[rd.pos] {
+		case ' ', '\t', '\n', '\r':
+			rd.pos++
+		default:
+			return
+		}
+	}
+}
+
+// expect consumes the character which needs to follow after the white space.
+func (rd *jsonReader) expect(c byte) error {
+	rd.skipSpace()
+	if rd.pos >= len(rd.data) || rd.data[rd.pos] != c {
+		return rd.syntaxError(strconv.QuoteRune(rune(c)))
+	}
+	rd.pos++
+	return nil
+}
+
+// end checks that only white space follows the decoded value.
+func (rd *jsonReader) end() error {
+	rd.skipSpace()
+	if rd.pos < len(rd.data) {
+		return rd.syntaxError("the end of the input")
+	}
+	return nil
+}
+
+// literal consumes the literal if it follows after the white space.
+func (rd *jsonReader) literal(lit string) bool {
+	rd.skipSpace()
+	if len(rd.data)-rd.pos >= len(lit) && string(rd.data[rd.pos:rd.pos+len(lit)]) == lit {
+		rd.pos += len(lit)
+		return true
+	}
+	return false
+}
+
+// readNull consumes null if it follows.
+func (rd *jsonReader) readNull() bool {
+	return rd.literal("null")
+}
+
+// readBool reads a boolean.
+func (rd *jsonReader) readBool() (bool, error) {
+	if rd.literal("true") {
+		return true, nil
+	}
+	if rd.literal("false") {
+		return false, nil
+	}
+	return false, rd.syntaxError("a boolean")
+}
+
+// readDigits consumes the decimal digits and reports whether there was at least one.
+func (rd *jsonReader) readDigits() bool {
+	start := rd.pos
+	for rd.pos < len(rd.data) && rd.data[rd.pos] >= '0' && rd.data[rd.pos] <= '9' {
+		rd.pos++
+	}
+	return rd.pos > start
+}
+
+// readNumber reads the text of a number.
+func (rd *jsonReader) readNumber() ([]byte, error) {
+	rd.skipSpace()
+	start := rd.pos
+	if rd.pos < len(rd.data) && rd.data[rd.pos] == '-' {
+		rd.pos++
+	}
+	if rd.pos < len(rd.data) && rd.data[rd.pos] == '0' {
+		rd.pos++
+	} else if !rd.readDigits() {
+		return nil, rd.syntaxError("a number")
+	}
+	if rd.pos < len(rd.data) && rd.data[rd.pos] == '.' {
+		rd.pos++
+		if !rd.readDigits() {
+			return nil, rd.syntaxError("a digit")
+		}
+	}
+	if rd.pos < len(rd.data) && (rd.data[rd.pos] == 'e' || rd.data[rd.pos] == 'E') {
+		rd.pos++
+		if rd.pos < len(rd.data) && (rd.data[rd.pos] == '+' || rd.data[rd.pos] == '-') {
+			rd.pos++
+		}
+		if !rd.readDigits() {
+			return nil, rd.syntaxError("a digit")
+		}
+	}
+	return rd.data[start:rd.pos], nil
+}
+
+// readInt reads an integer which fits into the given number of bits.
+func (rd *jsonReader) readInt(bits uint) (int64, error) {
+	num, err := rd.readNumber()
+	if err != nil {
+		return 0, err
+	}
+
+	digits := num
+	if num[0] == '-' {
+		digits = num[1:]
+	}
+
+	limit := uint64(1) << (bits - 1)
+	var value uint64
+	for _, c := range digits {
+		if c < '0' || c > '9' {
+			return 0, fmt.Errorf("cannot unmarshal number %s into an integer", num)
+		}
+		if value > limit/10 {
+			return 0, fmt.Errorf("cannot unmarshal number %s into an integer of %d bits", num, bits)
+		}
+		value = value*10 + uint64(c-'0')
+	}
+
+	if num[0] == '-' {
+		if value > limit {
+			return 0, fmt.Errorf("cannot unmarshal number %s into an integer of %d bits", num, bits)
+		}
+		return -int64(value), nil
+	}
+	if value >= limit {
+		return 0, fmt.Errorf("cannot unmarshal number %s into an integer of %d bits", num, bits)
+	}
+	return int64(value), nil
+}
+
+// readFloat reads a floating-point number of the given number of bits.
+func (rd *jsonReader) readFloat(bits int) (float64, error) {
+	num, err := rd.readNumber()
+	if err != nil {
+		return 0, err
+	}
+	return strconv.ParseFloat(string(num), bits)
+}
+
+// readStringBytes reads the content of a string between the quotes. The content needs to be unescaped if it contains
+// escape sequences or invalid UTF-8, as reported by the second result.
+func (rd *jsonReader) readStringBytes() ([]byte, bool, error) {
+	if err := rd.expect('"'); err != nil {
+		return nil, false, err
+	}
+	start := rd.pos
+	escaped := false
+	ascii := true
+	for rd.pos < len(rd.data) {
+		c := rd.data[rd.pos]
+		switch {
+		case c == '"':
+			content := rd.data[start:rd.pos]
+			rd.pos++
+			return content, escaped || (!ascii && !utf8.Valid(content)), nil
+		case c == '\\':
+			escaped = true
+			rd.pos++
+			if rd.pos >= len(rd.data) {
+				return nil, false, rd.syntaxError("an escape sequence")
+			}
+			switch rd.data[rd.pos] {
+			case '"', '\\', '/', 'b', 'f', 'n', 'r', 't':
+				rd.pos++
+			case 'u':
+				rd.pos++
+				for i := 0; i < 4; i++ {
+					if rd.pos >= len(rd.data) || unhex(rd.data[rd.pos]) < 0 {
+						return nil, false, rd.syntaxError("a hexadecimal digit")
+					}
+					rd.pos++
+				}
+			default:
+				return nil, false, rd.syntaxError("an escape sequence")
+			}
+		case c < 0x20:
+			return nil, false, rd.syntaxError("a character in string literal")
+		default:
+			if c >= utf8.RuneSelf {
+				ascii = false
+			}
+			rd.pos++
+		}
+	}
+	return nil, false, rd.syntaxError("the closing quote")
+}
+
+// readString reads a string.
+func (rd *jsonReader) readString() (string, error) {
+	content, escaped, err := rd.readStringBytes()
+	if err != nil {
+		return "", err
+	}
+	if escaped {
+		return string(unescapeJSON(content)), nil
+	}
+	return string(content), nil
+}
+
+// readRaw reads the text of the next value.
+func (rd *jsonReader) readRaw() ([]byte, error) {
+	rd.skipSpace()
+	start := rd.pos
+	if err := rd.skipValue(); err != nil {
+		return nil, err
+	}
+	return rd.data[start:rd.pos], nil
+}
+
+// nextKey reads the key of the next property of the object whose opening brace has been consumed.
+// It reports false once the closing brace has been consumed.
+func (rd *jsonReader) nextKey(first *bool) ([]byte, bool, error) {
+	rd.skipSpace()
+	if rd.pos < len(rd.data) && rd.data[rd.pos] == '}' {
+		rd.pos++
+		return nil, false, nil
+	}
+	if !*first {
+		if rd.pos >= len(rd.data) || rd.data[rd.pos] != ',' {
+			return nil, false, rd.syntaxError("',' or '}'")
+		}
+		rd.pos++
+	}
+	*first = false
+
+	key, escaped, err := rd.readStringBytes()
+	if err != nil {
+		return nil, false, err
+	}
+	if escaped {
+		key = unescapeJSON(key)
+	}
+	if err := rd.expect(':'); err != nil {
+		return nil, false, err
+	}
+	return key, true, nil
+}
+
+// nextItem checks whether the array whose opening bracket has been consumed continues with another item.
+// It reports false once the closing bracket has been consumed.
+func (rd *jsonReader) nextItem(first *bool) (bool, error) {
+	rd.skipSpace()
+	if rd.pos < len(rd.data) && rd.data[rd.pos] == ']' {
+		rd.pos++
+		return false, nil
+	}
+	if !*first {
+		if rd.pos >= len(rd.data) || rd.data[rd.pos] != ',' {
+			return false, rd.syntaxError("',' or ']'")
+		}
+		rd.pos++
+	}
+	*first = false
+	return true, nil
+}
+
+// skipValue skips the next value while checking its syntax.
+func (rd *jsonReader) skipValue() error {
+	rd.skipSpace()
+	if rd.pos >= len(rd.data) {
+		return rd.syntaxError("a value")
+	}
+
+	switch rd.data[rd.pos] {
+	case '{', '[':
+		closing := rd.data[rd.pos] == '{'
+		rd.pos++
+		rd.depth++
+		if rd.depth > maxJSONDepth {
+			return fmt.Errorf("exceeded max depth of %d at offset %d", maxJSONDepth, rd.pos)
+		}
+		for first := true; ; {
+			var ok bool
+			var err error
+			if closing {
+				_, ok, err = rd.nextKey(&first)
+			} else {
+				ok, err = rd.nextItem(&first)
+			}
+			if err != nil {
+				return err
+			}
+			if !ok {
+				break
+			}
+			if err := rd.skipValue(); err != nil {
+				return err
+			}
+		}
+		rd.depth--
+		return nil
+	case '"':
+		_, _, err := rd.readStringBytes()
+		return err
+	case 't', 'f':
+		_, err := rd.readBool()
+		return err
+	case 'n':
+		if !rd.readNull() {
+			return rd.syntaxError("null")
+		}
+		return nil
+	default:
+		_, err := rd.readNumber()
+		return err
+	}
+}
+
+// unhex decodes the hexadecimal digit or gives -1.
+func unhex(c byte) rune {
+	switch {
+	case c >= '0' && c <= '9':
+		return rune(c - '0')
+	case c >= 'a' && c <= 'f':
+		return rune(c - 'a' + 10)
+	case c >= 'A' && c <= 'F':
+		return rune(c - 'A' + 10)
+	}
+	return -1
+}
+
+// unhex4 decodes four hexadecimal digits whose syntax has already been checked.
+func unhex4(text []byte) rune {
+	return unhex(text[0])<<12 | unhex(text[1])<<8 | unhex(text[2])<<4 | unhex(text[3])
+}
+
+// unescapeJSON decodes the escape sequences of a string whose syntax has already been checked and replaces
+// the invalid UTF-8 with the replacement character as encoding/json does.
+func unescapeJSON(content []byte) []byte {
+	out := make([]byte, 0, len(content))
+	for i := 0; i < len(content); {
+		c := content[i]
+		switch {
+		case c == '\\':
+			switch content[i+1] {
+			case 'b':
+				out = append(out, '\b')
+			case 'f':
+				out = append(out, '\f')
+			case 'n':
+				out = append(out, '\n')
+			case 'r':
+				out = append(out, '\r')
+			case 't':
+				out = append(out, '\t')
+			case 'u':
+				r := unhex4(content[i+2 : i+6])
+				i += 4
+				if utf16.IsSurrogate(r) {
+					decoded := unicode.ReplacementChar
+					if i+8 <= len(content) && content[i+2] == '\\' && content[i+3] == 'u' {
+						decoded = utf16.DecodeRune(r, unhex4(content[i+4:i+8]))
+						if decoded != unicode.ReplacementChar {
+							i += 6
+						}
+					}
+					r = decoded
+				}
+				var encoded [utf8.UTFMax]byte
+				out = append(out, encoded[:utf8.EncodeRune(encoded[:], r)]...)
+			default:
+				out = append(out, content[i+1])
+			}
+			i += 2
+		case c < utf8.RuneSelf:
+			out = append(out, c)
+			i++
+		default:
+			r, size := utf8.DecodeRune(content[i:])
+			if r == utf8.RuneError && size == 1 {
+				out = append(out, "\ufffd"...)
+			} else {
+				out = append(out, content[i:i+size]...)
+			}
+			i += size
+		}
+	}
+	return out
+}
+
+// jsonFoldField gives the index of the name which matches the key case-insensitively, or -1 if there is none.
+func jsonFoldField(key []byte, names ...string) int {
+	for i, name := range names {
+		if strings.EqualFold(string(key), name) {
+			return i
+		}
+	}
+	return -1
+}
+
+// appendJSONString appends the string encoded as JSON with the same escaping as encoding/json.
+func appendJSONString(buf []byte, s string) []byte {
+	const hex = "0123456789abcdef"
+	buf = append(buf, '"')
+	start := 0
+	for i := 0; i < len(s); {
+		c := s[i]
+		if c < utf8.RuneSelf {
+			if c >= 0x20 && c != '"' && c != '\\' && c != '<' && c != '>' && c != '&' {
+				i++
+				continue
+			}
+			buf = append(buf, s[start:i]...)
+			switch c {
+			case '"', '\\':
+				buf = append(buf, '\\', c)
+			case '\n':
+				buf = append(buf, '\\', 'n')
+			case '\r':
+				buf = append(buf, '\\', 'r')
+			case '\t':
+				buf = append(buf, '\\', 't')
+			default:
+				buf = append(buf, '\\', 'u', '0', '0', hex[c>>4], hex[c&0xF])
+			}
+			i++
+			start = i
+			continue
+		}
+		r, size := utf8.DecodeRuneInString(s[i:])
+		if r == utf8.RuneError && size == 1 {
+			buf = append(buf, s[start:i]...)
+			buf = append(buf, `\ufffd`...)
+			i += size
+			start = i
+			continue
+		}
+		if r == '\u2028' || r == '\u2029' {
+			buf = append(buf, s[start:i]...)
+			buf = append(buf, '\\', 'u', '2', '0', '2', hex[r&0xF])
+			i += size
+			start = i
+			continue
+		}
+		i += size
+	}
+	buf = append(buf, s[start:]...)
+	return append(buf, '"')
+}
+
+// appendJSONFloat appends the floating-point number formatted as encoding/json does.
+func appendJSONFloat(buf []byte, f float64, bits int) ([]byte, error) {
+	if math.IsInf(f, 0) || math.IsNaN(f) {
+		return buf, fmt.Errorf("json: unsupported value: %s", strconv.FormatFloat(f, 'g', -1, bits))
+	}
+
+	format := byte('f')
+	if abs := math.Abs(f); abs != 0 {
+		if bits == 64 && (abs < 1e-6 || abs >= 1e21) || bits == 32 && (float32(abs) < 1e-6 || float32(abs) >= 1e21) {
+			format = 'e'
+		}
+	}
+	buf = strconv.AppendFloat(buf, f, format, -1, bits)
+	if format == 'e' {
+		// Clean up e-09 to e-9.
+		n := len(buf)
+		if n >= 4 && buf[n-4] == 'e' && buf[n-3] == '-' && buf[n-2] == '0' {
+			buf[n-2] = buf[n-1]
+			buf = buf[:n-1]
+		}
+	}
+	return buf, nil
+}
+
+// appendJSONTime appends the time formatted as time.Time.MarshalJSON does.
+func appendJSONTime(buf []byte, t time.Time) ([]byte, error) {
+	if y := t.Year(); y < 0 || y >= 10000 {
+		return buf, errors.New("Time.MarshalJSON: year outside of range [0,9999]")
+	}
+	buf = append(buf, '"')
+	buf = t.AppendFormat(buf, time.RFC3339Nano)
+	return append(buf, '"'), nil
+}
+
+// Automatically generated file by swagger_to. DO NOT EDIT OR APPEND ANYTHING!
@@ -0,0 +1,191 @@
+// Code generated by swagger_to. DO NOT EDIT.
+package profiles
+
+// Automatically generated file by swagger_to. DO NOT EDIT OR APPEND ANYTHING!
+//
+// The tests and the benchmarks use the generated JSON methods. Exclude the methods with the build tag
+// swagger_to_reflection to run the same tests and benchmarks with encoding/json for comparison:
+//
+//     go test -run JSON -bench JSON .
+//     go test -run JSON -bench JSON -tags swagger_to_reflection .
+
+import (
+	"encoding/json"
+	"testing"
+)
+
+// jsonAppender is implemented by the types with the generated JSON methods.
+type jsonAppender interface {
+	AppendJSON(buf []byte) ([]byte, error)
+}
+
+// appendJSON encodes the value with the generated method if available and with encoding/json otherwise.
+func appendJSON(buf []byte, value interface{}) ([]byte, error) {
+	if appender, ok := value.(jsonAppender); ok {
+		return appender.AppendJSON(buf)
+	}
+
+	encoded, err := json.Marshal(value)
+	return append(buf, encoded...), err
+}
+
+// unmarshalJSON decodes the value with the generated method if available and with encoding/json otherwise.
+func unmarshalJSON(data []byte, value interface{}) error {
+	if unmarshaler, ok := value.(json.Unmarshaler); ok {
+		return unmarshaler.UnmarshalJSON(data)
+	}
+
+	return json.Unmarshal(data, value)
+}
+
+// payloadProfile is a synthetic Profile as encoded by encoding/json.
+var payloadProfile = []byte("{\"name\":\"some text\",\"age\":42,\"score\":3.5,\"verified\":true,\"born\":\"2006-01-02T15:04:05Z\",\"tags\":[\"some text\",\"some text\",\"some text\"],\"address\":{\"city\":\"some text\",\"zip\":\"some text\"}}")
+
+func TestJSONRoundTripProfile(t *testing.T) {
+	var value Profile
+	if err := unmarshalJSON(payloadProfile, &value); err != nil {
+		t.Fatal(err)
+	}
+
+	encoded, err := appendJSON(nil, &value)
+	if err != nil {
+		t.Fatal(err)
+	}
+
+	if string(encoded) != string(payloadProfile) {
+		t.Fatalf("expected %s, got %s", payloadProfile, encoded)
+	}
+}
+
+func BenchmarkJSONEncodeProfile(b *testing.B) {
+	var value Profile
+	if err := json.Unmarshal(payloadProfile, &value); err != nil {
+		b.Fatal(err)
+	}
+
+	var buf []byte
+	var err error
+
+	b.ReportAllocs()
+	b.ResetTimer()
+	for i := 0; i < b.N; i++ {
+		buf, err = appendJSON(buf[:0], &value)
+		if err != nil {
+			b.Fatal(err)
+		}
+	}
+}
+
+func BenchmarkJSONDecodeProfile(b *testing.B) {
+	var value Profile
+
+	b.ReportAllocs()
+	for i := 0; i < b.N; i++ {
+		value = Profile{}
+		if err := unmarshalJSON(payloadProfile, &value); err != nil {
+			b.Fatal(err)
+		}
+	}
+}
+
+// payloadProfilePatch is a synthetic ProfilePatch as encoded by encoding/json.
+var payloadProfilePatch = []byte("{\"nickname\":\"a\",\"age\":42,\"email\":\"someone@example.com\"}")
+
+func TestJSONRoundTripProfilePatch(t *testing.T) {
+	var value ProfilePatch
+	if err := unmarshalJSON(payloadProfilePatch, &value); err != nil {
+		t.Fatal(err)
+	}
+
+	encoded, err := appendJSON(nil, &value)
+	if err != nil {
+		t.Fatal(err)
+	}
+
+	if string(encoded) != string(payloadProfilePatch) {
+		t.Fatalf("expected %s, got %s", payloadProfilePatch, encoded)
+	}
+}
+
+func BenchmarkJSONEncodeProfilePatch(b *testing.B) {
+	var value ProfilePatch
+	if err := json.Unmarshal(payloadProfilePatch, &value); err != nil {
+		b.Fatal(err)
+	}
+
+	var buf []byte
+	var err error
+
+	b.ReportAllocs()
+	b.ResetTimer()
+	for i := 0; i < b.N; i++ {
+		buf, err = appendJSON(buf[:0], &value)
+		if err != nil {
+			b.Fatal(err)
+		}
+	}
+}
+
+func BenchmarkJSONDecodeProfilePatch(b *testing.B) {
+	var value ProfilePatch
+
+	b.ReportAllocs()
+	for i := 0; i < b.N; i++ {
+		value = ProfilePatch{}
+		if err := unmarshalJSON(payloadProfilePatch, &value); err != nil {
+			b.Fatal(err)
+		}
+	}
+}
+
+// payloadSettings is a synthetic Settings as encoded by encoding/json.
+var payloadSettings = []byte("{\"notifications\":true,\"volume\":3.5}")
+
+func TestJSONRoundTripSettings(t *testing.T) {
+	var value Settings
+	if err := unmarshalJSON(payloadSettings, &value); err != nil {
+		t.Fatal(err)
+	}
+
+	encoded, err := appendJSON(nil, &value)
+	if err != nil {
+		t.Fatal(err)
+	}
+
+	if string(encoded) != string(payloadSettings) {
+		t.Fatalf("expected %s, got %s", payloadSettings, encoded)
+	}
+}
+
+func BenchmarkJSONEncodeSettings(b *testing.B) {
+	var value Settings
+	if err := json.Unmarshal(payloadSettings, &value); err != nil {
+		b.Fatal(err)
+	}
+
+	var buf []byte
+	var err error
+
+	b.ReportAllocs()
+	b.ResetTimer()
+	for i := 0; i < b.N; i++ {
+		buf, err = appendJSON(buf[:0], &value)
+		if err != nil {
+			b.Fatal(err)
+		}
+	}
+}
+
+func BenchmarkJSONDecodeSettings(b *testing.B) {
+	var value Settings
+
+	b.ReportAllocs()
+	for i := 0; i < b.N; i++ {
+		value = Settings{}
+		if err := unmarshalJSON(payloadSettings, &value); err != nil {
+			b.Fatal(err)
+		}
+	}
+}
+
+// Automatically generated file by swagger_to. DO NOT EDIT OR APPEND ANYTHING!
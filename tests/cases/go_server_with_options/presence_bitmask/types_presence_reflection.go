@@ -0,0 +1,209 @@
+// Code generated by swagger_to. DO NOT EDIT.
+
+//go:build swagger_to_reflection
+// +build swagger_to_reflection
+
+package profiles
+
+// Automatically generated file by swagger_to. DO NOT EDIT OR APPEND ANYTHING!
+//
+// The structs which record the presence of their optional fields need JSON methods even if the generated
+// JSON methods are excluded with the build tag swagger_to_reflection. The methods in this file encode and decode
+// them with encoding/json through wire structs whose optional fields are pointers.
+
+import (
+	"encoding/json"
+	"time"
+)
+
+// jsonWireProfile mirrors Profile for encoding/json.
+type jsonWireProfile struct {
+	Name     string     `json:"name"`
+	Age      *int64     `json:"age,omitempty"`
+	Score    *float64   `json:"score,omitempty"`
+	Verified *bool      `json:"verified,omitempty"`
+	Born     *time.Time `json:"born,omitempty"`
+	Tags     []string   `json:"tags,omitempty"`
+	Address  struct {
+		City *string `json:"city,omitempty"`
+
+		Zip *string `json:"zip,omitempty"`
+	} `json:"address,omitempty"`
+}
+
+// MarshalJSON encodes Profile as JSON; the optional fields which are not set are omitted.
+func (x Profile) MarshalJSON() ([]byte, error) {
+	var wire jsonWireProfile
+	wire.Name = x.Name
+	if x.HasAge() {
+		wire.Age = &x.Age
+	}
+	if x.HasScore() {
+		wire.Score = &x.Score
+	}
+	if x.HasVerified() {
+		wire.Verified = &x.Verified
+	}
+	if x.HasBorn() {
+		wire.Born = &x.Born
+	}
+	wire.Tags = x.Tags
+	wire.Address = x.Address
+	return json.Marshal(&wire)
+}
+
+// UnmarshalJSON decodes Profile from JSON. The properties missing in the data leave the fields unchanged
+// as encoding/json does.
+func (x *Profile) UnmarshalJSON(data []byte) error {
+	var wire jsonWireProfile
+	wire.Name = x.Name
+	if x.HasAge() {
+		wire.Age = &x.Age
+	}
+	if x.HasScore() {
+		wire.Score = &x.Score
+	}
+	if x.HasVerified() {
+		wire.Verified = &x.Verified
+	}
+	if x.HasBorn() {
+		wire.Born = &x.Born
+	}
+	wire.Tags = x.Tags
+	wire.Address = x.Address
+
+	if err := json.Unmarshal(data, &wire); err != nil {
+		return err
+	}
+
+	x.Name = wire.Name
+	if wire.Age != nil {
+		x.SetAge(*wire.Age)
+	} else {
+		x.ClearAge()
+	}
+	if wire.Score != nil {
+		x.SetScore(*wire.Score)
+	} else {
+		x.ClearScore()
+	}
+	if wire.Verified != nil {
+		x.SetVerified(*wire.Verified)
+	} else {
+		x.ClearVerified()
+	}
+	if wire.Born != nil {
+		x.SetBorn(*wire.Born)
+	} else {
+		x.ClearBorn()
+	}
+	x.Tags = wire.Tags
+	x.Address = wire.Address
+	return nil
+}
+
+// jsonWireProfilePatch mirrors ProfilePatch for encoding/json.
+type jsonWireProfilePatch struct {
+	Nickname *string `json:"nickname,omitempty"`
+	Age      *int32  `json:"age,omitempty"`
+	Email    *string `json:"email,omitempty"`
+}
+
+// MarshalJSON encodes ProfilePatch as JSON; the optional fields which are not set are omitted.
+func (x ProfilePatch) MarshalJSON() ([]byte, error) {
+	var wire jsonWireProfilePatch
+	if x.HasNickname() {
+		wire.Nickname = &x.Nickname
+	}
+	if x.HasAge() {
+		wire.Age = &x.Age
+	}
+	if x.HasEmail() {
+		wire.Email = &x.Email
+	}
+	return json.Marshal(&wire)
+}
+
+// UnmarshalJSON decodes ProfilePatch from JSON. The properties missing in the data leave the fields unchanged
+// as encoding/json does.
+func (x *ProfilePatch) UnmarshalJSON(data []byte) error {
+	var wire jsonWireProfilePatch
+	if x.HasNickname() {
+		wire.Nickname = &x.Nickname
+	}
+	if x.HasAge() {
+		wire.Age = &x.Age
+	}
+	if x.HasEmail() {
+		wire.Email = &x.Email
+	}
+
+	if err := json.Unmarshal(data, &wire); err != nil {
+		return err
+	}
+
+	if wire.Nickname != nil {
+		x.SetNickname(*wire.Nickname)
+	} else {
+		x.ClearNickname()
+	}
+	if wire.Age != nil {
+		x.SetAge(*wire.Age)
+	} else {
+		x.ClearAge()
+	}
+	if wire.Email != nil {
+		x.SetEmail(*wire.Email)
+	} else {
+		x.ClearEmail()
+	}
+	return nil
+}
+
+// jsonWireSettings mirrors Settings for encoding/json.
+type jsonWireSettings struct {
+	Notifications *bool    `json:"notifications,omitempty"`
+	Volume        *float32 `json:"volume,omitempty"`
+}
+
+// MarshalJSON encodes Settings as JSON; the optional fields which are not set are omitted.
+func (x Settings) MarshalJSON() ([]byte, error) {
+	var wire jsonWireSettings
+	if x.HasNotifications() {
+		wire.Notifications = &x.Notifications
+	}
+	if x.HasVolume() {
+		wire.Volume = &x.Volume
+	}
+	return json.Marshal(&wire)
+}
+
+// UnmarshalJSON decodes Settings from JSON. The properties missing in the data leave the fields unchanged
+// as encoding/json does.
+func (x *Settings) UnmarshalJSON(data []byte) error {
+	var wire jsonWireSettings
+	if x.HasNotifications() {
+		wire.Notifications = &x.Notifications
+	}
+	if x.HasVolume() {
+		wire.Volume = &x.Volume
+	}
+
+	if err := json.Unmarshal(data, &wire); err != nil {
+		return err
+	}
+
+	if wire.Notifications != nil {
+		x.SetNotifications(*wire.Notifications)
+	} else {
+		x.ClearNotifications()
+	}
+	if wire.Volume != nil {
+		x.SetVolume(*wire.Volume)
+	} else {
+		x.ClearVolume()
+	}
+	return nil
+}
+
+// Automatically generated file by swagger_to. DO NOT EDIT OR APPEND ANYTHING!
@@ -0,0 +1,71 @@
+// Code generated by swagger_to. DO NOT EDIT.
+package profiles
+
+// Automatically generated file by swagger_to. DO NOT EDIT OR APPEND ANYTHING!
+
+import (
+	"net/mail"
+	"regexp"
+)
+
+// validationError reports where the decoded request body violates the schema.
+type validationError struct {
+	// path is the JSON pointer to the invalid value.
+	path string
+
+	message string
+}
+
+func (e *validationError) Error() string {
+	if e.path == "" {
+		return e.message
+	}
+	return e.path + ": " + e.message
+}
+
+// prependPath prefixes the path of the validation error with the path to the nested value.
+func prependPath(err error, path string) error {
+	if verr, ok := err.(*validationError); ok {
+		verr.path = path + verr.path
+	}
+	return err
+}
+
+var pattern0 = regexp.MustCompile("^[a-z]+$")
+
+func isEmail(s string) bool {
+	_, err := mail.ParseAddress(s)
+	return err == nil
+}
+
+// wireProfilePatch is the JSON representation of ProfilePatch before the validation.
+type wireProfilePatch struct {
+	Nickname *string `json:"nickname"`
+	Age      *int32  `json:"age"`
+	Email    *string `json:"email"`
+}
+
+// decodeProfilePatch validates the decoded JSON and converts it to ProfilePatch.
+func decodeProfilePatch(wire *wireProfilePatch, result *ProfilePatch) error {
+	if wire.Nickname != nil {
+		if !pattern0.MatchString(string(*wire.Nickname)) {
+			return &validationError{path: "/nickname", message: "does not match the pattern: ^[a-z]+$"}
+		}
+		result.SetNickname(*wire.Nickname)
+	}
+
+	if wire.Age != nil {
+		result.SetAge(*wire.Age)
+	}
+
+	if wire.Email != nil {
+		if !isEmail(string(*wire.Email)) {
+			return &validationError{path: "/email", message: "is not a valid email"}
+		}
+		result.SetEmail(*wire.Email)
+	}
+
+	return nil
+}
+
+// Automatically generated file by swagger_to. DO NOT EDIT OR APPEND ANYTHING!
@@ -0,0 +1,27 @@
+// Code generated by swagger_to. DO NOT EDIT.
+package orders
+
+// Automatically generated file by swagger_to. DO NOT EDIT OR APPEND ANYTHING!
+
+import "net/http"
+
+// Handler defines an interface to handling the routes.
+type Handler interface {
+	// CreateOrder handles the path `/v1/orders` with the method "post".
+	//
+	// Path description:
+	// creates an order.
+	CreateOrder(w http.ResponseWriter,
+		r *http.Request,
+		order Order)
+
+	// ReplaceLines handles the path `/v1/lines` with the method "put".
+	//
+	// Path description:
+	// replaces the lines given as an anonymous array.
+	ReplaceLines(w http.ResponseWriter,
+		r *http.Request,
+		lines []Line)
+}
+
+// Automatically generated file by swagger_to. DO NOT EDIT OR APPEND ANYTHING!
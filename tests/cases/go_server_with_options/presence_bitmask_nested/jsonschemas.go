@@ -0,0 +1,208 @@
+// Code generated by swagger_to. DO NOT EDIT.
+package orders
+
+// Automatically generated file by swagger_to. DO NOT EDIT OR APPEND ANYTHING!
+
+import (
+	"errors"
+	"fmt"
+	"github.com/xeipuuv/gojsonschema"
+)
+
+func mustNewJSONSchema(text string, name string) *gojsonschema.Schema {
+	loader := gojsonschema.NewStringLoader(text)
+	schema, err := gojsonschema.NewSchema(loader)
+	if err != nil {
+		panic(fmt.Sprintf("failed to load JSON Schema %#v: %s", text, err.Error()))
+	}
+	return schema
+}
+
+var jsonSchemaOrderText = `{
+  "title": "Order",
+  "$schema": "http://json-schema.org/draft-04/schema#",
+  "definitions": {
+    "Line": {
+      "type": "object",
+      "required": [
+        "sku"
+      ],
+      "properties": {
+        "sku": {
+          "type": "string",
+          "pattern": "^[A-Z]{3}-[0-9]{4}$"
+        },
+        "quantity": {
+          "type": "integer",
+          "format": "int32"
+        },
+        "price": {
+          "type": "number",
+          "format": "double"
+        }
+      }
+    },
+    "Order": {
+      "type": "object",
+      "required": [
+        "id",
+        "lines"
+      ],
+      "properties": {
+        "id": {
+          "type": "string"
+        },
+        "note": {
+          "type": "string"
+        },
+        "lines": {
+          "type": "array",
+          "items": {
+            "$ref": "#/definitions/Line"
+          }
+        },
+        "by_warehouse": {
+          "type": "object",
+          "additionalProperties": {
+            "$ref": "#/definitions/Line"
+          }
+        }
+      }
+    }
+  },
+  "$ref": "#/definitions/Order"
+}`
+
+var jsonSchemaReplaceLinesLinesText = `{
+  "title": "replace_lines_lines",
+  "$schema": "http://json-schema.org/draft-04/schema#",
+  "definitions": {
+    "Line": {
+      "type": "object",
+      "required": [
+        "sku"
+      ],
+      "properties": {
+        "sku": {
+          "type": "string",
+          "pattern": "^[A-Z]{3}-[0-9]{4}$"
+        },
+        "quantity": {
+          "type": "integer",
+          "format": "int32"
+        },
+        "price": {
+          "type": "number",
+          "format": "double"
+        }
+      }
+    }
+  },
+  "type": "array",
+  "items": {
+    "$ref": "#/definitions/Line"
+  }
+}`
+
+var jsonSchemaLineText = `{
+  "title": "Line",
+  "$schema": "http://json-schema.org/draft-04/schema#",
+  "type": "object",
+  "required": [
+    "sku"
+  ],
+  "properties": {
+    "sku": {
+      "type": "string",
+      "pattern": "^[A-Z]{3}-[0-9]{4}$"
+    },
+    "quantity": {
+      "type": "integer",
+      "format": "int32"
+    },
+    "price": {
+      "type": "number",
+      "format": "double"
+    }
+  }
+}`
+
+var jsonSchemaOrder = mustNewJSONSchema(
+	jsonSchemaOrderText,
+	"Order")
+
+var jsonSchemaReplaceLinesLines = mustNewJSONSchema(
+	jsonSchemaReplaceLinesLinesText,
+	"replace_lines_lines")
+
+var jsonSchemaLine = mustNewJSONSchema(
+	jsonSchemaLineText,
+	"Line")
+
+// ValidateAgainstOrderSchema validates a message coming from the client against Order schema.
+func ValidateAgainstOrderSchema(bb []byte) error {
+	loader := gojsonschema.NewStringLoader(string(bb))
+	result, err := jsonSchemaOrder.Validate(loader)
+	if err != nil {
+		return err
+	}
+
+	if result.Valid() {
+		return nil
+	}
+
+	msg := ""
+	for i, valErr := range result.Errors() {
+		if i > 0 {
+			msg += ", "
+		}
+		msg += valErr.String()
+	}
+	return errors.New(msg)
+}
+
+// ValidateAgainstReplaceLinesLinesSchema validates a message coming from the client against replace_lines_lines schema.
+func ValidateAgainstReplaceLinesLinesSchema(bb []byte) error {
+	loader := gojsonschema.NewStringLoader(string(bb))
+	result, err := jsonSchemaReplaceLinesLines.Validate(loader)
+	if err != nil {
+		return err
+	}
+
+	if result.Valid() {
+		return nil
+	}
+
+	msg := ""
+	for i, valErr := range result.Errors() {
+		if i > 0 {
+			msg += ", "
+		}
+		msg += valErr.String()
+	}
+	return errors.New(msg)
+}
+
+// ValidateAgainstLineSchema validates a message coming from the client against Line schema.
+func ValidateAgainstLineSchema(bb []byte) error {
+	loader := gojsonschema.NewStringLoader(string(bb))
+	result, err := jsonSchemaLine.Validate(loader)
+	if err != nil {
+		return err
+	}
+
+	if result.Valid() {
+		return nil
+	}
+
+	msg := ""
+	for i, valErr := range result.Errors() {
+		if i > 0 {
+			msg += ", "
+		}
+		msg += valErr.String()
+	}
+	return errors.New(msg)
+}
+
+// Automatically generated file by swagger_to. DO NOT EDIT OR APPEND ANYTHING!
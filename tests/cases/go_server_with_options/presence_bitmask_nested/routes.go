@@ -0,0 +1,141 @@
+// Code generated by swagger_to. DO NOT EDIT.
+package orders
+
+// Automatically generated file by swagger_to. DO NOT EDIT OR APPEND ANYTHING!
+
+import (
+	"bytes"
+	"encoding/json"
+	"github.com/gorilla/mux"
+	"net/http"
+	"sync"
+)
+
+// SetupRouter sets up a router. If you don't use any middleware, you are good to go.
+// Otherwise, you need to maually re-implement this function with your middlewares.
+func SetupRouter(h Handler) *mux.Router {
+	r := mux.NewRouter()
+
+	r.HandleFunc(`/v1/orders`,
+		func(w http.ResponseWriter, r *http.Request) {
+			WrapCreateOrder(h, w, r)
+		}).Methods("post")
+
+	r.HandleFunc(`/v1/lines`,
+		func(w http.ResponseWriter, r *http.Request) {
+			WrapReplaceLines(h, w, r)
+		}).Methods("put")
+
+	return r
+}
+
+// bodyBufferPool recycles the buffers for reading the request bodies.
+var bodyBufferPool = sync.Pool{
+	New: func() interface{} {
+		return new(bytes.Buffer)
+	},
+}
+
+// maxPooledBodyBufferCap limits the capacity of the pooled buffers so that the occasional large bodies
+// are not kept in memory.
+const maxPooledBodyBufferCap = 64 * 1024
+
+// getBodyBuffer gives an empty buffer from the pool.
+func getBodyBuffer() *bytes.Buffer {
+	buf := bodyBufferPool.Get().(*bytes.Buffer)
+	buf.Reset()
+	return buf
+}
+
+// putBodyBuffer returns the buffer to the pool.
+func putBodyBuffer(buf *bytes.Buffer) {
+	if buf.Cap() <= maxPooledBodyBufferCap {
+		bodyBufferPool.Put(buf)
+	}
+}
+
+// WrapCreateOrder wraps the path `/v1/orders` with the method "post".
+//
+// Path description:
+// creates an order.
+func WrapCreateOrder(h Handler, w http.ResponseWriter, r *http.Request) {
+	var aOrder Order
+
+	if r.Body == nil {
+		http.Error(w, "Parameter 'order' expected in body, but got no body", http.StatusBadRequest)
+		return
+	}
+	{
+		r.Body = http.MaxBytesReader(w, r.Body, 1048576)
+		buf := getBodyBuffer()
+		_, err := buf.ReadFrom(r.Body)
+		if err != nil {
+			putBodyBuffer(buf)
+			http.Error(w, "Body unreadable: "+err.Error(), http.StatusBadRequest)
+			return
+		}
+
+		var wire wireOrder
+		err = json.Unmarshal(buf.Bytes(), &wire)
+		putBodyBuffer(buf)
+		if err != nil {
+			http.Error(w, "Error JSON-decoding body parameter 'order': "+err.Error(),
+				http.StatusBadRequest)
+			return
+		}
+
+		err = decodeOrder(&wire, &aOrder)
+		if err != nil {
+			http.Error(w, "Failed to validate against schema: "+err.Error(), http.StatusBadRequest)
+			return
+		}
+	}
+
+	h.CreateOrder(w,
+		r,
+		aOrder)
+}
+
+// WrapReplaceLines wraps the path `/v1/lines` with the method "put".
+//
+// Path description:
+// replaces the lines given as an anonymous array.
+func WrapReplaceLines(h Handler, w http.ResponseWriter, r *http.Request) {
+	var aLines []Line
+
+	if r.Body == nil {
+		http.Error(w, "Parameter 'lines' expected in body, but got no body", http.StatusBadRequest)
+		return
+	}
+	{
+		r.Body = http.MaxBytesReader(w, r.Body, 1048576)
+		buf := getBodyBuffer()
+		_, err := buf.ReadFrom(r.Body)
+		if err != nil {
+			putBodyBuffer(buf)
+			http.Error(w, "Body unreadable: "+err.Error(), http.StatusBadRequest)
+			return
+		}
+
+		var wire wireReplaceLinesBody
+		err = json.Unmarshal(buf.Bytes(), &wire)
+		putBodyBuffer(buf)
+		if err != nil {
+			http.Error(w, "Error JSON-decoding body parameter 'lines': "+err.Error(),
+				http.StatusBadRequest)
+			return
+		}
+
+		err = decodeReplaceLinesBody(&wire, &aLines)
+		if err != nil {
+			http.Error(w, "Failed to validate against schema: "+err.Error(), http.StatusBadRequest)
+			return
+		}
+	}
+
+	h.ReplaceLines(w,
+		r,
+		aLines)
+}
+
+// Automatically generated file by swagger_to. DO NOT EDIT OR APPEND ANYTHING!
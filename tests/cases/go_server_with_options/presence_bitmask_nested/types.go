@@ -0,0 +1,82 @@
+// Code generated by swagger_to. DO NOT EDIT.
+package orders
+
+// Automatically generated file by swagger_to. DO NOT EDIT OR APPEND ANYTHING!
+
+type Order struct {
+	ID string `json:"id"`
+
+	Note string `json:"note,omitempty"`
+
+	Lines []Line `json:"lines"`
+
+	ByWarehouse map[string]Line `json:"by_warehouse,omitempty"`
+
+	// presence records which of the optional fields stored by value are set.
+	presence [1]uint64
+}
+
+// HasNote reports whether the optional field Note is set.
+func (x *Order) HasNote() bool {
+	return x.presence[0]&(1<<0) != 0
+}
+
+// SetNote sets the optional field Note.
+func (x *Order) SetNote(value string) {
+	x.Note = value
+	x.presence[0] |= 1 << 0
+}
+
+// ClearNote unsets the optional field Note and resets it to the zero value.
+func (x *Order) ClearNote() {
+	var zero string
+	x.Note = zero
+	x.presence[0] &^= 1 << 0
+}
+
+type Line struct {
+	Sku string `json:"sku"`
+
+	Quantity int32 `json:"quantity,omitempty"`
+
+	Price float64 `json:"price,omitempty"`
+
+	// presence records which of the optional fields stored by value are set.
+	presence [1]uint64
+}
+
+// HasQuantity reports whether the optional field Quantity is set.
+func (x *Line) HasQuantity() bool {
+	return x.presence[0]&(1<<0) != 0
+}
+
+// SetQuantity sets the optional field Quantity.
+func (x *Line) SetQuantity(value int32) {
+	x.Quantity = value
+	x.presence[0] |= 1 << 0
+}
+
+// ClearQuantity unsets the optional field Quantity and resets it to the zero value.
+func (x *Line) ClearQuantity() {
+	var zero int32
+	x.Quantity = zero
+	x.presence[0] &^= 1 << 0
+}
+
+// HasPrice reports whether the optional field Price is set.
+func (x *Line) HasPrice() bool {
+	return x.presence[0]&(1<<1) != 0
+}
+
+// SetPrice sets the optional field Price.
+func (x *Line) SetPrice(value float64) {
+	x.Price = value
+	x.presence[0] |= 1 << 1
+}
+
+// ClearPrice unsets the optional field Price and resets it to the zero value.
+func (x *Line) ClearPrice() {
+	var zero float64
+	x.Price = zero
+	x.presence[0] &^= 1 << 1
+}
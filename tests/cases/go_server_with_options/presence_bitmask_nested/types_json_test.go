@@ -0,0 +1,141 @@
+// Code generated by swagger_to. DO NOT EDIT.
+package orders
+
+// Automatically generated file by swagger_to. DO NOT EDIT OR APPEND ANYTHING!
+//
+// The tests and the benchmarks use the generated JSON methods. Exclude the methods with the build tag
+// swagger_to_reflection to run the same tests and benchmarks with encoding/json for comparison:
+//
+//     go test -run JSON -bench JSON .
+//     go test -run JSON -bench JSON -tags swagger_to_reflection .
+
+import (
+	"encoding/json"
+	"testing"
+)
+
+// jsonAppender is implemented by the types with the generated JSON methods.
+type jsonAppender interface {
+	AppendJSON(buf []byte) ([]byte, error)
+}
+
+// appendJSON encodes the value with the generated method if available and with encoding/json otherwise.
+func appendJSON(buf []byte, value interface{}) ([]byte, error) {
+	if appender, ok := value.(jsonAppender); ok {
+		return appender.AppendJSON(buf)
+	}
+
+	encoded, err := json.Marshal(value)
+	return append(buf, encoded...), err
+}
+
+// unmarshalJSON decodes the value with the generated method if available and with encoding/json otherwise.
+func unmarshalJSON(data []byte, value interface{}) error {
+	if unmarshaler, ok := value.(json.Unmarshaler); ok {
+		return unmarshaler.UnmarshalJSON(data)
+	}
+
+	return json.Unmarshal(data, value)
+}
+
+// payloadOrder is a synthetic Order as encoded by encoding/json.
+var payloadOrder = []byte("{\"id\":\"some text\",\"note\":\"some text\",\"lines\":[{\"sku\":\"AAA-0000\",\"quantity\":42,\"price\":3.5},{\"sku\":\"AAA-0000\",\"quantity\":42,\"price\":3.5},{\"sku\":\"AAA-0000\",\"quantity\":42,\"price\":3.5}],\"by_warehouse\":{\"key0\":{\"sku\":\"AAA-0000\",\"quantity\":42,\"price\":3.5},\"key1\":{\"sku\":\"AAA-0000\",\"quantity\":42,\"price\":3.5},\"key2\":{\"sku\":\"AAA-0000\",\"quantity\":42,\"price\":3.5}}}")
+
+func TestJSONRoundTripOrder(t *testing.T) {
+	var value Order
+	if err := unmarshalJSON(payloadOrder, &value); err != nil {
+		t.Fatal(err)
+	}
+
+	encoded, err := appendJSON(nil, &value)
+	if err != nil {
+		t.Fatal(err)
+	}
+
+	if string(encoded) != string(payloadOrder) {
+		t.Fatalf("expected %s, got %s", payloadOrder, encoded)
+	}
+}
+
+func BenchmarkJSONEncodeOrder(b *testing.B) {
+	var value Order
+	if err := json.Unmarshal(payloadOrder, &value); err != nil {
+		b.Fatal(err)
+	}
+
+	var buf []byte
+	var err error
+
+	b.ReportAllocs()
+	b.ResetTimer()
+	for i := 0; i < b.N; i++ {
+		buf, err = appendJSON(buf[:0], &value)
+		if err != nil {
+			b.Fatal(err)
+		}
+	}
+}
+
+func BenchmarkJSONDecodeOrder(b *testing.B) {
+	var value Order
+
+	b.ReportAllocs()
+	for i := 0; i < b.N; i++ {
+		value = Order{}
+		if err := unmarshalJSON(payloadOrder, &value); err != nil {
+			b.Fatal(err)
+		}
+	}
+}
+
+// payloadLine is a synthetic Line as encoded by encoding/json.
+var payloadLine = []byte("{\"sku\":\"AAA-0000\",\"quantity\":42,\"price\":3.5}")
+
+func TestJSONRoundTripLine(t *testing.T) {
+	var value Line
+	if err := unmarshalJSON(payloadLine, &value); err != nil {
+		t.Fatal(err)
+	}
+
+	encoded, err := appendJSON(nil, &value)
+	if err != nil {
+		t.Fatal(err)
+	}
+
+	if string(encoded) != string(payloadLine) {
+		t.Fatalf("expected %s, got %s", payloadLine, encoded)
+	}
+}
+
+func BenchmarkJSONEncodeLine(b *testing.B) {
+	var value Line
+	if err := json.Unmarshal(payloadLine, &value); err != nil {
+		b.Fatal(err)
+	}
+
+	var buf []byte
+	var err error
+
+	b.ReportAllocs()
+	b.ResetTimer()
+	for i := 0; i < b.N; i++ {
+		buf, err = appendJSON(buf[:0], &value)
+		if err != nil {
+			b.Fatal(err)
+		}
+	}
+}
+
+func BenchmarkJSONDecodeLine(b *testing.B) {
+	var value Line
+
+	b.ReportAllocs()
+	for i := 0; i < b.N; i++ {
+		value = Line{}
+		if err := unmarshalJSON(payloadLine, &value); err != nil {
+			b.Fatal(err)
+		}
+	}
+}
+
+// Automatically generated file by swagger_to. DO NOT EDIT OR APPEND ANYTHING!
@@ -0,0 +1,112 @@
+// Code generated by swagger_to. DO NOT EDIT.
+
+//go:build swagger_to_reflection
+// +build swagger_to_reflection
+
+package orders
+
+// Automatically generated file by swagger_to. DO NOT EDIT OR APPEND ANYTHING!
+//
+// The structs which record the presence of their optional fields need JSON methods even if the generated
+// JSON methods are excluded with the build tag swagger_to_reflection. The methods in this file encode and decode
+// them with encoding/json through wire structs whose optional fields are pointers.
+
+import "encoding/json"
+
+// jsonWireOrder mirrors Order for encoding/json.
+type jsonWireOrder struct {
+	ID          string          `json:"id"`
+	Note        *string         `json:"note,omitempty"`
+	Lines       []Line          `json:"lines"`
+	ByWarehouse map[string]Line `json:"by_warehouse,omitempty"`
+}
+
+// MarshalJSON encodes Order as JSON; the optional fields which are not set are omitted.
+func (x Order) MarshalJSON() ([]byte, error) {
+	var wire jsonWireOrder
+	wire.ID = x.ID
+	if x.HasNote() {
+		wire.Note = &x.Note
+	}
+	wire.Lines = x.Lines
+	wire.ByWarehouse = x.ByWarehouse
+	return json.Marshal(&wire)
+}
+
+// UnmarshalJSON decodes Order from JSON. The properties missing in the data leave the fields unchanged
+// as encoding/json does.
+func (x *Order) UnmarshalJSON(data []byte) error {
+	var wire jsonWireOrder
+	wire.ID = x.ID
+	if x.HasNote() {
+		wire.Note = &x.Note
+	}
+	wire.Lines = x.Lines
+	wire.ByWarehouse = x.ByWarehouse
+
+	if err := json.Unmarshal(data, &wire); err != nil {
+		return err
+	}
+
+	x.ID = wire.ID
+	if wire.Note != nil {
+		x.SetNote(*wire.Note)
+	} else {
+		x.ClearNote()
+	}
+	x.Lines = wire.Lines
+	x.ByWarehouse = wire.ByWarehouse
+	return nil
+}
+
+// jsonWireLine mirrors Line for encoding/json.
+type jsonWireLine struct {
+	Sku      string   `json:"sku"`
+	Quantity *int32   `json:"quantity,omitempty"`
+	Price    *float64 `json:"price,omitempty"`
+}
+
+// MarshalJSON encodes Line as JSON; the optional fields which are not set are omitted.
+func (x Line) MarshalJSON() ([]byte, error) {
+	var wire jsonWireLine
+	wire.Sku = x.Sku
+	if x.HasQuantity() {
+		wire.Quantity = &x.Quantity
+	}
+	if x.HasPrice() {
+		wire.Price = &x.Price
+	}
+	return json.Marshal(&wire)
+}
+
+// UnmarshalJSON decodes Line from JSON. The properties missing in the data leave the fields unchanged
+// as encoding/json does.
+func (x *Line) UnmarshalJSON(data []byte) error {
+	var wire jsonWireLine
+	wire.Sku = x.Sku
+	if x.HasQuantity() {
+		wire.Quantity = &x.Quantity
+	}
+	if x.HasPrice() {
+		wire.Price = &x.Price
+	}
+
+	if err := json.Unmarshal(data, &wire); err != nil {
+		return err
+	}
+
+	x.Sku = wire.Sku
+	if wire.Quantity != nil {
+		x.SetQuantity(*wire.Quantity)
+	} else {
+		x.ClearQuantity()
+	}
+	if wire.Price != nil {
+		x.SetPrice(*wire.Price)
+	} else {
+		x.ClearPrice()
+	}
+	return nil
+}
+
+// Automatically generated file by swagger_to. DO NOT EDIT OR APPEND ANYTHING!
@@ -0,0 +1,127 @@
+// Code generated by swagger_to. DO NOT EDIT.
+package orders
+
+// Automatically generated file by swagger_to. DO NOT EDIT OR APPEND ANYTHING!
+
+import (
+	"regexp"
+	"strconv"
+)
+
+// validationError reports where the decoded request body violates the schema.
+type validationError struct {
+	// path is the JSON pointer to the invalid value.
+	path string
+
+	message string
+}
+
+func (e *validationError) Error() string {
+	if e.path == "" {
+		return e.message
+	}
+	return e.path + ": " + e.message
+}
+
+// prependPath prefixes the path of the validation error with the path to the nested value.
+func prependPath(err error, path string) error {
+	if verr, ok := err.(*validationError); ok {
+		verr.path = path + verr.path
+	}
+	return err
+}
+
+var pattern0 = regexp.MustCompile("^[A-Z]{3}-[0-9]{4}$")
+
+// wireOrder is the JSON representation of Order before the validation.
+type wireOrder struct {
+	ID          *string             `json:"id"`
+	Note        *string             `json:"note"`
+	Lines       []wireLine          `json:"lines"`
+	ByWarehouse map[string]wireLine `json:"by_warehouse"`
+}
+
+// decodeOrder validates the decoded JSON and converts it to Order.
+func decodeOrder(wire *wireOrder, result *Order) error {
+	if wire.ID == nil {
+		return &validationError{path: "/id", message: "is required, but missing"}
+	}
+	result.ID = *wire.ID
+
+	if wire.Note != nil {
+		result.SetNote(*wire.Note)
+	}
+
+	if wire.Lines == nil {
+		return &validationError{path: "/lines", message: "is required, but missing"}
+	}
+	result.Lines = make([]Line, len(wire.Lines))
+	for i1 := range wire.Lines {
+		if err := decodeLine(&wire.Lines[i1], &result.Lines[i1]); err != nil {
+			return prependPath(err, "/lines/"+strconv.Itoa(i1))
+		}
+	}
+
+	if wire.ByWarehouse != nil {
+		result.ByWarehouse = make(map[string]Line, len(wire.ByWarehouse))
+		for key1, value1 := range wire.ByWarehouse {
+			var item1 Line
+			if err := decodeLine(&value1, &item1); err != nil {
+				return prependPath(err, "/by_warehouse/"+key1)
+			}
+			result.ByWarehouse[key1] = item1
+		}
+	}
+
+	return nil
+}
+
+// wireLine is the JSON representation of Line before the validation.
+type wireLine struct {
+	Sku      *string  `json:"sku"`
+	Quantity *int32   `json:"quantity"`
+	Price    *float64 `json:"price"`
+}
+
+// decodeLine validates the decoded JSON and converts it to Line.
+func decodeLine(wire *wireLine, result *Line) error {
+	if wire.Sku == nil {
+		return &validationError{path: "/sku", message: "is required, but missing"}
+	}
+	if !pattern0.MatchString(string(*wire.Sku)) {
+		return &validationError{path: "/sku", message: "does not match the pattern: ^[A-Z]{3}-[0-9]{4}$"}
+	}
+	result.Sku = *wire.Sku
+
+	if wire.Quantity != nil {
+		result.SetQuantity(*wire.Quantity)
+	}
+
+	if wire.Price != nil {
+		result.SetPrice(*wire.Price)
+	}
+
+	return nil
+}
+
+// wireReplaceLinesBody is the JSON representation of the body argument of ReplaceLines before the validation.
+type wireReplaceLinesBody = []wireLine
+
+// argumentReplaceLinesBody is the type of the body argument of ReplaceLines.
+type argumentReplaceLinesBody = []Line
+
+// decodeReplaceLinesBody validates the decoded JSON body of ReplaceLines and converts it to the argument.
+func decodeReplaceLinesBody(wire *wireReplaceLinesBody, result *argumentReplaceLinesBody) error {
+	if *wire != nil {
+		*result = make([]Line, len(*wire))
+		for i0 := range *wire {
+			if err := decodeLine(&(*wire)[i0], &(*result)[i0]); err != nil {
+				return prependPath(err, "/"+strconv.Itoa(i0))
+			}
+		}
+	}
+
+	return nil
+}
+
+// Automatically generated file by swagger_to. DO NOT EDIT OR APPEND ANYTHING!
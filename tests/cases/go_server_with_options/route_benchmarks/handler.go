@@ -0,0 +1,54 @@
+// Code generated by swagger_to. DO NOT EDIT.
+package orders
+
+// Automatically generated file by swagger_to. DO NOT EDIT OR APPEND ANYTHING!
+
+import "net/http"
+
+// Handler defines an interface to handling the routes.
+type Handler interface {
+	// ListOrders handles the path `/v1/orders` with the method "get".
+	//
+	// Path description:
+	// lists the orders.
+	ListOrders(w http.ResponseWriter,
+		r *http.Request,
+		limit int32,
+		minTotal *float64,
+		open *bool,
+		customer *string,
+		xTenant string)
+
+	// CreateOrder handles the path `/v1/orders` with the method "post".
+	//
+	// Path description:
+	// creates an order.
+	CreateOrder(w http.ResponseWriter,
+		r *http.Request,
+		order Order)
+
+	// GetOrder handles the path `/v1/orders/{order_id:[A-Z]{2}[0-9]{6}}` with the method "get".
+	//
+	// Path description:
+	// gets an order.
+	GetOrder(w http.ResponseWriter,
+		r *http.Request,
+		orderID string)
+
+	// GetRates handles the path `/v1/rates/{currency:\p{Lu}{3}}` with the method "get".
+	//
+	// Path description:
+	// gets the exchange rates.
+	GetRates(w http.ResponseWriter,
+		r *http.Request,
+		currency string)
+
+	// Ping handles the path `/v1/ping` with the method "get".
+	//
+	// Path description:
+	// pings the service.
+	Ping(w http.ResponseWriter,
+		r *http.Request)
+}
+
+// Automatically generated file by swagger_to. DO NOT EDIT OR APPEND ANYTHING!
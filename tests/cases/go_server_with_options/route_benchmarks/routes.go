@@ -0,0 +1,235 @@
+// Code generated by swagger_to. DO NOT EDIT.
+package orders
+
+// Automatically generated file by swagger_to. DO NOT EDIT OR APPEND ANYTHING!
+
+import (
+	"bytes"
+	"encoding/json"
+	"github.com/gorilla/mux"
+	"net/http"
+	"strconv"
+	"sync"
+)
+
+// SetupRouter sets up a router. If you don't use any middleware, you are good to go.
+// Otherwise, you need to maually re-implement this function with your middlewares.
+func SetupRouter(h Handler) *mux.Router {
+	r := mux.NewRouter()
+
+	r.HandleFunc(`/v1/orders`,
+		func(w http.ResponseWriter, r *http.Request) {
+			WrapListOrders(h, w, r)
+		}).Methods("get")
+
+	r.HandleFunc(`/v1/orders`,
+		func(w http.ResponseWriter, r *http.Request) {
+			WrapCreateOrder(h, w, r)
+		}).Methods("post")
+
+	r.HandleFunc(`/v1/orders/{order_id:[A-Z]{2}[0-9]{6}}`,
+		func(w http.ResponseWriter, r *http.Request) {
+			WrapGetOrder(h, w, r)
+		}).Methods("get")
+
+	r.HandleFunc(`/v1/rates/{currency:\p{Lu}{3}}`,
+		func(w http.ResponseWriter, r *http.Request) {
+			WrapGetRates(h, w, r)
+		}).Methods("get")
+
+	r.HandleFunc(`/v1/ping`,
+		func(w http.ResponseWriter, r *http.Request) {
+			WrapPing(h, w, r)
+		}).Methods("get")
+
+	return r
+}
+
+// bodyBufferPool recycles the buffers for reading the request bodies.
+var bodyBufferPool = sync.Pool{
+	New: func() interface{} {
+		return new(bytes.Buffer)
+	},
+}
+
+// maxPooledBodyBufferCap limits the capacity of the pooled buffers so that the occasional large bodies
+// are not kept in memory.
+const maxPooledBodyBufferCap = 64 * 1024
+
+// getBodyBuffer gives an empty buffer from the pool.
+func getBodyBuffer() *bytes.Buffer {
+	buf := bodyBufferPool.Get().(*bytes.Buffer)
+	buf.Reset()
+	return buf
+}
+
+// putBodyBuffer returns the buffer to the pool.
+func putBodyBuffer(buf *bytes.Buffer) {
+	if buf.Cap() <= maxPooledBodyBufferCap {
+		bodyBufferPool.Put(buf)
+	}
+}
+
+// WrapListOrders wraps the path `/v1/orders` with the method "get".
+//
+// Path description:
+// lists the orders.
+func WrapListOrders(h Handler, w http.ResponseWriter, r *http.Request) {
+	var aLimit int32
+	var aMinTotal *float64
+	var aOpen *bool
+	var aCustomer *string
+	var aXTenant string
+
+	hdr := r.Header
+
+	if _, ok := hdr["X-Tenant"]; !ok {
+		http.Error(w, "Parameter 'X-Tenant' expected in header", http.StatusBadRequest)
+		return
+	}
+	aXTenant = hdr.Get("X-Tenant")
+
+	q := r.URL.Query()
+
+	if _, ok := q["limit"]; !ok {
+		http.Error(w, "Parameter 'limit' expected in query", http.StatusBadRequest)
+		return
+	}
+	{
+		parsed, err := strconv.ParseInt(q.Get("limit"), 10, 32)
+		if err != nil {
+			http.Error(w, "Parameter 'limit': "+err.Error(), http.StatusBadRequest)
+			return
+		}
+		converted := int32(parsed)
+		aLimit = converted
+	}
+
+	if _, ok := q["min_total"]; ok {
+		{
+			parsed, err := strconv.ParseFloat(q.Get("min_total"), 64)
+			if err != nil {
+				http.Error(w, "Parameter 'min_total': "+err.Error(), http.StatusBadRequest)
+				return
+			}
+			converted := float64(parsed)
+			aMinTotal = &converted
+		}
+	}
+
+	if _, ok := q["open"]; ok {
+		{
+			parsed, err := strconv.ParseBool(q.Get("open"))
+			if err != nil {
+				http.Error(w, "Parameter 'open': "+err.Error(), http.StatusBadRequest)
+				return
+			}
+			aOpen = &parsed
+		}
+	}
+
+	if _, ok := q["customer"]; ok {
+		val := q.Get("customer")
+		aCustomer = &val
+	}
+
+	h.ListOrders(w,
+		r,
+		aLimit,
+		aMinTotal,
+		aOpen,
+		aCustomer,
+		aXTenant)
+}
+
+// WrapCreateOrder wraps the path `/v1/orders` with the method "post".
+//
+// Path description:
+// creates an order.
+func WrapCreateOrder(h Handler, w http.ResponseWriter, r *http.Request) {
+	var aOrder Order
+
+	if r.Body == nil {
+		http.Error(w, "Parameter 'order' expected in body, but got no body", http.StatusBadRequest)
+		return
+	}
+	{
+		r.Body = http.MaxBytesReader(w, r.Body, 1048576)
+		buf := getBodyBuffer()
+		_, err := buf.ReadFrom(r.Body)
+		if err != nil {
+			putBodyBuffer(buf)
+			http.Error(w, "Body unreadable: "+err.Error(), http.StatusBadRequest)
+			return
+		}
+
+		err = ValidateAgainstOrderSchema(buf.Bytes())
+		if err != nil {
+			putBodyBuffer(buf)
+			http.Error(w, "Failed to validate against schema: "+err.Error(), http.StatusBadRequest)
+			return
+		}
+
+		err = json.Unmarshal(buf.Bytes(), &aOrder)
+		putBodyBuffer(buf)
+		if err != nil {
+			http.Error(w, "Error JSON-decoding body parameter 'order': "+err.Error(),
+				http.StatusBadRequest)
+			return
+		}
+	}
+
+	h.CreateOrder(w,
+		r,
+		aOrder)
+}
+
+// WrapGetOrder wraps the path `/v1/orders/{order_id:[A-Z]{2}[0-9]{6}}` with the method "get".
+//
+// Path description:
+// gets an order.
+func WrapGetOrder(h Handler, w http.ResponseWriter, r *http.Request) {
+	var aOrderID string
+
+	vars := mux.Vars(r)
+
+	if _, ok := vars["order_id"]; !ok {
+		http.Error(w, "Parameter 'order_id' expected in path", http.StatusBadRequest)
+		return
+	}
+	aOrderID = vars["order_id"]
+
+	h.GetOrder(w,
+		r,
+		aOrderID)
+}
+
+// WrapGetRates wraps the path `/v1/rates/{currency:\p{Lu}{3}}` with the method "get".
+//
+// Path description:
+// gets the exchange rates.
+func WrapGetRates(h Handler, w http.ResponseWriter, r *http.Request) {
+	var aCurrency string
+
+	vars := mux.Vars(r)
+
+	if _, ok := vars["currency"]; !ok {
+		http.Error(w, "Parameter 'currency' expected in path", http.StatusBadRequest)
+		return
+	}
+	aCurrency = vars["currency"]
+
+	h.GetRates(w,
+		r,
+		aCurrency)
+}
+
+// WrapPing wraps the path `/v1/ping` with the method "get".
+//
+// Path description:
+// pings the service.
+func WrapPing(h Handler, w http.ResponseWriter, r *http.Request) {
+	h.Ping(w, r)
+}
+
+// Automatically generated file by swagger_to. DO NOT EDIT OR APPEND ANYTHING!
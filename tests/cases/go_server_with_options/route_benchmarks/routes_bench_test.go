@@ -0,0 +1,172 @@
+// Code generated by swagger_to. DO NOT EDIT.
+package orders
+
+// Automatically generated file by swagger_to. DO NOT EDIT OR APPEND ANYTHING!
+
+// The benchmarks send a synthetic request to each route through SetupRouter. The requests are synthesized from
+// the types of the parameters and are expected to be accepted by the wrappers. By default, the handler does nothing
+// so that the benchmarks measure the routing, the parsing, the validation and the decoding. Set newBenchHandler
+// in an init function of your own test file to benchmark your handler as well.
+
+import (
+	"bytes"
+	"net/http"
+	"net/http/httptest"
+	"testing"
+)
+
+// newBenchHandler creates the handler for the benchmarks.
+var newBenchHandler = func() Handler { return benchNoopHandler{} }
+
+// benchNoopHandler implements the Handler with methods which do nothing.
+type benchNoopHandler struct{}
+
+// ListOrders does nothing.
+func (benchNoopHandler) ListOrders(w http.ResponseWriter,
+	r *http.Request,
+	limit int32,
+	minTotal *float64,
+	open *bool,
+	customer *string,
+	xTenant string) {
+}
+
+// CreateOrder does nothing.
+func (benchNoopHandler) CreateOrder(w http.ResponseWriter,
+	r *http.Request,
+	order Order) {
+}
+
+// GetOrder does nothing.
+func (benchNoopHandler) GetOrder(w http.ResponseWriter,
+	r *http.Request,
+	orderID string) {
+}
+
+// GetRates does nothing.
+func (benchNoopHandler) GetRates(w http.ResponseWriter,
+	r *http.Request,
+	currency string) {
+}
+
+// Ping does nothing.
+func (benchNoopHandler) Ping(w http.ResponseWriter, r *http.Request) {}
+
+// benchBody replays the request body without allocations.
+type benchBody struct {
+	bytes.Reader
+}
+
+// Close does nothing.
+func (*benchBody) Close() error {
+	return nil
+}
+
+// benchResponseWriter discards the response.
+type benchResponseWriter struct {
+	header http.Header
+	status int
+}
+
+// Header gives the header of the response.
+func (w *benchResponseWriter) Header() http.Header {
+	return w.header
+}
+
+// Write discards the data.
+func (w *benchResponseWriter) Write(data []byte) (int, error) {
+	if w.status == 0 {
+		w.status = http.StatusOK
+	}
+	return len(data), nil
+}
+
+// WriteHeader records the status code.
+func (w *benchResponseWriter) WriteHeader(status int) {
+	if w.status == 0 {
+		w.status = status
+	}
+}
+
+// benchRoute checks that the request is accepted and then measures how long the router takes to handle it.
+func benchRoute(b *testing.B, method string, target string, header http.Header, payload []byte) {
+	router := SetupRouter(newBenchHandler())
+
+	req := httptest.NewRequest(method, target, nil)
+	for key, values := range header {
+		req.Header[key] = values
+	}
+
+	body := &benchBody{}
+	if payload != nil {
+		body.Reset(payload)
+		req.Body = body
+		req.ContentLength = int64(len(payload))
+	}
+
+	rec := httptest.NewRecorder()
+	router.ServeHTTP(rec, req)
+	switch rec.Code {
+	case http.StatusBadRequest, http.StatusNotFound, http.StatusMethodNotAllowed:
+		b.Fatalf("The synthetic request %s %s was rejected with the status %d: %s", method, target, rec.Code, rec.Body)
+	}
+
+	w := &benchResponseWriter{header: make(http.Header)}
+
+	b.ReportAllocs()
+	b.ResetTimer()
+	for i := 0; i < b.N; i++ {
+		for key := range w.header {
+			delete(w.header, key)
+		}
+		w.status = 0
+
+		if payload != nil {
+			body.Reset(payload)
+			req.Body = body
+		}
+
+		router.ServeHTTP(w, req)
+	}
+}
+
+// BenchmarkRouteListOrders benchmarks the path `/v1/orders` with the method "get".
+func BenchmarkRouteListOrders(b *testing.B) {
+	header := http.Header{
+		"X-Tenant": {"some text"},
+	}
+	var payload []byte
+
+	benchRoute(b, "GET", "/v1/orders?limit=42&min_total=3.5&open=true&customer=C-0000", header, payload)
+}
+
+// BenchmarkRouteCreateOrder benchmarks the path `/v1/orders` with the method "post".
+func BenchmarkRouteCreateOrder(b *testing.B) {
+	var header http.Header
+	payload := []byte(`{"id":"123e4567-e89b-12d3-a456-426614174000","customer":"C-0000","email":"someone@example.com","placed":"2006-01-02T15:04:05Z","note":"some text","lines":[{"sku":"SKU-aaaaaaaa","quantity":42,"price":3.5},{"sku":"SKU-aaaaaaaa","quantity":42,"price":3.5},{"sku":"SKU-aaaaaaaa","quantity":42,"price":3.5}]}`)
+
+	benchRoute(b, "POST", "/v1/orders", header, payload)
+}
+
+// BenchmarkRouteGetOrder benchmarks the path `/v1/orders/{order_id:[A-Z]{2}[0-9]{6}}` with the method "get".
+func BenchmarkRouteGetOrder(b *testing.B) {
+	var header http.Header
+	var payload []byte
+
+	benchRoute(b, "GET", "/v1/orders/AA000000", header, payload)
+}
+
+// BenchmarkRouteGetRates benchmarks the path `/v1/rates/{currency:\p{Lu}{3}}` with the method "get".
+func BenchmarkRouteGetRates(b *testing.B) {
+	b.Skip("No request could be synthesized for the patterns: \\p{Lu}{3}")
+}
+
+// BenchmarkRoutePing benchmarks the path `/v1/ping` with the method "get".
+func BenchmarkRoutePing(b *testing.B) {
+	var header http.Header
+	var payload []byte
+
+	benchRoute(b, "GET", "/v1/ping", header, payload)
+}
+
+// Automatically generated file by swagger_to. DO NOT EDIT OR APPEND ANYTHING!
@@ -0,0 +1,28 @@
+// Code generated by swagger_to. DO NOT EDIT.
+package orders
+
+// Automatically generated file by swagger_to. DO NOT EDIT OR APPEND ANYTHING!
+
+import "time"
+
+type Order struct {
+	ID string `json:"id"`
+
+	Customer string `json:"customer"`
+
+	Email *string `json:"email,omitempty"`
+
+	Placed time.Time `json:"placed"`
+
+	Note *string `json:"note,omitempty"`
+
+	Lines []Line `json:"lines"`
+}
+
+type Line struct {
+	Sku string `json:"sku"`
+
+	Quantity int32 `json:"quantity"`
+
+	Price *float64 `json:"price,omitempty"`
+}
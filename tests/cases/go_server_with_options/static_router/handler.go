@@ -0,0 +1,76 @@
+// Code generated by swagger_to. DO NOT EDIT.
+package catalog
+
+// Automatically generated file by swagger_to. DO NOT EDIT OR APPEND ANYTHING!
+
+import "net/http"
+
+// Handler defines an interface to handling the routes.
+type Handler interface {
+	// ListProducts handles the path `/api/products` with the method "get".
+	//
+	// Path description:
+	// lists the products.
+	ListProducts(w http.ResponseWriter,
+		r *http.Request,
+		limit *int32)
+
+	// PutProduct handles the path `/api/products` with the method "put".
+	//
+	// Path description:
+	// puts a product.
+	PutProduct(w http.ResponseWriter,
+		r *http.Request,
+		product Product)
+
+	// SearchProducts handles the path `/api/products/search` with the method "get".
+	//
+	// Path description:
+	// searches the products.
+	SearchProducts(w http.ResponseWriter,
+		r *http.Request,
+		q string)
+
+	// GetProduct handles the path `/api/products/{id}` with the method "get".
+	//
+	// Path description:
+	// gets a product.
+	GetProduct(w http.ResponseWriter,
+		r *http.Request,
+		id int64)
+
+	// DeleteProduct handles the path `/api/products/{id}` with the method "delete".
+	//
+	// Path description:
+	// deletes a product.
+	DeleteProduct(w http.ResponseWriter,
+		r *http.Request,
+		id int64)
+
+	// GetReview handles the path `/api/products/{id}/reviews/{review_id:[a-z0-9]{8}}` with the method "get".
+	//
+	// Path description:
+	// gets a review of a product.
+	GetReview(w http.ResponseWriter,
+		r *http.Request,
+		id int64,
+		reviewID string)
+
+	// GetImage handles the path `/api/products/{id}/images/{name}.png` with the method "get".
+	//
+	// Path description:
+	// gets an image of a product.
+	GetImage(w http.ResponseWriter,
+		r *http.Request,
+		id int64,
+		name string)
+
+	// Health handles the path `/api/health` with the method "get".
+	//
+	// Path description:
+	// checks the health of the service.
+	Health(w http.ResponseWriter,
+		r *http.Request)
+}
+
+// Automatically generated file by swagger_to. DO NOT EDIT OR APPEND ANYTHING!
@@ -0,0 +1,371 @@
+// Code generated by swagger_to. DO NOT EDIT.
+package catalog
+
+// Automatically generated file by swagger_to. DO NOT EDIT OR APPEND ANYTHING!
+
+import (
+	"bytes"
+	"encoding/json"
+	"net/http"
+	"regexp"
+	"strconv"
+	"strings"
+	"sync"
+)
+
+// SetupRouter sets up a router which dispatches the requests on the path segments known at the generation time
+// without regular expressions. If you need middlewares, wrap the returned handler with them.
+func SetupRouter(h Handler) http.Handler {
+	return &router{h: h}
+}
+
+// router dispatches the requests to the wrappers of the routes.
+type router struct {
+	h Handler
+}
+
+// Patterns of the path parameters
+var (
+	pathPattern0 = regexp.MustCompile("^(?:[a-z0-9]{8})$")
+)
+
+// ServeHTTP dispatches the request to the wrapper of the matching route.
+func (rt *router) ServeHTTP(w http.ResponseWriter, r *http.Request) {
+	path := r.URL.Path
+	if !strings.HasPrefix(path, "/") {
+		http.NotFound(w, r)
+		return
+	}
+
+	var params [2]string
+	allow := ""
+
+	seg0, rest0, more0 := nextSegment(path[1:])
+	switch seg0 {
+	case "api":
+		if more0 {
+			seg1, rest1, more1 := nextSegment(rest0)
+			switch seg1 {
+			case "products":
+				if !more1 {
+					switch r.Method {
+					case "GET":
+						WrapListProducts(rt.h, w, r)
+						return
+					case "PUT":
+						WrapPutProduct(rt.h, w, r)
+						return
+					}
+					allow = "GET, PUT"
+				} else {
+					seg2, rest2, more2 := nextSegment(rest1)
+					switch seg2 {
+					case "search":
+						if !more2 {
+							switch r.Method {
+							case "GET":
+								WrapSearchProducts(rt.h, w, r)
+								return
+							}
+							allow = "GET"
+						}
+					}
+
+					if seg2 != "" {
+						params[0] = seg2
+						if !more2 {
+							switch r.Method {
+							case "GET":
+								WrapGetProduct(rt.h, w, r, params[:])
+								return
+							case "DELETE":
+								WrapDeleteProduct(rt.h, w, r, params[:])
+								return
+							}
+							allow = "GET, DELETE"
+						} else {
+							seg3, rest3, more3 := nextSegment(rest2)
+							switch seg3 {
+							case "reviews":
+								if more3 {
+									seg4, _, more4 := nextSegment(rest3)
+									if seg4 != "" && pathPattern0.MatchString(seg4) {
+										params[1] = seg4
+										if !more4 {
+											switch r.Method {
+											case "GET":
+												WrapGetReview(rt.h, w, r, params[:])
+												return
+											}
+											allow = "GET"
+										}
+									}
+								}
+							case "images":
+								if more3 {
+									seg4, _, more4 := nextSegment(rest3)
+									if len(seg4) > 4 && strings.HasSuffix(seg4, ".png") {
+										params[1] = seg4[:len(seg4)-4]
+										if !more4 {
+											switch r.Method {
+											case "GET":
+												WrapGetImage(rt.h, w, r, params[:])
+												return
+											}
+											allow = "GET"
+										}
+									}
+								}
+							}
+						}
+					}
+				}
+			case "health":
+				if !more1 {
+					switch r.Method {
+					case "GET":
+						WrapHealth(rt.h, w, r)
+						return
+					}
+					allow = "GET"
+				}
+			}
+		}
+	}
+
+	if allow != "" {
+		w.Header().Set("Allow", allow)
+		http.Error(w, http.StatusText(http.StatusMethodNotAllowed), http.StatusMethodNotAllowed)
+		return
+	}
+
+	http.NotFound(w, r)
+}
+
+// nextSegment splits the path at the first slash and reports whether there was a slash.
+func nextSegment(path string) (segment string, rest string, more bool) {
+	i := strings.IndexByte(path, '/')
+	if i < 0 {
+		return path, "", false
+	}
+	return path[:i], path[i+1:], true
+}
+
+// bodyBufferPool recycles the buffers for reading the request bodies.
+var bodyBufferPool = sync.Pool{
+	New: func() interface{} {
+		return new(bytes.Buffer)
+	},
+}
+
+// maxPooledBodyBufferCap limits the capacity of the pooled buffers so that the occasional large bodies
+// are not kept in memory.
+const maxPooledBodyBufferCap = 64 * 1024
+
+// getBodyBuffer gives an empty buffer from the pool.
+func getBodyBuffer() *bytes.Buffer {
+	buf := bodyBufferPool.Get().(*bytes.Buffer)
+	buf.Reset()
+	return buf
+}
+
+// putBodyBuffer returns the buffer to the pool.
+func putBodyBuffer(buf *bytes.Buffer) {
+	if buf.Cap() <= maxPooledBodyBufferCap {
+		bodyBufferPool.Put(buf)
+	}
+}
+
+// WrapListProducts wraps the path `/api/products` with the method "get".
+//
+// Path description:
+// lists the products.
+func WrapListProducts(h Handler, w http.ResponseWriter, r *http.Request) {
+	var aLimit *int32
+
+	q := r.URL.Query()
+
+	if _, ok := q["limit"]; ok {
+		{
+			parsed, err := strconv.ParseInt(q.Get("limit"), 10, 32)
+			if err != nil {
+				http.Error(w, "Parameter 'limit': "+err.Error(), http.StatusBadRequest)
+				return
+			}
+			converted := int32(parsed)
+			aLimit = &converted
+		}
+	}
+
+	h.ListProducts(w,
+		r,
+		aLimit)
+}
+
+// WrapPutProduct wraps the path `/api/products` with the method "put".
+//
+// Path description:
+// puts a product.
+func WrapPutProduct(h Handler, w http.ResponseWriter, r *http.Request) {
+	var aProduct Product
+
+	if r.Body == nil {
+		http.Error(w, "Parameter 'product' expected in body, but got no body", http.StatusBadRequest)
+		return
+	}
+	{
+		r.Body = http.MaxBytesReader(w, r.Body, 1048576)
+		buf := getBodyBuffer()
+		_, err := buf.ReadFrom(r.Body)
+		if err != nil {
+			putBodyBuffer(buf)
+			http.Error(w, "Body unreadable: "+err.Error(), http.StatusBadRequest)
+			return
+		}
+
+		err = ValidateAgainstProductSchema(buf.Bytes())
+		if err != nil {
+			putBodyBuffer(buf)
+			http.Error(w, "Failed to validate against schema: "+err.Error(), http.StatusBadRequest)
+			return
+		}
+
+		err = json.Unmarshal(buf.Bytes(), &aProduct)
+		putBodyBuffer(buf)
+		if err != nil {
+			http.Error(w, "Error JSON-decoding body parameter 'product': "+err.Error(),
+				http.StatusBadRequest)
+			return
+		}
+	}
+
+	h.PutProduct(w,
+		r,
+		aProduct)
+}
+
+// WrapSearchProducts wraps the path `/api/products/search` with the method "get".
+//
+// Path description:
+// searches the products.
+func WrapSearchProducts(h Handler, w http.ResponseWriter, r *http.Request) {
+	var aQ string
+
+	q := r.URL.Query()
+
+	if _, ok := q["q"]; !ok {
+		http.Error(w, "Parameter 'q' expected in query", http.StatusBadRequest)
+		return
+	}
+	aQ = q.Get("q")
+
+	h.SearchProducts(w,
+		r,
+		aQ)
+}
+
+// WrapGetProduct wraps the path `/api/products/{id}` with the method "get".
+//
+// Path description:
+// gets a product.
+func WrapGetProduct(h Handler, w http.ResponseWriter, r *http.Request, params []string) {
+	var aID int64
+
+	{
+		parsed, err := strconv.ParseInt(params[0], 10, 64)
+		if err != nil {
+			http.Error(w, "Parameter 'id': "+err.Error(), http.StatusBadRequest)
+			return
+		}
+		converted := int64(parsed)
+		aID = converted
+	}
+
+	h.GetProduct(w,
+		r,
+		aID)
+}
+
+// WrapDeleteProduct wraps the path `/api/products/{id}` with the method "delete".
+//
+// Path description:
+// deletes a product.
+func WrapDeleteProduct(h Handler, w http.ResponseWriter, r *http.Request, params []string) {
+	var aID int64
+
+	{
+		parsed, err := strconv.ParseInt(params[0], 10, 64)
+		if err != nil {
+			http.Error(w, "Parameter 'id': "+err.Error(), http.StatusBadRequest)
+			return
+		}
+		converted := int64(parsed)
+		aID = converted
+	}
+
+	h.DeleteProduct(w,
+		r,
+		aID)
+}
+
+// WrapGetReview wraps the path `/api/products/{id}/reviews/{review_id:[a-z0-9]{8}}` with the method "get".
+//
+// Path description:
+// gets a review of a product.
+func WrapGetReview(h Handler, w http.ResponseWriter, r *http.Request, params []string) {
+	var aID int64
+	var aReviewID string
+
+	{
+		parsed, err := strconv.ParseInt(params[0], 10, 64)
+		if err != nil {
+			http.Error(w, "Parameter 'id': "+err.Error(), http.StatusBadRequest)
+			return
+		}
+		converted := int64(parsed)
+		aID = converted
+	}
+
+	aReviewID = params[1]
+
+	h.GetReview(w,
+		r,
+		aID,
+		aReviewID)
+}
+
+// WrapGetImage wraps the path `/api/products/{id}/images/{name}.png` with the method "get".
+//
+// Path description:
+// gets an image of a product.
+func WrapGetImage(h Handler, w http.ResponseWriter, r *http.Request, params []string) {
+	var aID int64
+	var aName string
+
+	{
+		parsed, err := strconv.ParseInt(params[0], 10, 64)
+		if err != nil {
+			http.Error(w, "Parameter 'id': "+err.Error(), http.StatusBadRequest)
+			return
+		}
+		converted := int64(parsed)
+		aID = converted
+	}
+
+	aName = params[1]
+
+	h.GetImage(w,
+		r,
+		aID,
+		aName)
+}
+
+// WrapHealth wraps the path `/api/health` with the method "get".
+//
+// Path description:
+// checks the health of the service.
+func WrapHealth(h Handler, w http.ResponseWriter, r *http.Request) {
+	h.Health(w, r)
+}
+
+// Automatically generated file by swagger_to. DO NOT EDIT OR APPEND ANYTHING!
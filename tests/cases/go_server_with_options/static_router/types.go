@@ -0,0 +1,10 @@
+// Code generated by swagger_to. DO NOT EDIT.
+package catalog
+
+// Automatically generated file by swagger_to. DO NOT EDIT OR APPEND ANYTHING!
+
+type Product struct {
+	ID int64 `json:"id"`
+
+	Name string `json:"name"`
+}
@@ -0,0 +1,47 @@
+// Code generated by swagger_to. DO NOT EDIT.
+package catalog
+
+// Automatically generated file by swagger_to. DO NOT EDIT OR APPEND ANYTHING!
+
+import "net/http"
+
+// Handler defines an interface to handling the routes.
+type Handler interface {
+	// PutProduct handles the path `/products` with the method "put".
+	//
+	// Path description:
+	// Puts a single product.
+	PutProduct(w http.ResponseWriter,
+		r *http.Request,
+		product Product)
+
+	// PutProducts handles the path `/products/batch` with the method "post".
+	//
+	// Path description:
+	// Puts many products at once.
+	PutProducts(w http.ResponseWriter,
+		r *http.Request,
+		products []Product)
+
+	// PatchLabels handles the path `/labels` with the method "patch".
+	//
+	// Path description:
+	// Patches the labels without any constraints.
+	PatchLabels(w http.ResponseWriter,
+		r *http.Request,
+		labels map[string]string)
+
+	// AddContact handles the path `/contacts` with the method "post".
+	//
+	// Path description:
+	// Adds a contact given as an inline object.
+	AddContact(w http.ResponseWriter,
+		r *http.Request,
+		contact struct {
+	Email string `json:"email"`
+
+	Website *string `json:"website,omitempty"`
+})
+}
+
+// Automatically generated file by swagger_to. DO NOT EDIT OR APPEND ANYTHING!
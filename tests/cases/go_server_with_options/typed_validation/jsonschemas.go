@@ -0,0 +1,400 @@
+// Code generated by swagger_to. DO NOT EDIT.
+package catalog
+
+// Automatically generated file by swagger_to. DO NOT EDIT OR APPEND ANYTHING!
+
+import (
+	"errors"
+	"fmt"
+	"github.com/xeipuuv/gojsonschema"
+)
+
+func mustNewJSONSchema(text string, name string) *gojsonschema.Schema {
+	loader := gojsonschema.NewStringLoader(text)
+	schema, err := gojsonschema.NewSchema(loader)
+	if err != nil {
+		panic(fmt.Sprintf("failed to load JSON Schema %#v: %s", text, err.Error()))
+	}
+	return schema
+}
+
+var jsonSchemaProductText = `{
+  "title": "Product",
+  "$schema": "http://json-schema.org/draft-04/schema#",
+  "definitions": {
+    "Sku": {
+      "description": "is a stock-keeping unit.",
+      "type": "string",
+      "pattern": "^[A-Z]{3}-[0-9]{4}$"
+    },
+    "Dimensions": {
+      "type": "object",
+      "required": [
+        "width",
+        "height"
+      ],
+      "properties": {
+        "width": {
+          "type": "number",
+          "format": "double"
+        },
+        "height": {
+          "type": "number",
+          "format": "double"
+        }
+      }
+    },
+    "Product": {
+      "type": "object",
+      "required": [
+        "id",
+        "sku",
+        "name",
+        "dimensions",
+        "tags"
+      ],
+      "properties": {
+        "id": {
+          "type": "string",
+          "format": "uuid"
+        },
+        "sku": {
+          "$ref": "#/definitions/Sku"
+        },
+        "name": {
+          "type": "string"
+        },
+        "released": {
+          "type": "string",
+          "format": "date"
+        },
+        "updated": {
+          "type": "string",
+          "format": "date-time"
+        },
+        "alternative_sku": {
+          "$ref": "#/definitions/Sku"
+        },
+        "dimensions": {
+          "$ref": "#/definitions/Dimensions"
+        },
+        "tags": {
+          "type": "array",
+          "items": {
+            "type": "string",
+            "pattern": "^[a-z]+$"
+          }
+        },
+        "warehouses": {
+          "type": "object",
+          "additionalProperties": {
+            "$ref": "#/definitions/Dimensions"
+          }
+        },
+        "notes": {
+          "type": "string"
+        }
+      }
+    }
+  },
+  "$ref": "#/definitions/Product"
+}`
+
+var jsonSchemaPutProductsProductsText = `{
+  "title": "put_products_products",
+  "$schema": "http://json-schema.org/draft-04/schema#",
+  "definitions": {
+    "Sku": {
+      "description": "is a stock-keeping unit.",
+      "type": "string",
+      "pattern": "^[A-Z]{3}-[0-9]{4}$"
+    },
+    "Dimensions": {
+      "type": "object",
+      "required": [
+        "width",
+        "height"
+      ],
+      "properties": {
+        "width": {
+          "type": "number",
+          "format": "double"
+        },
+        "height": {
+          "type": "number",
+          "format": "double"
+        }
+      }
+    },
+    "Product": {
+      "type": "object",
+      "required": [
+        "id",
+        "sku",
+        "name",
+        "dimensions",
+        "tags"
+      ],
+      "properties": {
+        "id": {
+          "type": "string",
+          "format": "uuid"
+        },
+        "sku": {
+          "$ref": "#/definitions/Sku"
+        },
+        "name": {
+          "type": "string"
+        },
+        "released": {
+          "type": "string",
+          "format": "date"
+        },
+        "updated": {
+          "type": "string",
+          "format": "date-time"
+        },
+        "alternative_sku": {
+          "$ref": "#/definitions/Sku"
+        },
+        "dimensions": {
+          "$ref": "#/definitions/Dimensions"
+        },
+        "tags": {
+          "type": "array",
+          "items": {
+            "type": "string",
+            "pattern": "^[a-z]+$"
+          }
+        },
+        "warehouses": {
+          "type": "object",
+          "additionalProperties": {
+            "$ref": "#/definitions/Dimensions"
+          }
+        },
+        "notes": {
+          "type": "string"
+        }
+      }
+    }
+  },
+  "type": "array",
+  "items": {
+    "$ref": "#/definitions/Product"
+  }
+}`
+
+var jsonSchemaPatchLabelsLabelsText = `{
+  "title": "patch_labels_labels",
+  "$schema": "http://json-schema.org/draft-04/schema#",
+  "type": "object",
+  "additionalProperties": {
+    "type": "string"
+  }
+}`
+
+var jsonSchemaAddContactContactText = `{
+  "title": "add_contact_contact",
+  "$schema": "http://json-schema.org/draft-04/schema#",
+  "type": "object",
+  "required": [
+    "email"
+  ],
+  "properties": {
+    "email": {
+      "type": "string",
+      "format": "email"
+    },
+    "website": {
+      "type": "string",
+      "format": "uri"
+    }
+  }
+}`
+
+var jsonSchemaSkuText = `{
+  "title": "Sku",
+  "$schema": "http://json-schema.org/draft-04/schema#",
+  "description": "is a stock-keeping unit.",
+  "type": "string",
+  "pattern": "^[A-Z]{3}-[0-9]{4}$"
+}`
+
+var jsonSchemaDimensionsText = `{
+  "title": "Dimensions",
+  "$schema": "http://json-schema.org/draft-04/schema#",
+  "type": "object",
+  "required": [
+    "width",
+    "height"
+  ],
+  "properties": {
+    "width": {
+      "type": "number",
+      "format": "double"
+    },
+    "height": {
+      "type": "number",
+      "format": "double"
+    }
+  }
+}`
+
+var jsonSchemaProduct = mustNewJSONSchema(
+	jsonSchemaProductText,
+	"Product")
+
+var jsonSchemaPutProductsProducts = mustNewJSONSchema(
+	jsonSchemaPutProductsProductsText,
+	"put_products_products")
+
+var jsonSchemaPatchLabelsLabels = mustNewJSONSchema(
+	jsonSchemaPatchLabelsLabelsText,
+	"patch_labels_labels")
+
+var jsonSchemaAddContactContact = mustNewJSONSchema(
+	jsonSchemaAddContactContactText,
+	"add_contact_contact")
+
+var jsonSchemaSku = mustNewJSONSchema(
+	jsonSchemaSkuText,
+	"Sku")
+
+var jsonSchemaDimensions = mustNewJSONSchema(
+	jsonSchemaDimensionsText,
+	"Dimensions")
+
+// ValidateAgainstProductSchema validates a message coming from the client against Product schema.
+func ValidateAgainstProductSchema(bb []byte) error {
+	loader := gojsonschema.NewStringLoader(string(bb))
+	result, err := jsonSchemaProduct.Validate(loader)
+	if err != nil {
+		return err
+	}
+
+	if result.Valid() {
+		return nil
+	}
+
+	msg := ""
+	for i, valErr := range result.Errors() {
+		if i > 0 {
+			msg += ", "
+		}
+		msg += valErr.String()
+	}
+	return errors.New(msg)
+}
+
+// ValidateAgainstPutProductsProductsSchema validates a message coming from the client against put_products_products schema.
+func ValidateAgainstPutProductsProductsSchema(bb []byte) error {
+	loader := gojsonschema.NewStringLoader(string(bb))
+	result, err := jsonSchemaPutProductsProducts.Validate(loader)
+	if err != nil {
+		return err
+	}
+
+	if result.Valid() {
+		return nil
+	}
+
+	msg := ""
+	for i, valErr := range result.Errors() {
+		if i > 0 {
+			msg += ", "
+		}
+		msg += valErr.String()
+	}
+	return errors.New(msg)
+}
+
+// ValidateAgainstPatchLabelsLabelsSchema validates a message coming from the client against patch_labels_labels schema.
+func ValidateAgainstPatchLabelsLabelsSchema(bb []byte) error {
+	loader := gojsonschema.NewStringLoader(string(bb))
+	result, err := jsonSchemaPatchLabelsLabels.Validate(loader)
+	if err != nil {
+		return err
+	}
+
+	if result.Valid() {
+		return nil
+	}
+
+	msg := ""
+	for i, valErr := range result.Errors() {
+		if i > 0 {
+			msg += ", "
+		}
+		msg += valErr.String()
+	}
+	return errors.New(msg)
+}
+
+// ValidateAgainstAddContactContactSchema validates a message coming from the client against add_contact_contact schema.
+func ValidateAgainstAddContactContactSchema(bb []byte) error {
+	loader := gojsonschema.NewStringLoader(string(bb))
+	result, err := jsonSchemaAddContactContact.Validate(loader)
+	if err != nil {
+		return err
+	}
+
+	if result.Valid() {
+		return nil
+	}
+
+	msg := ""
+	for i, valErr := range result.Errors() {
+		if i > 0 {
+			msg += ", "
+		}
+		msg += valErr.String()
+	}
+	return errors.New(msg)
+}
+
+// ValidateAgainstSkuSchema validates a message coming from the client against Sku schema.
+func ValidateAgainstSkuSchema(bb []byte) error {
+	loader := gojsonschema.NewStringLoader(string(bb))
+	result, err := jsonSchemaSku.Validate(loader)
+	if err != nil {
+		return err
+	}
+
+	if result.Valid() {
+		return nil
+	}
+
+	msg := ""
+	for i, valErr := range result.Errors() {
+		if i > 0 {
+			msg += ", "
+		}
+		msg += valErr.String()
+	}
+	return errors.New(msg)
+}
+
+// ValidateAgainstDimensionsSchema validates a message coming from the client against Dimensions schema.
+func ValidateAgainstDimensionsSchema(bb []byte) error {
+	loader := gojsonschema.NewStringLoader(string(bb))
+	result, err := jsonSchemaDimensions.Validate(loader)
+	if err != nil {
+		return err
+	}
+
+	if result.Valid() {
+		return nil
+	}
+
+	msg := ""
+	for i, valErr := range result.Errors() {
+		if i > 0 {
+			msg += ", "
+		}
+		msg += valErr.String()
+	}
+	return errors.New(msg)
+}
+
+// Automatically generated file by swagger_to. DO NOT EDIT OR APPEND ANYTHING!
@@ -0,0 +1,232 @@
+// Code generated by swagger_to. DO NOT EDIT.
+package catalog
+
+// Automatically generated file by swagger_to. DO NOT EDIT OR APPEND ANYTHING!
+
+import (
+	"bytes"
+	"encoding/json"
+	"github.com/gorilla/mux"
+	"net/http"
+	"sync"
+)
+
+// SetupRouter sets up a router. If you don't use any middleware, you are good to go.
+// Otherwise, you need to maually re-implement this function with your middlewares.
+func SetupRouter(h Handler) *mux.Router {
+	r := mux.NewRouter()
+
+	r.HandleFunc(`/products`,
+		func(w http.ResponseWriter, r *http.Request) {
+			WrapPutProduct(h, w, r)
+		}).Methods("put")
+
+	r.HandleFunc(`/products/batch`,
+		func(w http.ResponseWriter, r *http.Request) {
+			WrapPutProducts(h, w, r)
+		}).Methods("post")
+
+	r.HandleFunc(`/labels`,
+		func(w http.ResponseWriter, r *http.Request) {
+			WrapPatchLabels(h, w, r)
+		}).Methods("patch")
+
+	r.HandleFunc(`/contacts`,
+		func(w http.ResponseWriter, r *http.Request) {
+			WrapAddContact(h, w, r)
+		}).Methods("post")
+
+	return r
+}
+
+// bodyBufferPool recycles the buffers for reading the request bodies.
+var bodyBufferPool = sync.Pool{
+	New: func() interface{} {
+		return new(bytes.Buffer)
+	},
+}
+
+// maxPooledBodyBufferCap limits the capacity of the pooled buffers so that the occasional large bodies
+// are not kept in memory.
+const maxPooledBodyBufferCap = 64 * 1024
+
+// getBodyBuffer gives an empty buffer from the pool.
+func getBodyBuffer() *bytes.Buffer {
+	buf := bodyBufferPool.Get().(*bytes.Buffer)
+	buf.Reset()
+	return buf
+}
+
+// putBodyBuffer returns the buffer to the pool.
+func putBodyBuffer(buf *bytes.Buffer) {
+	if buf.Cap() <= maxPooledBodyBufferCap {
+		bodyBufferPool.Put(buf)
+	}
+}
+
+// WrapPutProduct wraps the path `/products` with the method "put".
+//
+// Path description:
+// Puts a single product.
+func WrapPutProduct(h Handler, w http.ResponseWriter, r *http.Request) {
+	var aProduct Product
+
+	if r.Body == nil {
+		http.Error(w, "Parameter 'product' expected in body, but got no body", http.StatusBadRequest)
+		return
+	}
+	{
+		r.Body = http.MaxBytesReader(w, r.Body, 1048576)
+		buf := getBodyBuffer()
+		_, err := buf.ReadFrom(r.Body)
+		if err != nil {
+			putBodyBuffer(buf)
+			http.Error(w, "Body unreadable: "+err.Error(), http.StatusBadRequest)
+			return
+		}
+
+		var wire wireProduct
+		err = json.Unmarshal(buf.Bytes(), &wire)
+		putBodyBuffer(buf)
+		if err != nil {
+			http.Error(w, "Error JSON-decoding body parameter 'product': "+err.Error(),
+				http.StatusBadRequest)
+			return
+		}
+
+		err = decodeProduct(&wire, &aProduct)
+		if err != nil {
+			http.Error(w, "Failed to validate against schema: "+err.Error(), http.StatusBadRequest)
+			return
+		}
+	}
+
+	h.PutProduct(w,
+		r,
+		aProduct)
+}
+
+// WrapPutProducts wraps the path `/products/batch` with the method "post".
+//
+// Path description:
+// Puts many products at once.
+func WrapPutProducts(h Handler, w http.ResponseWriter, r *http.Request) {
+	var aProducts []Product
+
+	if r.Body == nil {
+		http.Error(w, "Parameter 'products' expected in body, but got no body", http.StatusBadRequest)
+		return
+	}
+	{
+		r.Body = http.MaxBytesReader(w, r.Body, 1048576)
+		buf := getBodyBuffer()
+		_, err := buf.ReadFrom(r.Body)
+		if err != nil {
+			putBodyBuffer(buf)
+			http.Error(w, "Body unreadable: "+err.Error(), http.StatusBadRequest)
+			return
+		}
+
+		var wire wirePutProductsBody
+		err = json.Unmarshal(buf.Bytes(), &wire)
+		putBodyBuffer(buf)
+		if err != nil {
+			http.Error(w, "Error JSON-decoding body parameter 'products': "+err.Error(),
+				http.StatusBadRequest)
+			return
+		}
+
+		err = decodePutProductsBody(&wire, &aProducts)
+		if err != nil {
+			http.Error(w, "Failed to validate against schema: "+err.Error(), http.StatusBadRequest)
+			return
+		}
+	}
+
+	h.PutProducts(w,
+		r,
+		aProducts)
+}
+
+// WrapPatchLabels wraps the path `/labels` with the method "patch".
+//
+// Path description:
+// Patches the labels without any constraints.
+func WrapPatchLabels(h Handler, w http.ResponseWriter, r *http.Request) {
+	var aLabels map[string]string
+
+	if r.Body == nil {
+		http.Error(w, "Parameter 'labels' expected in body, but got no body", http.StatusBadRequest)
+		return
+	}
+	{
+		r.Body = http.MaxBytesReader(w, r.Body, 1048576)
+		buf := getBodyBuffer()
+		_, err := buf.ReadFrom(r.Body)
+		if err != nil {
+			putBodyBuffer(buf)
+			http.Error(w, "Body unreadable: "+err.Error(), http.StatusBadRequest)
+			return
+		}
+
+		err = json.Unmarshal(buf.Bytes(), &aLabels)
+		putBodyBuffer(buf)
+		if err != nil {
+			http.Error(w, "Error JSON-decoding body parameter 'labels': "+err.Error(),
+				http.StatusBadRequest)
+			return
+		}
+	}
+
+	h.PatchLabels(w,
+		r,
+		aLabels)
+}
+
+// WrapAddContact wraps the path `/contacts` with the method "post".
+//
+// Path description:
+// Adds a contact given as an inline object.
+func WrapAddContact(h Handler, w http.ResponseWriter, r *http.Request) {
+	var aContact struct {
+			Email string `json:"email"`
+
+			Website *string `json:"website,omitempty"`
+		}
+
+	if r.Body == nil {
+		http.Error(w, "Parameter 'contact' expected in body, but got no body", http.StatusBadRequest)
+		return
+	}
+	{
+		r.Body = http.MaxBytesReader(w, r.Body, 1048576)
+		buf := getBodyBuffer()
+		_, err := buf.ReadFrom(r.Body)
+		if err != nil {
+			putBodyBuffer(buf)
+			http.Error(w, "Body unreadable: "+err.Error(), http.StatusBadRequest)
+			return
+		}
+
+		var wire wireAddContactBody
+		err = json.Unmarshal(buf.Bytes(), &wire)
+		putBodyBuffer(buf)
+		if err != nil {
+			http.Error(w, "Error JSON-decoding body parameter 'contact': "+err.Error(),
+				http.StatusBadRequest)
+			return
+		}
+
+		err = decodeAddContactBody(&wire, &aContact)
+		if err != nil {
+			http.Error(w, "Failed to validate against schema: "+err.Error(), http.StatusBadRequest)
+			return
+		}
+	}
+
+	h.AddContact(w,
+		r,
+		aContact)
+}
+
+// Automatically generated file by swagger_to. DO NOT EDIT OR APPEND ANYTHING!
@@ -0,0 +1,37 @@
+// Code generated by swagger_to. DO NOT EDIT.
+package catalog
+
+// Automatically generated file by swagger_to. DO NOT EDIT OR APPEND ANYTHING!
+
+import "time"
+
+// Sku is a stock-keeping unit.
+type Sku string
+
+type Dimensions struct {
+	Width float64 `json:"width"`
+
+	Height float64 `json:"height"`
+}
+
+type Product struct {
+	ID string `json:"id"`
+
+	Sku Sku `json:"sku"`
+
+	Name string `json:"name"`
+
+	Released *string `json:"released,omitempty"`
+
+	Updated *time.Time `json:"updated,omitempty"`
+
+	AlternativeSku *Sku `json:"alternative_sku,omitempty"`
+
+	Dimensions Dimensions `json:"dimensions"`
+
+	Tags []string `json:"tags"`
+
+	Warehouses map[string]Dimensions `json:"warehouses,omitempty"`
+
+	Notes *string `json:"notes,omitempty"`
+}
@@ -0,0 +1,223 @@
+// Code generated by swagger_to. DO NOT EDIT.
+package catalog
+
+// Automatically generated file by swagger_to. DO NOT EDIT OR APPEND ANYTHING!
+
+import (
+	"net/mail"
+	"net/url"
+	"regexp"
+	"strconv"
+	"time"
+)
+
+// validationError reports where the decoded request body violates the schema.
+type validationError struct {
+	// path is the JSON pointer to the invalid value.
+	path string
+
+	message string
+}
+
+func (e *validationError) Error() string {
+	if e.path == "" {
+		return e.message
+	}
+	return e.path + ": " + e.message
+}
+
+// prependPath prefixes the path of the validation error with the path to the nested value.
+func prependPath(err error, path string) error {
+	if verr, ok := err.(*validationError); ok {
+		verr.path = path + verr.path
+	}
+	return err
+}
+
+var pattern0 = regexp.MustCompile("^[A-Z]{3}-[0-9]{4}$")
+
+var pattern1 = regexp.MustCompile("^[a-z]+$")
+
+var uuidRe = regexp.MustCompile(`^[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}$`)
+
+func isUUID(s string) bool {
+	return uuidRe.MatchString(s)
+}
+
+func isDate(s string) bool {
+	_, err := time.Parse("2006-01-02", s)
+	return err == nil
+}
+
+func isEmail(s string) bool {
+	_, err := mail.ParseAddress(s)
+	return err == nil
+}
+
+func isURI(s string) bool {
+	u, err := url.Parse(s)
+	return err == nil && u.Scheme != ""
+}
+
+// wireProduct is the JSON representation of Product before the validation.
+type wireProduct struct {
+	ID             *string                   `json:"id"`
+	Sku            *Sku                      `json:"sku"`
+	Name           *string                   `json:"name"`
+	Released       *string                   `json:"released"`
+	Updated        *time.Time                `json:"updated"`
+	AlternativeSku *Sku                      `json:"alternative_sku"`
+	Dimensions     *wireDimensions           `json:"dimensions"`
+	Tags           []string                  `json:"tags"`
+	Warehouses     map[string]wireDimensions `json:"warehouses"`
+	Notes          *string                   `json:"notes"`
+}
+
+// decodeProduct validates the decoded JSON and converts it to Product.
+func decodeProduct(wire *wireProduct, result *Product) error {
+	if wire.ID == nil {
+		return &validationError{path: "/id", message: "is required, but missing"}
+	}
+	if !isUUID(string(*wire.ID)) {
+		return &validationError{path: "/id", message: "is not a valid uuid"}
+	}
+	result.ID = *wire.ID
+
+	if wire.Sku == nil {
+		return &validationError{path: "/sku", message: "is required, but missing"}
+	}
+	if !pattern0.MatchString(string(*wire.Sku)) {
+		return &validationError{path: "/sku", message: "does not match the pattern: ^[A-Z]{3}-[0-9]{4}$"}
+	}
+	result.Sku = *wire.Sku
+
+	if wire.Name == nil {
+		return &validationError{path: "/name", message: "is required, but missing"}
+	}
+	result.Name = *wire.Name
+
+	if wire.Released != nil {
+		if !isDate(string(*wire.Released)) {
+			return &validationError{path: "/released", message: "is not a valid date"}
+		}
+	}
+	result.Released = wire.Released
+
+	result.Updated = wire.Updated
+
+	if wire.AlternativeSku != nil {
+		if !pattern0.MatchString(string(*wire.AlternativeSku)) {
+			return &validationError{path: "/alternative_sku", message: "does not match the pattern: ^[A-Z]{3}-[0-9]{4}$"}
+		}
+	}
+	result.AlternativeSku = wire.AlternativeSku
+
+	if wire.Dimensions == nil {
+		return &validationError{path: "/dimensions", message: "is required, but missing"}
+	}
+	if err := decodeDimensions(wire.Dimensions, &result.Dimensions); err != nil {
+		return prependPath(err, "/dimensions")
+	}
+
+	if wire.Tags == nil {
+		return &validationError{path: "/tags", message: "is required, but missing"}
+	}
+	result.Tags = make([]string, len(wire.Tags))
+	for i1 := range wire.Tags {
+		if !pattern1.MatchString(string(wire.Tags[i1])) {
+			return &validationError{path: "/tags/" + strconv.Itoa(i1), message: "does not match the pattern: ^[a-z]+$"}
+		}
+		result.Tags[i1] = wire.Tags[i1]
+	}
+
+	if wire.Warehouses != nil {
+		result.Warehouses = make(map[string]Dimensions, len(wire.Warehouses))
+		for key1, value1 := range wire.Warehouses {
+			var item1 Dimensions
+			if err := decodeDimensions(&value1, &item1); err != nil {
+				return prependPath(err, "/warehouses/"+key1)
+			}
+			result.Warehouses[key1] = item1
+		}
+	}
+
+	result.Notes = wire.Notes
+
+	return nil
+}
+
+// wireDimensions is the JSON representation of Dimensions before the validation.
+type wireDimensions struct {
+	Width  *float64 `json:"width"`
+	Height *float64 `json:"height"`
+}
+
+// decodeDimensions validates the decoded JSON and converts it to Dimensions.
+func decodeDimensions(wire *wireDimensions, result *Dimensions) error {
+	if wire.Width == nil {
+		return &validationError{path: "/width", message: "is required, but missing"}
+	}
+	result.Width = *wire.Width
+
+	if wire.Height == nil {
+		return &validationError{path: "/height", message: "is required, but missing"}
+	}
+	result.Height = *wire.Height
+
+	return nil
+}
+
+// wirePutProductsBody is the JSON representation of the body argument of PutProducts before the validation.
+type wirePutProductsBody = []wireProduct
+
+// argumentPutProductsBody is the type of the body argument of PutProducts.
+type argumentPutProductsBody = []Product
+
+// decodePutProductsBody validates the decoded JSON body of PutProducts and converts it to the argument.
+func decodePutProductsBody(wire *wirePutProductsBody, result *argumentPutProductsBody) error {
+	if *wire != nil {
+		*result = make([]Product, len(*wire))
+		for i0 := range *wire {
+			if err := decodeProduct(&(*wire)[i0], &(*result)[i0]); err != nil {
+				return prependPath(err, "/"+strconv.Itoa(i0))
+			}
+		}
+	}
+
+	return nil
+}
+
+// wireAddContactBody is the JSON representation of the body argument of AddContact before the validation.
+type wireAddContactBody = struct {
+	Email   *string `json:"email"`
+	Website *string `json:"website"`
+}
+
+// argumentAddContactBody is the type of the body argument of AddContact.
+type argumentAddContactBody = struct {
+	Email string `json:"email"`
+
+	Website *string `json:"website,omitempty"`
+}
+
+// decodeAddContactBody validates the decoded JSON body of AddContact and converts it to the argument.
+func decodeAddContactBody(wire *wireAddContactBody, result *argumentAddContactBody) error {
+	if wire.Email == nil {
+		return &validationError{path: "/email", message: "is required, but missing"}
+	}
+	if !isEmail(string(*wire.Email)) {
+		return &validationError{path: "/email", message: "is not a valid email"}
+	}
+	result.Email = *wire.Email
+
+	if wire.Website != nil {
+		if !isURI(string(*wire.Website)) {
+			return &validationError{path: "/website", message: "is not a valid uri"}
+		}
+	}
+	result.Website = wire.Website
+
+	return nil
+}
+
+// Automatically generated file by swagger_to. DO NOT EDIT OR APPEND ANYTHING!
@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+# Automatically generated file by swagger_to. DO NOT EDIT OR APPEND ANYTHING!
+"""Implements the asynchronous client for test_server."""
+
+# pylint: skip-file
+# pydocstyle: add-ignore=D105,D107,D401
+
+import asyncio
+import json
+from typing import Any, BinaryIO, Dict, List, MutableMapping, Optional, Tuple, Union
+
+import aiohttp
+
+
+# Timeout in seconds of both connecting and reading, a tuple of the two, or the timeout of aiohttp
+_Timeout = Union[float, Tuple[Optional[float], Optional[float]], aiohttp.ClientTimeout]
+
+
+class _Unlimited:
+    """Stands in for the semaphore if the number of the concurrent calls is not limited."""
+
+    async def __aenter__(self) -> None:
+        return None
+
+    async def __aexit__(self, exc_type: Any, exc_value: Any, traceback: Any) -> None:
+        return None
+
+
+_UNLIMITED = _Unlimited()
+
+
+class RemoteCaller:
+    """Executes the remote calls to the server asynchronously."""
+
+    def __init__(
+        self,
+        url_prefix: str,
+        auth: Optional[aiohttp.BasicAuth] = None,
+        session: Optional[aiohttp.ClientSession] = None,
+        max_connections: int = 100,
+        max_connections_per_host: int = 0,
+        max_concurrency: int = 0,
+        connect_timeout: Optional[float] = None,
+        read_timeout: Optional[float] = None) -> None:
+        """
+        Initializes with the given values.
+
+        If the session is not given, it is created on the first call so that it binds to the running event loop.
+        The pool size and the authentication apply only to the created session. The timeouts apply to all
+        the calls and are raised as asyncio.TimeoutError.
+
+        :param url_prefix: prefix of the URLs of the remote calls
+        :param auth: authentication of the calls
+        :param session: session to be used for the calls instead of the created one
+        :param max_connections: maximum number of the pooled connections; 0 means no limit
+        :param max_connections_per_host: maximum number of the pooled connections to a single host; 0 means no limit
+        :param max_concurrency: maximum number of the calls in flight, the excess calls wait; 0 means no limit
+        :param connect_timeout: timeout in seconds for establishing a connection; None means no timeout
+        :param read_timeout: timeout in seconds between the bytes received from the server; None means no timeout
+        """
+        self.url_prefix = url_prefix
+        self.auth = auth
+        self.session = session
+        self.max_connections = max_connections
+        self.max_connections_per_host = max_connections_per_host
+        self.max_concurrency = max_concurrency
+        self.timeout = aiohttp.ClientTimeout(total=None, sock_connect=connect_timeout, sock_read=read_timeout)
+
+        self._owns_session = session is None
+        self._semaphore = None  # type: Optional[asyncio.Semaphore]
+
+    async def __aenter__(self) -> 'RemoteCaller':
+        return self
+
+    async def __aexit__(self, exc_type: Any, exc_value: Any, traceback: Any) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """Closes the session unless it has been given to the constructor."""
+        if self._owns_session and self.session is not None:
+            await self.session.close()
+            self.session = None
+
+    def _session(self) -> aiohttp.ClientSession:
+        """Returns the session, creates it on the first call."""
+        if self.session is None:
+            self.session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=self.max_connections, limit_per_host=self.max_connections_per_host),
+                auth=self.auth)
+
+        return self.session
+
+    def _timeout(self, request_timeout: Optional[_Timeout]) -> aiohttp.ClientTimeout:
+        """Returns the timeout of the call, the timeout of the caller unless overridden for the call."""
+        if request_timeout is None:
+            return self.timeout
+
+        if isinstance(request_timeout, aiohttp.ClientTimeout):
+            return request_timeout
+
+        if isinstance(request_timeout, tuple):
+            connect_timeout, read_timeout = request_timeout
+        else:
+            connect_timeout, read_timeout = request_timeout, request_timeout
+
+        return aiohttp.ClientTimeout(total=None, sock_connect=connect_timeout, sock_read=read_timeout)
+
+    def _slot(self) -> Union[asyncio.Semaphore, _Unlimited]:
+        """
+        Returns the context holding a slot for a call in flight.
+
+        A streamed response frees its slot once the headers are received.
+        """
+        if self.max_concurrency == 0:
+            return _UNLIMITED
+
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        return self._semaphore
+
+    async def open_file(
+            self,
+            path: str,
+            request_timeout: Optional[_Timeout] = None) -> aiohttp.ClientResponse:
+        """
+        Serves a static file that matches the path.
+
+        :param path: is the path to the file relative to the root.
+        :param request_timeout: overrides the connect and read timeouts of the caller for this call
+
+        :return: serves the file content.
+        """
+        url = "".join([
+            self.url_prefix,
+            '/',
+            str(path)])
+
+        async with self._slot():
+            resp = await self._session().request(
+                method='get',
+                url=url,
+                timeout=self._timeout(request_timeout))
+            resp.raise_for_status()
+            return resp
+
+
+# Automatically generated file by swagger_to. DO NOT EDIT OR APPEND ANYTHING!
@@ -0,0 +1,380 @@
+#!/usr/bin/env python3
+# Automatically generated file by swagger_to. DO NOT EDIT OR APPEND ANYTHING!
+"""Implements the asynchronous client for test."""
+
+# pylint: skip-file
+# pydocstyle: add-ignore=D105,D107,D401
+
+import asyncio
+import json
+from typing import Any, BinaryIO, Dict, List, MutableMapping, Optional, Tuple, Union
+
+import aiohttp
+
+
+class _Mismatch(ValueError):
+    """Signals that a JSON-ed object does not conform to the expected type."""
+
+    def __init__(self, expected: str, got: Any, path: str) -> None:
+        """
+        Initializes with the given values.
+
+        The decoders do not track the paths to the objects. The path is relative to the decoder which
+        raised the error and the enclosing decoders prepend their paths while the error propagates.
+
+        :param expected: description of the expected type
+        :param got: the mismatched object
+        :param path: path to the mismatched object
+        """
+        super().__init__()
+        self.expected = expected
+        self.got = type(got)
+        self.segments = [path]
+
+    def within(self, path: str) -> '_Mismatch':
+        """Prepends the path to the enclosing object."""
+        self.segments.append(path)
+        return self
+
+    def __str__(self) -> str:
+        return 'Expected {} at {!r}, but got {}.'.format(
+            self.expected, ''.join(reversed(self.segments)), self.got)
+
+
+def from_obj(obj: Any, expected: List[type], path: str = '') -> Any:
+    """
+    Checks and converts the given obj along the expected types.
+
+    :param obj: to be converted
+    :param expected: list of types representing the (nested) structure
+    :param path: to the object used for debugging
+    :return: the converted object
+    """
+    if not expected:
+        raise ValueError("`expected` is empty, but at least one type needs to be specified.")
+
+    exp = expected[0]
+
+    if exp == float:
+        if isinstance(obj, int):
+            return float(obj)
+
+        if isinstance(obj, float):
+            return obj
+
+        raise ValueError(
+            'Expected object of type int or float at {!r}, but got {}.'.format(path, type(obj)))
+
+    if exp in [bool, int, str, list, dict]:
+        if not isinstance(obj, exp):
+            raise ValueError(
+                'Expected object of type {} at {!r}, but got {}.'.format(exp, path, type(obj)))
+
+    if exp in [bool, int, float, str]:
+        return obj
+
+    if exp == list:
+        lst = []  # type: List[Any]
+        for i, value in enumerate(obj):
+            lst.append(
+                from_obj(value, expected=expected[1:], path='{}[{}]'.format(path, i)))
+
+        return lst
+
+    if exp == dict:
+        adict = dict()  # type: Dict[str, Any]
+        for key, value in obj.items():
+            if not isinstance(key, str):
+                raise ValueError(
+                    'Expected a key of type str at path {!r}, got: {}'.format(path, type(key)))
+
+            adict[key] = from_obj(value, expected=expected[1:], path='{}[{!r}]'.format(path, key))
+
+        return adict
+
+    if exp == Profile:
+        return profile_from_obj(obj, path=path)
+
+    raise ValueError("Unexpected `expected` type: {}".format(exp))
+
+
+def to_jsonable(obj: Any, expected: List[type], path: str = "") -> Any:
+    """
+    Checks and converts the given object along the expected types to a JSON-able representation.
+
+    :param obj: to be converted
+    :param expected: list of types representing the (nested) structure
+    :param path: path to the object used for debugging
+    :return: JSON-able representation of the object
+    """
+    if not expected:
+        raise ValueError("`expected` is empty, but at least one type needs to be specified.")
+
+    exp = expected[0]
+    if not isinstance(obj, exp):
+        raise ValueError('Expected object of type {} at path {!r}, but got {}.'.format(
+            exp, path, type(obj)))
+
+    # Assert on primitive types to help type-hinting.
+    if exp == bool:
+        assert isinstance(obj, bool)
+        return obj
+
+    if exp == int:
+        assert isinstance(obj, int)
+        return obj
+
+    if exp == float:
+        assert isinstance(obj, float)
+        return obj
+
+    if exp == str:
+        assert isinstance(obj, str)
+        return obj
+
+    if exp == list:
+        assert isinstance(obj, list)
+
+        lst = []  # type: List[Any]
+        for i, value in enumerate(obj):
+            lst.append(
+                to_jsonable(value, expected=expected[1:], path='{}[{}]'.format(path, i)))
+
+        return lst
+
+    if exp == dict:
+        assert isinstance(obj, dict)
+
+        adict = dict()  # type: Dict[str, Any]
+        for key, value in obj.items():
+            if not isinstance(key, str):
+                raise ValueError(
+                    'Expected a key of type str at path {!r}, got: {}'.format(path, type(key)))
+
+            adict[key] = to_jsonable(
+                value,
+                expected=expected[1:],
+                path='{}[{!r}]'.format(path, key))
+
+        return adict
+
+    if exp == Profile:
+        assert isinstance(obj, Profile)
+        return profile_to_jsonable(obj, path=path)
+
+    raise ValueError("Unexpected `expected` type: {}".format(exp))
+
+
+class Profile:
+    def __init__(
+            self,
+            last_name: str,
+            first_name: Optional[str] = None) -> None:
+        """Initializes with the given values."""
+        # Last name of the user.
+        self.last_name = last_name
+
+        # First name of the user.
+        self.first_name = first_name
+
+    def to_jsonable(self) -> MutableMapping[str, Any]:
+        """
+        Dispatches the conversion to profile_to_jsonable.
+
+        :return: JSON-able representation
+        """
+        return profile_to_jsonable(self)
+
+
+def new_profile() -> Profile:
+    """Generates an instance of Profile with default values."""
+    return Profile(
+        last_name='')
+
+
+def profile_from_obj(obj: Any, path: str = "") -> Profile:
+    """
+    Generates an instance of Profile from a dictionary object.
+
+    :param obj: a JSON-ed dictionary object representing an instance of Profile
+    :param path: path to the object used for debugging
+    :return: parsed instance of Profile
+    """
+    if not isinstance(obj, dict):
+        raise _Mismatch('a dict', obj, path)
+
+    obj_last_name = obj['last_name']  # type: str
+    if not isinstance(obj_last_name, str):
+        raise _Mismatch('a str', obj_last_name, path + '.last_name')
+
+    obj_first_name = obj.get('first_name', None)  # type: Optional[str]
+    if obj_first_name is not None and not isinstance(obj_first_name, str):
+        raise _Mismatch('a str', obj_first_name, path + '.first_name')
+
+    return Profile(
+        last_name=obj_last_name,
+        first_name=obj_first_name)
+
+
+def profile_to_jsonable(
+        profile: Profile,
+        path: str = "") -> MutableMapping[str, Any]:
+    """
+    Generates a JSON-able mapping from an instance of Profile.
+
+    :param profile: instance of Profile to be JSON-ized
+    :param path: path to the profile used for debugging
+    :return: a JSON-able representation
+    """
+    res = dict()  # type: Dict[str, Any]
+
+    res['last_name'] = profile.last_name
+
+    if profile.first_name is not None:
+        res['first_name'] = profile.first_name
+
+    return res
+
+
+# Timeout in seconds of both connecting and reading, a tuple of the two, or the timeout of aiohttp
+_Timeout = Union[float, Tuple[Optional[float], Optional[float]], aiohttp.ClientTimeout]
+
+
+class _Unlimited:
+    """Stands in for the semaphore if the number of the concurrent calls is not limited."""
+
+    async def __aenter__(self) -> None:
+        return None
+
+    async def __aexit__(self, exc_type: Any, exc_value: Any, traceback: Any) -> None:
+        return None
+
+
+_UNLIMITED = _Unlimited()
+
+
+class RemoteCaller:
+    """Executes the remote calls to the server asynchronously."""
+
+    def __init__(
+        self,
+        url_prefix: str,
+        auth: Optional[aiohttp.BasicAuth] = None,
+        session: Optional[aiohttp.ClientSession] = None,
+        max_connections: int = 100,
+        max_connections_per_host: int = 0,
+        max_concurrency: int = 0,
+        connect_timeout: Optional[float] = None,
+        read_timeout: Optional[float] = None) -> None:
+        """
+        Initializes with the given values.
+
+        If the session is not given, it is created on the first call so that it binds to the running event loop.
+        The pool size and the authentication apply only to the created session. The timeouts apply to all
+        the calls and are raised as asyncio.TimeoutError.
+
+        :param url_prefix: prefix of the URLs of the remote calls
+        :param auth: authentication of the calls
+        :param session: session to be used for the calls instead of the created one
+        :param max_connections: maximum number of the pooled connections; 0 means no limit
+        :param max_connections_per_host: maximum number of the pooled connections to a single host; 0 means no limit
+        :param max_concurrency: maximum number of the calls in flight, the excess calls wait; 0 means no limit
+        :param connect_timeout: timeout in seconds for establishing a connection; None means no timeout
+        :param read_timeout: timeout in seconds between the bytes received from the server; None means no timeout
+        """
+        self.url_prefix = url_prefix
+        self.auth = auth
+        self.session = session
+        self.max_connections = max_connections
+        self.max_connections_per_host = max_connections_per_host
+        self.max_concurrency = max_concurrency
+        self.timeout = aiohttp.ClientTimeout(total=None, sock_connect=connect_timeout, sock_read=read_timeout)
+
+        self._owns_session = session is None
+        self._semaphore = None  # type: Optional[asyncio.Semaphore]
+
+    async def __aenter__(self) -> 'RemoteCaller':
+        return self
+
+    async def __aexit__(self, exc_type: Any, exc_value: Any, traceback: Any) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """Closes the session unless it has been given to the constructor."""
+        if self._owns_session and self.session is not None:
+            await self.session.close()
+            self.session = None
+
+    def _session(self) -> aiohttp.ClientSession:
+        """Returns the session, creates it on the first call."""
+        if self.session is None:
+            self.session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=self.max_connections, limit_per_host=self.max_connections_per_host),
+                auth=self.auth)
+
+        return self.session
+
+    def _timeout(self, request_timeout: Optional[_Timeout]) -> aiohttp.ClientTimeout:
+        """Returns the timeout of the call, the timeout of the caller unless overridden for the call."""
+        if request_timeout is None:
+            return self.timeout
+
+        if isinstance(request_timeout, aiohttp.ClientTimeout):
+            return request_timeout
+
+        if isinstance(request_timeout, tuple):
+            connect_timeout, read_timeout = request_timeout
+        else:
+            connect_timeout, read_timeout = request_timeout, request_timeout
+
+        return aiohttp.ClientTimeout(total=None, sock_connect=connect_timeout, sock_read=read_timeout)
+
+    def _slot(self) -> Union[asyncio.Semaphore, _Unlimited]:
+        """
+        Returns the context holding a slot for a call in flight.
+
+        A streamed response frees its slot once the headers are received.
+        """
+        if self.max_concurrency == 0:
+            return _UNLIMITED
+
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        return self._semaphore
+
+    async def test_me(
+            self,
+            some_str_parameter: str,
+            some_int_parameter: Optional[int] = None,
+            request_timeout: Optional[_Timeout] = None) -> bytes:
+        """
+        Is a test endpoint.
+
+        :param some_str_parameter:
+        :param some_int_parameter:
+        :param request_timeout: overrides the connect and read timeouts of the caller for this call
+
+        :return: a confirmation
+        """
+        url = self.url_prefix + '/products'
+
+        data = {}  # type: Dict[str, str]
+
+        data['some_str_parameter'] = some_str_parameter
+
+        if some_int_parameter is not None:
+            data['some_int_parameter'] = json.dumps(some_int_parameter)
+
+        async with self._slot():
+            async with self._session().request(
+                    method='get',
+                    url=url,
+                    timeout=self._timeout(request_timeout),
+                    data=data) as resp:
+                resp.raise_for_status()
+                return await resp.read()
+
+
+# Automatically generated file by swagger_to. DO NOT EDIT OR APPEND ANYTHING!
@@ -0,0 +1,1187 @@
+#!/usr/bin/env python3
+# Automatically generated file by swagger_to. DO NOT EDIT OR APPEND ANYTHING!
+"""Implements the asynchronous client for uber."""
+
+# pylint: skip-file
+# pydocstyle: add-ignore=D105,D107,D401
+
+import asyncio
+import json
+from typing import Any, BinaryIO, Dict, List, MutableMapping, Optional, Tuple, Union
+
+import aiohttp
+
+
+class _Mismatch(ValueError):
+    """Signals that a JSON-ed object does not conform to the expected type."""
+
+    def __init__(self, expected: str, got: Any, path: str) -> None:
+        """
+        Initializes with the given values.
+
+        The decoders do not track the paths to the objects. The path is relative to the decoder which
+        raised the error and the enclosing decoders prepend their paths while the error propagates.
+
+        :param expected: description of the expected type
+        :param got: the mismatched object
+        :param path: path to the mismatched object
+        """
+        super().__init__()
+        self.expected = expected
+        self.got = type(got)
+        self.segments = [path]
+
+    def within(self, path: str) -> '_Mismatch':
+        """Prepends the path to the enclosing object."""
+        self.segments.append(path)
+        return self
+
+    def __str__(self) -> str:
+        return 'Expected {} at {!r}, but got {}.'.format(
+            self.expected, ''.join(reversed(self.segments)), self.got)
+
+
+def from_obj(obj: Any, expected: List[type], path: str = '') -> Any:
+    """
+    Checks and converts the given obj along the expected types.
+
+    :param obj: to be converted
+    :param expected: list of types representing the (nested) structure
+    :param path: to the object used for debugging
+    :return: the converted object
+    """
+    if not expected:
+        raise ValueError("`expected` is empty, but at least one type needs to be specified.")
+
+    exp = expected[0]
+
+    if exp == float:
+        if isinstance(obj, int):
+            return float(obj)
+
+        if isinstance(obj, float):
+            return obj
+
+        raise ValueError(
+            'Expected object of type int or float at {!r}, but got {}.'.format(path, type(obj)))
+
+    if exp in [bool, int, str, list, dict]:
+        if not isinstance(obj, exp):
+            raise ValueError(
+                'Expected object of type {} at {!r}, but got {}.'.format(exp, path, type(obj)))
+
+    if exp in [bool, int, float, str]:
+        return obj
+
+    if exp == list:
+        lst = []  # type: List[Any]
+        for i, value in enumerate(obj):
+            lst.append(
+                from_obj(value, expected=expected[1:], path='{}[{}]'.format(path, i)))
+
+        return lst
+
+    if exp == dict:
+        adict = dict()  # type: Dict[str, Any]
+        for key, value in obj.items():
+            if not isinstance(key, str):
+                raise ValueError(
+                    'Expected a key of type str at path {!r}, got: {}'.format(path, type(key)))
+
+            adict[key] = from_obj(value, expected=expected[1:], path='{}[{!r}]'.format(path, key))
+
+        return adict
+
+    if exp == Product:
+        return product_from_obj(obj, path=path)
+
+    if exp == ProductList:
+        return product_list_from_obj(obj, path=path)
+
+    if exp == PriceEstimate:
+        return price_estimate_from_obj(obj, path=path)
+
+    if exp == Profile:
+        return profile_from_obj(obj, path=path)
+
+    if exp == Activity:
+        return activity_from_obj(obj, path=path)
+
+    if exp == Activities:
+        return activities_from_obj(obj, path=path)
+
+    raise ValueError("Unexpected `expected` type: {}".format(exp))
+
+
+def to_jsonable(obj: Any, expected: List[type], path: str = "") -> Any:
+    """
+    Checks and converts the given object along the expected types to a JSON-able representation.
+
+    :param obj: to be converted
+    :param expected: list of types representing the (nested) structure
+    :param path: path to the object used for debugging
+    :return: JSON-able representation of the object
+    """
+    if not expected:
+        raise ValueError("`expected` is empty, but at least one type needs to be specified.")
+
+    exp = expected[0]
+    if not isinstance(obj, exp):
+        raise ValueError('Expected object of type {} at path {!r}, but got {}.'.format(
+            exp, path, type(obj)))
+
+    # Assert on primitive types to help type-hinting.
+    if exp == bool:
+        assert isinstance(obj, bool)
+        return obj
+
+    if exp == int:
+        assert isinstance(obj, int)
+        return obj
+
+    if exp == float:
+        assert isinstance(obj, float)
+        return obj
+
+    if exp == str:
+        assert isinstance(obj, str)
+        return obj
+
+    if exp == list:
+        assert isinstance(obj, list)
+
+        lst = []  # type: List[Any]
+        for i, value in enumerate(obj):
+            lst.append(
+                to_jsonable(value, expected=expected[1:], path='{}[{}]'.format(path, i)))
+
+        return lst
+
+    if exp == dict:
+        assert isinstance(obj, dict)
+
+        adict = dict()  # type: Dict[str, Any]
+        for key, value in obj.items():
+            if not isinstance(key, str):
+                raise ValueError(
+                    'Expected a key of type str at path {!r}, got: {}'.format(path, type(key)))
+
+            adict[key] = to_jsonable(
+                value,
+                expected=expected[1:],
+                path='{}[{!r}]'.format(path, key))
+
+        return adict
+
+    if exp == Product:
+        assert isinstance(obj, Product)
+        return product_to_jsonable(obj, path=path)
+
+    if exp == ProductList:
+        assert isinstance(obj, ProductList)
+        return product_list_to_jsonable(obj, path=path)
+
+    if exp == PriceEstimate:
+        assert isinstance(obj, PriceEstimate)
+        return price_estimate_to_jsonable(obj, path=path)
+
+    if exp == Profile:
+        assert isinstance(obj, Profile)
+        return profile_to_jsonable(obj, path=path)
+
+    if exp == Activity:
+        assert isinstance(obj, Activity)
+        return activity_to_jsonable(obj, path=path)
+
+    if exp == Activities:
+        assert isinstance(obj, Activities)
+        return activities_to_jsonable(obj, path=path)
+
+    raise ValueError("Unexpected `expected` type: {}".format(exp))
+
+
+class Product:
+    def __init__(
+            self,
+            product_id: str,
+            desc: str,
+            display_name: str,
+            capacity: int,
+            image: str) -> None:
+        """Initializes with the given values."""
+        # Unique identifier representing a specific product for a given latitude & longitude.
+        # For example, uberX in San Francisco will have a different product_id than uberX in Los Angeles.
+        self.product_id = product_id
+
+        # Description of product.
+        self.desc = desc
+
+        # Display name of product.
+        self.display_name = display_name
+
+        # Capacity of product. For example, 4 people.
+        self.capacity = capacity
+
+        # Image URL representing the product.
+        self.image = image
+
+    def to_jsonable(self) -> MutableMapping[str, Any]:
+        """
+        Dispatches the conversion to product_to_jsonable.
+
+        :return: JSON-able representation
+        """
+        return product_to_jsonable(self)
+
+
+def new_product() -> Product:
+    """Generates an instance of Product with default values."""
+    return Product(
+        product_id='',
+        desc='',
+        display_name='',
+        capacity=0,
+        image='')
+
+
+def product_from_obj(obj: Any, path: str = "") -> Product:
+    """
+    Generates an instance of Product from a dictionary object.
+
+    :param obj: a JSON-ed dictionary object representing an instance of Product
+    :param path: path to the object used for debugging
+    :return: parsed instance of Product
+    """
+    if not isinstance(obj, dict):
+        raise _Mismatch('a dict', obj, path)
+
+    obj_product_id = obj['product_id']  # type: str
+    if not isinstance(obj_product_id, str):
+        raise _Mismatch('a str', obj_product_id, path + '.product_id')
+
+    obj_desc = obj['desc']  # type: str
+    if not isinstance(obj_desc, str):
+        raise _Mismatch('a str', obj_desc, path + '.desc')
+
+    obj_display_name = obj['display_name']  # type: str
+    if not isinstance(obj_display_name, str):
+        raise _Mismatch('a str', obj_display_name, path + '.display_name')
+
+    obj_capacity = obj['capacity']  # type: int
+    if not isinstance(obj_capacity, int):
+        raise _Mismatch('an int', obj_capacity, path + '.capacity')
+
+    obj_image = obj['image']  # type: str
+    if not isinstance(obj_image, str):
+        raise _Mismatch('a str', obj_image, path + '.image')
+
+    return Product(
+        product_id=obj_product_id,
+        desc=obj_desc,
+        display_name=obj_display_name,
+        capacity=obj_capacity,
+        image=obj_image)
+
+
+def product_to_jsonable(
+        product: Product,
+        path: str = "") -> MutableMapping[str, Any]:
+    """
+    Generates a JSON-able mapping from an instance of Product.
+
+    :param product: instance of Product to be JSON-ized
+    :param path: path to the product used for debugging
+    :return: a JSON-able representation
+    """
+    res = dict()  # type: Dict[str, Any]
+
+    res['product_id'] = product.product_id
+
+    res['desc'] = product.desc
+
+    res['display_name'] = product.display_name
+
+    res['capacity'] = product.capacity
+
+    res['image'] = product.image
+
+    return res
+
+
+class ProductList:
+    def __init__(
+            self,
+            products: List['Product']) -> None:
+        """Initializes with the given values."""
+        # Contains the list of products
+        self.products = products
+
+    def to_jsonable(self) -> MutableMapping[str, Any]:
+        """
+        Dispatches the conversion to product_list_to_jsonable.
+
+        :return: JSON-able representation
+        """
+        return product_list_to_jsonable(self)
+
+
+def new_product_list() -> ProductList:
+    """Generates an instance of ProductList with default values."""
+    return ProductList(
+        products=[])
+
+
+def product_list_from_obj(obj: Any, path: str = "") -> ProductList:
+    """
+    Generates an instance of ProductList from a dictionary object.
+
+    :param obj: a JSON-ed dictionary object representing an instance of ProductList
+    :param path: path to the object used for debugging
+    :return: parsed instance of ProductList
+    """
+    if not isinstance(obj, dict):
+        raise _Mismatch('a dict', obj, path)
+
+    try:
+        obj_products = _decode_list_of_product(obj['products'])  # type: List['Product']
+    except _Mismatch as err:
+        raise err.within(path + '.products')
+
+    return ProductList(
+        products=obj_products)
+
+
+def product_list_to_jsonable(
+        product_list: ProductList,
+        path: str = "") -> MutableMapping[str, Any]:
+    """
+    Generates a JSON-able mapping from an instance of ProductList.
+
+    :param product_list: instance of ProductList to be JSON-ized
+    :param path: path to the product_list used for debugging
+    :return: a JSON-able representation
+    """
+    res = dict()  # type: Dict[str, Any]
+
+    res['products'] = _encode_list_of_product(product_list.products)
+
+    return res
+
+
+class PriceEstimate:
+    def __init__(
+            self,
+            product_id: str,
+            currency_code: str,
+            display_name: str,
+            estimate: str,
+            low_estimate: Optional[float] = None,
+            high_estimate: Optional[float] = None,
+            surge_multiplier: Optional[float] = None) -> None:
+        """Initializes with the given values."""
+        # Unique identifier representing a specific product for a given latitude & longitude. For example,
+        # uberX in San Francisco will have a different product_id than uberX in Los Angeles
+        self.product_id = product_id
+
+        # [ISO 4217](http://en.wikipedia.org/wiki/ISO_4217) currency code.
+        self.currency_code = currency_code
+
+        # Display name of product.
+        self.display_name = display_name
+
+        # Formatted string of estimate in local currency of the start location.
+        # Estimate could be a range, a single number (flat rate) or "Metered" for TAXI.
+        self.estimate = estimate
+
+        # Lower bound of the estimated price.
+        self.low_estimate = low_estimate
+
+        # Upper bound of the estimated price.
+        self.high_estimate = high_estimate
+
+        # Expected surge multiplier. Surge is active if surge_multiplier is greater than 1.
+        # Price estimate already factors in the surge multiplier.
+        self.surge_multiplier = surge_multiplier
+
+    def to_jsonable(self) -> MutableMapping[str, Any]:
+        """
+        Dispatches the conversion to price_estimate_to_jsonable.
+
+        :return: JSON-able representation
+        """
+        return price_estimate_to_jsonable(self)
+
+
+def new_price_estimate() -> PriceEstimate:
+    """Generates an instance of PriceEstimate with default values."""
+    return PriceEstimate(
+        product_id='',
+        currency_code='',
+        display_name='',
+        estimate='')
+
+
+def price_estimate_from_obj(obj: Any, path: str = "") -> PriceEstimate:
+    """
+    Generates an instance of PriceEstimate from a dictionary object.
+
+    :param obj: a JSON-ed dictionary object representing an instance of PriceEstimate
+    :param path: path to the object used for debugging
+    :return: parsed instance of PriceEstimate
+    """
+    if not isinstance(obj, dict):
+        raise _Mismatch('a dict', obj, path)
+
+    obj_product_id = obj['product_id']  # type: str
+    if not isinstance(obj_product_id, str):
+        raise _Mismatch('a str', obj_product_id, path + '.product_id')
+
+    obj_currency_code = obj['currency_code']  # type: str
+    if not isinstance(obj_currency_code, str):
+        raise _Mismatch('a str', obj_currency_code, path + '.currency_code')
+
+    obj_display_name = obj['display_name']  # type: str
+    if not isinstance(obj_display_name, str):
+        raise _Mismatch('a str', obj_display_name, path + '.display_name')
+
+    obj_estimate = obj['estimate']  # type: str
+    if not isinstance(obj_estimate, str):
+        raise _Mismatch('a str', obj_estimate, path + '.estimate')
+
+    obj_low_estimate = obj.get('low_estimate', None)  # type: Optional[float]
+    if isinstance(obj_low_estimate, int):
+        obj_low_estimate = float(obj_low_estimate)
+    elif obj_low_estimate is not None and not isinstance(obj_low_estimate, float):
+        raise _Mismatch('an int or a float', obj_low_estimate, path + '.low_estimate')
+
+    obj_high_estimate = obj.get('high_estimate', None)  # type: Optional[float]
+    if isinstance(obj_high_estimate, int):
+        obj_high_estimate = float(obj_high_estimate)
+    elif obj_high_estimate is not None and not isinstance(obj_high_estimate, float):
+        raise _Mismatch('an int or a float', obj_high_estimate, path + '.high_estimate')
+
+    obj_surge_multiplier = obj.get('surge_multiplier', None)  # type: Optional[float]
+    if isinstance(obj_surge_multiplier, int):
+        obj_surge_multiplier = float(obj_surge_multiplier)
+    elif obj_surge_multiplier is not None and not isinstance(obj_surge_multiplier, float):
+        raise _Mismatch('an int or a float', obj_surge_multiplier, path + '.surge_multiplier')
+
+    return PriceEstimate(
+        product_id=obj_product_id,
+        currency_code=obj_currency_code,
+        display_name=obj_display_name,
+        estimate=obj_estimate,
+        low_estimate=obj_low_estimate,
+        high_estimate=obj_high_estimate,
+        surge_multiplier=obj_surge_multiplier)
+
+
+def price_estimate_to_jsonable(
+        price_estimate: PriceEstimate,
+        path: str = "") -> MutableMapping[str, Any]:
+    """
+    Generates a JSON-able mapping from an instance of PriceEstimate.
+
+    :param price_estimate: instance of PriceEstimate to be JSON-ized
+    :param path: path to the price_estimate used for debugging
+    :return: a JSON-able representation
+    """
+    res = dict()  # type: Dict[str, Any]
+
+    res['product_id'] = price_estimate.product_id
+
+    res['currency_code'] = price_estimate.currency_code
+
+    res['display_name'] = price_estimate.display_name
+
+    res['estimate'] = price_estimate.estimate
+
+    if price_estimate.low_estimate is not None:
+        res['low_estimate'] = price_estimate.low_estimate
+
+    if price_estimate.high_estimate is not None:
+        res['high_estimate'] = price_estimate.high_estimate
+
+    if price_estimate.surge_multiplier is not None:
+        res['surge_multiplier'] = price_estimate.surge_multiplier
+
+    return res
+
+
+class Profile:
+    def __init__(
+            self,
+            last_name: str,
+            email: str,
+            picture: str,
+            first_name: Optional[str] = None,
+            promo_code: Optional[str] = None) -> None:
+        """Initializes with the given values."""
+        # Last name of the Uber user.
+        self.last_name = last_name
+
+        # Email address of the Uber user
+        self.email = email
+
+        # Image URL of the Uber user.
+        self.picture = picture
+
+        # First name of the Uber user.
+        self.first_name = first_name
+
+        # Promo code of the Uber user.
+        self.promo_code = promo_code
+
+    def to_jsonable(self) -> MutableMapping[str, Any]:
+        """
+        Dispatches the conversion to profile_to_jsonable.
+
+        :return: JSON-able representation
+        """
+        return profile_to_jsonable(self)
+
+
+def new_profile() -> Profile:
+    """Generates an instance of Profile with default values."""
+    return Profile(
+        last_name='',
+        email='',
+        picture='')
+
+
+def profile_from_obj(obj: Any, path: str = "") -> Profile:
+    """
+    Generates an instance of Profile from a dictionary object.
+
+    :param obj: a JSON-ed dictionary object representing an instance of Profile
+    :param path: path to the object used for debugging
+    :return: parsed instance of Profile
+    """
+    if not isinstance(obj, dict):
+        raise _Mismatch('a dict', obj, path)
+
+    obj_last_name = obj['last_name']  # type: str
+    if not isinstance(obj_last_name, str):
+        raise _Mismatch('a str', obj_last_name, path + '.last_name')
+
+    obj_email = obj['email']  # type: str
+    if not isinstance(obj_email, str):
+        raise _Mismatch('a str', obj_email, path + '.email')
+
+    obj_picture = obj['picture']  # type: str
+    if not isinstance(obj_picture, str):
+        raise _Mismatch('a str', obj_picture, path + '.picture')
+
+    obj_first_name = obj.get('first_name', None)  # type: Optional[str]
+    if obj_first_name is not None and not isinstance(obj_first_name, str):
+        raise _Mismatch('a str', obj_first_name, path + '.first_name')
+
+    obj_promo_code = obj.get('promo_code', None)  # type: Optional[str]
+    if obj_promo_code is not None and not isinstance(obj_promo_code, str):
+        raise _Mismatch('a str', obj_promo_code, path + '.promo_code')
+
+    return Profile(
+        last_name=obj_last_name,
+        email=obj_email,
+        picture=obj_picture,
+        first_name=obj_first_name,
+        promo_code=obj_promo_code)
+
+
+def profile_to_jsonable(
+        profile: Profile,
+        path: str = "") -> MutableMapping[str, Any]:
+    """
+    Generates a JSON-able mapping from an instance of Profile.
+
+    :param profile: instance of Profile to be JSON-ized
+    :param path: path to the profile used for debugging
+    :return: a JSON-able representation
+    """
+    res = dict()  # type: Dict[str, Any]
+
+    res['last_name'] = profile.last_name
+
+    res['email'] = profile.email
+
+    res['picture'] = profile.picture
+
+    if profile.first_name is not None:
+        res['first_name'] = profile.first_name
+
+    if profile.promo_code is not None:
+        res['promo_code'] = profile.promo_code
+
+    return res
+
+
+class Activity:
+    def __init__(
+            self,
+            uuid: str) -> None:
+        """Initializes with the given values."""
+        # Unique identifier for the activity
+        self.uuid = uuid
+
+    def to_jsonable(self) -> MutableMapping[str, Any]:
+        """
+        Dispatches the conversion to activity_to_jsonable.
+
+        :return: JSON-able representation
+        """
+        return activity_to_jsonable(self)
+
+
+def new_activity() -> Activity:
+    """Generates an instance of Activity with default values."""
+    return Activity(
+        uuid='')
+
+
+def activity_from_obj(obj: Any, path: str = "") -> Activity:
+    """
+    Generates an instance of Activity from a dictionary object.
+
+    :param obj: a JSON-ed dictionary object representing an instance of Activity
+    :param path: path to the object used for debugging
+    :return: parsed instance of Activity
+    """
+    if not isinstance(obj, dict):
+        raise _Mismatch('a dict', obj, path)
+
+    obj_uuid = obj['uuid']  # type: str
+    if not isinstance(obj_uuid, str):
+        raise _Mismatch('a str', obj_uuid, path + '.uuid')
+
+    return Activity(
+        uuid=obj_uuid)
+
+
+def activity_to_jsonable(
+        activity: Activity,
+        path: str = "") -> MutableMapping[str, Any]:
+    """
+    Generates a JSON-able mapping from an instance of Activity.
+
+    :param activity: instance of Activity to be JSON-ized
+    :param path: path to the activity used for debugging
+    :return: a JSON-able representation
+    """
+    res = dict()  # type: Dict[str, Any]
+
+    res['uuid'] = activity.uuid
+
+    return res
+
+
+class Activities:
+    def __init__(
+            self,
+            offset: int,
+            limit: int,
+            count: int,
+            history: List['Activity']) -> None:
+        """Initializes with the given values."""
+        # Position in pagination.
+        self.offset = offset
+
+        # Number of items to retrieve (100 max).
+        self.limit = limit
+
+        # Total number of items available.
+        self.count = count
+
+        self.history = history
+
+    def to_jsonable(self) -> MutableMapping[str, Any]:
+        """
+        Dispatches the conversion to activities_to_jsonable.
+
+        :return: JSON-able representation
+        """
+        return activities_to_jsonable(self)
+
+
+def new_activities() -> Activities:
+    """Generates an instance of Activities with default values."""
+    return Activities(
+        offset=0,
+        limit=0,
+        count=0,
+        history=[])
+
+
+def activities_from_obj(obj: Any, path: str = "") -> Activities:
+    """
+    Generates an instance of Activities from a dictionary object.
+
+    :param obj: a JSON-ed dictionary object representing an instance of Activities
+    :param path: path to the object used for debugging
+    :return: parsed instance of Activities
+    """
+    if not isinstance(obj, dict):
+        raise _Mismatch('a dict', obj, path)
+
+    obj_offset = obj['offset']  # type: int
+    if not isinstance(obj_offset, int):
+        raise _Mismatch('an int', obj_offset, path + '.offset')
+
+    obj_limit = obj['limit']  # type: int
+    if not isinstance(obj_limit, int):
+        raise _Mismatch('an int', obj_limit, path + '.limit')
+
+    obj_count = obj['count']  # type: int
+    if not isinstance(obj_count, int):
+        raise _Mismatch('an int', obj_count, path + '.count')
+
+    try:
+        obj_history = _decode_list_of_activity(obj['history'])  # type: List['Activity']
+    except _Mismatch as err:
+        raise err.within(path + '.history')
+
+    return Activities(
+        offset=obj_offset,
+        limit=obj_limit,
+        count=obj_count,
+        history=obj_history)
+
+
+def activities_to_jsonable(
+        activities: Activities,
+        path: str = "") -> MutableMapping[str, Any]:
+    """
+    Generates a JSON-able mapping from an instance of Activities.
+
+    :param activities: instance of Activities to be JSON-ized
+    :param path: path to the activities used for debugging
+    :return: a JSON-able representation
+    """
+    res = dict()  # type: Dict[str, Any]
+
+    res['offset'] = activities.offset
+
+    res['limit'] = activities.limit
+
+    res['count'] = activities.count
+
+    res['history'] = _encode_list_of_activity(activities.history)
+
+    return res
+
+
+def _decode_list_of_product(obj: Any) -> List['Product']:
+    """
+    Checks and converts the JSON-ed object to List['Product'].
+
+    :param obj: to be converted
+    :return: the converted object
+    """
+    if not isinstance(obj, list):
+        raise _Mismatch('a list', obj, '')
+
+    result = []  # type: List['Product']
+    try:
+        for item in obj:
+            result.append(product_from_obj(item))
+    except _Mismatch as err:
+        raise err.within('[{}]'.format(len(result)))
+
+    return result
+
+
+def _decode_list_of_activity(obj: Any) -> List['Activity']:
+    """
+    Checks and converts the JSON-ed object to List['Activity'].
+
+    :param obj: to be converted
+    :return: the converted object
+    """
+    if not isinstance(obj, list):
+        raise _Mismatch('a list', obj, '')
+
+    result = []  # type: List['Activity']
+    try:
+        for item in obj:
+            result.append(activity_from_obj(item))
+    except _Mismatch as err:
+        raise err.within('[{}]'.format(len(result)))
+
+    return result
+
+
+def _decode_dict_of_product(obj: Any) -> Dict[str, 'Product']:
+    """
+    Checks and converts the JSON-ed object to Dict[str, 'Product'].
+
+    :param obj: to be converted
+    :return: the converted object
+    """
+    if not isinstance(obj, dict):
+        raise _Mismatch('a dict', obj, '')
+
+    result = dict()  # type: Dict[str, 'Product']
+    for key, value in obj.items():
+        if not isinstance(key, str):
+            raise _Mismatch('a key of type str', key, '')
+
+        try:
+            result[key] = product_from_obj(value)
+        except _Mismatch as err:
+            raise err.within('[{!r}]'.format(key))
+
+    return result
+
+
+def _encode_list_of_product(obj: List['Product']) -> List[Any]:
+    """
+    Converts the list to a JSON-able representation.
+
+    :param obj: to be converted
+    :return: JSON-able representation
+    """
+    return [product_to_jsonable(item) for item in obj]
+
+
+def _encode_list_of_activity(obj: List['Activity']) -> List[Any]:
+    """
+    Converts the list to a JSON-able representation.
+
+    :param obj: to be converted
+    :return: JSON-able representation
+    """
+    return [activity_to_jsonable(item) for item in obj]
+
+
+# Timeout in seconds of both connecting and reading, a tuple of the two, or the timeout of aiohttp
+_Timeout = Union[float, Tuple[Optional[float], Optional[float]], aiohttp.ClientTimeout]
+
+
+class _Unlimited:
+    """Stands in for the semaphore if the number of the concurrent calls is not limited."""
+
+    async def __aenter__(self) -> None:
+        return None
+
+    async def __aexit__(self, exc_type: Any, exc_value: Any, traceback: Any) -> None:
+        return None
+
+
+_UNLIMITED = _Unlimited()
+
+
+class RemoteCaller:
+    """Executes the remote calls to the server asynchronously."""
+
+    def __init__(
+        self,
+        url_prefix: str,
+        auth: Optional[aiohttp.BasicAuth] = None,
+        session: Optional[aiohttp.ClientSession] = None,
+        max_connections: int = 100,
+        max_connections_per_host: int = 0,
+        max_concurrency: int = 0,
+        connect_timeout: Optional[float] = None,
+        read_timeout: Optional[float] = None) -> None:
+        """
+        Initializes with the given values.
+
+        If the session is not given, it is created on the first call so that it binds to the running event loop.
+        The pool size and the authentication apply only to the created session. The timeouts apply to all
+        the calls and are raised as asyncio.TimeoutError.
+
+        :param url_prefix: prefix of the URLs of the remote calls
+        :param auth: authentication of the calls
+        :param session: session to be used for the calls instead of the created one
+        :param max_connections: maximum number of the pooled connections; 0 means no limit
+        :param max_connections_per_host: maximum number of the pooled connections to a single host; 0 means no limit
+        :param max_concurrency: maximum number of the calls in flight, the excess calls wait; 0 means no limit
+        :param connect_timeout: timeout in seconds for establishing a connection; None means no timeout
+        :param read_timeout: timeout in seconds between the bytes received from the server; None means no timeout
+        """
+        self.url_prefix = url_prefix
+        self.auth = auth
+        self.session = session
+        self.max_connections = max_connections
+        self.max_connections_per_host = max_connections_per_host
+        self.max_concurrency = max_concurrency
+        self.timeout = aiohttp.ClientTimeout(total=None, sock_connect=connect_timeout, sock_read=read_timeout)
+
+        self._owns_session = session is None
+        self._semaphore = None  # type: Optional[asyncio.Semaphore]
+
+    async def __aenter__(self) -> 'RemoteCaller':
+        return self
+
+    async def __aexit__(self, exc_type: Any, exc_value: Any, traceback: Any) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """Closes the session unless it has been given to the constructor."""
+        if self._owns_session and self.session is not None:
+            await self.session.close()
+            self.session = None
+
+    def _session(self) -> aiohttp.ClientSession:
+        """Returns the session, creates it on the first call."""
+        if self.session is None:
+            self.session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=self.max_connections, limit_per_host=self.max_connections_per_host),
+                auth=self.auth)
+
+        return self.session
+
+    def _timeout(self, request_timeout: Optional[_Timeout]) -> aiohttp.ClientTimeout:
+        """Returns the timeout of the call, the timeout of the caller unless overridden for the call."""
+        if request_timeout is None:
+            return self.timeout
+
+        if isinstance(request_timeout, aiohttp.ClientTimeout):
+            return request_timeout
+
+        if isinstance(request_timeout, tuple):
+            connect_timeout, read_timeout = request_timeout
+        else:
+            connect_timeout, read_timeout = request_timeout, request_timeout
+
+        return aiohttp.ClientTimeout(total=None, sock_connect=connect_timeout, sock_read=read_timeout)
+
+    def _slot(self) -> Union[asyncio.Semaphore, _Unlimited]:
+        """
+        Returns the context holding a slot for a call in flight.
+
+        A streamed response frees its slot once the headers are received.
+        """
+        if self.max_concurrency == 0:
+            return _UNLIMITED
+
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        return self._semaphore
+
+    async def products(
+            self,
+            latitude: float,
+            longitude: float,
+            request_timeout: Optional[_Timeout] = None) -> Dict[str, 'Product']:
+        """
+        The Products endpoint returns information about the Uber products offered at a given location.
+
+        :param latitude: Latitude component of location.
+        :param longitude: Longitude component of location.
+        :param request_timeout: overrides the connect and read timeouts of the caller for this call
+
+        :return: An array of products
+        """
+        url = self.url_prefix + '/products'
+
+        params = {}  # type: Dict[str, str]
+
+        params['latitude'] = json.dumps(latitude)
+
+        params['longitude'] = json.dumps(longitude)
+
+        async with self._slot():
+            async with self._session().request(
+                    method='get',
+                    url=url,
+                    timeout=self._timeout(request_timeout),
+                    params=params) as resp:
+                resp.raise_for_status()
+                return _decode_dict_of_product(await resp.json(content_type=None))
+
+    async def estimates_price(
+            self,
+            start_latitude: float,
+            start_longitude: float,
+            end_latitude: float,
+            end_longitude: float,
+            max_lines: Optional[int] = None,
+            request_timeout: Optional[_Timeout] = None) -> List['Product']:
+        """
+        The Price Estimates endpoint returns an estimated price range for each product offered at a given
+        location. The price estimate is provided as a formatted string with the full price range and the localized
+        currency symbol.
+
+        :param start_latitude: Latitude component of start location.
+        :param start_longitude: Longitude component of start location.
+        :param end_latitude: Latitude component of end location.
+        :param end_longitude: Longitude component of end location.
+        :param max_lines: A maximum number of lines in the produced json.
+        :param request_timeout: overrides the connect and read timeouts of the caller for this call
+
+        :return: An array of price estimates by product
+        """
+        url = "".join([
+            self.url_prefix,
+            '/estimates/price/',
+            str(start_latitude),
+            '/',
+            str(start_longitude),
+            '/',
+            str(end_latitude),
+            '/',
+            str(end_longitude)])
+
+        params = {}  # type: Dict[str, str]
+
+        if max_lines is not None:
+            params['max_lines'] = json.dumps(max_lines)
+
+        async with self._slot():
+            async with self._session().request(
+                    method='get',
+                    url=url,
+                    timeout=self._timeout(request_timeout),
+                    params=params) as resp:
+                resp.raise_for_status()
+                return _decode_list_of_product(await resp.json(content_type=None))
+
+    async def estimates_time(
+            self,
+            start_latitude: float,
+            start_longitude: float,
+            customer_uuid: Optional[str] = None,
+            product_id: Optional[str] = None,
+            request_timeout: Optional[_Timeout] = None) -> Dict[str, 'Product']:
+        """
+        The Time Estimates endpoint returns ETAs for all products.
+
+        :param start_latitude: Latitude component of start location.
+        :param start_longitude: Longitude component of start location.
+        :param customer_uuid: Unique customer identifier to be used for experience customization.
+        :param product_id: Unique identifier representing a specific product for a given latitude & longitude.
+        :param request_timeout: overrides the connect and read timeouts of the caller for this call
+
+        :return: An array of products
+        """
+        url = self.url_prefix + '/estimates/time'
+
+        params = {}  # type: Dict[str, str]
+
+        params['start_latitude'] = json.dumps(start_latitude)
+
+        params['start_longitude'] = json.dumps(start_longitude)
+
+        if customer_uuid is not None:
+            params['customer_uuid'] = customer_uuid
+
+        if product_id is not None:
+            params['product_id'] = product_id
+
+        async with self._slot():
+            async with self._session().request(
+                    method='get',
+                    url=url,
+                    timeout=self._timeout(request_timeout),
+                    params=params) as resp:
+                resp.raise_for_status()
+                return _decode_dict_of_product(await resp.json(content_type=None))
+
+    async def update_me(
+            self,
+            update_user: 'Profile',
+            request_timeout: Optional[_Timeout] = None) -> 'Profile':
+        """
+        Update an User Profile.
+
+        :param update_user: profile of a user to update
+        :param request_timeout: overrides the connect and read timeouts of the caller for this call
+
+        :return: Previous profile information for a user
+        """
+        url = self.url_prefix + '/me'
+
+        data = profile_to_jsonable(update_user)
+
+        async with self._slot():
+            async with self._session().request(
+                    method='patch',
+                    url=url,
+                    timeout=self._timeout(request_timeout),
+                    json=data) as resp:
+                resp.raise_for_status()
+                return profile_from_obj(await resp.json(content_type=None))
+
+    async def upload_infos(
+            self,
+            user_id: str,
+            profile_picture: BinaryIO,
+            birthday: Optional[str] = None,
+            request_timeout: Optional[_Timeout] = None) -> bytes:
+        """
+        Upload information about an User.
+
+        :param user_id: identifies a user.
+        :param profile_picture: contains the user image encoded in JPEG as a multi-value field.
+        :param birthday: is the user's birth date.
+        :param request_timeout: overrides the connect and read timeouts of the caller for this call
+
+        :return: Confirms that the information was uploaded.
+        """
+        url = self.url_prefix + '/upload_infos'
+
+        data = {}  # type: Dict[str, str]
+
+        data['user_id'] = user_id
+
+        if birthday is not None:
+            data['birthday'] = birthday
+
+        files = {}  # type: Dict[str, BinaryIO]
+
+        files['profile_picture'] = profile_picture
+
+        form = aiohttp.FormData()
+        for name, value in data.items():
+            form.add_field(name, value)
+        for name, file in files.items():
+            form.add_field(name, file)
+
+        async with self._slot():
+            async with self._session().request(
+                    method='patch',
+                    url=url,
+                    timeout=self._timeout(request_timeout),
+                    data=form) as resp:
+                resp.raise_for_status()
+                return await resp.read()
+
+    async def history(
+            self,
+            offset: Optional[int] = None,
+            limit: Optional[int] = None,
+            request_timeout: Optional[_Timeout] = None) -> 'Activities':
+        """
+        The User Activity endpoint returns data about a user's lifetime activity with Uber. The response will
+        include pickup locations and times, dropoff locations and times, the distance of past requests, and
+        information about which products were requested.
+
+        :param offset: Offset the list of returned results by this amount. Default is zero.
+        :param limit: Number of items to retrieve. Default is 5, maximum is 100.
+        :param request_timeout: overrides the connect and read timeouts of the caller for this call
+
+        :return: History information for the given user
+        """
+        url = self.url_prefix + '/history'
+
+        params = {}  # type: Dict[str, str]
+
+        if offset is not None:
+            params['offset'] = json.dumps(offset)
+
+        if limit is not None:
+            params['limit'] = json.dumps(limit)
+
+        async with self._slot():
+            async with self._session().request(
+                    method='get',
+                    url=url,
+                    timeout=self._timeout(request_timeout),
+                    params=params) as resp:
+                resp.raise_for_status()
+                return activities_from_obj(await resp.json(content_type=None))
+
+
+# Automatically generated file by swagger_to. DO NOT EDIT OR APPEND ANYTHING!
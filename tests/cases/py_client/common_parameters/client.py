@@ -7,10 +7,19 @@
 
 import contextlib
 import json
-from typing import Any, BinaryIO, Dict, List, MutableMapping, Optional, cast
+import threading
+import weakref
+from typing import Any, BinaryIO, Callable, Dict, List, MutableMapping, Optional, Tuple, Union, cast
 
 import requests
+import requests.adapters
 import requests.auth
+import urllib3
+import urllib3.util.retry
+
+
+# Timeout in seconds of both connecting and reading, or a tuple of the two
+_Timeout = Union[float, Tuple[Optional[float], Optional[float]]]
 
 
 class RemoteCaller:
@@ -20,22 +29,114 @@ class RemoteCaller:
         self,
         url_prefix: str,
         auth: Optional[requests.auth.AuthBase] = None,
-        session: Optional[requests.Session] = None) -> None:
+        session: Optional[requests.Session] = None,
+        pool_size: int = 10,
+        max_connections_per_host: int = 10,
+        max_retries: int = 0,
+        backoff_factor: float = 0.0,
+        connect_timeout: Optional[float] = None,
+        read_timeout: Optional[float] = None,
+        session_factory: Optional[Callable[[], requests.Session]] = None) -> None:
+        """
+        Initializes with the given values.
+
+        If the session is not given, the caller is thread-safe: each thread calls through its own session and all
+        the sessions share a single thread-safe pool of the connections. The connections are kept alive in the pool
+        between the calls. The session property then gives the session of the current thread.
+
+        :param url_prefix: prefix of the URLs of the remote calls
+        :param auth: authentication of the calls
+        :param session:
+            session to be used for all the calls instead of the sessions of the threads.
+            The pool and the retries are not applied to it, and it is up to you whether it is safe to share.
+        :param pool_size: number of the hosts whose connections are pooled
+        :param max_connections_per_host: maximum number of the pooled connections to a single host
+        :param max_retries:
+            maximum number of the retries on connection errors and on the statuses 502, 503 and 504.
+            Non-idempotent methods such as POST are not retried. The read errors are not retried so that
+            the read timeouts are raised as requests.ReadTimeout.
+        :param backoff_factor: the retries wait backoff_factor * 2 ** (retry - 1) seconds
+        :param connect_timeout: timeout in seconds for establishing a connection; None means no timeout
+        :param read_timeout: timeout in seconds between the bytes received from the server; None means no timeout
+        :param session_factory:
+            creates the session of each thread, e.g., to set the headers or the hooks of all the calls.
+            The pool and the retries are mounted on the created sessions.
+        """
         self.url_prefix = url_prefix
         self.auth = auth
-        self.session = session
+        self._given_session = session
+        self.session_factory = session_factory if session_factory is not None else requests.Session
+        self.timeout = (connect_timeout, read_timeout)  # type: _Timeout
+
+        self._adapter = requests.adapters.HTTPAdapter(
+            pool_connections=pool_size,
+            pool_maxsize=max_connections_per_host,
+            max_retries=urllib3.util.retry.Retry(
+                total=max_retries,
+                read=False,
+                backoff_factor=backoff_factor,
+                status_forcelist=[502, 503, 504],
+                raise_on_status=False))
+        self._local = threading.local()
+
+        # Sessions of the threads so that they can be closed; the sessions of the finished threads are dropped.
+        self._sessions = weakref.WeakSet()  # type: weakref.WeakSet[requests.Session]
+        self._sessions_lock = threading.Lock()
+
+    def close(self) -> None:
+        """Closes the sessions of the threads and the pooled connections."""
+        with self._sessions_lock:
+            sessions = list(self._sessions)
+            self._sessions.clear()
+
+        for session in sessions:
+            session.close()
+
+        self._adapter.close()
+
+    @property
+    def session(self) -> requests.Session:
+        """
+        Returns the session given to the constructor or, if none was given, the session of the current thread.
+
+        The changes to the session of a thread do not apply to the other threads; configure the sessions of all
+        the threads with the session_factory instead.
+        """
+        return self._session()
+
+    @session.setter
+    def session(self, value: Optional[requests.Session]) -> None:
+        """Sets the session to be used for all the calls; None switches back to the sessions of the threads."""
+        self._given_session = value
+
+    def _session(self) -> requests.Session:
+        """Returns the session of the current thread, creates it on the first call in the thread."""
+        if self._given_session is not None:
+            return self._given_session
+
+        session = getattr(self._local, 'session', None)  # type: Optional[requests.Session]
+        if session is None:
+            session = self.session_factory()
+            if self.auth is not None:
+                session.auth = self.auth
+            session.mount('http://', self._adapter)
+            session.mount('https://', self._adapter)
+            self._local.session = session
+
+            with self._sessions_lock:
+                self._sessions.add(session)
 
-        if not self.session:
-            self.session = requests.Session()
-            self.session.auth = self.auth
+        return session
 
     def get_foo(
             self,
-            foo_id: str) -> MutableMapping[str, Any]:
+            foo_id: str,
+            request_timeout: Optional[_Timeout] = None) -> MutableMapping[str, Any]:
         """
         Send a get request to /api/v1/foo/{foo_id}.
 
         :param foo_id: The foo id
+        :param request_timeout: overrides the connect and read timeouts of the caller for this call
 
         :return: Success
         """
@@ -44,9 +145,10 @@ class RemoteCaller:
             '/api/v1/foo/',
             str(foo_id)])
 
-        resp = self.session.request(
+        resp = self._session().request(
             method='get',
             url=url,
+            timeout=self.timeout if request_timeout is None else request_timeout,
         )
 
         with contextlib.closing(resp):
@@ -7,10 +7,44 @@
 
 import contextlib
 import json
-from typing import Any, BinaryIO, Dict, List, MutableMapping, Optional, cast
+import threading
+import weakref
+from typing import Any, BinaryIO, Callable, Dict, List, MutableMapping, Optional, Tuple, Union, cast
 
 import requests
+import requests.adapters
 import requests.auth
+import urllib3
+import urllib3.util.retry
+
+
+class _Mismatch(ValueError):
+    """Signals that a JSON-ed object does not conform to the expected type."""
+
+    def __init__(self, expected: str, got: Any, path: str) -> None:
+        """
+        Initializes with the given values.
+
+        The decoders do not track the paths to the objects. The path is relative to the decoder which
+        raised the error and the enclosing decoders prepend their paths while the error propagates.
+
+        :param expected: description of the expected type
+        :param got: the mismatched object
+        :param path: path to the mismatched object
+        """
+        super().__init__()
+        self.expected = expected
+        self.got = type(got)
+        self.segments = [path]
+
+    def within(self, path: str) -> '_Mismatch':
+        """Prepends the path to the enclosing object."""
+        self.segments.append(path)
+        return self
+
+    def __str__(self) -> str:
+        return 'Expected {} at {!r}, but got {}.'.format(
+            self.expected, ''.join(reversed(self.segments)), self.got)
 
 
 def from_obj(obj: Any, expected: List[type], path: str = '') -> Any:
@@ -171,20 +205,14 @@ def test_object_from_obj(obj: Any, path: str = "") -> TestObject:
     :return: parsed instance of TestObject
     """
     if not isinstance(obj, dict):
-        raise ValueError('Expected a dict at path {}, but got: {}'.format(path, type(obj)))
-
-    for key in obj:
-        if not isinstance(key, str):
-            raise ValueError(
-                'Expected a key of type str at path {}, but got: {}'.format(path, type(key)))
+        raise _Mismatch('a dict', obj, path)
 
-    timestamp_from_obj = from_obj(
-        obj['timestamp'],
-        expected=[str],
-        path=path + '.timestamp')  # type: str
+    obj_timestamp = obj['timestamp']  # type: str
+    if not isinstance(obj_timestamp, str):
+        raise _Mismatch('a str', obj_timestamp, path + '.timestamp')
 
     return TestObject(
-        timestamp=timestamp_from_obj)
+        timestamp=obj_timestamp)
 
 
 def test_object_to_jsonable(
@@ -204,6 +232,10 @@ def test_object_to_jsonable(
     return res
 
 
+# Timeout in seconds of both connecting and reading, or a tuple of the two
+_Timeout = Union[float, Tuple[Optional[float], Optional[float]]]
+
+
 class RemoteCaller:
     """Executes the remote calls to the server."""
 
@@ -211,22 +243,114 @@ class RemoteCaller:
         self,
         url_prefix: str,
         auth: Optional[requests.auth.AuthBase] = None,
-        session: Optional[requests.Session] = None) -> None:
+        session: Optional[requests.Session] = None,
+        pool_size: int = 10,
+        max_connections_per_host: int = 10,
+        max_retries: int = 0,
+        backoff_factor: float = 0.0,
+        connect_timeout: Optional[float] = None,
+        read_timeout: Optional[float] = None,
+        session_factory: Optional[Callable[[], requests.Session]] = None) -> None:
+        """
+        Initializes with the given values.
+
+        If the session is not given, the caller is thread-safe: each thread calls through its own session and all
+        the sessions share a single thread-safe pool of the connections. The connections are kept alive in the pool
+        between the calls. The session property then gives the session of the current thread.
+
+        :param url_prefix: prefix of the URLs of the remote calls
+        :param auth: authentication of the calls
+        :param session:
+            session to be used for all the calls instead of the sessions of the threads.
+            The pool and the retries are not applied to it, and it is up to you whether it is safe to share.
+        :param pool_size: number of the hosts whose connections are pooled
+        :param max_connections_per_host: maximum number of the pooled connections to a single host
+        :param max_retries:
+            maximum number of the retries on connection errors and on the statuses 502, 503 and 504.
+            Non-idempotent methods such as POST are not retried. The read errors are not retried so that
+            the read timeouts are raised as requests.ReadTimeout.
+        :param backoff_factor: the retries wait backoff_factor * 2 ** (retry - 1) seconds
+        :param connect_timeout: timeout in seconds for establishing a connection; None means no timeout
+        :param read_timeout: timeout in seconds between the bytes received from the server; None means no timeout
+        :param session_factory:
+            creates the session of each thread, e.g., to set the headers or the hooks of all the calls.
+            The pool and the retries are mounted on the created sessions.
+        """
         self.url_prefix = url_prefix
         self.auth = auth
-        self.session = session
+        self._given_session = session
+        self.session_factory = session_factory if session_factory is not None else requests.Session
+        self.timeout = (connect_timeout, read_timeout)  # type: _Timeout
+
+        self._adapter = requests.adapters.HTTPAdapter(
+            pool_connections=pool_size,
+            pool_maxsize=max_connections_per_host,
+            max_retries=urllib3.util.retry.Retry(
+                total=max_retries,
+                read=False,
+                backoff_factor=backoff_factor,
+                status_forcelist=[502, 503, 504],
+                raise_on_status=False))
+        self._local = threading.local()
+
+        # Sessions of the threads so that they can be closed; the sessions of the finished threads are dropped.
+        self._sessions = weakref.WeakSet()  # type: weakref.WeakSet[requests.Session]
+        self._sessions_lock = threading.Lock()
+
+    def close(self) -> None:
+        """Closes the sessions of the threads and the pooled connections."""
+        with self._sessions_lock:
+            sessions = list(self._sessions)
+            self._sessions.clear()
+
+        for session in sessions:
+            session.close()
+
+        self._adapter.close()
+
+    @property
+    def session(self) -> requests.Session:
+        """
+        Returns the session given to the constructor or, if none was given, the session of the current thread.
+
+        The changes to the session of a thread do not apply to the other threads; configure the sessions of all
+        the threads with the session_factory instead.
+        """
+        return self._session()
+
+    @session.setter
+    def session(self, value: Optional[requests.Session]) -> None:
+        """Sets the session to be used for all the calls; None switches back to the sessions of the threads."""
+        self._given_session = value
+
+    def _session(self) -> requests.Session:
+        """Returns the session of the current thread, creates it on the first call in the thread."""
+        if self._given_session is not None:
+            return self._given_session
+
+        session = getattr(self._local, 'session', None)  # type: Optional[requests.Session]
+        if session is None:
+            session = self.session_factory()
+            if self.auth is not None:
+                session.auth = self.auth
+            session.mount('http://', self._adapter)
+            session.mount('https://', self._adapter)
+            self._local.session = session
+
+            with self._sessions_lock:
+                self._sessions.add(session)
 
-        if not self.session:
-            self.session = requests.Session()
-            self.session.auth = self.auth
+        return session
 
     def test_me(
             self,
-            test_object: Optional['TestObject'] = None) -> 'TestObject':
+            test_object: Optional['TestObject'] = None,
+            request_timeout: Optional[_Timeout] = None) -> 'TestObject':
         """
         Is a test endpoint.
 
         :param test_object:
+        :param request_timeout: overrides the connect and read timeouts of the caller for this call
 
         :return: a test object
         """
@@ -234,21 +358,18 @@ class RemoteCaller:
 
         data = None  # type: Optional[Any]
         if test_object != None:
-            data = to_jsonable(
-                test_object,
-                expected=[TestObject])
+            data = test_object_to_jsonable(test_object)
 
-        resp = self.session.request(
+        resp = self._session().request(
             method='get',
             url=url,
             json=data,
+            timeout=self.timeout if request_timeout is None else request_timeout,
         )
 
         with contextlib.closing(resp):
             resp.raise_for_status()
-            return from_obj(
-                obj=resp.json(),
-                expected=[TestObject])
+            return test_object_from_obj(resp.json())
 
 
 # Automatically generated file by swagger_to. DO NOT EDIT OR APPEND ANYTHING!
@@ -7,10 +7,44 @@
 
 import contextlib
 import json
-from typing import Any, BinaryIO, Dict, List, MutableMapping, Optional, cast
+import threading
+import weakref
+from typing import Any, BinaryIO, Callable, Dict, List, MutableMapping, Optional, Tuple, Union, cast
 
 import requests
+import requests.adapters
 import requests.auth
+import urllib3
+import urllib3.util.retry
+
+
+class _Mismatch(ValueError):
+    """Signals that a JSON-ed object does not conform to the expected type."""
+
+    def __init__(self, expected: str, got: Any, path: str) -> None:
+        """
+        Initializes with the given values.
+
+        The decoders do not track the paths to the objects. The path is relative to the decoder which
+        raised the error and the enclosing decoders prepend their paths while the error propagates.
+
+        :param expected: description of the expected type
+        :param got: the mismatched object
+        :param path: path to the mismatched object
+        """
+        super().__init__()
+        self.expected = expected
+        self.got = type(got)
+        self.segments = [path]
+
+    def within(self, path: str) -> '_Mismatch':
+        """Prepends the path to the enclosing object."""
+        self.segments.append(path)
+        return self
+
+    def __str__(self) -> str:
+        return 'Expected {} at {!r}, but got {}.'.format(
+            self.expected, ''.join(reversed(self.segments)), self.got)
 
 
 def from_obj(obj: Any, expected: List[type], path: str = '') -> Any:
@@ -167,24 +201,14 @@ def some_definition_from_obj(obj: Any, path: str = "") -> SomeDefinition:
     :return: parsed instance of SomeDefinition
     """
     if not isinstance(obj, dict):
-        raise ValueError('Expected a dict at path {}, but got: {}'.format(path, type(obj)))
+        raise _Mismatch('a dict', obj, path)
 
-    for key in obj:
-        if not isinstance(key, str):
-            raise ValueError(
-                'Expected a key of type str at path {}, but got: {}'.format(path, type(key)))
-
-    obj_some_property = obj.get('some.property', None)
-    if obj_some_property is not None:
-        some_property_from_obj = from_obj(
-            obj_some_property,
-            expected=[int],
-            path=path + '.some.property')  # type: Optional[int]
-    else:
-        some_property_from_obj = None
+    obj_some_property = obj.get('some.property', None)  # type: Optional[int]
+    if obj_some_property is not None and not isinstance(obj_some_property, int):
+        raise _Mismatch('an int', obj_some_property, path + '.some.property')
 
     return SomeDefinition(
-        some_property=some_property_from_obj)
+        some_property=obj_some_property)
 
 
 def some_definition_to_jsonable(
@@ -205,6 +229,10 @@ def some_definition_to_jsonable(
     return res
 
 
+# Timeout in seconds of both connecting and reading, or a tuple of the two
+_Timeout = Union[float, Tuple[Optional[float], Optional[float]]]
+
+
 class RemoteCaller:
     """Executes the remote calls to the server."""
 
@@ -212,24 +240,116 @@ class RemoteCaller:
         self,
         url_prefix: str,
         auth: Optional[requests.auth.AuthBase] = None,
-        session: Optional[requests.Session] = None) -> None:
+        session: Optional[requests.Session] = None,
+        pool_size: int = 10,
+        max_connections_per_host: int = 10,
+        max_retries: int = 0,
+        backoff_factor: float = 0.0,
+        connect_timeout: Optional[float] = None,
+        read_timeout: Optional[float] = None,
+        session_factory: Optional[Callable[[], requests.Session]] = None) -> None:
+        """
+        Initializes with the given values.
+
+        If the session is not given, the caller is thread-safe: each thread calls through its own session and all
+        the sessions share a single thread-safe pool of the connections. The connections are kept alive in the pool
+        between the calls. The session property then gives the session of the current thread.
+
+        :param url_prefix: prefix of the URLs of the remote calls
+        :param auth: authentication of the calls
+        :param session:
+            session to be used for all the calls instead of the sessions of the threads.
+            The pool and the retries are not applied to it, and it is up to you whether it is safe to share.
+        :param pool_size: number of the hosts whose connections are pooled
+        :param max_connections_per_host: maximum number of the pooled connections to a single host
+        :param max_retries:
+            maximum number of the retries on connection errors and on the statuses 502, 503 and 504.
+            Non-idempotent methods such as POST are not retried. The read errors are not retried so that
+            the read timeouts are raised as requests.ReadTimeout.
+        :param backoff_factor: the retries wait backoff_factor * 2 ** (retry - 1) seconds
+        :param connect_timeout: timeout in seconds for establishing a connection; None means no timeout
+        :param read_timeout: timeout in seconds between the bytes received from the server; None means no timeout
+        :param session_factory:
+            creates the session of each thread, e.g., to set the headers or the hooks of all the calls.
+            The pool and the retries are mounted on the created sessions.
+        """
         self.url_prefix = url_prefix
         self.auth = auth
-        self.session = session
+        self._given_session = session
+        self.session_factory = session_factory if session_factory is not None else requests.Session
+        self.timeout = (connect_timeout, read_timeout)  # type: _Timeout
+
+        self._adapter = requests.adapters.HTTPAdapter(
+            pool_connections=pool_size,
+            pool_maxsize=max_connections_per_host,
+            max_retries=urllib3.util.retry.Retry(
+                total=max_retries,
+                read=False,
+                backoff_factor=backoff_factor,
+                status_forcelist=[502, 503, 504],
+                raise_on_status=False))
+        self._local = threading.local()
+
+        # Sessions of the threads so that they can be closed; the sessions of the finished threads are dropped.
+        self._sessions = weakref.WeakSet()  # type: weakref.WeakSet[requests.Session]
+        self._sessions_lock = threading.Lock()
+
+    def close(self) -> None:
+        """Closes the sessions of the threads and the pooled connections."""
+        with self._sessions_lock:
+            sessions = list(self._sessions)
+            self._sessions.clear()
+
+        for session in sessions:
+            session.close()
+
+        self._adapter.close()
+
+    @property
+    def session(self) -> requests.Session:
+        """
+        Returns the session given to the constructor or, if none was given, the session of the current thread.
+
+        The changes to the session of a thread do not apply to the other threads; configure the sessions of all
+        the threads with the session_factory instead.
+        """
+        return self._session()
 
-        if not self.session:
-            self.session = requests.Session()
-            self.session.auth = self.auth
+    @session.setter
+    def session(self, value: Optional[requests.Session]) -> None:
+        """Sets the session to be used for all the calls; None switches back to the sessions of the threads."""
+        self._given_session = value
+
+    def _session(self) -> requests.Session:
+        """Returns the session of the current thread, creates it on the first call in the thread."""
+        if self._given_session is not None:
+            return self._given_session
+
+        session = getattr(self._local, 'session', None)  # type: Optional[requests.Session]
+        if session is None:
+            session = self.session_factory()
+            if self.auth is not None:
+                session.auth = self.auth
+            session.mount('http://', self._adapter)
+            session.mount('https://', self._adapter)
+            self._local.session = session
+
+            with self._sessions_lock:
+                self._sessions.add(session)
+
+        return session
 
     def do_something(
             self,
             some_parameter: 'SomeDefinition',
-            another_parameter: Optional[str] = None) -> MutableMapping[str, Any]:
+            another_parameter: Optional[str] = None,
+            request_timeout: Optional[_Timeout] = None) -> MutableMapping[str, Any]:
         """
         Send a post request to /do.something.
 
         :param some_parameter: some test parameter
         :param another_parameter: another test parameter, this time not required and in query
+        :param request_timeout: overrides the connect and read timeouts of the caller for this call
 
         :return: Success
         """
@@ -240,16 +360,14 @@ class RemoteCaller:
         if another_parameter is not None:
             params['another.parameter'] = another_parameter
 
-        data = to_jsonable(
-            some_parameter,
-            expected=[SomeDefinition])
-
+        data = some_definition_to_jsonable(some_parameter)
 
-        resp = self.session.request(
+        resp = self._session().request(
             method='post',
             url=url,
             params=params,
             json=data,
+            timeout=self.timeout if request_timeout is None else request_timeout,
         )
 
         with contextlib.closing(resp):
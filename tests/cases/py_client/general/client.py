@@ -7,10 +7,44 @@
 
 import contextlib
 import json
-from typing import Any, BinaryIO, Dict, List, MutableMapping, Optional, cast
+import threading
+import weakref
+from typing import Any, BinaryIO, Callable, Dict, List, MutableMapping, Optional, Tuple, Union, cast
 
 import requests
+import requests.adapters
 import requests.auth
+import urllib3
+import urllib3.util.retry
+
+
+class _Mismatch(ValueError):
+    """Signals that a JSON-ed object does not conform to the expected type."""
+
+    def __init__(self, expected: str, got: Any, path: str) -> None:
+        """
+        Initializes with the given values.
+
+        The decoders do not track the paths to the objects. The path is relative to the decoder which
+        raised the error and the enclosing decoders prepend their paths while the error propagates.
+
+        :param expected: description of the expected type
+        :param got: the mismatched object
+        :param path: path to the mismatched object
+        """
+        super().__init__()
+        self.expected = expected
+        self.got = type(got)
+        self.segments = [path]
+
+    def within(self, path: str) -> '_Mismatch':
+        """Prepends the path to the enclosing object."""
+        self.segments.append(path)
+        return self
+
+    def __str__(self) -> str:
+        return 'Expected {} at {!r}, but got {}.'.format(
+            self.expected, ''.join(reversed(self.segments)), self.got)
 
 
 def from_obj(obj: Any, expected: List[type], path: str = '') -> Any:
@@ -225,44 +259,34 @@ def product_from_obj(obj: Any, path: str = "") -> Product:
     :return: parsed instance of Product
     """
     if not isinstance(obj, dict):
-        raise ValueError('Expected a dict at path {}, but got: {}'.format(path, type(obj)))
+        raise _Mismatch('a dict', obj, path)
 
-    for key in obj:
-        if not isinstance(key, str):
-            raise ValueError(
-                'Expected a key of type str at path {}, but got: {}'.format(path, type(key)))
+    obj_product_id = obj['product_id']  # type: str
+    if not isinstance(obj_product_id, str):
+        raise _Mismatch('a str', obj_product_id, path + '.product_id')
 
-    product_id_from_obj = from_obj(
-        obj['product_id'],
-        expected=[str],
-        path=path + '.product_id')  # type: str
+    obj_desc = obj['desc']  # type: str
+    if not isinstance(obj_desc, str):
+        raise _Mismatch('a str', obj_desc, path + '.desc')
 
-    desc_from_obj = from_obj(
-        obj['desc'],
-        expected=[str],
-        path=path + '.desc')  # type: str
+    obj_display_name = obj['display_name']  # type: str
+    if not isinstance(obj_display_name, str):
+        raise _Mismatch('a str', obj_display_name, path + '.display_name')
 
-    display_name_from_obj = from_obj(
-        obj['display_name'],
-        expected=[str],
-        path=path + '.display_name')  # type: str
+    obj_capacity = obj['capacity']  # type: int
+    if not isinstance(obj_capacity, int):
+        raise _Mismatch('an int', obj_capacity, path + '.capacity')
 
-    capacity_from_obj = from_obj(
-        obj['capacity'],
-        expected=[int],
-        path=path + '.capacity')  # type: int
-
-    image_from_obj = from_obj(
-        obj['image'],
-        expected=[str],
-        path=path + '.image')  # type: str
+    obj_image = obj['image']  # type: str
+    if not isinstance(obj_image, str):
+        raise _Mismatch('a str', obj_image, path + '.image')
 
     return Product(
-        product_id=product_id_from_obj,
-        desc=desc_from_obj,
-        display_name=display_name_from_obj,
-        capacity=capacity_from_obj,
-        image=image_from_obj)
+        product_id=obj_product_id,
+        desc=obj_desc,
+        display_name=obj_display_name,
+        capacity=obj_capacity,
+        image=obj_image)
 
 
 def product_to_jsonable(
@@ -322,20 +346,15 @@ def product_list_from_obj(obj: Any, path: str = "") -> ProductList:
     :return: parsed instance of ProductList
     """
     if not isinstance(obj, dict):
-        raise ValueError('Expected a dict at path {}, but got: {}'.format(path, type(obj)))
+        raise _Mismatch('a dict', obj, path)
 
-    for key in obj:
-        if not isinstance(key, str):
-            raise ValueError(
-                'Expected a key of type str at path {}, but got: {}'.format(path, type(key)))
-
-    products_from_obj = from_obj(
-        obj['products'],
-        expected=[list, Product],
-        path=path + '.products')  # type: List['Product']
+    try:
+        obj_products = _decode_list_of_product(obj['products'])  # type: List['Product']
+    except _Mismatch as err:
+        raise err.within(path + '.products')
 
     return ProductList(
-        products=products_from_obj)
+        products=obj_products)
 
 
 def product_list_to_jsonable(
@@ -350,10 +369,7 @@ def product_list_to_jsonable(
     """
     res = dict()  # type: Dict[str, Any]
 
-    res['products'] = to_jsonable(
-        product_list.products,
-        expected=[list, Product],
-        path='{}.products'.format(path))
+    res['products'] = _encode_list_of_product(product_list.products)
 
     return res
 
@@ -420,68 +436,50 @@ def price_estimate_from_obj(obj: Any, path: str = "") -> PriceEstimate:
     :return: parsed instance of PriceEstimate
     """
     if not isinstance(obj, dict):
-        raise ValueError('Expected a dict at path {}, but got: {}'.format(path, type(obj)))
-
-    for key in obj:
-        if not isinstance(key, str):
-            raise ValueError(
-                'Expected a key of type str at path {}, but got: {}'.format(path, type(key)))
-
-    product_id_from_obj = from_obj(
-        obj['product_id'],
-        expected=[str],
-        path=path + '.product_id')  # type: str
-
-    currency_code_from_obj = from_obj(
-        obj['currency_code'],
-        expected=[str],
-        path=path + '.currency_code')  # type: str
-
-    display_name_from_obj = from_obj(
-        obj['display_name'],
-        expected=[str],
-        path=path + '.display_name')  # type: str
-
-    estimate_from_obj = from_obj(
-        obj['estimate'],
-        expected=[str],
-        path=path + '.estimate')  # type: str
-
-    obj_low_estimate = obj.get('low_estimate', None)
-    if obj_low_estimate is not None:
-        low_estimate_from_obj = from_obj(
-            obj_low_estimate,
-            expected=[float],
-            path=path + '.low_estimate')  # type: Optional[float]
-    else:
-        low_estimate_from_obj = None
-
-    obj_high_estimate = obj.get('high_estimate', None)
-    if obj_high_estimate is not None:
-        high_estimate_from_obj = from_obj(
-            obj_high_estimate,
-            expected=[float],
-            path=path + '.high_estimate')  # type: Optional[float]
-    else:
-        high_estimate_from_obj = None
-
-    obj_surge_multiplier = obj.get('surge_multiplier', None)
-    if obj_surge_multiplier is not None:
-        surge_multiplier_from_obj = from_obj(
-            obj_surge_multiplier,
-            expected=[float],
-            path=path + '.surge_multiplier')  # type: Optional[float]
-    else:
-        surge_multiplier_from_obj = None
+        raise _Mismatch('a dict', obj, path)
+
+    obj_product_id = obj['product_id']  # type: str
+    if not isinstance(obj_product_id, str):
+        raise _Mismatch('a str', obj_product_id, path + '.product_id')
+
+    obj_currency_code = obj['currency_code']  # type: str
+    if not isinstance(obj_currency_code, str):
+        raise _Mismatch('a str', obj_currency_code, path + '.currency_code')
+
+    obj_display_name = obj['display_name']  # type: str
+    if not isinstance(obj_display_name, str):
+        raise _Mismatch('a str', obj_display_name, path + '.display_name')
+
+    obj_estimate = obj['estimate']  # type: str
+    if not isinstance(obj_estimate, str):
+        raise _Mismatch('a str', obj_estimate, path + '.estimate')
+
+    obj_low_estimate = obj.get('low_estimate', None)  # type: Optional[float]
+    if isinstance(obj_low_estimate, int):
+        obj_low_estimate = float(obj_low_estimate)
+    elif obj_low_estimate is not None and not isinstance(obj_low_estimate, float):
+        raise _Mismatch('an int or a float', obj_low_estimate, path + '.low_estimate')
+
+    obj_high_estimate = obj.get('high_estimate', None)  # type: Optional[float]
+    if isinstance(obj_high_estimate, int):
+        obj_high_estimate = float(obj_high_estimate)
+    elif obj_high_estimate is not None and not isinstance(obj_high_estimate, float):
+        raise _Mismatch('an int or a float', obj_high_estimate, path + '.high_estimate')
+
+    obj_surge_multiplier = obj.get('surge_multiplier', None)  # type: Optional[float]
+    if isinstance(obj_surge_multiplier, int):
+        obj_surge_multiplier = float(obj_surge_multiplier)
+    elif obj_surge_multiplier is not None and not isinstance(obj_surge_multiplier, float):
+        raise _Mismatch('an int or a float', obj_surge_multiplier, path + '.surge_multiplier')
 
     return PriceEstimate(
-        product_id=product_id_from_obj,
-        currency_code=currency_code_from_obj,
-        display_name=display_name_from_obj,
-        estimate=estimate_from_obj,
-        low_estimate=low_estimate_from_obj,
-        high_estimate=high_estimate_from_obj,
-        surge_multiplier=surge_multiplier_from_obj)
+        product_id=obj_product_id,
+        currency_code=obj_currency_code,
+        display_name=obj_display_name,
+        estimate=obj_estimate,
+        low_estimate=obj_low_estimate,
+        high_estimate=obj_high_estimate,
+        surge_multiplier=obj_surge_multiplier)
 
 
 def price_estimate_to_jsonable(
@@ -566,52 +564,34 @@ def profile_from_obj(obj: Any, path: str = "") -> Profile:
     :return: parsed instance of Profile
     """
     if not isinstance(obj, dict):
-        raise ValueError('Expected a dict at path {}, but got: {}'.format(path, type(obj)))
+        raise _Mismatch('a dict', obj, path)
 
-    for key in obj:
-        if not isinstance(key, str):
-            raise ValueError(
-                'Expected a key of type str at path {}, but got: {}'.format(path, type(key)))
-
-    last_name_from_obj = from_obj(
-        obj['last_name'],
-        expected=[str],
-        path=path + '.last_name')  # type: str
-
-    email_from_obj = from_obj(
-        obj['email'],
-        expected=[str],
-        path=path + '.email')  # type: str
-
-    picture_from_obj = from_obj(
-        obj['picture'],
-        expected=[str],
-        path=path + '.picture')  # type: str
-
-    obj_first_name = obj.get('first_name', None)
-    if obj_first_name is not None:
-        first_name_from_obj = from_obj(
-            obj_first_name,
-            expected=[str],
-            path=path + '.first_name')  # type: Optional[str]
-    else:
-        first_name_from_obj = None
-
-    obj_promo_code = obj.get('promo_code', None)
-    if obj_promo_code is not None:
-        promo_code_from_obj = from_obj(
-            obj_promo_code,
-            expected=[str],
-            path=path + '.promo_code')  # type: Optional[str]
-    else:
-        promo_code_from_obj = None
+    obj_last_name = obj['last_name']  # type: str
+    if not isinstance(obj_last_name, str):
+        raise _Mismatch('a str', obj_last_name, path + '.last_name')
+
+    obj_email = obj['email']  # type: str
+    if not isinstance(obj_email, str):
+        raise _Mismatch('a str', obj_email, path + '.email')
+
+    obj_picture = obj['picture']  # type: str
+    if not isinstance(obj_picture, str):
+        raise _Mismatch('a str', obj_picture, path + '.picture')
+
+    obj_first_name = obj.get('first_name', None)  # type: Optional[str]
+    if obj_first_name is not None and not isinstance(obj_first_name, str):
+        raise _Mismatch('a str', obj_first_name, path + '.first_name')
+
+    obj_promo_code = obj.get('promo_code', None)  # type: Optional[str]
+    if obj_promo_code is not None and not isinstance(obj_promo_code, str):
+        raise _Mismatch('a str', obj_promo_code, path + '.promo_code')
 
     return Profile(
-        last_name=last_name_from_obj,
-        email=email_from_obj,
-        picture=picture_from_obj,
-        first_name=first_name_from_obj,
-        promo_code=promo_code_from_obj)
+        last_name=obj_last_name,
+        email=obj_email,
+        picture=obj_picture,
+        first_name=obj_first_name,
+        promo_code=obj_promo_code)
 
 
 def profile_to_jsonable(
@@ -673,20 +653,14 @@ def activity_from_obj(obj: Any, path: str = "") -> Activity:
     :return: parsed instance of Activity
     """
     if not isinstance(obj, dict):
-        raise ValueError('Expected a dict at path {}, but got: {}'.format(path, type(obj)))
-
-    for key in obj:
-        if not isinstance(key, str):
-            raise ValueError(
-                'Expected a key of type str at path {}, but got: {}'.format(path, type(key)))
+        raise _Mismatch('a dict', obj, path)
 
-    uuid_from_obj = from_obj(
-        obj['uuid'],
-        expected=[str],
-        path=path + '.uuid')  # type: str
+    obj_uuid = obj['uuid']  # type: str
+    if not isinstance(obj_uuid, str):
+        raise _Mismatch('a str', obj_uuid, path + '.uuid')
 
     return Activity(
-        uuid=uuid_from_obj)
+        uuid=obj_uuid)
 
 
 def activity_to_jsonable(
@@ -752,38 +726,30 @@ def activities_from_obj(obj: Any, path: str = "") -> Activities:
     :return: parsed instance of Activities
     """
     if not isinstance(obj, dict):
-        raise ValueError('Expected a dict at path {}, but got: {}'.format(path, type(obj)))
+        raise _Mismatch('a dict', obj, path)
 
-    for key in obj:
-        if not isinstance(key, str):
-            raise ValueError(
-                'Expected a key of type str at path {}, but got: {}'.format(path, type(key)))
-
-    offset_from_obj = from_obj(
-        obj['offset'],
-        expected=[int],
-        path=path + '.offset')  # type: int
+    obj_offset = obj['offset']  # type: int
+    if not isinstance(obj_offset, int):
+        raise _Mismatch('an int', obj_offset, path + '.offset')
 
-    limit_from_obj = from_obj(
-        obj['limit'],
-        expected=[int],
-        path=path + '.limit')  # type: int
+    obj_limit = obj['limit']  # type: int
+    if not isinstance(obj_limit, int):
+        raise _Mismatch('an int', obj_limit, path + '.limit')
 
-    count_from_obj = from_obj(
-        obj['count'],
-        expected=[int],
-        path=path + '.count')  # type: int
+    obj_count = obj['count']  # type: int
+    if not isinstance(obj_count, int):
+        raise _Mismatch('an int', obj_count, path + '.count')
 
-    history_from_obj = from_obj(
-        obj['history'],
-        expected=[list, Activity],
-        path=path + '.history')  # type: List['Activity']
+    try:
+        obj_history = _decode_list_of_activity(obj['history'])  # type: List['Activity']
+    except _Mismatch as err:
+        raise err.within(path + '.history')
 
     return Activities(
-        offset=offset_from_obj,
-        limit=limit_from_obj,
-        count=count_from_obj,
-        history=history_from_obj)
+        offset=obj_offset,
+        limit=obj_limit,
+        count=obj_count,
+        history=obj_history)
 
 
 def activities_to_jsonable(
@@ -804,14 +770,98 @@ def activities_to_jsonable(
 
     res['count'] = activities.count
 
-    res['history'] = to_jsonable(
-        activities.history,
-        expected=[list, Activity],
-        path='{}.history'.format(path))
+    res['history'] = _encode_list_of_activity(activities.history)
 
     return res
 
 
+def _decode_list_of_product(obj: Any) -> List['Product']:
+    """
+    Checks and converts the JSON-ed object to List['Product'].
+
+    :param obj: to be converted
+    :return: the converted object
+    """
+    if not isinstance(obj, list):
+        raise _Mismatch('a list', obj, '')
+
+    result = []  # type: List['Product']
+    try:
+        for item in obj:
+            result.append(product_from_obj(item))
+    except _Mismatch as err:
+        raise err.within('[{}]'.format(len(result)))
+
+    return result
+
+
+def _decode_list_of_activity(obj: Any) -> List['Activity']:
+    """
+    Checks and converts the JSON-ed object to List['Activity'].
+
+    :param obj: to be converted
+    :return: the converted object
+    """
+    if not isinstance(obj, list):
+        raise _Mismatch('a list', obj, '')
+
+    result = []  # type: List['Activity']
+    try:
+        for item in obj:
+            result.append(activity_from_obj(item))
+    except _Mismatch as err:
+        raise err.within('[{}]'.format(len(result)))
+
+    return result
+
+
+def _decode_dict_of_product(obj: Any) -> Dict[str, 'Product']:
+    """
+    Checks and converts the JSON-ed object to Dict[str, 'Product'].
+
+    :param obj: to be converted
+    :return: the converted object
+    """
+    if not isinstance(obj, dict):
+        raise _Mismatch('a dict', obj, '')
+
+    result = dict()  # type: Dict[str, 'Product']
+    for key, value in obj.items():
+        if not isinstance(key, str):
+            raise _Mismatch('a key of type str', key, '')
+
+        try:
+            result[key] = product_from_obj(value)
+        except _Mismatch as err:
+            raise err.within('[{!r}]'.format(key))
+
+    return result
+
+
+def _encode_list_of_product(obj: List['Product']) -> List[Any]:
+    """
+    Converts the list to a JSON-able representation.
+
+    :param obj: to be converted
+    :return: JSON-able representation
+    """
+    return [product_to_jsonable(item) for item in obj]
+
+
+def _encode_list_of_activity(obj: List['Activity']) -> List[Any]:
+    """
+    Converts the list to a JSON-able representation.
+
+    :param obj: to be converted
+    :return: JSON-able representation
+    """
+    return [activity_to_jsonable(item) for item in obj]
+
+
+# Timeout in seconds of both connecting and reading, or a tuple of the two
+_Timeout = Union[float, Tuple[Optional[float], Optional[float]]]
+
+
 class RemoteCaller:
     """Executes the remote calls to the server."""
 
@@ -819,24 +869,116 @@ class RemoteCaller:
         self,
         url_prefix: str,
         auth: Optional[requests.auth.AuthBase] = None,
-        session: Optional[requests.Session] = None) -> None:
+        session: Optional[requests.Session] = None,
+        pool_size: int = 10,
+        max_connections_per_host: int = 10,
+        max_retries: int = 0,
+        backoff_factor: float = 0.0,
+        connect_timeout: Optional[float] = None,
+        read_timeout: Optional[float] = None,
+        session_factory: Optional[Callable[[], requests.Session]] = None) -> None:
+        """
+        Initializes with the given values.
+
+        If the session is not given, the caller is thread-safe: each thread calls through its own session and all
+        the sessions share a single thread-safe pool of the connections. The connections are kept alive in the pool
+        between the calls. The session property then gives the session of the current thread.
+
+        :param url_prefix: prefix of the URLs of the remote calls
+        :param auth: authentication of the calls
+        :param session:
+            session to be used for all the calls instead of the sessions of the threads.
+            The pool and the retries are not applied to it, and it is up to you whether it is safe to share.
+        :param pool_size: number of the hosts whose connections are pooled
+        :param max_connections_per_host: maximum number of the pooled connections to a single host
+        :param max_retries:
+            maximum number of the retries on connection errors and on the statuses 502, 503 and 504.
+            Non-idempotent methods such as POST are not retried. The read errors are not retried so that
+            the read timeouts are raised as requests.ReadTimeout.
+        :param backoff_factor: the retries wait backoff_factor * 2 ** (retry - 1) seconds
+        :param connect_timeout: timeout in seconds for establishing a connection; None means no timeout
+        :param read_timeout: timeout in seconds between the bytes received from the server; None means no timeout
+        :param session_factory:
+            creates the session of each thread, e.g., to set the headers or the hooks of all the calls.
+            The pool and the retries are mounted on the created sessions.
+        """
         self.url_prefix = url_prefix
         self.auth = auth
-        self.session = session
+        self._given_session = session
+        self.session_factory = session_factory if session_factory is not None else requests.Session
+        self.timeout = (connect_timeout, read_timeout)  # type: _Timeout
+
+        self._adapter = requests.adapters.HTTPAdapter(
+            pool_connections=pool_size,
+            pool_maxsize=max_connections_per_host,
+            max_retries=urllib3.util.retry.Retry(
+                total=max_retries,
+                read=False,
+                backoff_factor=backoff_factor,
+                status_forcelist=[502, 503, 504],
+                raise_on_status=False))
+        self._local = threading.local()
+
+        # Sessions of the threads so that they can be closed; the sessions of the finished threads are dropped.
+        self._sessions = weakref.WeakSet()  # type: weakref.WeakSet[requests.Session]
+        self._sessions_lock = threading.Lock()
+
+    def close(self) -> None:
+        """Closes the sessions of the threads and the pooled connections."""
+        with self._sessions_lock:
+            sessions = list(self._sessions)
+            self._sessions.clear()
+
+        for session in sessions:
+            session.close()
+
+        self._adapter.close()
+
+    @property
+    def session(self) -> requests.Session:
+        """
+        Returns the session given to the constructor or, if none was given, the session of the current thread.
+
+        The changes to the session of a thread do not apply to the other threads; configure the sessions of all
+        the threads with the session_factory instead.
+        """
+        return self._session()
 
-        if not self.session:
-            self.session = requests.Session()
-            self.session.auth = self.auth
+    @session.setter
+    def session(self, value: Optional[requests.Session]) -> None:
+        """Sets the session to be used for all the calls; None switches back to the sessions of the threads."""
+        self._given_session = value
+
+    def _session(self) -> requests.Session:
+        """Returns the session of the current thread, creates it on the first call in the thread."""
+        if self._given_session is not None:
+            return self._given_session
+
+        session = getattr(self._local, 'session', None)  # type: Optional[requests.Session]
+        if session is None:
+            session = self.session_factory()
+            if self.auth is not None:
+                session.auth = self.auth
+            session.mount('http://', self._adapter)
+            session.mount('https://', self._adapter)
+            self._local.session = session
+
+            with self._sessions_lock:
+                self._sessions.add(session)
+
+        return session
 
     def products(
             self,
             latitude: float,
-            longitude: float) -> Dict[str, 'Product']:
+            longitude: float,
+            request_timeout: Optional[_Timeout] = None) -> Dict[str, 'Product']:
         """
         The Products endpoint returns information about the Uber products offered at a given location.
 
         :param latitude: Latitude component of location.
         :param longitude: Longitude component of location.
+        :param request_timeout: overrides the connect and read timeouts of the caller for this call
 
         :return: An array of products
         """
@@ -848,17 +990,16 @@ class RemoteCaller:
 
         params['longitude'] = json.dumps(longitude)
 
-        resp = self.session.request(
+        resp = self._session().request(
             method='get',
             url=url,
             params=params,
+            timeout=self.timeout if request_timeout is None else request_timeout,
         )
 
         with contextlib.closing(resp):
             resp.raise_for_status()
-            return from_obj(
-                obj=resp.json(),
-                expected=[dict, Product])
+            return _decode_dict_of_product(resp.json())
 
     def estimates_price(
             self,
@@ -866,7 +1007,8 @@ class RemoteCaller:
             start_longitude: float,
             end_latitude: float,
             end_longitude: float,
-            max_lines: Optional[int] = None) -> List['Product']:
+            max_lines: Optional[int] = None,
+            request_timeout: Optional[_Timeout] = None) -> List['Product']:
         """
         The Price Estimates endpoint returns an estimated price range for each product offered at a given
         location. The price estimate is provided as a formatted string with the full price range and the localized
@@ -877,6 +1019,7 @@ class RemoteCaller:
         :param end_latitude: Latitude component of end location.
         :param end_longitude: Longitude component of end location.
         :param max_lines: A maximum number of lines in the produced json.
+        :param request_timeout: overrides the connect and read timeouts of the caller for this call
 
         :return: An array of price estimates by product
         """
@@ -896,24 +1039,24 @@ class RemoteCaller:
         if max_lines is not None:
             params['max_lines'] = json.dumps(max_lines)
 
-        resp = self.session.request(
+        resp = self._session().request(
             method='get',
             url=url,
             params=params,
+            timeout=self.timeout if request_timeout is None else request_timeout,
         )
 
         with contextlib.closing(resp):
             resp.raise_for_status()
-            return from_obj(
-                obj=resp.json(),
-                expected=[list, Product])
+            return _decode_list_of_product(resp.json())
 
     def estimates_time(
             self,
             start_latitude: float,
             start_longitude: float,
             customer_uuid: Optional[str] = None,
-            product_id: Optional[str] = None) -> Dict[str, 'Product']:
+            product_id: Optional[str] = None,
+            request_timeout: Optional[_Timeout] = None) -> Dict[str, 'Product']:
         """
         The Time Estimates endpoint returns ETAs for all products.
 
@@ -921,6 +1064,7 @@ class RemoteCaller:
         :param start_longitude: Longitude component of start location.
         :param customer_uuid: Unique customer identifier to be used for experience customization.
         :param product_id: Unique identifier representing a specific product for a given latitude & longitude.
+        :param request_timeout: overrides the connect and read timeouts of the caller for this call
 
         :return: An array of products
         """
@@ -938,58 +1082,57 @@ class RemoteCaller:
         if product_id is not None:
             params['product_id'] = product_id
 
-        resp = self.session.request(
+        resp = self._session().request(
             method='get',
             url=url,
             params=params,
+            timeout=self.timeout if request_timeout is None else request_timeout,
         )
 
         with contextlib.closing(resp):
             resp.raise_for_status()
-            return from_obj(
-                obj=resp.json(),
-                expected=[dict, Product])
+            return _decode_dict_of_product(resp.json())
 
     def update_me(
             self,
-            update_user: 'Profile') -> 'Profile':
+            update_user: 'Profile',
+            request_timeout: Optional[_Timeout] = None) -> 'Profile':
         """
         Update an User Profile.
 
         :param update_user: profile of a user to update
+        :param request_timeout: overrides the connect and read timeouts of the caller for this call
 
         :return: Previous profile information for a user
         """
         url = self.url_prefix + '/me'
 
-        data = to_jsonable(
-            update_user,
-            expected=[Profile])
-
+        data = profile_to_jsonable(update_user)
 
-        resp = self.session.request(
+        resp = self._session().request(
             method='patch',
             url=url,
             json=data,
+            timeout=self.timeout if request_timeout is None else request_timeout,
         )
 
         with contextlib.closing(resp):
             resp.raise_for_status()
-            return from_obj(
-                obj=resp.json(),
-                expected=[Profile])
+            return profile_from_obj(resp.json())
 
     def upload_infos(
             self,
             user_id: str,
             profile_picture: BinaryIO,
-            birthday: Optional[str] = None) -> bytes:
+            birthday: Optional[str] = None,
+            request_timeout: Optional[_Timeout] = None) -> bytes:
         """
         Upload information about an User.
 
         :param user_id: identifies a user.
         :param profile_picture: contains the user image encoded in JPEG as a multi-value field.
         :param birthday: is the user's birth date.
+        :param request_timeout: overrides the connect and read timeouts of the caller for this call
 
         :return: Confirms that the information was uploaded.
         """
@@ -1006,11 +1149,12 @@ class RemoteCaller:
 
         files['profile_picture'] = profile_picture
 
-        resp = self.session.request(
+        resp = self._session().request(
             method='patch',
             url=url,
             data=data,
             files=files,
+            timeout=self.timeout if request_timeout is None else request_timeout,
         )
 
         with contextlib.closing(resp):
@@ -1020,7 +1164,8 @@ class RemoteCaller:
     def history(
             self,
             offset: Optional[int] = None,
-            limit: Optional[int] = None) -> 'Activities':
+            limit: Optional[int] = None,
+            request_timeout: Optional[_Timeout] = None) -> 'Activities':
         """
         The User Activity endpoint returns data about a user's lifetime activity with Uber. The response will
         include pickup locations and times, dropoff locations and times, the distance of past requests, and
@@ -1028,6 +1173,7 @@ class RemoteCaller:
 
         :param offset: Offset the list of returned results by this amount. Default is zero.
         :param limit: Number of items to retrieve. Default is 5, maximum is 100.
+        :param request_timeout: overrides the connect and read timeouts of the caller for this call
 
         :return: History information for the given user
         """
@@ -1041,17 +1187,16 @@ class RemoteCaller:
         if limit is not None:
             params['limit'] = json.dumps(limit)
 
-        resp = self.session.request(
+        resp = self._session().request(
             method='get',
             url=url,
             params=params,
+            timeout=self.timeout if request_timeout is None else request_timeout,
         )
 
         with contextlib.closing(resp):
             resp.raise_for_status()
-            return from_obj(
-                obj=resp.json(),
-                expected=[Activities])
+            return activities_from_obj(resp.json())
 
 
 # Automatically generated file by swagger_to. DO NOT EDIT OR APPEND ANYTHING!
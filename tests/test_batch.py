@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""Test the batch generation."""
+import contextlib
+import io
+import json
+import os
+import pathlib
+import tempfile
+import unittest
+
+import swagger_to.batch
+import swagger_to.bin.swagger_to_batch
+
+# pylint: disable=missing-docstring
+
+
+class TestBatch(unittest.TestCase):
+    def setUp(self):
+        self.cases_dir = pathlib.Path(os.path.realpath(__file__)).parent / "cases"
+        self.tmp_dir = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.outdir = pathlib.Path(self.tmp_dir.name)
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def write_manifest(self, jobs) -> pathlib.Path:
+        pth = self.outdir / "manifest.json"
+        pth.write_text(json.dumps({"jobs": jobs}))
+        return pth
+
+    def test_batch(self):
+        manifest_path = self.write_manifest(
+            jobs=[{
+                "swagger_path": str(self.cases_dir / "go_server" / "general" / "swagger.yaml"),
+                "target": "go_server",
+                "output": "go",
+                "no_samples": True
+            }, {
+                "swagger_path": str(self.cases_dir / "py_client" / "general" / "swagger.yaml"),
+                "target": "py_client",
+                "output": "py/client.py"
+            }, {
+                "swagger_path": str(self.cases_dir / "py_client" / "general" / "swagger.yaml"),
+                "target": "elm_client",
+                "output": "elm",
+                "no_samples": True
+            }])
+
+        stdout = io.StringIO()
+        with contextlib.redirect_stdout(stdout):
+            retcode = swagger_to.bin.swagger_to_batch.main(argv=['--manifest', str(manifest_path), '--workers', '2'])
+
+        self.assertEqual(0, retcode, stdout.getvalue())
+        self.assertIn("Executed 3 of 3 job(s)", stdout.getvalue())
+
+        for name in ['types.go', 'routes.go', 'handler.go', 'jsonschemas.go']:
+            self.assertEqual((self.cases_dir / "go_server" / "general" / name).read_text(),
+                             (self.outdir / "go" / name).read_text())
+
+        self.assertFalse((self.outdir / "go" / "handler_impl.go.sample").exists())
+
+        self.assertEqual((self.cases_dir / "py_client" / "general" / "client.py").read_text(),
+                         (self.outdir / "py" / "client.py").read_text())
+
+        self.assertTrue((self.outdir / "elm" / "Client.elm").exists())
+
+    def test_go_server_options(self):
+        case_dir = self.cases_dir / "go_server_with_options" / "route_benchmarks"
+        manifest_path = self.write_manifest(jobs=[{
+            "swagger_path": str(case_dir / "swagger.yaml"),
+            "target": "go_server",
+            "output": "go",
+            "go_server_options": {
+                "route_benchmarks": True
+            }
+        }])
+
+        jobs, errs = swagger_to.batch.parse_manifest(path=manifest_path)
+        self.assertEqual([], errs)
+
+        results = swagger_to.batch.run(jobs=jobs, max_workers=1)
+        self.assertEqual([None], [result.error for result in results])
+
+        for name in ['types.go', 'routes.go', 'handler.go', 'jsonschemas.go', 'routes_bench_test.go']:
+            self.assertEqual((case_dir / name).read_text(), (self.outdir / "go" / name).read_text(), name)
+
+    def test_invalid_go_server_options(self):
+        manifest_path = self.write_manifest(jobs=[{
+            "swagger_path": "swagger.yaml",
+            "target": "py_client",
+            "output": "client.py",
+            "go_server_options": {
+                "typed_validation": True
+            }
+        }, {
+            "swagger_path": "swagger.yaml",
+            "target": "go_server",
+            "output": "go",
+            "go_server_options": {
+                "typed_validation": "yes"
+            }
+        }, {
+            "swagger_path": "swagger.yaml",
+            "target": "go_server",
+            "output": "go",
+            "go_server_options": {
+                "no_such_option": True
+            }
+        }])
+
+        jobs, errs = swagger_to.batch.parse_manifest(path=manifest_path)
+
+        self.assertEqual([], jobs)
+        self.assertEqual([
+            'job 0: the property "go_server_options" applies only to the target go_server',
+            'job 1: expected "go_server_options" to be an object of booleans',
+            'job 2: unexpected Go server option(s) in: {"no_such_option": true}'
+        ], errs)
+
+    def test_fail_fast(self):
+        invalid_path = self.cases_dir / "parsing" / "info_description_not_string" / "swagger.yaml"
+        valid_path = self.cases_dir / "py_client" / "general" / "swagger.yaml"
+
+        jobs = [
+            swagger_to.batch.Job(swagger_path=invalid_path, target='py_client', output=self.outdir / 'invalid.py'),
+            swagger_to.batch.Job(swagger_path=invalid_path, target='elm_client', output=self.outdir / 'invalid'),
+            swagger_to.batch.Job(swagger_path=valid_path, target='py_client', output=self.outdir / 'valid.py'),
+        ]
+
+        results = swagger_to.batch.run(jobs=jobs, max_workers=1, fail_fast=True)
+
+        # The jobs after the failure are not started.
+        self.assertLessEqual(len(results), 2)
+        self.assertIsNotNone(results[0].error)
+        self.assertIn("Failed to parse the Swagger file", results[0].error)
+
+        results = swagger_to.batch.run(jobs=jobs, max_workers=1, fail_fast=False, force=True)
+        self.assertEqual(3, len(results))
+        self.assertEqual([True, True, False], [result.error is not None for result in results])
+        self.assertTrue((self.outdir / 'valid.py').exists())
+
+    def test_invalid_manifest(self):
+        manifest_path = self.write_manifest(jobs=[{"swagger_path": "swagger.yaml", "target": "cobol_client"}])
+
+        jobs, errs = swagger_to.batch.parse_manifest(path=manifest_path)
+
+        self.assertEqual([], jobs)
+        self.assertEqual([
+            "job 0: expected a string property 'output'",
+            "job 0: expected the target to be one of go_server, py_client, py_async_client, ts_angular5_client, "
+            "elm_client, but got: 'cobol_client'"
+        ], errs)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+"""Test the on-disk cache of the parsed and intermediate representations."""
+import os
+import pathlib
+import pickle
+import shutil
+import tempfile
+import unittest
+
+import swagger_to
+import swagger_to.cache
+import swagger_to.py_client
+
+# pylint: disable=missing-docstring
+# pylint: disable=protected-access
+
+
+def generate_client_py(entry: swagger_to.cache.Entry) -> str:
+    py_typedefs = swagger_to.py_client.to_typedefs(intermediate_typedefs=entry.typedefs)
+    py_requests = swagger_to.py_client.to_requests(endpoints=entry.endpoints, typedefs=py_typedefs)
+    return swagger_to.py_client.generate_client_py(
+        service_name=entry.swagger.name, typedefs=py_typedefs, requests=py_requests)
+
+
+class TestCache(unittest.TestCase):
+    def setUp(self):
+        self.tests_dir = pathlib.Path(os.path.realpath(__file__)).parent
+        self.case_dir = self.tests_dir / "cases" / "py_client" / "general"
+
+        self.tmp_dir = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.cache = swagger_to.cache.Cache(directory=pathlib.Path(self.tmp_dir.name) / "cache")
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_hit_gives_the_same_code(self):
+        swagger_path = self.case_dir / "swagger.yaml"
+
+        entry, errs = swagger_to.cache.load(path=swagger_path, cache=self.cache)
+        self.assertEqual([], errs)
+        assert entry is not None
+
+        self.assertEqual(1, len(list(self.cache.directory.glob('*.pickle'))))
+
+        key = swagger_to.cache.Cache.key(content=swagger_path.read_bytes(), suffix='.yaml')
+        self.assertIsNotNone(self.cache.get(key=key))
+
+        cached_entry, errs = swagger_to.cache.load(path=swagger_path, cache=self.cache)
+        self.assertEqual([], errs)
+        assert cached_entry is not None
+
+        self.assertIsNot(entry, cached_entry)
+        self.assertEqual((self.case_dir / "client.py").read_text(), generate_client_py(entry=cached_entry))
+
+    def test_source_is_updated_on_hit(self):
+        other_path = pathlib.Path(self.tmp_dir.name) / "other.yaml"
+        shutil.copy(str(self.case_dir / "swagger.yaml"), str(other_path))
+
+        _, errs = swagger_to.cache.load(path=self.case_dir / "swagger.yaml", cache=self.cache)
+        self.assertEqual([], errs)
+
+        entry, errs = swagger_to.cache.load(path=other_path, cache=self.cache)
+        self.assertEqual([], errs)
+        assert entry is not None
+        assert entry.swagger.raw_dict is not None
+
+        self.assertEqual(1, len(list(self.cache.directory.glob('*.pickle'))))
+        self.assertEqual(str(other_path), entry.swagger.raw_dict.source)
+        self.assertEqual(str(other_path), entry.swagger.raw_dict['definitions'].source)
+
+    def test_hit_in_memory_does_not_change_the_source_of_other_files(self):
+        other_path = pathlib.Path(self.tmp_dir.name) / "other.yaml"
+        shutil.copy(str(self.case_dir / "swagger.yaml"), str(other_path))
+
+        memory = swagger_to.cache.MemoryCache()
+
+        entry, errs = swagger_to.cache.load(path=self.case_dir / "swagger.yaml", memory=memory)
+        self.assertEqual([], errs)
+        assert entry is not None
+        assert entry.swagger.raw_dict is not None
+
+        other_entry, errs = swagger_to.cache.load(path=other_path, memory=memory)
+        self.assertEqual([], errs)
+        assert other_entry is not None
+        assert other_entry.swagger.raw_dict is not None
+
+        self.assertEqual(str(other_path), other_entry.swagger.raw_dict['definitions'].source)
+        self.assertEqual(str(self.case_dir / "swagger.yaml"), entry.swagger.raw_dict.source)
+        self.assertEqual(str(self.case_dir / "swagger.yaml"), entry.swagger.raw_dict['definitions'].source)
+
+        again, errs = swagger_to.cache.load(path=self.case_dir / "swagger.yaml", memory=memory)
+        self.assertEqual([], errs)
+        self.assertIs(entry, again)
+
+    def test_tampered_entry_is_not_unpickled(self):
+        swagger_path = self.case_dir / "swagger.yaml"
+        entry, errs = swagger_to.cache.load(path=swagger_path, cache=self.cache)
+        self.assertEqual([], errs)
+
+        key = swagger_to.cache.Cache.key(content=swagger_path.read_bytes(), suffix='.yaml')
+        pth = self.cache.directory / '{}.pickle'.format(key)
+
+        # A valid pickle without the signature of the cache.
+        pth.write_bytes(pickle.dumps(entry))
+        self.assertIsNone(self.cache.get(key=key))
+        self.assertFalse(pth.exists())
+
+        # The same entry signed with another key.
+        _, errs = swagger_to.cache.load(path=swagger_path, cache=self.cache)
+        self.assertEqual([], errs)
+
+        other_cache = swagger_to.cache.Cache(directory=pathlib.Path(self.tmp_dir.name) / "other_cache")
+        other_cache.put(key=key, entry=self.cache.get(key=key))
+        shutil.copy(str(other_cache.directory / '{}.pickle'.format(key)), str(pth))
+
+        self.assertIsNone(self.cache.get(key=key))
+
+    @unittest.skipIf(not hasattr(os, 'getuid'), "The permissions are checked only on POSIX systems.")
+    def test_key_accessible_to_others_disables_the_cache(self):
+        swagger_path = self.case_dir / "swagger.yaml"
+        _, errs = swagger_to.cache.load(path=swagger_path, cache=self.cache)
+        self.assertEqual([], errs)
+
+        key = swagger_to.cache.Cache.key(content=swagger_path.read_bytes(), suffix='.yaml')
+        (self.cache.directory / '.secret').chmod(0o644)
+
+        cache = swagger_to.cache.Cache(directory=self.cache.directory)
+        self.assertIsNone(cache.get(key=key))
+
+        for pth in cache.directory.glob('*.pickle'):
+            pth.unlink()
+
+        _, errs = swagger_to.cache.load(path=swagger_path, cache=cache)
+        self.assertEqual([], errs)
+        self.assertEqual([], list(cache.directory.glob('*.pickle')))
+
+    def test_errors_are_not_cached(self):
+        swagger_path = self.tests_dir / "cases" / "parsing" / "info_description_not_string" / "swagger.yaml"
+
+        entry, errs = swagger_to.cache.load(path=swagger_path, cache=self.cache)
+        self.assertIsNone(entry)
+        self.assertNotEqual([], errs)
+        self.assertEqual([], list(self.cache.directory.glob('*.pickle')))
+
+    def test_corrupted_entry_is_a_miss(self):
+        swagger_path = self.case_dir / "swagger.yaml"
+        _, errs = swagger_to.cache.load(path=swagger_path, cache=self.cache)
+        self.assertEqual([], errs)
+
+        key = swagger_to.cache.Cache.key(content=swagger_path.read_bytes(), suffix='.yaml')
+        (self.cache.directory / '{}.pickle'.format(key)).write_bytes(b'corrupted')
+
+        self.assertIsNone(self.cache.get(key=key))
+
+        entry, errs = swagger_to.cache.load(path=swagger_path, cache=self.cache)
+        self.assertEqual([], errs)
+        self.assertIsNotNone(entry)
+        self.assertIsNotNone(self.cache.get(key=key))
+
+    def test_eviction_and_clear(self):
+        paths = []
+        for i in range(3):
+            pth = pathlib.Path(self.tmp_dir.name) / "swagger{}.yaml".format(i)
+            pth.write_text((self.case_dir / "swagger.yaml").read_text() + "\n# variant {}\n".format(i))
+            paths.append(pth)
+
+        _, errs = swagger_to.cache.load(path=paths[0], cache=self.cache)
+        self.assertEqual([], errs)
+        entry_size = sum(pth.stat().st_size for pth in self.cache.directory.glob('*.pickle'))
+
+        small_cache = swagger_to.cache.Cache(directory=self.cache.directory, max_size=2 * entry_size + entry_size // 2)
+        for pth in paths[1:]:
+            # Make sure that the modification times differ.
+            for existing in small_cache.directory.glob('*.pickle'):
+                stat = existing.stat()
+                os.utime(str(existing), (stat.st_atime - 10, stat.st_mtime - 10))
+
+            _, errs = swagger_to.cache.load(path=pth, cache=small_cache)
+            self.assertEqual([], errs)
+
+        keys = [swagger_to.cache.Cache.key(content=pth.read_bytes(), suffix='.yaml') for pth in paths]
+        self.assertIsNone(small_cache.get(key=keys[0]))
+        self.assertIsNotNone(small_cache.get(key=keys[1]))
+        self.assertIsNotNone(small_cache.get(key=keys[2]))
+
+        small_cache.clear()
+        self.assertEqual([], list(small_cache.directory.glob('*.pickle')))
+
+    def test_key_depends_on_version(self):
+        self.assertIn(swagger_to.__version__, (self.tests_dir.parent / "setup.py").read_text())
+
+        key = swagger_to.cache.Cache.key(content=b'swagger', suffix='.yaml')
+        self.assertNotEqual(key, swagger_to.cache.Cache.key(content=b'swagger', suffix='.json'))
+
+        original_version = swagger_to.__version__
+        try:
+            swagger_to.__version__ = original_version + '.dev'
+            self.assertNotEqual(key, swagger_to.cache.Cache.key(content=b'swagger', suffix='.yaml'))
+        finally:
+            swagger_to.__version__ = original_version
+
+    def test_key_depends_on_sources(self):
+        key = swagger_to.cache.Cache.key(content=b'swagger', suffix='.yaml')
+
+        original_digest = swagger_to.cache._sources_digest()
+        try:
+            swagger_to.cache._SOURCES_DIGEST = b'modified'
+            self.assertNotEqual(key, swagger_to.cache.Cache.key(content=b'swagger', suffix='.yaml'))
+        finally:
+            swagger_to.cache._SOURCES_DIGEST = original_digest
+
+        self.assertEqual(key, swagger_to.cache.Cache.key(content=b'swagger', suffix='.yaml'))
+
+    def test_entry_of_a_missing_class_is_a_miss(self):
+        swagger_path = self.case_dir / "swagger.yaml"
+        key = swagger_to.cache.Cache.key(content=swagger_path.read_bytes(), suffix='.yaml')
+
+        self.cache.directory.mkdir(parents=True)
+        (self.cache.directory / '{}.pickle'.format(key)).write_bytes(
+            pickle.dumps(swagger_to.cache.Entry, protocol=pickle.HIGHEST_PROTOCOL).replace(b'Entry', b'Entri'))
+
+        self.assertIsNone(self.cache.get(key=key))
+        self.assertEqual([], list(self.cache.directory.glob('*.pickle')))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -7,10 +7,13 @@ import tempfile
 import unittest
 
 import collections
+import json
 
+import swagger_to.cache
 import swagger_to.go_server
 import swagger_to.intermediate
 import swagger_to.swagger
+import swagger_to.targets
 
 # pylint: disable=missing-docstring
 # pylint: disable=protected-access
@@ -25,6 +28,63 @@ class TestEscapeStr(unittest.TestCase):
                          swagger_to.go_server._escaped_str('some \\ " \a \f \t \n \r \v text'))
 
 
+class TestCanonicalHeaderKey(unittest.TestCase):
+    def test_that_it_works(self):
+        self.assertEqual('X-Request-Id', swagger_to.go_server._canonical_header_key('X-Request-ID'))
+        self.assertEqual('Some-Parameter', swagger_to.go_server._canonical_header_key('some-parameter'))
+
+    def test_invalid_characters(self):
+        self.assertEqual('some parameter', swagger_to.go_server._canonical_header_key('some parameter'))
+
+
+class TestSampleMatching(unittest.TestCase):
+    def test_preferred_text(self):
+        self.assertEqual('some text', swagger_to.go_server._sample_matching(pattern='^[a-z ]+$', text='some text'))
+
+    def test_that_it_works(self):
+        for pattern in [
+                '^C-[0-9]{4}$', '[A-Z]{2}[0-9]{6}', '^(SKU|PRD)-[a-f0-9]{8}$', r'^\d+\.\d*$', '^[^a-z]+$',
+                r'^\w+@\w+\.(com|org)$', '^a.b?c*d+$', r'^[\w.\-]{3,}$', '^(?:ab|c)+x{2,5}?$', r'^\x41[]a]\t$'
+        ]:
+            sample = swagger_to.go_server._sample_matching(pattern=pattern, text='some text')
+            self.assertRegex(sample, pattern)
+
+    def test_unsupported(self):
+        for pattern in ['^(?=x)y$', r'^(a)\1$', r'^\p{L}$']:
+            self.assertIsNone(swagger_to.go_server._sample_matching(pattern=pattern, text='some text'))
+
+
+class TestTrackPresence(unittest.TestCase):
+    def test_accessor_clash(self):
+        swagger, errs = swagger_to.swagger.parse_yaml(stream="""\
+swagger: '2.0'
+info:
+  title: Test
+  version: 1.0.0
+basePath: /
+tags:
+  - name: test
+paths: {}
+definitions:
+  Clash:
+    type: object
+    properties:
+      age:
+        type: integer
+      has_age:
+        type: boolean
+""")
+        self.assertEqual([], errs)
+
+        intermediate_typedefs = swagger_to.intermediate.to_typedefs(swagger=swagger)
+
+        go_typedefs = swagger_to.go_server.to_typedefs(intermediate_typedefs=intermediate_typedefs)
+        self.assertIsInstance(go_typedefs['Clash'].fields['Age'].typedef, swagger_to.go_server.Pointerdef)
+
+        with self.assertRaises(ValueError):
+            swagger_to.go_server.to_typedefs(intermediate_typedefs=intermediate_typedefs, presence_bitmask=True)
+
+
 def meld(expected: str, got: str) -> None:
     """Calls meld to diff the two strings."""
     with tempfile.NamedTemporaryFile() as tmp1, \
@@ -85,5 +145,38 @@ class TestGoServer(unittest.TestCase):
                                  "A mismatch between the generated file and the expected file: {}".format(expected_pth))
 
 
+class TestGoServerWithOptions(unittest.TestCase):
+    def __init__(self, methodName: str = 'runTest') -> None:
+        self.maxDiff = None  # pylint: disable=invalid-name
+        super().__init__(methodName=methodName)
+
+    def test_that_it_works(self):
+        tests_dir = pathlib.Path(os.path.realpath(__file__)).parent
+
+        cases_dir = tests_dir / "cases" / "go_server_with_options"
+
+        for case_dir in sorted(cases_dir.iterdir()):
+            swagger_path = case_dir / "swagger.yaml"
+
+            swagger, errs = swagger_to.swagger.parse_yaml_file(path=swagger_path)
+            if errs:
+                raise ValueError("Failed to parse Swagger file {}:\n{}".format(swagger_path, "\n".join(errs)))
+
+            options = swagger_to.go_server.Options(**json.loads((case_dir / "options.json").read_text()))
+
+            got = swagger_to.targets.render_go_server(
+                entry=swagger_to.cache.translate(swagger=swagger), outdir=pathlib.Path(), options=options)
+
+            for pth, text in got.items():
+                expected_pth = case_dir / pth
+
+                # Leave this snippet here to facilitate updating the tests in the future
+                # expected_pth.write_text(text)
+
+                expected = expected_pth.read_text()
+                self.assertEqual(expected, text,
+                                 "A mismatch between the generated file and the expected file: {}".format(expected_pth))
+
+
 if __name__ == '__main__':
     unittest.main()
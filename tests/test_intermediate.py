@@ -8,8 +8,9 @@ import collections
 import json
 import os
 import pathlib
+import random
 import unittest
-from typing import Any, MutableMapping
+from typing import Any, List, MutableMapping, Set
 
 import swagger_to.go_server
 import swagger_to.intermediate
@@ -81,6 +82,89 @@ def jsonize_typedefs(typedefs: MutableMapping[str, swagger_to.intermediate.Typed
     return result
 
 
+def collect_referenced_definitions(typedef: swagger_to.swagger.Typedef,
+                                   definitions: MutableMapping[str, swagger_to.swagger.Definition]) -> List[str]:
+    """Collect the referenced definitions by walking the type definitions with a plain depth-first search."""
+    result = []  # type: List[str]
+    stack = [typedef]  # type: List[swagger_to.swagger.Typedef]
+    visited_definitions = set()  # type: Set[str]
+
+    while len(stack) > 0:
+        another_typedef = stack.pop()
+
+        if another_typedef.ref != '':
+            definition_name = swagger_to.parse_definition_ref(another_typedef.ref)
+
+            if definition_name not in visited_definitions:
+                result.append(definition_name)
+                stack.append(definitions[definition_name].typedef)
+                visited_definitions.add(definition_name)
+
+        else:
+            stack.extend(another_typedef.properties.values())
+
+            if another_typedef.items is not None:
+                stack.append(another_typedef.items)
+
+            if another_typedef.additional_properties is not None:
+                stack.append(another_typedef.additional_properties)
+
+            if another_typedef.all_of is not None:
+                stack.extend(another_typedef.all_of)
+
+    return result
+
+
+def random_typedef(rng: random.Random, names: List[str], depth: int) -> swagger_to.swagger.Typedef:
+    """Generate a random type definition referencing the given definitions."""
+    typedef = swagger_to.swagger.Typedef()
+
+    choice = rng.randrange(6) if depth > 0 else 0
+    if choice in [0, 1]:
+        typedef.ref = '#/definitions/{}'.format(rng.choice(names))
+    elif choice == 2:
+        typedef.type = 'array'
+        typedef.items = random_typedef(rng=rng, names=names, depth=depth - 1)
+    elif choice == 3:
+        typedef.type = 'object'
+        typedef.additional_properties = random_typedef(rng=rng, names=names, depth=depth - 1)
+    elif choice == 4:
+        typedef.all_of = [random_typedef(rng=rng, names=names, depth=depth - 1) for _ in range(rng.randrange(3))]
+    else:
+        typedef.type = 'object'
+        for i in range(rng.randrange(4)):
+            typedef.properties['property_{}'.format(i)] = random_typedef(rng=rng, names=names, depth=depth - 1)
+
+    return typedef
+
+
+class TestDefinitionGraph(unittest.TestCase):
+    def test_referenced_definitions_against_depth_first_search(self):
+        rng = random.Random(1984)
+
+        for _ in range(200):
+            names = ['Definition{}'.format(i) for i in range(rng.randrange(1, 20))]
+
+            definitions = collections.OrderedDict()  # type: MutableMapping[str, swagger_to.swagger.Definition]
+            for name in names:
+                typedef = swagger_to.swagger.Typedef()
+                typedef.type = 'object'
+                for i in range(rng.randrange(4)):
+                    typedef.properties['property_{}'.format(i)] = random_typedef(rng=rng, names=names, depth=3)
+
+                definitions[name] = swagger_to.swagger.Definition(identifier=name, typedef=typedef, swagger=None)
+
+            graph = swagger_to.intermediate._DefinitionGraph(definitions=definitions)
+
+            roots = [definition.typedef for definition in definitions.values()]
+            roots.append(random_typedef(rng=rng, names=names, depth=3))
+
+            for root in roots:
+                self.assertListEqual(
+                    collect_referenced_definitions(typedef=root, definitions=definitions),
+                    graph.referenced_definitions(typedef=root))
+
+
 class TestIntermediate(unittest.TestCase):
     def test_that_it_does_not_break(self):
         tests_dir = pathlib.Path(os.path.realpath(__file__)).parent
@@ -1,8 +1,14 @@
 #!/usr/bin/env python3
 """Test that parsing does not break on certain edge cases."""
+import datetime
+import json
 import os
 import pathlib
+import tempfile
 import unittest
+from typing import Any, List, Tuple  # pylint: disable=unused-import
+
+import yaml
 
 import swagger_to.go_server
 import swagger_to.intermediate
@@ -12,6 +18,39 @@ import swagger_to.swagger
 # pylint: disable=protected-access
 
 
+def flatten_raw_dicts(value: Any, path: str = '') -> List[Tuple[str, int]]:
+    """List (path, line number) of all the raw dictionaries nested in the value."""
+    result = []  # type: List[Tuple[str, int]]
+    if isinstance(value, swagger_to.swagger.RawDict):
+        result.append((path, value.lineno))
+        for key, item in value.items():
+            result.extend(flatten_raw_dicts(value=item, path='{}/{}'.format(path, key)))
+    elif isinstance(value, list):
+        for i, item in enumerate(value):
+            result.extend(flatten_raw_dicts(value=item, path='{}/{}'.format(path, i)))
+
+    return result
+
+
+class TestParseDuration(unittest.TestCase):
+    def test_that_it_works(self):
+        cases = [
+            ('2s', datetime.timedelta(seconds=2)),
+            ('250ms', datetime.timedelta(milliseconds=250)),
+            ('1m30s', datetime.timedelta(seconds=90)),
+            ('1.5h', datetime.timedelta(minutes=90)),
+            ('.5s', datetime.timedelta(milliseconds=500)),
+            ('3000ns', datetime.timedelta(microseconds=3)),
+        ]
+
+        for text, expected in cases:
+            self.assertEqual(expected, swagger_to.swagger._parse_duration(text=text), text)
+
+    def test_invalid(self):
+        for text in ['', '5', '-1s', '1 s', '10 seconds', '1ns', '1.0005ms']:
+            self.assertIsNone(swagger_to.swagger._parse_duration(text=text), text)
+
+
 class TestParsing(unittest.TestCase):
     def test_that_it_does_not_break(self):
         tests_dir = pathlib.Path(os.path.realpath(__file__)).parent
@@ -29,6 +68,60 @@ class TestParsing(unittest.TestCase):
             self.assertEqual(expected_errs, "\n".join(errs),
                              "Mismatch against the expected errors from {}".format(expected_errs_pth))
 
+    @unittest.skipIf(not hasattr(yaml, 'CSafeLoader'), "PyYAML has been built without libyaml.")
+    def test_libyaml_loader_matches_pure_python_loader(self):
+        tests_dir = pathlib.Path(os.path.realpath(__file__)).parent
+
+        for swagger_path in sorted((tests_dir / "cases").glob("**/swagger.yaml")):
+            with swagger_path.open('rt', encoding='utf-8') as fid:
+                expected = yaml.load(fid, swagger_to.swagger._PY_LOADER)
+
+            with swagger_path.open('rt', encoding='utf-8') as fid:
+                got = yaml.load(fid, swagger_to.swagger._LOADER)
+
+            self.assertEqual(expected, got, "Mismatch in the content of {}".format(swagger_path))
+            self.assertEqual(
+                flatten_raw_dicts(expected), flatten_raw_dicts(got),
+                "Mismatch in line numbers of {}".format(swagger_path))
+            self.assertEqual(str(swagger_path), got.source)
+
+    def test_json_matches_yaml(self):
+        tests_dir = pathlib.Path(os.path.realpath(__file__)).parent
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            for i, yaml_path in enumerate(sorted((tests_dir / "cases").glob("**/swagger.yaml"))):
+                # Convert to JSON; both loaders have to give the same raw dictionaries since JSON is a subset of YAML.
+                json_path = pathlib.Path(tmp_dir) / "swagger{}.json".format(i)
+                with yaml_path.open('rt', encoding='utf-8') as fid:
+                    json_path.write_text(json.dumps(yaml.safe_load(fid), indent=2, default=str), encoding='utf-8')
+
+                swagger_from_yaml, yaml_errs = swagger_to.swagger.parse_yaml_file(path=json_path)
+                swagger_from_json, json_errs = swagger_to.swagger.parse_file(path=json_path)
+
+                self.assertEqual(yaml_errs, json_errs, "Mismatch in errors of {}".format(yaml_path))
+                self.assertEqual(swagger_from_yaml.raw_dict, swagger_from_json.raw_dict,
+                                 "Mismatch in the content of {}".format(yaml_path))
+                self.assertEqual(
+                    flatten_raw_dicts(swagger_from_yaml.raw_dict), flatten_raw_dicts(swagger_from_json.raw_dict),
+                    "Mismatch in line numbers of {}".format(yaml_path))
+
+    def test_json_line_numbers(self):
+        text = ('{\n'
+                '  "a": {"text": "{ with braces }", "b": {\n'
+                '    "c": "\\"}"}},\n'
+                '  "d": [{}, {\n'
+                '  }]\n'
+                '}\n')
+
+        raw_dict = swagger_to.swagger._load_json(text=text, source='some.json')
+
+        self.assertEqual([('', 0), ('/a', 1), ('/a/b', 1), ('/d/0', 3), ('/d/1', 3)], flatten_raw_dicts(raw_dict))
+        self.assertEqual('some.json', raw_dict.source)
+        self.assertEqual('"}', raw_dict['a']['b']['c'])
+
+    def test_schema_validator_is_shared(self):
+        self.assertIs(swagger_to.swagger.schema_validator(), swagger_to.swagger.schema_validator())
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""Test the asynchronous Py client code generation."""
+import asyncio
+import http.server
+import importlib.util
+import json
+import os
+import pathlib
+import threading
+import time
+import unittest
+from typing import Any, List  # pylint: disable=unused-import
+
+import swagger_to.intermediate
+import swagger_to.py_client
+import swagger_to.swagger
+
+try:
+    import aiohttp  # pylint: disable=unused-import
+    HAS_AIOHTTP = True
+except ImportError:
+    HAS_AIOHTTP = False
+
+# pylint: disable=missing-docstring
+
+
+def load_client(case_dir: pathlib.Path) -> Any:
+    """Import the expected client of the test case as a module."""
+    spec = importlib.util.spec_from_file_location('async_client_{}'.format(case_dir.name), str(case_dir / "client.py"))
+    module = importlib.util.module_from_spec(spec)  # type: ignore
+    spec.loader.exec_module(module)  # type: ignore
+    return module
+
+
+class TestPyAsyncClient(unittest.TestCase):
+    def __init__(self, methodName: str = 'runTest') -> None:
+        self.maxDiff = None  # pylint: disable=invalid-name
+        super().__init__(methodName=methodName)
+
+    def test_that_it_works(self):
+        tests_dir = pathlib.Path(os.path.realpath(__file__)).parent
+
+        cases_dir = tests_dir / "cases" / "py_async_client"
+
+        for case_dir in sorted(pth for pth in cases_dir.iterdir() if pth.is_dir()):
+            swagger_path = case_dir / "swagger.yaml"
+            if not swagger_path.exists():
+                continue
+
+            swagger, errs = swagger_to.swagger.parse_yaml_file(path=swagger_path)
+            if errs:
+                raise ValueError("Failed to parse Swagger file {}:\n{}".format(swagger_path, "\n".join(errs)))
+
+            intermediate_typedefs = swagger_to.intermediate.to_typedefs(swagger=swagger)
+            intermediate_params = swagger_to.intermediate.to_parameters(swagger=swagger, typedefs=intermediate_typedefs)
+
+            endpoints = swagger_to.intermediate.to_endpoints(
+                swagger=swagger, typedefs=intermediate_typedefs, params=intermediate_params)
+
+            py_typedefs = swagger_to.py_client.to_typedefs(intermediate_typedefs=intermediate_typedefs)
+            py_requests = swagger_to.py_client.to_requests(endpoints=endpoints, typedefs=py_typedefs)
+
+            text = swagger_to.py_client.generate_async_client_py(
+                service_name=swagger.name, typedefs=py_typedefs, requests=py_requests)
+
+            expected_pth = case_dir / "client.py"
+            expected = expected_pth.read_text()
+
+            self.assertEqual(expected, text, ("The expected code from {} does not match the generated code "
+                                              "for the Swagger spec {}.").format(expected_pth, swagger_path))
+
+
+class _StubHandler(http.server.BaseHTTPRequestHandler):
+    """Serve the products after a delay and count the requests in flight."""
+
+    lock = threading.Lock()
+    in_flight = 0
+    max_in_flight = 0
+    delay = 0.05
+
+    def do_GET(self):  # pylint: disable=invalid-name
+        cls = type(self)
+        with cls.lock:
+            cls.in_flight += 1
+            cls.max_in_flight = max(cls.max_in_flight, cls.in_flight)
+
+        try:
+            time.sleep(cls.delay)
+
+            if self.path.startswith('/products'):
+                body = json.dumps({
+                    'uberX': {
+                        'product_id': 'uberX',
+                        'desc': 'some description',
+                        'display_name': 'uberX',
+                        'capacity': 4,
+                        'image': 'https://example.com/uberx.png'
+                    }
+                }).encode()
+                content_type = 'application/json'
+            else:
+                body = b'x' * (1 << 20)
+                content_type = 'application/octet-stream'
+
+            self.send_response(200)
+            self.send_header('Content-Type', content_type)
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        finally:
+            with cls.lock:
+                cls.in_flight -= 1
+
+    def log_message(self, format, *args):  # pylint: disable=redefined-builtin
+        pass
+
+
+@unittest.skipUnless(HAS_AIOHTTP, "aiohttp is not installed")
+class TestAgainstStubServer(unittest.TestCase):
+    def setUp(self):
+        _StubHandler.in_flight = 0
+        _StubHandler.max_in_flight = 0
+        _StubHandler.delay = 0.05
+
+        self.server = http.server.ThreadingHTTPServer(('127.0.0.1', 0), _StubHandler)
+        self.thread = threading.Thread(target=self.server.serve_forever)
+        self.thread.start()
+        self.url_prefix = 'http://127.0.0.1:{}'.format(self.server.server_address[1])
+
+        self.cases_dir = pathlib.Path(os.path.realpath(__file__)).parent / "cases" / "py_async_client"
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+        self.thread.join()
+
+    def test_concurrency_limit(self):
+        client = load_client(case_dir=self.cases_dir / "general")
+
+        async def run() -> List[Any]:
+            async with client.RemoteCaller(url_prefix=self.url_prefix, max_concurrency=2) as remote_caller:
+                return await asyncio.gather(*[remote_caller.products(latitude=1.0, longitude=2.0) for _ in range(8)])
+
+        results = asyncio.run(run())
+
+        self.assertEqual(8, len(results))
+        self.assertEqual(4, results[0]['uberX'].capacity)
+        self.assertLessEqual(_StubHandler.max_in_flight, 2)
+
+    def test_streamed_response(self):
+        client = load_client(case_dir=self.cases_dir / "file_stream")
+
+        async def run() -> int:
+            async with client.RemoteCaller(url_prefix=self.url_prefix) as remote_caller:
+                resp = await remote_caller.open_file(path='some/file')
+                try:
+                    size = 0
+                    async for chunk in resp.content.iter_chunked(1 << 16):
+                        size += len(chunk)
+
+                    return size
+                finally:
+                    resp.release()
+
+        self.assertEqual(1 << 20, asyncio.run(run()))
+
+    def test_timeouts(self):
+        _StubHandler.delay = 0.5
+        client = load_client(case_dir=self.cases_dir / "general")
+
+        async def run(read_timeout: float, request_timeout: Any = None) -> Any:
+            async with client.RemoteCaller(
+                    url_prefix=self.url_prefix, connect_timeout=5.0, read_timeout=read_timeout) as remote_caller:
+                return await remote_caller.products(latitude=1.0, longitude=2.0, request_timeout=request_timeout)
+
+        with self.assertRaises(asyncio.TimeoutError):
+            asyncio.run(run(read_timeout=0.05))
+
+        with self.assertRaises(asyncio.TimeoutError):
+            asyncio.run(run(read_timeout=5.0, request_timeout=(5.0, 0.05)))
+
+        self.assertEqual(4, asyncio.run(run(read_timeout=0.05, request_timeout=5.0))['uberX'].capacity)
+
+        results = asyncio.run(run(read_timeout=0.05, request_timeout=aiohttp.ClientTimeout(sock_read=5.0)))
+        self.assertEqual(4, results['uberX'].capacity)
+
+
+if __name__ == '__main__':
+    unittest.main()
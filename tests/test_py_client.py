@@ -1,8 +1,18 @@
 #!/usr/bin/env python3
 """Test the Py client code generation."""
+import concurrent.futures
+import http.server
+import importlib.util
+import json
 import os
 import pathlib
+import threading
+import time
 import unittest
+from typing import Any, List, Set, Tuple  # pylint: disable=unused-import
+
+import icontract
+import requests
 
 import swagger_to.intermediate
 import swagger_to.py_client
@@ -55,6 +65,267 @@ class TestPyClient(unittest.TestCase):
             self.assertEqual(expected, text, ("The expected code from {} does not match the generated code "
                                               "for the Swagger spec {}.").format(expected_pth, swagger_path))
 
+    def test_request_timeout_parameter_is_reserved(self):
+        case_dir = pathlib.Path(os.path.realpath(__file__)).parent / "cases" / "py_client" / "timeout_parameter"
+
+        text = (case_dir / "swagger.yaml").read_text().replace('- name: timeout', '- name: request_timeout')
+        swagger, errs = swagger_to.swagger.parse_yaml(stream=text)
+        self.assertEqual([], errs)
+
+        intermediate_typedefs = swagger_to.intermediate.to_typedefs(swagger=swagger)
+        intermediate_params = swagger_to.intermediate.to_parameters(swagger=swagger, typedefs=intermediate_typedefs)
+        endpoints = swagger_to.intermediate.to_endpoints(
+            swagger=swagger, typedefs=intermediate_typedefs, params=intermediate_params)
+
+        py_typedefs = swagger_to.py_client.to_typedefs(intermediate_typedefs=intermediate_typedefs)
+        py_requests = swagger_to.py_client.to_requests(endpoints=endpoints, typedefs=py_typedefs)
+
+        for generate in [swagger_to.py_client.generate_client_py, swagger_to.py_client.generate_async_client_py]:
+            with self.assertRaises(icontract.ViolationError) as ctx:
+                generate(service_name=swagger.name, typedefs=py_typedefs, requests=py_requests)
+
+            self.assertIn("The argument 'request_timeout' of the request function is reserved", str(ctx.exception))
+
+
+def load_client(case_dir: pathlib.Path) -> Any:
+    """Import the expected client of the test case as a module."""
+    spec = importlib.util.spec_from_file_location('client_{}'.format(case_dir.name), str(case_dir / "client.py"))
+    module = importlib.util.module_from_spec(spec)  # type: ignore
+    spec.loader.exec_module(module)  # type: ignore
+    return module
+
+
+class TestDecoders(unittest.TestCase):
+    def setUp(self):
+        tests_dir = pathlib.Path(os.path.realpath(__file__)).parent
+        self.client = load_client(case_dir=tests_dir / "cases" / "py_client" / "general")
+
+    def test_valid(self):
+        product_list = self.client.product_list_from_obj({
+            'products': [{
+                'product_id': 'uberX',
+                'desc': 'some description',
+                'display_name': 'uberX',
+                'capacity': 4,
+                'image': 'https://example.com/uberx.png'
+            }]
+        })
+
+        self.assertEqual(1, len(product_list.products))
+        self.assertEqual(4, product_list.products[0].capacity)
+
+        estimate = self.client.price_estimate_from_obj({
+            'product_id': 'uberX',
+            'currency_code': 'USD',
+            'display_name': 'uberX',
+            'estimate': '$10',
+            'low_estimate': 9
+        })
+
+        self.assertIsInstance(estimate.low_estimate, float)
+        self.assertIsNone(estimate.high_estimate)
+
+    def test_path_to_the_mismatch(self):
+        history = [{'uuid': 'some-uuid'}, {'uuid': 'other-uuid'}, {'uuid': 3}]
+
+        with self.assertRaises(ValueError) as ctx:
+            self.client.activities_from_obj({'offset': 0, 'limit': 3, 'count': 3, 'history': history}, path='resp')
+
+        self.assertEqual("Expected a str at 'resp.history[2].uuid', but got <class 'int'>.", str(ctx.exception))
+
+        with self.assertRaises(ValueError) as ctx:
+            self.client.from_obj({'uberX': []}, expected=[dict, self.client.Product])
+
+        self.assertEqual("Expected a dict at \"['uberX']\", but got <class 'list'>.", str(ctx.exception))
+
+
+class TestEncoders(unittest.TestCase):
+    def setUp(self):
+        tests_dir = pathlib.Path(os.path.realpath(__file__)).parent
+        self.client = load_client(case_dir=tests_dir / "cases" / "py_client" / "general")
+
+    def test_round_trip(self):
+        jsonable = {'offset': 0, 'limit': 2, 'count': 2, 'history': [{'uuid': 'some-uuid'}, {'uuid': 'other-uuid'}]}
+
+        activities = self.client.activities_from_obj(jsonable)
+        self.assertEqual(jsonable, self.client.activities_to_jsonable(activities))
+        self.assertEqual(jsonable, self.client.to_jsonable(activities, expected=[self.client.Activities]))
+
+
+class _StubHandler(http.server.BaseHTTPRequestHandler):
+    """Serve the history after failing with 503 for the given number of times and after the given delay."""
+
+    # Keep the connections alive so that their reuse can be observed.
+    protocol_version = 'HTTP/1.1'
+    disable_nagle_algorithm = True
+
+    lock = threading.Lock()
+    failures = 0
+    delay = 0.0
+    connections = set()  # type: Set[Tuple[str, int]]
+    user_agents = set()  # type: Set[str]
+
+    def do_GET(self):  # pylint: disable=invalid-name
+        cls = type(self)
+        with cls.lock:
+            cls.connections.add(self.client_address)
+            cls.user_agents.add(self.headers.get('User-Agent', ''))
+
+        if cls.failures > 0:
+            cls.failures -= 1
+            self.send_response(503)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+
+        time.sleep(cls.delay)
+
+        body = json.dumps({'offset': 0, 'limit': 1, 'count': 1, 'history': [{'uuid': 'some-uuid'}]}).encode()
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+
+        try:
+            self.wfile.write(body)
+        except BrokenPipeError:
+            # The client timed out.
+            pass
+
+    def log_message(self, format, *args):  # pylint: disable=redefined-builtin
+        pass
+
+
+class TestRemoteCaller(unittest.TestCase):
+    def setUp(self):
+        _StubHandler.failures = 0
+        _StubHandler.delay = 0.0
+        _StubHandler.connections = set()
+        _StubHandler.user_agents = set()
+
+        self.server = http.server.ThreadingHTTPServer(('127.0.0.1', 0), _StubHandler)
+        self.thread = threading.Thread(target=self.server.serve_forever)
+        self.thread.start()
+        self.url_prefix = 'http://127.0.0.1:{}'.format(self.server.server_address[1])
+
+        tests_dir = pathlib.Path(os.path.realpath(__file__)).parent
+        self.client = load_client(case_dir=tests_dir / "cases" / "py_client" / "general")
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+        self.thread.join()
+
+    def test_retries(self):
+        _StubHandler.failures = 2
+        remote_caller = self.client.RemoteCaller(url_prefix=self.url_prefix, max_retries=2, backoff_factor=0.01)
+        self.assertEqual('some-uuid', remote_caller.history().history[0].uuid)
+
+        _StubHandler.failures = 1
+        remote_caller = self.client.RemoteCaller(url_prefix=self.url_prefix)
+        with self.assertRaises(requests.HTTPError):
+            remote_caller.history()
+
+    def test_timeouts(self):
+        _StubHandler.delay = 0.5
+        remote_caller = self.client.RemoteCaller(url_prefix=self.url_prefix, connect_timeout=5.0, read_timeout=0.05)
+
+        with self.assertRaises(requests.Timeout):
+            remote_caller.history()
+
+        remote_caller = self.client.RemoteCaller(
+            url_prefix=self.url_prefix, max_retries=2, connect_timeout=5.0, read_timeout=0.05)
+
+        with self.assertRaises(requests.ReadTimeout):
+            remote_caller.history()
+
+        self.assertEqual(1, remote_caller.history(request_timeout=5.0).count)
+
+    def test_concurrent_calls(self):
+        _StubHandler.delay = 0.02
+        remote_caller = self.client.RemoteCaller(url_prefix=self.url_prefix, max_connections_per_host=8)
+
+        def calls_per_second(threads: int) -> float:
+            start = time.perf_counter()
+            with concurrent.futures.ThreadPoolExecutor(max_workers=threads) as executor:
+                activities = list(executor.map(lambda _: remote_caller.history(), range(32)))
+
+            duration = time.perf_counter() - start
+
+            self.assertEqual(['some-uuid'] * 32, [activity.history[0].uuid for activity in activities])
+            return len(activities) / duration
+
+        try:
+            single = calls_per_second(threads=1)
+            multi = calls_per_second(threads=8)
+        finally:
+            remote_caller.close()
+
+        # The calls wait on the server so the throughput scales with the threads sharing the caller.
+        self.assertGreater(multi, 3 * single, "Expected the throughput to scale from {:.1f} calls/s with a single "
+                           "thread, but got {:.1f} calls/s with 8 threads.".format(single, multi))
+
+        # The threads share the pool so that the connections are reused across the threads.
+        self.assertLessEqual(len(_StubHandler.connections), 8)
+
+    def test_session_factory(self):
+        sessions = []  # type: List[_TrackedSession]
+
+        def create_session() -> requests.Session:
+            session = _TrackedSession()
+            session.headers['User-Agent'] = 'some-agent'
+            sessions.append(session)
+            return session
+
+        remote_caller = self.client.RemoteCaller(url_prefix=self.url_prefix, session_factory=create_session)
+
+        def call(_: int) -> int:
+            remote_caller.history()
+            return threading.get_ident()
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+            threads = list(executor.map(call, range(8)))
+
+        self.assertEqual({'some-agent'}, _StubHandler.user_agents)
+        self.assertEqual(len(set(threads)), len(sessions))
+
+        remote_caller.close()
+        self.assertTrue(all(session.closed for session in sessions))
+
+    def test_session_property(self):
+        remote_caller = self.client.RemoteCaller(url_prefix=self.url_prefix)
+
+        # The session of the current thread is kept on the instance and can be configured as before.
+        session = remote_caller.session
+        self.assertIs(session, remote_caller.session)
+        session.headers['User-Agent'] = 'some-agent'
+
+        remote_caller.history()
+        self.assertEqual({'some-agent'}, _StubHandler.user_agents)
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+            self.assertIsNot(session, executor.submit(lambda: remote_caller.session).result())
+
+        given = requests.Session()
+        remote_caller.session = given
+        self.assertIs(given, remote_caller.session)
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+            self.assertIs(given, executor.submit(lambda: remote_caller.session).result())
+
+        remote_caller.close()
+        given.close()
+
+
+class _TrackedSession(requests.Session):
+    """Record whether the session has been closed."""
+
+    closed = False
+
+    def close(self) -> None:
+        self.closed = True
+        super().close()
+
 
 class TestDocstring(unittest.TestCase):
     def test_single_line(self):
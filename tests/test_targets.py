@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""Test rendering and writing the targets."""
+import collections
+import contextlib
+import io
+import os
+import pathlib
+import tempfile
+import unittest
+
+import swagger_to.bin.swagger_to_multi
+import swagger_to.cache
+import swagger_to.targets
+
+# pylint: disable=missing-docstring
+
+
+class TestTargets(unittest.TestCase):
+    def test_render(self):
+        cases_dir = pathlib.Path(os.path.realpath(__file__)).parent / "cases"
+
+        table = [
+            ('go_server', pathlib.Path('.'), ['types.go', 'routes.go', 'handler.go', 'jsonschemas.go']),
+            ('py_client', pathlib.Path('client.py'), ['client.py']),
+            ('py_async_client', pathlib.Path('client.py'), ['client.py']),
+            ('ts_angular5_client', pathlib.Path('client.ts'), ['client.ts']),
+            ('elm_client', pathlib.Path('.'), ['Client.elm']),
+        ]
+
+        for target, output, expected_names in table:
+            case_dir = cases_dir / target / "general"
+
+            entry, errs = swagger_to.cache.load(path=case_dir / "swagger.yaml")
+            self.assertEqual([], errs)
+            assert entry is not None
+
+            files = swagger_to.targets.render(target=target, entry=entry, output=output, no_samples=True)
+
+            self.assertEqual(expected_names, [pth.name for pth in files])
+            for pth, text in files.items():
+                self.assertEqual((case_dir / pth.name).read_text(), text, "Mismatch in {} against {}".format(
+                    target, case_dir / pth.name))
+
+    def test_write_skips_unchanged_files(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            outdir = pathlib.Path(tmp_dir)
+            files = collections.OrderedDict([(outdir / 'a.txt', 'a'), (outdir / 'sub' / 'b.txt', 'b')])
+
+            self.assertEqual([outdir / 'a.txt', outdir / 'sub' / 'b.txt'], swagger_to.targets.write(files=files))
+
+            for pth in files:
+                os.utime(str(pth), (0, 0))
+
+            self.assertEqual([], swagger_to.targets.write(files=files, force=True))
+            self.assertEqual([0, 0], [int(pth.stat().st_mtime) for pth in files])
+
+            files[outdir / 'sub' / 'b.txt'] = 'bb'
+            changed = swagger_to.targets.write(files=files, force=True)
+
+            self.assertEqual([outdir / 'sub' / 'b.txt'], changed)
+            self.assertEqual(0, int((outdir / 'a.txt').stat().st_mtime))
+            self.assertEqual('bb', (outdir / 'sub' / 'b.txt').read_text())
+
+            self.assertEqual("1 of 2 file(s) changed:\n  {}".format(outdir / 'sub' / 'b.txt'),
+                             swagger_to.targets.describe_changes(files=files, changed=changed))
+
+            with self.assertRaises(FileExistsError):
+                swagger_to.targets.write(files=files)
+
+    def test_multi(self):
+        case_dir = pathlib.Path(os.path.realpath(__file__)).parent / "cases" / "py_client" / "general"
+        swagger_path = case_dir / "swagger.yaml"
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            outdir = pathlib.Path(tmp_dir)
+            # yapf: disable
+            argv = [
+                '--swagger_path', str(swagger_path),
+                '--go_server_outdir', str(outdir / 'go'),
+                '--py_client_outpath', str(outdir / 'py' / 'client.py'),
+                '--elm_client_outdir', str(outdir / 'elm'),
+                '--no_samples'
+            ]
+            # yapf: enable
+
+            with contextlib.redirect_stdout(io.StringIO()):
+                self.assertEqual(0, swagger_to.bin.swagger_to_multi.main(argv=argv))
+
+            self.assertEqual(
+                sorted([
+                    'go/types.go', 'go/routes.go', 'go/handler.go', 'go/jsonschemas.go', 'py/client.py',
+                    'elm/Client.elm'
+                ]), sorted(pth.relative_to(outdir).as_posix() for pth in outdir.glob('**/*') if pth.is_file()))
+
+            self.assertEqual((case_dir / "client.py").read_text(), (outdir / 'py' / 'client.py').read_text())
+
+            # Existing files are not overwritten without --force.
+            (outdir / 'py' / 'client.py').write_text('modified')
+
+            stderr = io.StringIO()
+            with contextlib.redirect_stdout(io.StringIO()), contextlib.redirect_stderr(stderr):
+                self.assertEqual(1, swagger_to.bin.swagger_to_multi.main(argv=argv))
+
+            self.assertEqual('modified', (outdir / 'py' / 'client.py').read_text())
+            self.assertIn('--force', stderr.getvalue())
+
+            with contextlib.redirect_stdout(io.StringIO()):
+                self.assertEqual(0, swagger_to.bin.swagger_to_multi.main(argv=argv + ['--force']))
+
+            self.assertEqual((case_dir / "client.py").read_text(), (outdir / 'py' / 'client.py').read_text())
+
+    def test_multi_with_go_server_options(self):
+        case_dir = pathlib.Path(os.path.realpath(__file__)).parent / "cases" / "py_client" / "general"
+        swagger_path = case_dir / "swagger.yaml"
+
+        for jobs in ['1', '2']:
+            with tempfile.TemporaryDirectory() as tmp_dir:
+                outdir = pathlib.Path(tmp_dir)
+                # yapf: disable
+                argv = [
+                    '--swagger_path', str(swagger_path),
+                    '--go_server_outdir', str(outdir / 'go'),
+                    '--py_client_outpath', str(outdir / 'py' / 'client.py'),
+                    '--no_samples',
+                    '--route_benchmarks',
+                    '--jobs', jobs
+                ]
+                # yapf: enable
+
+                with contextlib.redirect_stdout(io.StringIO()):
+                    self.assertEqual(0, swagger_to.bin.swagger_to_multi.main(argv=argv))
+
+                self.assertTrue((outdir / 'go' / 'routes_bench_test.go').exists())
+                self.assertTrue((outdir / 'py' / 'client.py').exists())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""Test the persistent worker."""
+import io
+import json
+import os
+import pathlib
+import tempfile
+import unittest
+import unittest.mock
+
+import swagger_to.bin.swagger_to_worker
+import swagger_to.cache
+
+# pylint: disable=missing-docstring
+
+
+class TestWorker(unittest.TestCase):
+    def test_read_requests(self):
+        stream = io.StringIO('{"arguments": ["a"], "requestId": 1}\n'
+                             '{"arguments": ["b"],\n'
+                             ' "requestId": 2}\n'
+                             '\n'
+                             '{"arguments": [], "requestId": 3}{"arguments": [], "requestId": 4}\n')
+
+        requests = list(swagger_to.bin.swagger_to_worker.read_requests(stream=stream))
+
+        self.assertEqual([1, 2, 3, 4], [request['requestId'] for request in requests])
+        self.assertEqual(["b"], requests[1]['arguments'])
+
+    def test_serve(self):
+        case_dir = pathlib.Path(os.path.realpath(__file__)).parent / "cases" / "py_client" / "general"
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            outdir = pathlib.Path(tmp_dir)
+
+            flagfile = outdir / "args.params"
+            flagfile.write_text("--py_client_outpath\n{}\n--force\n".format(outdir / "second.py"))
+
+            swagger_path = str(case_dir / "swagger.yaml")
+
+            # yapf: disable
+            requests = [
+                {"arguments": ["--swagger_path", swagger_path, "--py_client_outpath", str(outdir / "first.py")],
+                 "requestId": 1},
+                {"arguments": ["--swagger_path", swagger_path, "@{}".format(flagfile)],
+                 "requestId": 2},
+                {"arguments": ["--swagger_path", str(outdir / "missing.yaml"), "--py_client_outpath",
+                               str(outdir / "third.py")],
+                 "requestId": 3},
+            ]
+            # yapf: enable
+
+            stdin = io.StringIO(''.join(json.dumps(request) + '\n' for request in requests))
+            stdout = io.StringIO()
+            memory = swagger_to.cache.MemoryCache()
+
+            swagger_to.bin.swagger_to_worker.serve(stdin=stdin, stdout=stdout, memory=memory)
+
+            responses = [json.loads(line) for line in stdout.getvalue().splitlines()]
+
+            self.assertEqual([1, 2, 3], [response['requestId'] for response in responses])
+            self.assertEqual([0, 0, 1], [response['exitCode'] for response in responses])
+            self.assertIn("Swagger file does not exist", responses[2]['output'])
+
+            expected = (case_dir / "client.py").read_text()
+            self.assertEqual(expected, (outdir / "first.py").read_text())
+            self.assertEqual(expected, (outdir / "second.py").read_text())
+
+            key = swagger_to.cache.Cache.key(content=(case_dir / "swagger.yaml").read_bytes(), suffix='.yaml')
+            self.assertIsNotNone(memory.get(key=key))
+
+    def test_multiple_targets_are_rendered_in_the_worker(self):
+        case_dir = pathlib.Path(os.path.realpath(__file__)).parent / "cases" / "py_client" / "general"
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            outdir = pathlib.Path(tmp_dir)
+
+            arguments = ["--swagger_path", str(case_dir / "swagger.yaml"), "--jobs", "2"]
+            arguments.extend(["--py_client_outpath", str(outdir / "client.py")])
+            arguments.extend(["--elm_client_outdir", str(outdir / "elm")])
+
+            pool = unittest.mock.patch(
+                'concurrent.futures.ProcessPoolExecutor', side_effect=AssertionError("Unexpected process pool"))
+
+            with pool:
+                response = swagger_to.bin.swagger_to_worker.handle(
+                    request=dict(arguments=arguments, requestId=1), memory=swagger_to.cache.MemoryCache())
+
+            self.assertEqual(0, response['exitCode'], response['output'])
+            self.assertEqual((case_dir / "client.py").read_text(), (outdir / "client.py").read_text())
+            self.assertTrue((outdir / "elm" / "Client.elm").exists())
+
+
+if __name__ == '__main__':
+    unittest.main()